@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Asset Pack for Equipment Editor
+Single-file, memory-mappable container for images and fonts (header index + aligned entries)
+"""
+
+import os
+import mmap
+import json
+import struct
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+try:
+    from . import thumbnail_cache
+except ImportError:
+    import thumbnail_cache
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+BASE_DIR = SCRIPT_DIR.parent
+PACK_FILE = BASE_DIR / "resources" / "assets.blpack"
+FONTS_DIR = BASE_DIR / "resources" / "fonts"
+
+# File layout:
+#   header  - magic, version, index size (little endian)
+#   index   - UTF-8 JSON: key -> {offset, length, category, original, thumbnails?}
+#   padding - up to ALIGNMENT
+#   data    - entries, each starting on an ALIGNMENT boundary
+# Offsets in the index are relative to the start of the data section.
+# Images packed with cached thumbnails list their sizes; each is an entry of its own (thumbnail_key).
+PACK_MAGIC = b'BLPK'
+PACK_VERSION = 1
+HEADER_FORMAT = '<4sHxxQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+ALIGNMENT = 64
+
+
+def _align(value: int) -> int:
+    """Round value up to the next ALIGNMENT boundary."""
+    return (value + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def pack_key(relative_path: str) -> str:
+    """Normalize a BASE_DIR-relative path into a pack key."""
+    return relative_path.replace('\\', '/').lstrip('/')
+
+
+def thumbnail_key(key: str, size: int) -> str:
+    """Pack key of an image's thumbnail of one size."""
+    return f"{key}@{size}"
+
+
+class AssetPack:
+    """Read-only view over a pack file. Entries are returned as views into the mapping (no read() per file)."""
+    
+    def __init__(self, path: Path = PACK_FILE):
+        self.path = Path(path)
+        
+        # One open() for the whole asset tree - the mapping keeps its own handle
+        with open(self.path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        # (mtime, size) of the file as mapped - a rebuilt pack has another
+        self.signature = (stat.st_mtime_ns, stat.st_size)
+        self._view = memoryview(self._mmap)
+        
+        magic, version, index_size = struct.unpack_from(HEADER_FORMAT, self._mmap, 0)
+        if magic != PACK_MAGIC:
+            raise ValueError(f"Not an asset pack: {self.path}")
+        if version != PACK_VERSION:
+            raise ValueError(f"Unsupported asset pack version {version}: {self.path}")
+        
+        index = json.loads(bytes(self._view[HEADER_SIZE:HEADER_SIZE + index_size]))
+        self._data_start = _align(HEADER_SIZE + index_size)
+        self.entries: Dict[str, dict] = index
+        
+        # Reverse lookup: original filename (lowercase) -> key
+        self.originals: Dict[str, str] = {}
+        for key, entry in index.items():
+            original = entry.get('original')
+            if original:
+                self.originals.setdefault(original.lower(), key)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+    
+    def read(self, key: str) -> Optional[memoryview]:
+        """Get entry bytes as a view into the mapping, or None."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        start = self._data_start + entry['offset']
+        return self._view[start:start + entry['length']]
+    
+    def sized_key(self, key: str, size: Optional[int] = None) -> str:
+        """
+        Key to serve for an image at a size: its smallest packed thumbnail >= size
+        (largest if size is None), or the image itself if it was packed without thumbnails.
+        """
+        sizes = self.entries[key].get('thumbnails')
+        if not sizes:
+            return key
+        return thumbnail_key(key, thumbnail_cache.pick_size(sizes, size))
+    
+    def sized_keys(self, key: str) -> List[str]:
+        """The image's key and the keys of its packed thumbnails."""
+        return [key] + [thumbnail_key(key, size) for size in self.entries[key].get('thumbnails', [])]
+    
+    def keys_in_category(self, category: str) -> List[str]:
+        """Get all keys stored under a category."""
+        return [key for key, entry in self.entries.items() if entry.get('category') == category]
+    
+    def close(self):
+        """Release the mapping. Views handed out by read() must be released first."""
+        self._view.release()
+        self._mmap.close()
+
+
+def build_pack(image_index: Dict[str, List[Tuple[str, str]]], output: Path = PACK_FILE,
+               fonts_dir: Path = FONTS_DIR) -> Dict[str, int]:
+    """
+    Build a pack file from organize_images output.
+    image_index: category -> [(original filename, BASE_DIR-relative path)]
+    Up-to-date thumbnails from the thumbnail cache are packed with their images.
+    Identical files are stored once and share an entry offset.
+    """
+    sources = []  # (key, absolute path, category, original)
+    for category, files in image_index.items():
+        for original, relative_path in files:
+            key = pack_key(relative_path)
+            sources.append((key, BASE_DIR / key, category, original))
+    
+    if fonts_dir.exists():
+        for font_path in sorted(fonts_dir.glob('*.ttf')):
+            key = pack_key(str(font_path.relative_to(BASE_DIR)))
+            sources.append((key, font_path, 'fonts', font_path.name))
+    
+    index = {}
+    blobs = []  # (offset, data)
+    offsets_by_hash = {}
+    data_size = 0
+    stats = {'entries': 0, 'thumbnails': 0, 'deduplicated': 0, 'missing': 0}
+    
+    def add(key: str, path: Path, category: str, original: Optional[str]) -> bool:
+        nonlocal data_size
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            print(f"  WARNING: Missing file: {path}")
+            stats['missing'] += 1
+            return False
+        
+        digest = hashlib.sha1(data).digest()
+        if digest in offsets_by_hash:
+            offset = offsets_by_hash[digest]
+            stats['deduplicated'] += 1
+        else:
+            offset = _align(data_size)
+            blobs.append((offset, data))
+            offsets_by_hash[digest] = offset
+            data_size = offset + len(data)
+        
+        index[key] = {
+            'offset': offset,
+            'length': len(data),
+            'category': category,
+            'original': original
+        }
+        return True
+    
+    for key, path, category, original in sources:
+        if key in index or not add(key, path, category, original):
+            continue
+        stats['entries'] += 1
+        
+        thumbnails = thumbnail_cache.get_thumbnails(str(path)) if category != 'fonts' else {}
+        sizes = [size for size, thumbnail in sorted(thumbnails.items())
+                 if add(thumbnail_key(key, size), Path(thumbnail), 'thumbnails', None)]
+        if sizes:
+            index[key]['thumbnails'] = sizes
+            stats['thumbnails'] += len(sizes)
+    
+    index_bytes = json.dumps(index, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    data_start = _align(HEADER_SIZE + len(index_bytes))
+    
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output.with_suffix('.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(struct.pack(HEADER_FORMAT, PACK_MAGIC, PACK_VERSION, len(index_bytes)))
+        f.write(index_bytes)
+        for offset, data in blobs:
+            f.seek(data_start + offset)
+            f.write(data)
+        f.truncate(data_start + data_size)
+    os.replace(tmp_path, output)
+    
+    stats['bytes'] = data_start + data_size
+    return stats
+
+
+def load_organized_index(index_file: Path) -> Dict[str, List[Tuple[str, str]]]:
+    """Load the image index written by organize_images.save_image_index."""
+    with open(index_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {
+        category: [(entry['original'], entry['path']) for entry in files]
+        for category, files in data.items()
+    }
+
+
+def main():
+    try:
+        from . import organize_images
+    except ImportError:
+        import organize_images
+    
+    parser = argparse.ArgumentParser(description="Build the single-file asset pack")
+    parser.add_argument('--index', type=Path, default=organize_images.TARGET_BASE / "image_index.json",
+                        help="image index written by organize_images.py")
+    parser.add_argument('--output', type=Path, default=PACK_FILE, help="pack file to write")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Asset Pack Build")
+    print("=" * 50)
+    
+    if not args.index.exists():
+        print(f"ERROR: Image index not found: {args.index}")
+        print("Run organize_images.py first.")
+        return
+    
+    print(f"\nReading {args.index}...")
+    image_index = load_organized_index(args.index)
+    
+    print("Packing assets...")
+    stats = build_pack(image_index, args.output)
+    
+    print("\nSummary:")
+    print(f"  Entries: {stats['entries']}")
+    print(f"  Thumbnails: {stats['thumbnails']}")
+    print(f"  Deduplicated: {stats['deduplicated']}")
+    print(f"  Missing: {stats['missing']}")
+    print(f"  Size: {stats['bytes']} bytes")
+    if not stats['thumbnails']:
+        print("  (no cached thumbnails - run thumbnail_cache.py first to pack them)")
+    print(f"\nAsset pack saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
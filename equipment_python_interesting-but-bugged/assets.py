@@ -5,8 +5,12 @@ Resolves image paths (local first, CDN fallback)
 
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional, Set
 import json
+try:
+    from . import thumbnail_cache, asset_pack
+except ImportError:
+    import thumbnail_cache, asset_pack
 
 # Base paths
 SCRIPT_DIR = Path(__file__).parent
@@ -17,47 +21,137 @@ INDEX_FILE = ASSETS_BASE / "image_index.json"
 # CDN fallback
 MAXROLL_CDN_BASE = "https://assets-ng.maxroll.gg/bl4-tools/assets/db/assets/"
 
+# Paths served from the asset pack look like "pack:<key>"
+PACK_PREFIX = "pack:"
+
 # Image cache (in-memory)
 _image_cache = {}
 _image_index = None
-
-
-def load_image_index():
-    """Load image index from JSON file."""
-    global _image_index
+_asset_pack = None
+_asset_pack_checked = False
+# Lowercase original filenames whose loose file is newer than the pack (served loose instead)
+_pack_overrides: Set[str] = set()
+
+
+def open_asset_pack(pack_file: Path = asset_pack.PACK_FILE) -> Optional['asset_pack.AssetPack']:
+    """Open a pack file if it exists, else None."""
+    if not pack_file.exists():
+        return None
+    try:
+        return asset_pack.AssetPack(pack_file)
+    except Exception as e:
+        print(f"WARNING: Could not open asset pack: {e}")
+        return None
+
+
+def get_asset_pack() -> Optional['asset_pack.AssetPack']:
+    """Open the asset pack once if it exists, else None (loose files are used)."""
+    global _asset_pack, _asset_pack_checked
+    
+    if _asset_pack_checked:
+        return _asset_pack
     
-    if _image_index is not None:
-        return _image_index
+    _asset_pack_checked = True
+    _asset_pack = open_asset_pack(asset_pack.PACK_FILE)
     
-    _image_index = {}
+    return _asset_pack
+
+
+def get_pack_overrides() -> Set[str]:
+    """Originals currently served from loose files although the pack has them."""
+    return set(_pack_overrides)
+
+
+def set_asset_pack(pack: Optional['asset_pack.AssetPack'], overrides: Iterable[str] = ()):
+    """Install a pack opened elsewhere (hot reload); overrides are originals to serve loose instead."""
+    global _asset_pack, _asset_pack_checked, _pack_overrides
+    _asset_pack = pack
+    _asset_pack_checked = True
+    _pack_overrides = set(overrides)
+    _image_cache.clear()
+
+
+def is_pack_path(path: str) -> bool:
+    """Check whether a resolved path refers to an asset pack entry."""
+    return path.startswith(PACK_PREFIX)
+
+
+def read_asset(path: str) -> Optional[memoryview]:
+    """Read a pack entry as a view into the mapping, or None (decoders still copy it, e.g. into a QByteArray)."""
+    pack = get_asset_pack()
+    if pack is None or not is_pack_path(path):
+        return None
+    return pack.read(path[len(PACK_PREFIX):])
+
+
+def read_image_index(index_file: Path = INDEX_FILE) -> dict:
+    """Read an image index file as a lookup: lowercase original filename -> {'path', 'category'}."""
+    index = {}
     
-    if INDEX_FILE.exists():
+    if index_file.exists():
         try:
-            with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+            with open(index_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 # Build reverse lookup: filename -> path
                 for category, files in data.items():
                     for entry in files:
                         original = entry.get('original', '').lower()
-                        path = entry.get('path', '')
+                        # Index is written on Windows - normalize separators
+                        path = entry.get('path', '').replace('\\', '/')
                         if original and path:
-                            _image_index[original] = {
+                            index[original] = {
                                 'path': path,
                                 'category': category
                             }
         except Exception as e:
             print(f"WARNING: Could not load image index: {e}")
     
+    return index
+
+
+def load_image_index():
+    """Load image index from JSON file."""
+    global _image_index
+    
+    if _image_index is None:
+        _image_index = read_image_index(INDEX_FILE)
+    
     return _image_index
 
 
-def resolve_image_path(filename: str, category: Optional[str] = None) -> str:
+def set_image_index(index: dict):
+    """Install an image index read elsewhere (hot reload)."""
+    global _image_index
+    _image_index = index
+    _image_cache.clear()
+
+
+def clear_cache():
+    """Forget the image index (INDEX_FILE is loaded again on next use)."""
+    global _image_index
+    _image_index = None
+    _image_cache.clear()
+
+
+def _serve_local(local_path: Path, size: Optional[int]) -> str:
+    """Prefer a cached thumbnail over decoding the original local file."""
+    thumbnail = thumbnail_cache.get_thumbnail_path(str(local_path), size)
+    return thumbnail if thumbnail else str(local_path)
+
+
+def resolve_image_path(filename: str, category: Optional[str] = None, size: Optional[int] = None) -> str:
     """
-    Resolve image path (local first, CDN fallback).
-    Returns local file path if exists, otherwise CDN URL.
+    Resolve image path (asset pack, then local via the thumbnail cache, then CDN fallback).
+    Returns a pack path, cached thumbnail or local file path if exists, otherwise CDN URL.
+    size selects the smallest cached thumbnail covering it (largest if None).
     """
     filename_lower = filename.lower()
     
+    # Asset pack first - no per-file stat() or open(); its packed thumbnails stand in for the cache
+    pack = get_asset_pack()
+    if pack is not None and filename_lower in pack.originals and filename_lower not in _pack_overrides:
+        return PACK_PREFIX + pack.sized_key(pack.originals[filename_lower], size)
+    
     # Load index
     index = load_image_index()
     
@@ -66,7 +160,7 @@ def resolve_image_path(filename: str, category: Optional[str] = None) -> str:
         entry = index[filename_lower]
         local_path = BASE_DIR / entry['path']
         if local_path.exists():
-            return str(local_path)
+            return _serve_local(local_path, size)
     
     # Try direct lookup in category directory
     if category:
@@ -77,7 +171,7 @@ def resolve_image_path(filename: str, category: Optional[str] = None) -> str:
                 if not test_path.suffix:
                     test_path = category_dir / f"{filename}{ext}"
                 if test_path.exists():
-                    return str(test_path)
+                    return _serve_local(test_path, size)
     
     # Fallback to CDN
     # Try to construct CDN path based on filename patterns
@@ -97,7 +191,7 @@ def resolve_image_path(filename: str, category: Optional[str] = None) -> str:
     return f"{MAXROLL_CDN_BASE}{filename}"
 
 
-def get_weapon_icon(weapon_type: str) -> str:
+def get_weapon_icon(weapon_type: str, size: Optional[int] = None) -> str:
     """Get weapon type icon path."""
     type_map = {
         'assault': 'assault.webp',
@@ -108,17 +202,17 @@ def get_weapon_icon(weapon_type: str) -> str:
         'heavy-weapon': 'heavy-weapon.webp'
     }
     filename = type_map.get(weapon_type.lower(), 'assault.webp')
-    return resolve_image_path(filename, 'weapons')
+    return resolve_image_path(filename, 'weapons', size)
 
 
-def get_manufacturer_icon(manufacturer: str, icon_type: str = 'logo') -> str:
+def get_manufacturer_icon(manufacturer: str, icon_type: str = 'logo', size: Optional[int] = None) -> str:
     """Get manufacturer icon path."""
     # icon_type: 'logo', 'banner', 'header-logo'
     filename = f"{manufacturer.lower()}-{icon_type}.webp"
-    return resolve_image_path(filename, 'manufacturers')
+    return resolve_image_path(filename, 'manufacturers', size)
 
 
-def get_item_augment_icon(manufacturer: Optional[str] = None, legendary: bool = False) -> str:
+def get_item_augment_icon(manufacturer: Optional[str] = None, legendary: bool = False, size: Optional[int] = None) -> str:
     """Get item augment icon path."""
     if legendary:
         filename = 'legendary.webp'
@@ -127,10 +221,10 @@ def get_item_augment_icon(manufacturer: Optional[str] = None, legendary: bool =
     else:
         filename = 'legendary.webp'  # Default
     
-    return resolve_image_path(filename, 'item-augments')
+    return resolve_image_path(filename, 'item-augments', size)
 
 
-def get_slot_icon(slot_type: str) -> str:
+def get_slot_icon(slot_type: str, size: Optional[int] = None) -> str:
     """Get slot type icon path."""
     type_map = {
         'repkit': 'repkit.webp',
@@ -140,5 +234,5 @@ def get_slot_icon(slot_type: str) -> str:
         'enhancement': 'enhancement.webp'
     }
     filename = type_map.get(slot_type.lower(), 'repkit.webp')
-    return resolve_image_path(filename, 'slots')
+    return resolve_image_path(filename, 'slots', size)
 
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Build Codes for Equipment Editor
+Compact, versioned, URL-safe text encoding of an equipped loadout
+"""
+
+import json
+import time
+import zlib
+import base64
+import random
+import argparse
+from typing import Dict, List, Optional
+try:
+    from . import catalog
+    from .str_weak import SLOT_IDS
+    from .item_picker import SLOT_ENTITIES, WEAPON_ICON_TYPES, item_from_row
+except ImportError:
+    import catalog
+    from str_weak import SLOT_IDS
+    from item_picker import SLOT_ENTITIES, WEAPON_ICON_TYPES, item_from_row
+
+# Layout (version 1), all integers LEB128 varints unless noted:
+#   version (1 byte), catalog fingerprint (2 bytes, little endian), filled-slot mask,
+#   then per filled slot in SLOT_IDS order:
+#     catalog row + 1 (0 = custom item, followed by subtype code + 1),
+#     packed attributes (see below), then if FLAG_AUGMENTS: count and catalog row of each.
+# Packed attributes: bits 0-2 rarity (RARITY_NONE = no rarity), bit 3 augments, bits 4-9 element (0 = none, else code + 1),
+# bits 10-17 manufacturer (0 = catalog's own, 1 = none, else code + 2).
+# An item straight from the catalog with no augments is two to four bytes.
+CODE_VERSION = 1
+RARITY_BITS = 3
+RARITY_NONE = (1 << RARITY_BITS) - 1
+FLAG_AUGMENTS = 1 << RARITY_BITS
+ELEMENT_SHIFT = RARITY_BITS + 1
+ELEMENT_BITS = 6
+MANUFACTURER_SHIFT = ELEMENT_SHIFT + ELEMENT_BITS
+MANUFACTURER_BITS = 8
+MANUFACTURER_DEFAULT = 0
+MANUFACTURER_NONE = 1
+
+# Keys a build code keeps; anything else in the slot item is dropped
+ENCODED_KEYS = ['id', 'table', 'name', 'entity', 'subtype', 'rarity', 'manufacturer', 'weaponType',
+                'element', 'augments']
+
+# Encode buffer size (grown if a build with many augments needs more)
+BUFFER_SIZE = 256
+MAX_VARINT_BYTES = 10
+
+
+def _fingerprint(item_catalog: catalog.Catalog) -> int:
+    """16-bit checksum of the catalog's ids and enums (row numbers are only valid for the same catalog)."""
+    checksum = 0
+    for row in range(len(item_catalog)):
+        checksum = zlib.crc32((item_catalog.string('id', row) or '').encode('utf-8') + b'\0', checksum)
+    checksum = zlib.crc32(json.dumps(item_catalog.enums, sort_keys=True).encode('utf-8'), checksum)
+    return checksum & 0xFFFF
+
+
+class BuildCodec:
+    """Encodes equipment (slot id -> item data) to build codes and back, against one catalog."""
+    
+    def __init__(self, item_catalog: catalog.Catalog):
+        self.catalog = item_catalog
+        self.fingerprint = _fingerprint(item_catalog)
+        self.rarity_codes = {rarity: code for code, rarity in enumerate(catalog.RARITIES)}
+        self.elements = item_catalog.enums['elements']
+        self.manufacturers = item_catalog.enums['manufacturer']
+        self.subtypes = item_catalog.enums['subtype']
+        self.element_codes = {element: code + 1 for code, element in enumerate(self.elements)}
+        self.manufacturer_codes = {value: code + 2 for code, value in enumerate(self.manufacturers)}
+        self.manufacturer_codes[None] = MANUFACTURER_NONE
+        self.subtype_codes = {value: code + 1 for code, value in enumerate(self.subtypes)}
+        if len(self.elements) >= 1 << ELEMENT_BITS or len(self.manufacturers) + 2 > 1 << MANUFACTURER_BITS:
+            raise ValueError("Too many elements or manufacturers for the build code format")
+        
+        # Decoded base items by catalog row, filled on first use
+        self._items: List[Optional[dict]] = [None] * len(item_catalog)
+        self._buffer = bytearray(BUFFER_SIZE)
+        self._data = b''
+        self._position = 0
+    
+    def _row(self, item_id: str, table: Optional[str]) -> int:
+        row = self.catalog.find(item_id, table)
+        if row < 0:
+            row = self.catalog.find(item_id)
+        if row < 0:
+            raise ValueError(f"Item not in catalog: {item_id}")
+        return row
+    
+    def encode(self, equipment: Dict[str, Optional[dict]]) -> str:
+        """Build code for equipment. Raises ValueError for items the catalog does not know."""
+        buffer = self._buffer
+        buffer[0] = CODE_VERSION
+        buffer[1] = self.fingerprint & 0xFF
+        buffer[2] = self.fingerprint >> 8
+        position = 3
+        
+        mask = 0
+        for bit, slot_id in enumerate(SLOT_IDS):
+            if equipment.get(slot_id):
+                mask |= 1 << bit
+        position = self._write(position, mask)
+        
+        for slot_id in SLOT_IDS:
+            item_data = equipment.get(slot_id)
+            if not item_data:
+                continue
+            
+            item_id = item_data.get('id')
+            if item_id:
+                row = self._row(item_id, item_data.get('table'))
+                position = self._write(position, row + 1)
+                own_manufacturer = self.catalog.enum('manufacturer', row)
+            else:
+                subtype = item_data.get('subtype')
+                if subtype not in self.subtype_codes:
+                    raise ValueError(f"Unknown subtype for custom item in {slot_id}: {subtype}")
+                position = self._write(position, 0)
+                position = self._write(position, self.subtype_codes[subtype])
+                own_manufacturer = None
+            
+            rarity = item_data.get('rarity')
+            if rarity is None:
+                packed = RARITY_NONE
+            elif rarity in self.rarity_codes:
+                packed = self.rarity_codes[rarity]
+            else:
+                raise ValueError(f"Unknown rarity in {slot_id}: {rarity}")
+            augments = item_data.get('augments')
+            if augments:
+                packed |= FLAG_AUGMENTS
+            element = item_data.get('element')
+            if element is not None:
+                if element not in self.element_codes:
+                    raise ValueError(f"Unknown element in {slot_id}: {element}")
+                packed |= self.element_codes[element] << ELEMENT_SHIFT
+            manufacturer = item_data.get('manufacturer', own_manufacturer)
+            if manufacturer != own_manufacturer:
+                if manufacturer not in self.manufacturer_codes:
+                    raise ValueError(f"Unknown manufacturer in {slot_id}: {manufacturer}")
+                packed |= self.manufacturer_codes[manufacturer] << MANUFACTURER_SHIFT
+            position = self._write(position, packed)
+            
+            if augments:
+                position = self._write(position, len(augments))
+                for augment_id in augments:
+                    position = self._write(position, self._row(augment_id, None))
+        
+        return base64.urlsafe_b64encode(memoryview(self._buffer)[:position]).rstrip(b'=').decode('ascii')
+    
+    def _write(self, position: int, value: int) -> int:
+        """Write value as a varint at position. Returns the position after it."""
+        buffer = self._buffer
+        if position + MAX_VARINT_BYTES > len(buffer):
+            buffer.extend(bytes(len(buffer)))
+        while value > 0x7F:
+            buffer[position] = (value & 0x7F) | 0x80
+            value >>= 7
+            position += 1
+        buffer[position] = value
+        return position + 1
+    
+    def decode(self, code: str) -> Dict[str, Optional[dict]]:
+        """Equipment for a build code (every slot id). Raises ValueError for invalid codes."""
+        code = code.strip()
+        try:
+            data = base64.urlsafe_b64decode(code + '=' * (-len(code) % 4))
+        except (ValueError, TypeError) as e:
+            raise ValueError(f"Not a build code: {e}") from None
+        if len(data) < 4:
+            raise ValueError("Build code is too short")
+        if data[0] != CODE_VERSION:
+            raise ValueError(f"Unsupported build code version {data[0]}")
+        if data[1] | (data[2] << 8) != self.fingerprint:
+            raise ValueError("Build code was made with a different item catalog")
+        
+        self._data = data
+        self._position = 3
+        catalog_rows = len(self._items)
+        mask = self._read()
+        
+        equipment: Dict[str, Optional[dict]] = {}
+        for bit, slot_id in enumerate(SLOT_IDS):
+            if not mask >> bit & 1:
+                equipment[slot_id] = None
+                continue
+            
+            row = self._read() - 1
+            if row >= catalog_rows:
+                raise ValueError(f"Unknown catalog row {row} in {slot_id}")
+            if row >= 0:
+                item_data = self._item(row)
+                own_manufacturer = item_data.get('manufacturer')
+            else:
+                subtype_code = self._read() - 1
+                if not 0 <= subtype_code < len(self.subtypes):
+                    raise ValueError(f"Unknown subtype code in {slot_id}")
+                subtype = self.subtypes[subtype_code]
+                item_data = {'entity': SLOT_ENTITIES.get(slot_id), 'subtype': subtype}
+                if subtype in WEAPON_ICON_TYPES:
+                    item_data['weaponType'] = WEAPON_ICON_TYPES[subtype]
+                own_manufacturer = None
+            
+            packed = self._read()
+            rarity = packed & ((1 << RARITY_BITS) - 1)
+            if rarity == RARITY_NONE:
+                item_data.pop('rarity', None)
+            elif rarity >= len(catalog.RARITIES):
+                raise ValueError(f"Unknown rarity code in {slot_id}")
+            else:
+                item_data['rarity'] = catalog.RARITIES[rarity]
+            
+            element = (packed >> ELEMENT_SHIFT) & ((1 << ELEMENT_BITS) - 1)
+            if element:
+                if element > len(self.elements):
+                    raise ValueError(f"Unknown element code in {slot_id}")
+                item_data['element'] = self.elements[element - 1]
+            
+            manufacturer = packed >> MANUFACTURER_SHIFT
+            if manufacturer == MANUFACTURER_NONE:
+                if own_manufacturer is not None:
+                    item_data['manufacturer'] = None
+            elif manufacturer != MANUFACTURER_DEFAULT:
+                if manufacturer - 2 >= len(self.manufacturers):
+                    raise ValueError(f"Unknown manufacturer code in {slot_id}")
+                item_data['manufacturer'] = self.manufacturers[manufacturer - 2]
+            
+            if packed & FLAG_AUGMENTS:
+                augments = []
+                for _ in range(self._read()):
+                    augment_row = self._read()
+                    if augment_row >= catalog_rows:
+                        raise ValueError(f"Unknown augment row {augment_row} in {slot_id}")
+                    augments.append(self.catalog.string('id', augment_row))
+                item_data['augments'] = augments
+            
+            equipment[slot_id] = item_data
+        
+        if self._position != len(data):
+            raise ValueError("Build code has trailing data")
+        return equipment
+    
+    def _read(self) -> int:
+        """Read the varint at the decode position and move past it."""
+        data = self._data
+        position = self._position
+        value = shift = 0
+        while True:
+            if position >= len(data):
+                raise ValueError("Build code is truncated")
+            byte = data[position]
+            position += 1
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if byte < 0x80:
+                break
+        self._position = position
+        return value
+    
+    def _item(self, row: int) -> dict:
+        """Fresh copy of the slot item for a catalog row (the base dict is built once)."""
+        base = self._items[row]
+        if base is None:
+            base = self._items[row] = item_from_row(self.catalog, row)
+        return dict(base)
+
+
+def normalized(item_data: Optional[dict]) -> Optional[dict]:
+    """Item data as a build code keeps it (ENCODED_KEYS, unset values dropped)."""
+    if not item_data:
+        return None
+    return {key: item_data[key] for key in ENCODED_KEYS if item_data.get(key) is not None}
+
+
+# Shared codec (built on first use)
+_codec = None
+
+
+def get_codec() -> Optional[BuildCodec]:
+    """Get the codec for the shared catalog, or None if the catalog has not been extracted."""
+    global _codec
+    
+    if _codec is None:
+        item_catalog = catalog.get_catalog()
+        if item_catalog is not None:
+            _codec = BuildCodec(item_catalog)
+    
+    return _codec
+
+
+def clear_cache():
+    """Drop the shared codec (rebuilt for the current catalog on next use)."""
+    global _codec
+    _codec = None
+
+
+def make_random_equipment(codec: BuildCodec, rng: random.Random) -> Dict[str, Optional[dict]]:
+    """Random equipment: catalog and custom items, random (or no) rarity, element, manufacturer and augments."""
+    item_catalog = codec.catalog
+    equipment = {}
+    for slot_id in SLOT_IDS:
+        roll = rng.random()
+        if roll < 0.15:
+            equipment[slot_id] = None
+            continue
+        if roll < 0.25:
+            subtype = rng.choice(codec.subtypes)
+            item_data = {'entity': SLOT_ENTITIES.get(slot_id), 'subtype': subtype}
+            if subtype in WEAPON_ICON_TYPES:
+                item_data['weaponType'] = WEAPON_ICON_TYPES[subtype]
+        else:
+            item_data = item_from_row(item_catalog, rng.randrange(len(item_catalog)))
+        item_data['rarity'] = rng.choice(catalog.RARITIES + [None])
+        if rng.random() < 0.3:
+            item_data['element'] = rng.choice(codec.elements + [None])
+        if rng.random() < 0.2:
+            item_data['manufacturer'] = rng.choice(codec.manufacturers + [None])
+        if rng.random() < 0.3:
+            item_data['augments'] = [item_catalog.string('id', rng.randrange(len(item_catalog)))
+                                     for _ in range(rng.randint(1, 4))]
+        equipment[slot_id] = item_data
+    return equipment
+
+
+def fuzz(codec: BuildCodec, count: int, seed: int = 0) -> int:
+    """Round-trip random builds and decode corrupted codes. Returns failures."""
+    rng = random.Random(seed)
+    failures = 0
+    for _ in range(count):
+        equipment = make_random_equipment(codec, rng)
+        code = codec.encode(equipment)
+        decoded = codec.decode(code)
+        if any(normalized(equipment[slot_id]) != normalized(decoded[slot_id]) for slot_id in SLOT_IDS):
+            failures += 1
+        if codec.encode(decoded) != code:
+            failures += 1
+        
+        # Damaged codes must decode to something or raise ValueError, nothing else
+        damaged = list(code)
+        damaged[rng.randrange(len(damaged))] = rng.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_')
+        for candidate in (''.join(damaged), code[:rng.randrange(len(code))]):
+            try:
+                codec.decode(candidate)
+            except ValueError:
+                pass
+            except Exception:
+                failures += 1
+    return failures
+
+
+def run_benchmark(codec: BuildCodec, count: int, seed: int = 0) -> Dict[str, float]:
+    """Encode and decode throughput (codes/s) and size against the JSON of the same builds."""
+    rng = random.Random(seed)
+    builds = [make_random_equipment(codec, rng) for _ in range(count)]
+    
+    codec.encode(builds[0])
+    start = time.perf_counter()
+    codes = [codec.encode(equipment) for equipment in builds]
+    encode_seconds = time.perf_counter() - start
+    
+    codec.decode(codes[0])
+    start = time.perf_counter()
+    for code in codes:
+        codec.decode(code)
+    decode_seconds = time.perf_counter() - start
+    
+    json_length = sum(len(json.dumps(equipment, separators=(',', ':'))) for equipment in builds)
+    code_length = sum(len(code) for code in codes)
+    return {
+        'encode_per_s': count / encode_seconds,
+        'decode_per_s': count / decode_seconds,
+        'code_chars': code_length / count,
+        'json_chars': json_length / count
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode, check and benchmark build codes")
+    parser.add_argument('code', nargs='?', help="build code to decode")
+    parser.add_argument('--fuzz', type=int, default=2000, metavar='BUILDS', help="random builds to round-trip")
+    parser.add_argument('--bench', type=int, nargs='?', const=50000, metavar='BUILDS',
+                        help="time encoding and decoding BUILDS random builds (default 50000)")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Build Codes")
+    print("=" * 50)
+    
+    codec = get_codec()
+    if codec is None:
+        print(f"ERROR: Item catalog not found: {catalog.CATALOG_FILE}")
+        return
+    
+    if args.code:
+        try:
+            equipment = codec.decode(args.code)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            return
+        for slot_id, item_data in equipment.items():
+            if item_data:
+                details = [item_data.get(key) for key in ('rarity', 'manufacturer', 'element')]
+                name = item_data.get('name') or item_data.get('subtype')
+                print(f"  {slot_id}: {name} ({', '.join(value for value in details if value)})")
+            else:
+                print(f"  {slot_id}: (empty)")
+    
+    failures = fuzz(codec, args.fuzz)
+    if failures:
+        print(f"ERROR: {failures} fuzz check(s) failed")
+    
+    if args.bench:
+        stats = run_benchmark(codec, args.bench)
+    
+    print("\nSummary:")
+    print(f"  Format version: {CODE_VERSION}, catalog fingerprint {codec.fingerprint:04x}")
+    print(f"  Fuzz builds: {args.fuzz} ({failures} failures)")
+    if args.bench:
+        print(f"  Encode: {stats['encode_per_s']:,.0f} codes/s")
+        print(f"  Decode: {stats['decode_per_s']:,.0f} codes/s")
+        print(f"  Size: {stats['code_chars']:.0f} chars per build (JSON: {stats['json_chars']:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+"""
+Build Importer for Equipment Editor
+Streams JSON / JSONL exports of web-editor builds into the loadout library, checking every item
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import itertools
+import threading
+import multiprocessing
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+try:
+    from . import catalog
+    from .str_weak import SLOT_IDS
+    from .item_picker import SLOT_ENTITIES, WEAPON_ICON_TYPES, item_from_row
+    from .loadout_library import LoadoutLibrary, LIBRARY_FILE
+except ImportError:
+    import catalog
+    from str_weak import SLOT_IDS
+    from item_picker import SLOT_ENTITIES, WEAPON_ICON_TYPES, item_from_row
+    from loadout_library import LoadoutLibrary, LIBRARY_FILE
+
+# Characters read per chunk from the export
+CHUNK_CHARS = 1 << 20
+
+# A JSON array element larger than this is treated as a syntax error (keeps a broken file from being read whole)
+MAX_RECORD_CHARS = 16 << 20
+
+# Records per worker task, and tasks queued per worker (bounds memory however large the export)
+BATCH_RECORDS = 500
+QUEUED_BATCHES = 4
+
+# Weapon slots in fill order for records given as a plain list of items
+WEAPON_SLOT_IDS = [slot_id for slot_id in SLOT_IDS if slot_id.startswith('weapon')]
+
+# Entity type -> slot id for everything but weapons (getSlotIdFromType in js/utils.js)
+ENTITY_SLOTS = {entity: slot_id for slot_id, entity in SLOT_ENTITIES.items() if not slot_id.startswith('weapon')}
+
+# Skipped around JSON array elements and commas
+ARRAY_WHITESPACE = ' \t\r\n'
+
+# Where a record came from: a JSONL line (raw text, parsed by the workers) or a parsed JSON array element
+RECORD_LINE = 'line'
+RECORD_ELEMENT = 'element'
+
+# (origin, number, line text / element / ValueError)
+Record = Tuple[str, int, Any]
+
+
+def _iter_lines(f: TextIO, first_line: str, line_number: int) -> Iterator[Record]:
+    """(RECORD_LINE, line number, raw line) for every non-blank line; lines are parsed by the workers."""
+    for number, line in enumerate(itertools.chain([first_line], f), line_number):
+        if line.strip():
+            yield RECORD_LINE, number, line
+
+
+def _iter_array(f: TextIO) -> Iterator[Record]:
+    """(RECORD_ELEMENT, element number, element) of a top-level JSON array (f is just past the '['), about one chunk in memory."""
+    decoder = json.JSONDecoder()
+    buffer = ''
+    position = 0
+    eof = False
+    number = 0
+    # After an element only ',' or ']' may follow; after a ',' only another element
+    after_element = False
+    after_comma = False
+    
+    def fill():
+        nonlocal buffer, position, eof
+        chunk = f.read(CHUNK_CHARS)
+        eof = not chunk
+        buffer = buffer[position:] + chunk
+        position = 0
+    
+    while True:
+        while position < len(buffer) and buffer[position] in ARRAY_WHITESPACE:
+            position += 1
+        if position >= len(buffer):
+            if eof:
+                yield RECORD_ELEMENT, number + 1, ValueError("Unexpected end of file (missing ']')")
+                return
+            fill()
+            continue
+        
+        char = buffer[position]
+        if char == ']' and not after_comma:
+            return
+        if after_element:
+            if char != ',':
+                yield RECORD_ELEMENT, number + 1, ValueError(f"Expected ',' or ']' after array element {number}")
+                return
+            position += 1
+            after_element = False
+            after_comma = True
+            continue
+        if char in ',]':
+            yield RECORD_ELEMENT, number + 1, ValueError(f"Expected a value at array element {number + 1}")
+            return
+        
+        try:
+            record, end = decoder.raw_decode(buffer, position)
+        except json.JSONDecodeError as e:
+            if eof or len(buffer) - position > MAX_RECORD_CHARS:
+                yield RECORD_ELEMENT, number + 1, ValueError(f"Invalid JSON: {e.msg} (array element {number + 1})")
+                return
+            # Probably cut at the chunk boundary: read more and retry
+            fill()
+            continue
+        if end >= len(buffer) and not eof:
+            # A number or literal may continue in the next chunk
+            fill()
+            continue
+        
+        number += 1
+        yield RECORD_ELEMENT, number, record
+        position = end
+        after_element = True
+        after_comma = False
+
+
+def iter_records(f: TextIO) -> Iterator[Record]:
+    """Records of an export: a JSON array of builds, or JSONL (one build per line)."""
+    line_number = 1
+    first = f.read(1)
+    while first.isspace():
+        line_number += first == '\n'
+        first = f.read(1)
+    if first == '[':
+        yield from _iter_array(f)
+    elif first:
+        yield from _iter_lines(f, first + f.readline(), line_number)
+
+
+def _known(value: Any, values: set) -> bool:
+    return isinstance(value, str) and value in values
+
+
+class BuildValidator:
+    """Checks web-editor items ({type, id, customAttr}) against the catalog and converts them to slot items."""
+    
+    def __init__(self, item_catalog: catalog.Catalog):
+        self.catalog = item_catalog
+        self.rows: Dict[Tuple[str, str], int] = {}
+        for row in range(len(item_catalog)):
+            self.rows.setdefault((item_catalog.enum('entity', row), item_catalog.string('id', row)), row)
+        self.ids = {item_id for _, item_id in self.rows}
+        self.subtypes = set(item_catalog.enums['subtype'])
+        self.manufacturers = set(item_catalog.enums['manufacturer'])
+        self.elements = set(item_catalog.enums['elements'])
+    
+    def convert_item(self, item: Any, slot_id: str, errors: List[str]) -> Optional[dict]:
+        """Slot item for one exported item, or None (with the reasons added to errors)."""
+        if not isinstance(item, dict):
+            errors.append(f"{slot_id}: item is not an object")
+            return None
+        entity = item.get('type')
+        if entity != SLOT_ENTITIES.get(slot_id):
+            errors.append(f"{slot_id}: item type {entity!r} does not fit the slot")
+            return None
+        attributes = item.get('customAttr') or {}
+        if not isinstance(attributes, dict):
+            errors.append(f"{slot_id}: customAttr is not an object")
+            return None
+        count = len(errors)
+        
+        rarity = attributes.get('rarity', 0)
+        if not isinstance(rarity, int) or isinstance(rarity, bool) or not 0 <= rarity < len(catalog.RARITIES):
+            errors.append(f"{slot_id}: invalid rarity {rarity!r}")
+        subtype = attributes.get('type')
+        if subtype is not None and not _known(subtype, self.subtypes):
+            errors.append(f"{slot_id}: unknown subtype {subtype!r}")
+        
+        item_id = item.get('id')
+        if item_id:
+            row = self.rows.get((entity, item_id), -1) if isinstance(item_id, str) else -1
+            if row < 0:
+                errors.append(f"{slot_id}: {item_id!r} is not a {entity} in the catalog")
+        elif subtype is None:
+            errors.append(f"{slot_id}: custom item has no subtype")
+        
+        manufacturer = attributes.get('manufacturerId')
+        if manufacturer is not None and not _known(manufacturer, self.manufacturers):
+            errors.append(f"{slot_id}: unknown manufacturer {manufacturer!r}")
+        element = attributes.get('elementId')
+        if element is not None and not _known(element, self.elements):
+            errors.append(f"{slot_id}: unknown element {element!r}")
+        augments = attributes.get('augmentIds') or []
+        if not isinstance(augments, list):
+            errors.append(f"{slot_id}: augmentIds is not a list")
+            augments = []
+        for augment_id in augments:
+            if not _known(augment_id, self.ids):
+                errors.append(f"{slot_id}: unknown augment {augment_id!r}")
+        
+        if len(errors) > count:
+            return None
+        
+        if item_id:
+            item_data = item_from_row(self.catalog, row)
+            if subtype is not None:
+                item_data['subtype'] = subtype
+        else:
+            item_data = {'entity': entity, 'subtype': subtype}
+        if item_data.get('subtype') in WEAPON_ICON_TYPES:
+            item_data['weaponType'] = WEAPON_ICON_TYPES[item_data['subtype']]
+        item_data['rarity'] = catalog.RARITIES[rarity]
+        if manufacturer is not None:
+            item_data['manufacturer'] = manufacturer
+        if element is not None:
+            item_data['element'] = element
+        if augments:
+            item_data['augments'] = list(augments)
+        return item_data
+    
+    def check_record(self, number: int, record: Any) -> Tuple[Optional[dict], List[str]]:
+        """
+        Library build for one record, or None with the errors. A record is
+        {"equipment": {slot id: item}, "name"?, "notes"?} (the web editor state),
+        a {slot id: item} mapping, or a list of items (weapons fill weapon1-4 in order).
+        """
+        name = f"Imported build {number}"
+        notes = ''
+        if isinstance(record, dict) and ('equipment' in record or 'items' in record):
+            name = str(record.get('name') or name)
+            notes = str(record.get('notes') or '')
+            record = record.get('equipment', record.get('items'))
+        
+        errors: List[str] = []
+        slotted: List[Tuple[str, Any]] = []
+        if isinstance(record, dict):
+            for slot_id, item in record.items():
+                if slot_id not in SLOT_ENTITIES:
+                    errors.append(f"unknown slot {slot_id!r}")
+                elif item is not None:
+                    slotted.append((slot_id, item))
+        elif isinstance(record, list):
+            weapons = iter(WEAPON_SLOT_IDS)
+            used = set()
+            for item in record:
+                entity = item.get('type') if isinstance(item, dict) else None
+                entity = entity if isinstance(entity, str) else None
+                slot_id = next(weapons, None) if entity == 'bl4-weapon' else ENTITY_SLOTS.get(entity)
+                if slot_id is None:
+                    errors.append(f"no free slot for item type {entity!r}")
+                elif slot_id in used:
+                    errors.append(f"more than one {entity} item")
+                else:
+                    used.add(slot_id)
+                    slotted.append((slot_id, item))
+        else:
+            errors.append("record is not a build object or item list")
+        
+        equipment = {slot_id: None for slot_id in SLOT_IDS}
+        for slot_id, item in slotted:
+            equipment[slot_id] = self.convert_item(item, slot_id, errors)
+        if errors:
+            return None, errors
+        if not slotted:
+            return None, ["build has no items"]
+        return {'name': name, 'notes': notes, 'equipment': equipment}, []
+
+
+# Worker state (set by _init_worker in each process)
+_validator: Optional[BuildValidator] = None
+
+
+def _init_worker(validator: Optional[BuildValidator]):
+    global _validator
+    if validator is None:
+        item_catalog = catalog.get_catalog()
+        validator = BuildValidator(item_catalog) if item_catalog is not None else None
+    _validator = validator
+
+
+def _check_batch(batch: List[Record]) -> List[Tuple[str, int, Optional[dict], List[str]]]:
+    results = []
+    for origin, number, record in batch:
+        if isinstance(record, Exception):
+            results.append((origin, number, None, [str(record)]))
+            continue
+        if origin == RECORD_LINE:
+            try:
+                record = json.loads(record)
+            except ValueError as e:
+                results.append((origin, number, None, [f"Invalid JSON: {e}"]))
+                continue
+        elif not isinstance(record, (dict, list)):
+            # Array elements are already parsed: a string element is not a build, whatever it contains
+            results.append((origin, number, None, ["array element is not a build object or item list"]))
+            continue
+        build, errors = _validator.check_record(number, record)
+        results.append((origin, number, build, errors))
+    return results
+
+
+class RecordFeed:
+    """
+    Batches of records; window, if given, is acquired before each batch (released per result).
+    Once stopped is set the feed ends at its next wait.
+    """
+    
+    def __init__(self, records: Iterable[Record], window: Optional[threading.Semaphore] = None,
+                 batch_size: int = BATCH_RECORDS):
+        self.records = records
+        self.window = window
+        self.batch_size = batch_size
+        self.count = 0
+        self.stopped = threading.Event()
+    
+    def __iter__(self) -> Iterator[List[Record]]:
+        batch = []
+        for record in self.records:
+            batch.append(record)
+            self.count += 1
+            if len(batch) >= self.batch_size:
+                if not self._wait():
+                    return
+                yield batch
+                batch = []
+        if batch and self._wait():
+            yield batch
+    
+    def _wait(self) -> bool:
+        """Wait for room in the window; False if the consumer stopped meanwhile."""
+        if self.window is not None:
+            self.window.acquire()
+        return not self.stopped.is_set()
+
+
+class ImportReport:
+    """Counts and the per-record error report (JSONL lines {"file", "origin", "record", "errors"}, written as they come)."""
+    
+    def __init__(self, report_file: Optional[TextIO] = None):
+        self.report_file = report_file
+        self.source = ''
+        self.records = 0
+        self.valid = 0
+        self.rejected = 0
+        self.errors: List[Tuple[str, str, int, List[str]]] = []
+    
+    def add(self, origin: str, number: int, errors: List[str]):
+        self.records += 1
+        if not errors:
+            self.valid += 1
+            return
+        self.rejected += 1
+        if len(self.errors) < 20:
+            self.errors.append((self.source, origin, number, errors))
+        if self.report_file is not None:
+            entry = {'file': self.source, 'origin': origin, 'record': number, 'errors': errors}
+            self.report_file.write(json.dumps(entry) + '\n')
+
+
+def check_builds(records: Iterable[Record], report: ImportReport, workers: int = 0) -> Iterator[dict]:
+    """
+    Valid builds of records, in record order, checked in worker processes
+    (0 = one per CPU, 1 = in this process). Rejected records go to report.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        if _validator is None:
+            _init_worker(None)
+        window = None
+        feed = RecordFeed(records)
+        results = map(_check_batch, feed)
+        pool = None
+    else:
+        window = threading.Semaphore(workers * QUEUED_BATCHES)
+        feed = RecordFeed(records, window)
+        pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(None,))
+        results = pool.imap(_check_batch, feed)
+    
+    try:
+        for batch in results:
+            if window is not None:
+                window.release()
+            for origin, number, build, errors in batch:
+                report.add(origin, number, errors)
+                if build is not None:
+                    yield build
+    finally:
+        if pool is not None:
+            # The pool's feed thread may be blocked on a full window: stop it and let it through
+            feed.stopped.set()
+            for _ in range(workers * QUEUED_BATCHES):
+                window.release()
+            pool.terminate()
+            pool.join()
+
+
+def import_file(path: Path, library: Optional[LoadoutLibrary], report: ImportReport,
+                workers: int = 0) -> int:
+    """Import one export (None library = check only). Returns the number of builds imported."""
+    report.source = str(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        builds = check_builds(iter_records(f), report, workers)
+        if library is None:
+            return sum(1 for _ in builds)
+        return library.import_loadouts(builds)
+
+
+def _export_item(rng: random.Random, item_catalog: catalog.Catalog, rows: List[int], entity: str) -> dict:
+    row = rng.choice(rows)
+    attributes = {'rarity': rng.randrange(len(catalog.RARITIES))}
+    if rng.random() < 0.2:
+        attributes['manufacturerId'] = rng.choice(item_catalog.enums['manufacturer'])
+    if rng.random() < 0.2:
+        attributes['elementId'] = rng.choice(item_catalog.enums['elements'])
+    return {'type': entity, 'id': item_catalog.string('id', row), 'customAttr': attributes}
+
+
+def write_sample_export(path: Path, count: int, seed: int = 0, bad_fraction: float = 0.02) -> int:
+    """Write count random JSONL builds (about bad_fraction of them invalid). Returns bytes written."""
+    rng = random.Random(seed)
+    item_catalog = catalog.get_catalog()
+    rows = {slot_id: list(item_catalog.rows(entity)) for slot_id, entity in SLOT_ENTITIES.items()}
+    with open(path, 'w', encoding='utf-8') as f:
+        for number in range(count):
+            equipment = {slot_id: _export_item(rng, item_catalog, rows[slot_id], entity)
+                         for slot_id, entity in SLOT_ENTITIES.items() if rows[slot_id]}
+            if rng.random() < bad_fraction:
+                equipment[rng.choice(list(equipment))]['id'] = 'not-an-item'
+            f.write(json.dumps({'name': f"Build {number}", 'equipment': equipment}) + '\n')
+        return f.tell()
+
+
+def _peak_memory_mb() -> float:
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import web-editor build exports (JSON array or JSONL)")
+    parser.add_argument('files', nargs='*', type=Path, help="export files")
+    parser.add_argument('--db', type=Path, default=LIBRARY_FILE, help="loadout library file")
+    parser.add_argument('--check', action='store_true', help="only validate, import nothing")
+    parser.add_argument('--report', type=Path, help="write the per-record error report (JSONL) here")
+    parser.add_argument('--workers', type=int, default=0, help="worker processes (0 = one per CPU)")
+    parser.add_argument('--bench', type=int, nargs='?', const=200000, metavar='BUILDS',
+                        help="check a generated JSONL export of BUILDS builds (default 200000)")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Build Importer")
+    print("=" * 50)
+    
+    if catalog.get_catalog() is None:
+        print(f"ERROR: Item catalog not found: {catalog.CATALOG_FILE}")
+        return
+    
+    report_file = open(args.report, 'w', encoding='utf-8') if args.report else None
+    report = ImportReport(report_file)
+    imported = 0
+    start = time.perf_counter()
+    try:
+        if args.bench:
+            with tempfile.TemporaryDirectory() as directory:
+                path = Path(directory) / "builds.jsonl"
+                size = write_sample_export(path, args.bench)
+                print(f"\nChecking {args.bench} generated builds ({size / 1e6:.0f} MB)...")
+                start = time.perf_counter()
+                import_file(path, None, report, args.workers)
+        else:
+            library = None if args.check else LoadoutLibrary(args.db)
+            try:
+                for path in args.files:
+                    print(f"\n{'Checking' if args.check else 'Importing'} {path}...")
+                    try:
+                        imported += import_file(path, library, report, args.workers)
+                    except OSError as e:
+                        print(f"ERROR: Could not read {path}: {e}")
+            finally:
+                if library is not None:
+                    library.close()
+    finally:
+        if report_file is not None:
+            report_file.close()
+    elapsed = time.perf_counter() - start
+    
+    for source, origin, number, errors in report.errors:
+        print(f"  {Path(source).name} {origin} {number}: {'; '.join(errors)}")
+    if report.rejected > len(report.errors):
+        print(f"  ... {report.rejected - len(report.errors)} more rejected record(s)")
+    
+    print("\nSummary:")
+    print(f"  Records: {report.records} ({report.valid} valid, {report.rejected} rejected)")
+    if not args.bench and not args.check:
+        print(f"  Imported: {imported} build(s) into {args.db}")
+    if report_file is not None:
+        print(f"  Error report: {args.report}")
+    if elapsed > 0 and report.records:
+        print(f"  Time: {elapsed:.1f} s ({report.records / elapsed:,.0f} records/s)")
+    print(f"  Peak memory (this process): {_peak_memory_mb():.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,506 @@
+#!/usr/bin/env python3
+"""
+Web Bundle Builder for Equipment Editor
+Bundles index.html's ES modules and stylesheets into fingerprinted, minified, precompressed files
+"""
+
+import os
+import re
+import gzip
+import json
+import shutil
+import textwrap
+import hashlib
+import argparse
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+BASE_DIR = SCRIPT_DIR.parent
+INDEX_FILE = BASE_DIR / "index.html"
+DIST_DIR = BASE_DIR / "dist"
+STATIC_DIR_NAME = "static"
+
+# Directories the bundle still loads at runtime, linked (or copied) into the output
+RUNTIME_DIRS = ["js/data", "assets"]
+
+# Fingerprint length (hex digits of sha256) - also what serve_web.py recognizes as immutable
+HASH_LENGTH = 8
+
+# Only text files this size or larger get a .gz variant
+GZIP_MIN_SIZE = 256
+
+# index.html tags
+MODULE_SCRIPT_PATTERN = re.compile(r'[ \t]*<script\s+type="module"\s+src="([^"]+)"\s*>\s*</script>[ \t]*\r?\n?')
+INLINE_MODULE_PATTERN = re.compile(r'([ \t]*)<script\s+type="module"\s*>(.*?)</script>', re.DOTALL)
+STYLESHEET_PATTERN = re.compile(r'[ \t]*<link\s+rel="stylesheet"\s+href="([^"]+)"\s*/?>[ \t]*\r?\n?')
+
+# Module syntax (top-level statements start at column 0, as everywhere in js/)
+IMPORT_PATTERN = re.compile(
+    r'^import\s*(?:(?P<default>[\w$]+)\s*,?\s*)?(?:\{(?P<names>[^}]*)\}|\*\s*as\s+(?P<namespace>[\w$]+))?'
+    r'\s*(?:from\s*)?[\'"](?P<source>[^\'"]+)[\'"]\s*;?',
+    re.MULTILINE
+)
+EXPORT_DECLARATION_PATTERN = re.compile(r'^export\s+(?=(?:async\s+function|function\*?|class|const|let|var)\s)', re.MULTILINE)
+DECLARED_NAME_PATTERN = re.compile(r'(?:async\s+function|function\*?|class|const|let|var)\s+([\w$]+)')
+EXPORT_DEFAULT_PATTERN = re.compile(r'^export\s+default\s+', re.MULTILINE)
+EXPORT_LIST_PATTERN = re.compile(r'^export\s*\{([^}]*)\}\s*;?', re.MULTILINE)
+DYNAMIC_IMPORT_PATTERN = re.compile(r'(?<![\w$.])import\(\s*(?:([\'"])([^\'"]+)\1\s*)?')
+IMPORT_META_URL = 'import.meta.url'
+CSS_URL_PATTERN = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+# Keywords after which "/" starts a regular expression rather than a division
+REGEX_KEYWORDS = {'return', 'typeof', 'instanceof', 'in', 'of', 'new', 'delete', 'void', 'throw', 'case',
+                  'do', 'else', 'yield', 'await'}
+
+
+def minify_js(source: str) -> str:
+    """
+    Drop comments, indentation, trailing spaces and blank lines; collapse runs of spaces.
+    Strings, template literals and regular expressions are copied untouched, and line breaks are
+    kept (so automatic semicolon insertion still sees them).
+    """
+    out = []
+    i = 0
+    length = len(source)
+    # One entry per open template literal: brace depth of its current ${ } expression
+    templates: List[int] = []
+    last = ''  # last significant character or word outside strings/comments
+    at_line_start = True
+    
+    def emit(text: str):
+        nonlocal at_line_start
+        out.append(text)
+        at_line_start = False
+    
+    def read_template(start: int) -> int:
+        """Copy template text from start up to the closing ` or the next ${; returns the next index."""
+        j = start
+        while j < length:
+            c = source[j]
+            if c == '\\':
+                j += 2
+                continue
+            if c == '`':
+                emit(source[start:j + 1])
+                templates.pop()
+                return j + 1
+            if c == '$' and source.startswith('${', j):
+                emit(source[start:j + 2])
+                return j + 2
+            j += 1
+        raise ValueError("Unterminated template literal")
+    
+    while i < length:
+        c = source[i]
+        
+        if c == '\n' or c == '\r':
+            if out and not at_line_start:
+                while out and out[-1] in (' ', '\t'):
+                    out.pop()
+                out.append('\n')
+                at_line_start = True
+            i += 1
+            continue
+        
+        if c in ' \t':
+            if not at_line_start and out and out[-1] != ' ':
+                out.append(' ')
+            i += 1
+            continue
+        
+        if c == '/' and source.startswith('//', i):
+            end = source.find('\n', i)
+            i = length if end < 0 else end
+            continue
+        
+        if c == '/' and source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            if end < 0:
+                raise ValueError("Unterminated comment")
+            i = end + 2
+            if out and out[-1] not in (' ', '\n'):
+                out.append(' ')
+            continue
+        
+        if c in '\'"':
+            j = i + 1
+            while j < length and source[j] != c:
+                if source[j] == '\\':
+                    j += 1
+                elif source[j] == '\n':
+                    raise ValueError("Unterminated string literal")
+                j += 1
+            emit(source[i:j + 1])
+            last = c
+            i = j + 1
+            continue
+        
+        if c == '`':
+            templates.append(0)
+            emit('`')
+            i = read_template(i + 1)
+            last = '`'
+            continue
+        
+        if c == '/' and (not last or last in '(,=:[!&|?{};+-*%<>~^' or last in REGEX_KEYWORDS):
+            j = i + 1
+            in_class = False
+            while j < length:
+                d = source[j]
+                if d == '\\':
+                    j += 2
+                    continue
+                if d == '\n':
+                    raise ValueError("Unterminated regular expression")
+                if d == '[':
+                    in_class = True
+                elif d == ']':
+                    in_class = False
+                elif d == '/' and not in_class:
+                    break
+                j += 1
+            j += 1
+            while j < length and (source[j].isalnum()):
+                j += 1
+            emit(source[i:j])
+            last = ')'
+            i = j
+            continue
+        
+        if templates and c == '{':
+            templates[-1] += 1
+        elif templates and c == '}':
+            if templates[-1] == 0:
+                # End of a ${ } expression - back into the template text
+                emit('}')
+                i = read_template(i + 1)
+                last = '`'
+                continue
+            templates[-1] -= 1
+        
+        if c.isalnum() or c in '_$':
+            j = i
+            while j < length and (source[j].isalnum() or source[j] in '_$'):
+                j += 1
+            word = source[i:j]
+            emit(word)
+            last = word if word in REGEX_KEYWORDS else 'a'
+            i = j
+            continue
+        
+        emit(c)
+        last = c
+        i += 1
+    
+    return ''.join(out).strip() + '\n'
+
+
+def minify_css(source: str) -> str:
+    """Drop comments and collapse whitespace around { } ; , and after ":" (strings are kept)."""
+    parts = re.split(r'("(?:[^"\\]|\\.)*"|\'(?:[^\'\\]|\\.)*\')', source)
+    for index in range(0, len(parts), 2):
+        text = re.sub(r'/\*.*?\*/', '', parts[index], flags=re.DOTALL)
+        text = re.sub(r'\s+', ' ', text)
+        text = re.sub(r'\s*([{};,])\s*', r'\1', text)
+        text = re.sub(r':\s+', ':', text)
+        parts[index] = text.replace(';}', '}')
+    return ''.join(parts).strip() + '\n'
+
+
+def _parse_names(names: str) -> List[Tuple[str, str]]:
+    """'a, b as c' -> [('a', 'a'), ('b', 'c')] (exported name, local name)."""
+    pairs = []
+    for part in names.split(','):
+        part = part.strip()
+        if part:
+            exported, _, local = part.partition(' as ')
+            pairs.append((exported.strip(), (local or exported).strip()))
+    return pairs
+
+
+class Module:
+    """One ES module of the graph: its source, static dependencies and exports."""
+    
+    def __init__(self, key: str, path: Optional[Path], source: str):
+        self.key = key  # path relative to BASE_DIR ('js/utils.js'), or 'index.html' for the inline script
+        self.path = path
+        self.source = source
+        self.dependencies: List[str] = []
+        self.dynamic: Set[str] = set()
+    
+    @property
+    def directory(self) -> str:
+        return os.path.dirname(self.key)
+
+
+class ModuleGraph:
+    """Module graph of index.html: script entries in document order, then the inline module."""
+    
+    def __init__(self, base_dir: Path = BASE_DIR):
+        self.base_dir = base_dir
+        self.modules: Dict[str, Module] = {}
+        self.order: List[str] = []  # dependencies before dependents (evaluation order)
+        self._visiting: Set[str] = set()
+    
+    def resolve(self, directory: str, specifier: str) -> Optional[str]:
+        """Graph key of a relative specifier, or None for URLs and bare specifiers."""
+        if not specifier.startswith(('./', '../')):
+            return None
+        return os.path.normpath(os.path.join(directory, specifier)).replace('\\', '/')
+    
+    def add(self, key: str, source: Optional[str] = None) -> Module:
+        """Add a module and (depth first) everything it imports statically."""
+        if key in self.modules:
+            return self.modules[key]
+        if key in self._visiting:
+            raise ValueError(f"Circular import of {key} (not supported by the bundle loader)")
+        self._visiting.add(key)
+        
+        path = None
+        if source is None:
+            path = self.base_dir / key
+            source = path.read_text(encoding='utf-8')
+        module = Module(key, path, source)
+        
+        for match in IMPORT_PATTERN.finditer(source):
+            dependency = self.resolve(module.directory, match.group('source'))
+            if dependency is None:
+                raise ValueError(f"{key}: cannot bundle import of {match.group('source')}")
+            module.dependencies.append(dependency)
+            self.add(dependency)
+        for match in DYNAMIC_IMPORT_PATTERN.finditer(source):
+            if match.group(2):
+                dependency = self.resolve(module.directory, match.group(2))
+                if dependency is not None and (self.base_dir / dependency).exists():
+                    module.dynamic.add(dependency)
+        
+        self._visiting.discard(key)
+        self.modules[key] = module
+        self.order.append(key)
+        return module
+    
+    def add_dynamic(self):
+        """Add modules that are only imported dynamically (they are bundled too, and resolve instantly)."""
+        pending = [key for module in list(self.modules.values()) for key in module.dynamic]
+        for key in pending:
+            if key not in self.modules:
+                self.add(key)
+
+
+def wrap_module(module: Module, graph: ModuleGraph, bundle_dir: str) -> str:
+    """Module source as a registry entry: imports read from the registry, exports returned."""
+    source = module.source
+    exports: List[Tuple[str, str]] = []
+    
+    def import_replacement(match: re.Match) -> str:
+        dependency = f'__modules[{json.dumps(graph.resolve(module.directory, match.group("source")))}]'
+        lines = []
+        if match.group('default'):
+            lines.append(f"const {match.group('default')} = {dependency}.default;")
+        if match.group('names') is not None:
+            names = ', '.join(exported if exported == local else f"{exported}: {local}"
+                              for exported, local in _parse_names(match.group('names')))
+            lines.append(f"const {{ {names} }} = {dependency};")
+        if match.group('namespace'):
+            lines.append(f"const {match.group('namespace')} = {dependency};")
+        return ' '.join(lines)
+    
+    source = IMPORT_PATTERN.sub(import_replacement, source)
+    
+    for match in EXPORT_DECLARATION_PATTERN.finditer(source):
+        name = DECLARED_NAME_PATTERN.match(source, match.end())
+        exports.append((name.group(1), name.group(1)))
+    source = EXPORT_DECLARATION_PATTERN.sub('', source)
+    
+    def export_list_replacement(match: re.Match) -> str:
+        exports.extend((exported, local) for local, exported in _parse_names(match.group(1)))
+        return ''
+    
+    source = EXPORT_LIST_PATTERN.sub(export_list_replacement, source)
+    
+    match = EXPORT_DEFAULT_PATTERN.search(source)
+    if match:
+        declared = DECLARED_NAME_PATTERN.match(source, match.end())
+        if declared:
+            source = source[:match.start()] + source[match.end():]
+            exports.append(('default', declared.group(1)))
+        else:
+            source = source[:match.start()] + 'const __default = ' + source[match.end():]
+            exports.append(('default', '__default'))
+    
+    # Dynamic imports: bundled modules resolve from the registry, anything else relative to the original file
+    uses_import = False
+    
+    def dynamic_replacement(match: re.Match) -> str:
+        nonlocal uses_import
+        if match.group(2):
+            dependency = graph.resolve(module.directory, match.group(2))
+            if dependency in graph.modules:
+                return f'Promise.resolve(__modules[{json.dumps(dependency)}]'
+        uses_import = True
+        return '__import(' + match.group(0)[len('import('):]
+    
+    source = DYNAMIC_IMPORT_PATTERN.sub(dynamic_replacement, source)
+    uses_url = uses_import or IMPORT_META_URL in source
+    source = source.replace(IMPORT_META_URL, '__url')
+    
+    header = ''
+    if uses_url:
+        original = os.path.relpath(module.key, bundle_dir).replace('\\', '/')
+        header = f'const __url = new URL({json.dumps(original)}, import.meta.url).href;\n'
+    if uses_import:
+        header += 'const __import = (specifier) => import(new URL(specifier, __url).href);\n'
+    returned = ', '.join(name if name == local else f"{name}: {local}" for name, local in exports)
+    return (f"// {module.key}\n__modules[{json.dumps(module.key)}] = (() => {{\n"
+            f"{header}{source}\nreturn {{ {returned} }};\n}})();\n")
+
+
+def fingerprinted_name(stem: str, data: bytes, suffix: str) -> str:
+    """name.<hash>.ext - served with immutable caching by serve_web.py."""
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{suffix}"
+
+
+def write_output(path: Path, data: bytes) -> List[Path]:
+    """Write a file and its precompressed .gz variant (if worth it). Returns the written paths."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    written = [path]
+    if len(data) >= GZIP_MIN_SIZE:
+        compressed = gzip.compress(data, 9, mtime=0)
+        if len(compressed) < len(data):
+            gzip_path = path.with_name(path.name + '.gz')
+            gzip_path.write_bytes(compressed)
+            written.append(gzip_path)
+    return written
+
+
+def _link_runtime_dir(base_dir: Path, output_dir: Path, relative: str):
+    """Make a directory the bundle loads at runtime available in the output (symlink, else copy)."""
+    source = base_dir / relative
+    target = output_dir / relative
+    if not source.exists():
+        return
+    if target.is_symlink() or target.is_file():
+        target.unlink()
+    elif target.exists():
+        shutil.rmtree(target)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        target.symlink_to(os.path.relpath(source, target.parent), target_is_directory=True)
+    except OSError:
+        shutil.copytree(source, target)
+
+
+def _gzip_size(data: bytes) -> int:
+    return len(gzip.compress(data, 9, mtime=0))
+
+
+def build(index_file: Path = INDEX_FILE, output_dir: Path = DIST_DIR) -> Dict[str, int]:
+    """Build output_dir/index.html plus bundles. Returns before/after request counts and sizes."""
+    base_dir = index_file.parent
+    html = index_file.read_text(encoding='utf-8')
+    static_dir = output_dir / STATIC_DIR_NAME
+    
+    # JavaScript: script entries in document order, then the inline module
+    graph = ModuleGraph(base_dir)
+    for src in MODULE_SCRIPT_PATTERN.findall(html):
+        graph.add(graph.resolve('', src if src.startswith(('./', '../')) else './' + src))
+    inline = INLINE_MODULE_PATTERN.search(html)
+    if inline:
+        graph.add(index_file.name, textwrap.dedent(inline.group(2)))
+    graph.add_dynamic()
+    
+    bundle_source = "const __modules = {};\n" + ''.join(
+        wrap_module(graph.modules[key], graph, STATIC_DIR_NAME) for key in graph.order
+    )
+    js_data = minify_js(bundle_source).encode('utf-8')
+    
+    # CSS: linked local stylesheets in order; url()s rewritten relative to the bundle
+    stylesheets = [href for href in STYLESHEET_PATTERN.findall(html) if not href.startswith(('http:', 'https:', '//'))]
+    css_parts = []
+    for href in stylesheets:
+        css_dir = os.path.dirname(href)
+        
+        def rebase(match: re.Match) -> str:
+            url = match.group(2)
+            if url.startswith(('data:', 'http:', 'https:', '/', '#')):
+                return match.group(0)
+            rebased = os.path.relpath(os.path.normpath(os.path.join(css_dir, url)), STATIC_DIR_NAME)
+            return f'url({match.group(1)}{rebased.replace(os.sep, "/")}{match.group(1)})'
+        
+        css_parts.append(CSS_URL_PATTERN.sub(rebase, (base_dir / href).read_text(encoding='utf-8')))
+    css_data = minify_css('\n'.join(css_parts)).encode('utf-8')
+    
+    # Fresh static dir: old fingerprints are unreferenced
+    if static_dir.exists():
+        shutil.rmtree(static_dir)
+    js_name = fingerprinted_name('app', js_data, '.js')
+    css_name = fingerprinted_name('app', css_data, '.css')
+    written = write_output(static_dir / js_name, js_data) + write_output(static_dir / css_name, css_data)
+    
+    # Page: one stylesheet link where the first was, one module script where the first script was
+    first_link = True
+    
+    def replace_link(match: re.Match) -> str:
+        nonlocal first_link
+        if match.group(1) not in stylesheets:
+            return match.group(0)
+        if first_link:
+            first_link = False
+            return f'    <link rel="stylesheet" href="{STATIC_DIR_NAME}/{css_name}">\n'
+        return ''
+    
+    page = STYLESHEET_PATTERN.sub(replace_link, html)
+    page = MODULE_SCRIPT_PATTERN.sub('', page)
+    page = INLINE_MODULE_PATTERN.sub(
+        lambda match: f'{match.group(1)}<script type="module" src="{STATIC_DIR_NAME}/{js_name}"></script>', page)
+    page_data = page.encode('utf-8')
+    written += write_output(output_dir / index_file.name, page_data)
+    
+    for relative in RUNTIME_DIRS:
+        _link_runtime_dir(base_dir, output_dir, relative)
+    
+    # Report: every module and stylesheet was one request before
+    before_files = [base_dir / key for key in graph.order if key != index_file.name]
+    before_files += [base_dir / href for href in stylesheets]
+    before_data = [path.read_bytes() for path in before_files] + [html.encode('utf-8')]
+    return {
+        'modules': len(graph.order),
+        'stylesheets': len(stylesheets),
+        'requests_before': len(before_data),
+        'requests_after': 3,
+        'bytes_before': sum(len(data) for data in before_data),
+        'bytes_after': len(js_data) + len(css_data) + len(page_data),
+        'gzip_bytes_before': sum(_gzip_size(data) for data in before_data),
+        'gzip_bytes_after': _gzip_size(js_data) + _gzip_size(css_data) + _gzip_size(page_data),
+        'files': len(written)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bundle index.html for deployment")
+    parser.add_argument('--index', type=Path, default=INDEX_FILE, help="page to bundle")
+    parser.add_argument('--output', type=Path, default=DIST_DIR, help="output directory")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Web Bundle Builder")
+    print("=" * 50)
+    
+    try:
+        results = build(args.index, args.output)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Build failed: {e}")
+        return
+    
+    print(f"\nBundled {results['modules']} modules and {results['stylesheets']} stylesheets")
+    print("\nSummary:")
+    print(f"  Requests: {results['requests_before']} -> {results['requests_after']}")
+    print(f"  Size: {results['bytes_before'] / 1024:.1f} KB -> {results['bytes_after'] / 1024:.1f} KB")
+    print(f"  Gzipped: {results['gzip_bytes_before'] / 1024:.1f} KB -> {results['gzip_bytes_after'] / 1024:.1f} KB")
+    print(f"  Files written: {results['files']} (to {args.output})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""
+Item Catalog for Equipment Editor
+Columnar, array-backed store of every item record extracted from the game data chunk
+"""
+
+import os
+import sys
+import json
+import struct
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Iterable
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+CATALOG_FILE = SCRIPT_DIR / "data" / "catalog.bin"
+GAME_DATA_FILE = SCRIPT_DIR / "data" / "game_data.json"
+
+# Entity types (same ids as ENTITY_TYPES in js/game-data.js, plus augments and firmware)
+ENTITY_TYPES = [
+    'bl4-weapon',
+    'bl4-repkit',
+    'bl4-ordnance',
+    'bl4-class-mod',
+    'bl4-shield',
+    'bl4-enhancement',
+    'bl4-augment',
+    'bl4-firmware'
+]
+
+# Rarities by level (RARITY_MAP in js/game-data.js, colors as used by styles.RARITY_COLORS)
+RARITIES = ['gray', 'green', 'blue', 'purple', 'orange']
+
+# Column kinds: interned strings (index into the string table), enum codes, bitmasks.
+# -1 means "not set" for string and enum columns.
+STRING_COLUMNS = ['id', 'name', 'description', 'icon', 'table']
+ENUM_COLUMNS = ['entity', 'subtype', 'source', 'manufacturer', 'character', 'rarity']
+MASK_COLUMNS = ['elements']
+COLUMN_TYPECODES = {
+    **{name: 'i' for name in STRING_COLUMNS},
+    **{name: 'b' for name in ENUM_COLUMNS},
+    **{name: 'I' for name in MASK_COLUMNS}
+}
+ENUM_LIMITS = {
+    **{name: 127 for name in ENUM_COLUMNS},
+    **{name: 32 for name in MASK_COLUMNS}
+}
+
+# File layout: header, JSON schema, then 8-byte aligned sections
+# (one per column, then string offsets, then the UTF-8 string blob)
+CATALOG_MAGIC = b'BLCT'
+CATALOG_VERSION = 1
+HEADER_FORMAT = '<4sHxxI'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+SECTION_ALIGNMENT = 8
+
+
+def _align(value: int) -> int:
+    """Round value up to the next SECTION_ALIGNMENT boundary."""
+    return (value + SECTION_ALIGNMENT - 1) // SECTION_ALIGNMENT * SECTION_ALIGNMENT
+
+
+class StringTable:
+    """Interned strings stored as one UTF-8 blob plus an offsets array."""
+    
+    def __init__(self, blob: bytes = b'', offsets: Optional[array] = None):
+        self.blob = blob
+        self.offsets = offsets if offsets is not None else array('I', [0])
+    
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+    
+    def get(self, index: int) -> Optional[str]:
+        """Get string by index (None for -1)."""
+        if index < 0:
+            return None
+        return self.blob[self.offsets[index]:self.offsets[index + 1]].decode('utf-8')
+
+
+class Catalog:
+    """
+    Item catalog with one typed array per column.
+    Records are never materialized unless record() is called.
+    """
+    
+    def __init__(self, columns: Dict[str, array], enums: Dict[str, List[str]], strings: StringTable):
+        self.columns = columns
+        self.enums = enums
+        self.strings = strings
+        self._enum_codes = {
+            name: {value: code for code, value in enumerate(values)}
+            for name, values in enums.items()
+        }
+        self._id_index = None
+    
+    def __len__(self) -> int:
+        return len(self.columns['id'])
+    
+    def string(self, column: str, row: int) -> Optional[str]:
+        """Get a string column value."""
+        return self.strings.get(self.columns[column][row])
+    
+    def enum(self, column: str, row: int) -> Optional[str]:
+        """Get an enum column value."""
+        code = self.columns[column][row]
+        if code < 0:
+            return None
+        return self.enums[column][code]
+    
+    def code(self, column: str, value: Optional[str]) -> int:
+        """Get the integer code of an enum value (-1 if unknown)."""
+        if value is None:
+            return -1
+        return self._enum_codes[column].get(value, -1)
+    
+    def elements(self, row: int) -> List[str]:
+        """Get element ids for a row."""
+        mask = self.columns['elements'][row]
+        return [element for bit, element in enumerate(self.enums['elements']) if mask & (1 << bit)]
+    
+    def find(self, item_id: str, table: Optional[str] = None) -> int:
+        """Get row of an item id (optionally within a source table), or -1."""
+        if self._id_index is None:
+            # Built on first lookup only: (id, table) -> row
+            self._id_index = {}
+            for row in range(len(self)):
+                key = (self.string('id', row), self.string('table', row))
+                self._id_index.setdefault(key, row)
+                self._id_index.setdefault((key[0], None), row)
+        return self._id_index.get((item_id, table), -1)
+    
+    def record(self, row: int) -> dict:
+        """Materialize one row as a dict."""
+        record = {name: self.string(name, row) for name in STRING_COLUMNS}
+        record.update({name: self.enum(name, row) for name in ENUM_COLUMNS})
+        record['elements'] = self.elements(row)
+        return record
+    
+    def rows(self, entity: Optional[str] = None) -> Iterable[int]:
+        """Iterate row numbers, optionally only for one entity type."""
+        if entity is None:
+            return range(len(self))
+        code = self.code('entity', entity)
+        column = self.columns['entity']
+        return (row for row in range(len(self)) if column[row] == code)
+    
+    def save(self, path: Path = CATALOG_FILE):
+        """Save catalog to a binary file, replacing it atomically (readers never see half a file)."""
+        sections = [self.columns[name] for name in COLUMN_TYPECODES]
+        sections.append(self.strings.offsets)
+        
+        schema = {
+            'rows': len(self),
+            'columns': [[name, COLUMN_TYPECODES[name], self.columns[name].itemsize] for name in COLUMN_TYPECODES],
+            'enums': self.enums,
+            'strings': len(self.strings),
+            'blob': len(self.strings.blob)
+        }
+        schema_bytes = json.dumps(schema, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(struct.pack(HEADER_FORMAT, CATALOG_MAGIC, CATALOG_VERSION, len(schema_bytes)))
+            f.write(schema_bytes)
+            for section in sections:
+                data = section.tobytes() if sys.byteorder == 'little' else _swapped(section).tobytes()
+                f.write(b'\0' * (_align(f.tell()) - f.tell()))
+                f.write(data)
+            f.write(b'\0' * (_align(f.tell()) - f.tell()))
+            f.write(self.strings.blob)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: Path = CATALOG_FILE) -> 'Catalog':
+        """Load catalog from a binary file (one array per column, no per-record objects)."""
+        with open(path, 'rb') as f:
+            data = f.read()
+        view = memoryview(data)
+        
+        magic, version, schema_size = struct.unpack_from(HEADER_FORMAT, data, 0)
+        if magic != CATALOG_MAGIC:
+            raise ValueError(f"Not a catalog file: {path}")
+        if version != CATALOG_VERSION:
+            raise ValueError(f"Unsupported catalog version {version}: {path}")
+        schema = json.loads(bytes(view[HEADER_SIZE:HEADER_SIZE + schema_size]))
+        
+        position = HEADER_SIZE + schema_size
+        rows = schema['rows']
+        
+        def read_array(typecode: str, count: int) -> array:
+            nonlocal position
+            position = _align(position)
+            values = array(typecode)
+            end = position + count * values.itemsize
+            values.frombytes(view[position:end])
+            if sys.byteorder != 'little':
+                values.byteswap()
+            position = end
+            return values
+        
+        columns = {name: read_array(typecode, rows) for name, typecode, _ in schema['columns']}
+        offsets = read_array('I', schema['strings'] + 1)
+        position = _align(position)
+        blob = bytes(view[position:position + schema['blob']])
+        
+        return cls(columns, schema['enums'], StringTable(blob, offsets))
+
+
+def _swapped(values: array) -> array:
+    """Byte-swapped copy of an array (files are little endian)."""
+    copy = array(values.typecode, values)
+    copy.byteswap()
+    return copy
+
+
+class CatalogBuilder:
+    """Accumulates records into columns, interning strings and enum values."""
+    
+    def __init__(self, enums: Optional[Dict[str, List[str]]] = None):
+        self.columns = {name: array(typecode) for name, typecode in COLUMN_TYPECODES.items()}
+        self.enums = {name: [] for name in ENUM_COLUMNS + MASK_COLUMNS}
+        self.enums['entity'] = list(ENTITY_TYPES)
+        self.enums['rarity'] = list(RARITIES)
+        for name, values in (enums or {}).items():
+            self.enums[name] = list(values)
+        self._enum_codes = {
+            name: {value: code for code, value in enumerate(values)}
+            for name, values in self.enums.items()
+        }
+        self._strings = {}
+        self._blob = bytearray()
+        self._offsets = array('I', [0])
+    
+    def _intern(self, text: Optional[str]) -> int:
+        if text is None:
+            return -1
+        index = self._strings.get(text)
+        if index is None:
+            index = len(self._strings)
+            self._strings[text] = index
+            self._blob += text.encode('utf-8')
+            self._offsets.append(len(self._blob))
+        return index
+    
+    def _code(self, column: str, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        codes = self._enum_codes[column]
+        if value not in codes:
+            if len(codes) >= ENUM_LIMITS[column]:
+                raise ValueError(f"Too many {column} values for the catalog format")
+            codes[value] = len(self.enums[column])
+            self.enums[column].append(value)
+        return codes[value]
+    
+    def add(self, record: dict):
+        """Add one record (keys: STRING_COLUMNS, ENUM_COLUMNS, 'elements' list)."""
+        for name in STRING_COLUMNS:
+            self.columns[name].append(self._intern(record.get(name)))
+        for name in ENUM_COLUMNS:
+            self.columns[name].append(self._code(name, record.get(name)))
+        mask = 0
+        for element in record.get('elements') or []:
+            mask |= 1 << self._code('elements', element)
+        self.columns['elements'].append(mask)
+    
+    def build(self) -> Catalog:
+        """Get the finished catalog."""
+        return Catalog(self.columns, self.enums, StringTable(bytes(self._blob), self._offsets))
+
+
+# Shared catalog (loaded on first use)
+_catalog = None
+
+
+def get_catalog() -> Optional[Catalog]:
+    """Load catalog from CATALOG_FILE once, or None if it has not been extracted."""
+    global _catalog
+    
+    if _catalog is not None:
+        return _catalog
+    
+    if CATALOG_FILE.exists():
+        try:
+            _catalog = Catalog.load(CATALOG_FILE)
+        except Exception as e:
+            print(f"WARNING: Could not load item catalog: {e}")
+    
+    return _catalog
+
+
+def set_catalog(item_catalog: Optional[Catalog]):
+    """Install an already loaded catalog as the shared one (hot reload)."""
+    global _catalog
+    _catalog = item_catalog
+
+
+def clear_cache():
+    """Forget the shared catalog (CATALOG_FILE is loaded again on next use)."""
+    global _catalog
+    _catalog = None
+
+
+def load_game_data(path: Path = GAME_DATA_FILE) -> dict:
+    """Load game data written by extract_game_data.py (empty if missing)."""
+    if path.exists():
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"WARNING: Could not load game data: {e}")
+    return {}
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Catalog Query for Equipment Editor
+Bitmap-indexed faceted filtering (rarity x manufacturer x element x subtype) with live counts
+"""
+
+import time
+import random
+import argparse
+from typing import Dict, List, Optional, Iterable, Iterator
+try:
+    from . import catalog
+except ImportError:
+    import catalog
+
+# Facets indexed by default: facet -> catalog column
+FACETS = {
+    'entity': 'entity',
+    'subtype': 'subtype',
+    'rarity': 'rarity',
+    'manufacturer': 'manufacturer',
+    'element': 'elements',
+    'source': 'source',
+    'character': 'character'
+}
+
+# Display names (RARITY_MAP, WEAPON_TYPES, ORDNANCE_TYPES, SHIELD_TYPES in js/game-data.js)
+RARITY_NAMES = {
+    'gray': 'Common',
+    'green': 'Uncommon',
+    'blue': 'Rare',
+    'purple': 'Epic',
+    'orange': 'Legendary'
+}
+
+SUBTYPE_NAMES = {
+    'ar': 'Assault Rifle',
+    'pistol': 'Pistol',
+    'smg': 'SMG',
+    'shotgun': 'Shotgun',
+    'sniper': 'Sniper Rifle',
+    'repkit': 'Repkit',
+    'grenade': 'Grenade',
+    'heavy-weapon': 'Heavy Weapon',
+    'class-mod': 'Class Mod',
+    'energy': 'Energy',
+    'armor': 'Armor',
+    'enhancement': 'Enhancement'
+}
+
+# Bit positions set in each byte value, for walking bitmaps a byte at a time
+_BYTE_BITS = [tuple(bit for bit in range(8) if value & (1 << bit)) for value in range(256)]
+
+
+def iter_bits(bitmap: int) -> Iterator[int]:
+    """Iterate set bit positions (row numbers) in ascending order."""
+    if not bitmap:
+        return
+    data = bitmap.to_bytes((bitmap.bit_length() + 7) // 8, 'little')
+    for index, value in enumerate(data):
+        if value:
+            base = index * 8
+            for bit in _BYTE_BITS[value]:
+                yield base + bit
+
+
+class QueryResult:
+    """Rows matching a query, plus per-value counts for every facet."""
+    
+    def __init__(self, index: 'FacetIndex', bitmap: int, counts: Dict[str, Dict[str, int]]):
+        self.index = index
+        self.bitmap = bitmap
+        self.counts = counts
+    
+    def __len__(self) -> int:
+        return self.bitmap.bit_count()
+    
+    def rows(self, offset: int = 0, limit: Optional[int] = None) -> List[int]:
+        """Get matching row numbers (one page if limit is given)."""
+        result = []
+        for position, row in enumerate(iter_bits(self.bitmap)):
+            if position < offset:
+                continue
+            if limit is not None and len(result) >= limit:
+                break
+            result.append(row)
+        return result
+    
+    def ids(self, offset: int = 0, limit: Optional[int] = None) -> List[str]:
+        """Get matching item ids."""
+        item_catalog = self.index.catalog
+        return [item_catalog.string('id', row) for row in self.rows(offset, limit)]
+
+
+class FacetIndex:
+    """
+    One bitmap (Python int, bit n = catalog row n) per facet value.
+    Values within a facet are OR-ed, facets are AND-ed together.
+    """
+    
+    def __init__(self, item_catalog: catalog.Catalog, facets: Optional[Dict[str, str]] = None):
+        self.catalog = item_catalog
+        self.facets = dict(facets or FACETS)
+        self.all_rows = (1 << len(item_catalog)) - 1
+        self.bitmaps: Dict[str, Dict[str, int]] = {}
+        
+        for facet, column in self.facets.items():
+            values = item_catalog.enums[column]
+            codes = item_catalog.columns[column]
+            bits = [[] for _ in values]
+            if column in catalog.MASK_COLUMNS:
+                for row, mask in enumerate(codes):
+                    while mask:
+                        low = mask & -mask
+                        bits[low.bit_length() - 1].append(row)
+                        mask ^= low
+            else:
+                for row, code in enumerate(codes):
+                    if code >= 0:
+                        bits[code].append(row)
+            self.bitmaps[facet] = {
+                value: _bitmap_from_rows(rows) for value, rows in zip(values, bits) if rows
+            }
+    
+    def values(self, facet: str) -> List[str]:
+        """Get the indexed values of a facet."""
+        return list(self.bitmaps[facet])
+    
+    def facet_bitmap(self, facet: str, values: Iterable[str]) -> int:
+        """OR of the bitmaps for the selected values of one facet."""
+        bitmap = 0
+        value_bitmaps = self.bitmaps[facet]
+        for value in values:
+            bitmap |= value_bitmaps.get(value, 0)
+        return bitmap
+    
+    def query(self, selection: Optional[Dict[str, Iterable[str]]] = None, counts: bool = True) -> QueryResult:
+        """
+        Resolve a selection (facet -> accepted values; empty/missing = any).
+        Counts for a facet are computed against the other facets only,
+        so they show how many rows each value would give if picked.
+        """
+        selected = {
+            facet: self.facet_bitmap(facet, values)
+            for facet, values in (selection or {}).items() if values
+        }
+        
+        bitmap = self.all_rows
+        for facet_bitmap in selected.values():
+            bitmap &= facet_bitmap
+        
+        facet_counts = {}
+        if counts:
+            for facet, value_bitmaps in self.bitmaps.items():
+                if facet in selected:
+                    others = self.all_rows
+                    for other, facet_bitmap in selected.items():
+                        if other != facet:
+                            others &= facet_bitmap
+                else:
+                    others = bitmap
+                facet_counts[facet] = {
+                    value: (others & value_bitmap).bit_count()
+                    for value, value_bitmap in value_bitmaps.items()
+                }
+        
+        return QueryResult(self, bitmap, facet_counts)
+
+
+def _bitmap_from_rows(rows: List[int]) -> int:
+    """Build a bitmap from ascending row numbers."""
+    data = bytearray((rows[-1] >> 3) + 1)
+    for row in rows:
+        data[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(data, 'little')
+
+
+# Shared index over the shared catalog (built on first use)
+_facet_index = None
+
+
+def get_facet_index() -> Optional[FacetIndex]:
+    """Get the facet index for catalog.get_catalog(), or None if there is no catalog."""
+    global _facet_index
+    
+    if _facet_index is not None:
+        return _facet_index
+    
+    item_catalog = catalog.get_catalog()
+    if item_catalog is not None:
+        _facet_index = FacetIndex(item_catalog)
+    
+    return _facet_index
+
+
+def set_facet_index(index: Optional[FacetIndex]):
+    """Install a facet index built elsewhere (e.g. by hot_reload.py off the GUI thread)."""
+    global _facet_index
+    _facet_index = index
+
+
+def clear_cache():
+    """Drop the shared facet index (rebuilt for the current catalog on next use)."""
+    global _facet_index
+    _facet_index = None
+
+
+def make_synthetic_catalog(base: catalog.Catalog, count: int, seed: int = 0) -> catalog.Catalog:
+    """Catalog of count rows sampled from base rows, with randomized rarity."""
+    rng = random.Random(seed)
+    builder = catalog.CatalogBuilder({name: base.enums[name] for name in ('manufacturer', 'elements', 'character')})
+    records = [base.record(row) for row in range(len(base))]
+    for number in range(count):
+        record = dict(rng.choice(records))
+        record['id'] = f"{record['id']}#{number}"
+        record['rarity'] = rng.choice(catalog.RARITIES)
+        builder.add(record)
+    return builder.build()
+
+
+def run_benchmark(index: FacetIndex, queries: int = 1000, seed: int = 0) -> Dict[str, float]:
+    """Time random 1-4 facet queries with counts. Returns microseconds per query."""
+    rng = random.Random(seed)
+    facets = ['rarity', 'manufacturer', 'element', 'subtype']
+    selections = []
+    for _ in range(queries):
+        picked = rng.sample(facets, rng.randint(1, len(facets)))
+        selections.append({
+            facet: rng.sample(index.values(facet), min(len(index.values(facet)), rng.randint(1, 2)))
+            for facet in picked
+        })
+    
+    start = time.perf_counter()
+    for selection in selections:
+        index.query(selection, counts=False)
+    plain = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    matched = 0
+    for selection in selections:
+        matched += len(index.query(selection))
+    with_counts = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for selection in selections[:100]:
+        index.query(selection, counts=False).ids(limit=50)
+    ids = time.perf_counter() - start
+    
+    return {
+        'query_us': plain / queries * 1e6,
+        'query_counts_us': with_counts / queries * 1e6,
+        'ids_page_us': ids / min(queries, 100) * 1e6,
+        'average_matches': matched / queries
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the item catalog by facets")
+    parser.add_argument('--rarity', action='append', default=[], help="rarity color (repeatable)")
+    parser.add_argument('--manufacturer', action='append', default=[], help="manufacturer id (repeatable)")
+    parser.add_argument('--element', action='append', default=[], help="element id (repeatable)")
+    parser.add_argument('--subtype', action='append', default=[], help="item subtype (repeatable)")
+    parser.add_argument('--entity', action='append', default=[], help="entity type, e.g. bl4-weapon (repeatable)")
+    parser.add_argument('--bench', type=int, metavar='ROWS', help="benchmark on a synthetic catalog of ROWS rows")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Catalog Query")
+    print("=" * 50)
+    
+    item_catalog = catalog.get_catalog()
+    if item_catalog is None:
+        print(f"ERROR: Item catalog not found: {catalog.CATALOG_FILE}")
+        print("Run extract_game_data.py first.")
+        return
+    
+    if args.bench:
+        print(f"\nBuilding synthetic catalog ({args.bench} rows)...")
+        item_catalog = make_synthetic_catalog(item_catalog, args.bench)
+        start = time.perf_counter()
+        index = FacetIndex(item_catalog)
+        build_ms = (time.perf_counter() - start) * 1000
+        stats = run_benchmark(index)
+        
+        print("\nSummary:")
+        print(f"  Rows: {len(item_catalog)}")
+        print(f"  Index build: {build_ms:.1f} ms")
+        print(f"  Query: {stats['query_us']:.1f} us")
+        print(f"  Query + facet counts: {stats['query_counts_us']:.1f} us")
+        print(f"  Query + first 50 ids: {stats['ids_page_us']:.1f} us")
+        print(f"  Average matches: {stats['average_matches']:.0f}")
+        return
+    
+    index = FacetIndex(item_catalog)
+    selection = {
+        'rarity': args.rarity,
+        'manufacturer': args.manufacturer,
+        'element': args.element,
+        'subtype': args.subtype,
+        'entity': args.entity
+    }
+    result = index.query(selection)
+    
+    print(f"\nMatches: {len(result)}")
+    for row in result.rows(limit=20):
+        print(f"  {item_catalog.string('id', row)}: {item_catalog.string('name', row)}")
+    if len(result) > 20:
+        print(f"  ... and {len(result) - 20} more")
+    
+    print("\nSummary:")
+    for facet in ('rarity', 'manufacturer', 'element', 'subtype'):
+        counts = {value: count for value, count in result.counts[facet].items() if count}
+        print(f"  {facet}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+Data Delta for Equipment Editor
+Diffs two chunk versions and patches game_data.json and catalog.bin in place
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import argparse
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+try:
+    from . import catalog, extract_game_data
+except ImportError:
+    import catalog, extract_game_data
+
+# Delta file header
+DELTA_FORMAT = 'bl4-data-delta'
+DELTA_VERSION = 1
+
+# Record fields that identify a catalog row across versions
+KEY_FIELDS = ('table', 'id')
+
+
+def game_data_digest(game_data: Dict[str, Any]) -> str:
+    """Content hash of game data (key order does not matter)."""
+    text = json.dumps(game_data, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()[:16]
+
+
+def catalog_digest(item_catalog: catalog.Catalog) -> str:
+    """Content hash of a catalog: enums and records in row order (build codes store row numbers)."""
+    digest = hashlib.sha256(json.dumps(item_catalog.enums, sort_keys=True).encode('utf-8'))
+    for row in range(len(item_catalog)):
+        digest.update(json.dumps(item_catalog.record(row), sort_keys=True, ensure_ascii=False).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def _version(name: str, game_data: Dict[str, Any], item_catalog: catalog.Catalog) -> Dict[str, str]:
+    return {'chunk': name, 'gameData': game_data_digest(game_data), 'catalog': catalog_digest(item_catalog)}
+
+
+def _merged_order(old_keys: List, new_keys: List, inserted: Dict[Any, int]) -> List:
+    """Order apply() rebuilds: surviving old keys in old order, inserted keys placed at their new index."""
+    new_set = set(new_keys)
+    order = [key for key in old_keys if key in new_set]
+    for key, index in sorted(inserted.items(), key=lambda entry: entry[1]):
+        order.insert(index, key)
+    return order
+
+
+def diff_game_data(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, dict]:
+    """
+    Per-section changes: dict sections list added, removed and changed keys;
+    anything else is replaced whole. 'order' is only stored if apply() would get the key order wrong.
+    """
+    sections = {}
+    for section in list(new) + [section for section in old if section not in new]:
+        old_value, new_value = old.get(section), new.get(section)
+        if section not in new:
+            sections[section] = {'delete': True}
+        elif old_value == new_value and section in old:
+            continue
+        elif isinstance(old_value, dict) and isinstance(new_value, dict):
+            keys = list(new_value)
+            added = {key: index for index, key in enumerate(keys) if key not in old_value}
+            changes = {
+                'added': {key: new_value[key] for key in added},
+                'removed': [key for key in old_value if key not in new_value],
+                'changed': {key: new_value[key] for key in keys if key in old_value and old_value[key] != new_value[key]},
+                'index': added
+            }
+            if _merged_order(list(old_value), keys, added) != keys:
+                changes['order'] = keys
+            sections[section] = changes
+        else:
+            sections[section] = {'replace': new_value}
+    return sections
+
+
+def diff_catalog(old: catalog.Catalog, new: catalog.Catalog) -> Dict[str, Any]:
+    """
+    Per-entity changes: added records (with their new row), removed keys and changed fields only.
+    Enums are stored when they differ, 'order' only if surviving rows were reordered.
+    """
+    old_records = {}
+    for row in range(len(old)):
+        record = old.record(row)
+        old_records[tuple(record[field] for field in KEY_FIELDS)] = record
+    new_keys = []
+    entities: Dict[str, Dict[str, list]] = {}
+    
+    def changes_for(entity: Optional[str]) -> Dict[str, list]:
+        return entities.setdefault(entity or '', {'added': [], 'removed': [], 'changed': []})
+    
+    added = {}
+    for row in range(len(new)):
+        record = new.record(row)
+        key = tuple(record[field] for field in KEY_FIELDS)
+        new_keys.append(key)
+        old_record = old_records.get(key)
+        if old_record is None:
+            added[key] = row
+            changes_for(record['entity'])['added'].append({'row': row, 'record': record})
+        elif old_record != record:
+            fields = {name: value for name, value in record.items() if old_record.get(name) != value}
+            fields.update({field: record[field] for field in KEY_FIELDS})
+            changes_for(record['entity'])['changed'].append(fields)
+    
+    new_set = set(new_keys)
+    for key, record in old_records.items():
+        if key not in new_set:
+            changes_for(record['entity'])['removed'].append(list(key))
+    
+    delta: Dict[str, Any] = {'entities': entities}
+    if old.enums != new.enums:
+        delta['enums'] = new.enums
+    if _merged_order(list(old_records), new_keys, added) != new_keys:
+        delta['order'] = [list(key) for key in new_keys]
+    return delta
+
+
+def make_delta(old_name: str, old: Tuple[Dict[str, Any], catalog.Catalog],
+               new_name: str, new: Tuple[Dict[str, Any], catalog.Catalog]) -> Dict[str, Any]:
+    """Delta from one extracted (game data, catalog) version to another."""
+    return {
+        'format': DELTA_FORMAT,
+        'version': DELTA_VERSION,
+        'from': _version(old_name, *old),
+        'to': _version(new_name, *new),
+        'gameData': diff_game_data(old[0], new[0]),
+        'catalog': diff_catalog(old[1], new[1])
+    }
+
+
+def apply_game_data_delta(game_data: Dict[str, Any], delta: Dict[str, Any]) -> Dict[str, Any]:
+    """Patched copy of game data. ValueError if it is not the delta's base version or the result differs."""
+    if game_data_digest(game_data) != delta['from']['gameData']:
+        raise ValueError("Game data is not the version this delta applies to")
+    
+    patched = dict(game_data)
+    for section, changes in delta['gameData'].items():
+        if changes.get('delete'):
+            patched.pop(section, None)
+        elif 'replace' in changes:
+            patched[section] = changes['replace']
+        else:
+            old_value = patched.get(section) or {}
+            keys = changes.get('order') or _merged_order(
+                list(old_value), [key for key in old_value if key not in changes['removed']], changes['index'])
+            values = {**old_value, **changes['changed'], **changes['added']}
+            patched[section] = {key: values[key] for key in keys}
+    
+    if game_data_digest(patched) != delta['to']['gameData']:
+        raise ValueError("Patched game data does not match the delta's target version")
+    return patched
+
+
+def apply_catalog_delta(item_catalog: catalog.Catalog, delta: Dict[str, Any]) -> catalog.Catalog:
+    """Patched catalog. ValueError if it is not the delta's base version or the result differs."""
+    if catalog_digest(item_catalog) != delta['from']['catalog']:
+        raise ValueError("Catalog is not the version this delta applies to")
+    changes = delta['catalog']
+    
+    records = {}
+    for row in range(len(item_catalog)):
+        record = item_catalog.record(row)
+        records[tuple(record[field] for field in KEY_FIELDS)] = record
+    
+    removed = set()
+    added = {}
+    for entity_changes in changes['entities'].values():
+        removed.update(tuple(key) for key in entity_changes['removed'])
+        for fields in entity_changes['changed']:
+            key = tuple(fields[field] for field in KEY_FIELDS)
+            if key not in records:
+                raise ValueError(f"Changed record {key[1]} ({key[0]}) is not in the catalog")
+            records[key] = {**records[key], **fields}
+        for entry in entity_changes['added']:
+            key = tuple(entry['record'][field] for field in KEY_FIELDS)
+            records[key] = entry['record']
+            added[key] = entry['row']
+    
+    if 'order' in changes:
+        keys = [tuple(key) for key in changes['order']]
+    else:
+        survivors = [key for key in records if key not in removed and key not in added]
+        keys = _merged_order(survivors, survivors, added)
+    
+    builder = catalog.CatalogBuilder(changes.get('enums') or item_catalog.enums)
+    for key in keys:
+        builder.add(records[key])
+    patched = builder.build()
+    
+    if catalog_digest(patched) != delta['to']['catalog']:
+        raise ValueError("Patched catalog does not match the delta's target version")
+    return patched
+
+
+def write_delta(delta: Dict[str, Any], path: Path):
+    """Write a delta as compact JSON (gzipped if the name ends in .gz)."""
+    data = json.dumps(delta, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    if path.suffix == '.gz':
+        data = gzip.compress(data, 9)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def read_delta(path: Path) -> Dict[str, Any]:
+    """Read a delta written by write_delta(). ValueError if it is not one."""
+    data = path.read_bytes()
+    if data[:2] == b'\x1f\x8b':
+        data = gzip.decompress(data)
+    delta = json.loads(data)
+    if not isinstance(delta, dict) or delta.get('format') != DELTA_FORMAT:
+        raise ValueError(f"Not a data delta: {path}")
+    if delta.get('version') != DELTA_VERSION:
+        raise ValueError(f"Unsupported delta version {delta.get('version')}: {path}")
+    return delta
+
+
+def _replace_file(path: Path, write):
+    """Write a file next to path and rename it over path (readers never see half a file)."""
+    temp_path = path.with_name(path.name + '.tmp')
+    write(temp_path)
+    os.replace(temp_path, path)
+
+
+def patch_files(delta: Dict[str, Any], game_data_file: Path = catalog.GAME_DATA_FILE,
+                catalog_file: Path = catalog.CATALOG_FILE) -> bool:
+    """
+    Patch game data and catalog files in place. Both are verified before either is written.
+    Returns False if they already are the target version; ValueError if they are neither version.
+    """
+    game_data = catalog.load_game_data(game_data_file)
+    item_catalog = catalog.Catalog.load(catalog_file)
+    if (game_data_digest(game_data) == delta['to']['gameData']
+            and catalog_digest(item_catalog) == delta['to']['catalog']):
+        return False
+    
+    patched_game_data = apply_game_data_delta(game_data, delta)
+    patched_catalog = apply_catalog_delta(item_catalog, delta)
+    _replace_file(game_data_file, lambda path: extract_game_data.save_game_data(patched_game_data, path))
+    _replace_file(catalog_file, patched_catalog.save)
+    return True
+
+
+def extract_version(js_file: Path) -> Optional[Tuple[Dict[str, Any], catalog.Catalog]]:
+    """Extract (game data, catalog) from one chunk version without saving, or None."""
+    content = extract_game_data.read_chunk(js_file)
+    if content is None:
+        return None
+    try:
+        return extract_game_data.extract_sources(content)
+    except ValueError as e:
+        print(f"ERROR: Could not parse {js_file.name}: {e}")
+        return None
+
+
+def dataset_size(game_data: Dict[str, Any], item_catalog: catalog.Catalog) -> int:
+    """Bytes of game_data.json plus catalog.bin for one version."""
+    with tempfile.TemporaryDirectory() as directory:
+        game_data_file = Path(directory) / "game_data.json"
+        catalog_file = Path(directory) / "catalog.bin"
+        extract_game_data.save_game_data(game_data, game_data_file)
+        item_catalog.save(catalog_file)
+        return game_data_file.stat().st_size + catalog_file.stat().st_size
+
+
+def print_delta(delta: Dict[str, Any]):
+    """Print per-category change counts."""
+    for section, changes in delta['gameData'].items():
+        if 'delete' in changes or 'replace' in changes:
+            print(f"  {section}: {'removed' if 'delete' in changes else 'replaced'}")
+        else:
+            print(f"  {section}: +{len(changes['added'])} -{len(changes['removed'])} ~{len(changes['changed'])}")
+    for entity, changes in sorted(delta['catalog']['entities'].items()):
+        print(f"  {entity or '(no entity)'}: "
+              f"+{len(changes['added'])} -{len(changes['removed'])} ~{len(changes['changed'])}")
+    if 'enums' in delta['catalog']:
+        print("  Catalog enums changed")
+    if 'order' in delta['catalog']:
+        print("  Catalog rows reordered")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two chunk versions, or patch extracted data with a delta")
+    parser.add_argument('old', type=Path, nargs='?', help="old chunk (bl4-chunk-00-*.js)")
+    parser.add_argument('new', type=Path, nargs='?', help="new chunk")
+    parser.add_argument('--output', type=Path, default=Path("data-delta.json.gz"), help="delta file to write")
+    parser.add_argument('--apply', type=Path, metavar='DELTA', help="patch the data files with a delta")
+    parser.add_argument('--game-data', type=Path, default=catalog.GAME_DATA_FILE, help="game data file to patch")
+    parser.add_argument('--catalog', type=Path, default=catalog.CATALOG_FILE, help="catalog file to patch")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Data Delta")
+    print("=" * 50)
+    
+    if args.apply:
+        try:
+            delta = read_delta(args.apply)
+            print(f"\n{delta['from']['chunk']} -> {delta['to']['chunk']}")
+            patched = patch_files(delta, args.game_data, args.catalog)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"ERROR: Could not apply {args.apply}: {e}")
+            return
+        print("\nSummary:")
+        print_delta(delta)
+        print(f"  {'Patched' if patched else 'Already up to date'}: {args.game_data.name}, {args.catalog.name}")
+        return
+    
+    if args.old is None or args.new is None:
+        parser.error("give an old and a new chunk, or --apply DELTA")
+    
+    versions = []
+    for js_file in (args.old, args.new):
+        print(f"\nExtracting {js_file.name}...")
+        extracted = extract_version(js_file)
+        if extracted is None:
+            return
+        versions.append(extracted)
+    
+    delta = make_delta(args.old.name, versions[0], args.new.name, versions[1])
+    # Applying the delta must reproduce the new version exactly
+    apply_game_data_delta(versions[0][0], delta)
+    apply_catalog_delta(versions[0][1], delta)
+    write_delta(delta, args.output)
+    
+    delta_size = args.output.stat().st_size
+    full_size = dataset_size(*versions[1])
+    print("\nSummary:")
+    print_delta(delta)
+    print(f"  Delta: {delta_size:,} bytes ({delta_size / full_size:.1%} of the {full_size:,} byte dataset)")
+    print(f"  Saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
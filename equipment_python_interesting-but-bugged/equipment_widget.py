@@ -4,28 +4,104 @@ Main equipment display with weapon, support, and auxiliary slots
 Matches maxroll.gg design exactly
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
-from PyQt6.QtCore import Qt, pyqtSignal
+from typing import Dict, Iterable, List, Optional, Set
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QSizePolicy
+from PyQt6.QtCore import Qt, pyqtSignal, QRect
 try:
-    from .slot_widget import SlotWidget
-    from . import styles
+    from .slot_widget import SlotWidget, resolve_slot_icon
+    from .persistent_map import PersistentMap, History
+    from .state_store import Store
 except ImportError:
-    from slot_widget import SlotWidget
-    import styles
+    from slot_widget import SlotWidget, resolve_slot_icon
+    from persistent_map import PersistentMap, History
+    from state_store import Store
+
+
+class WeaponsContainer(QWidget):
+    """Cross of 4 weapon slots that keeps its 1:1.1 aspect ratio while scaling."""
+    
+    # Minimum cross size (width, height) - aspect ratio 1:1.1
+    BASE_WIDTH = 400
+    ASPECT_RATIO = 1.1
+    
+    # Slot sizes as fractions of the cross (width, height), from CSS
+    SLOT_FRACTIONS = {
+        'weapon1': (0.53, 0.56),
+        'weapon2': (0.56, 0.53),
+        'weapon3': (0.53, 0.56),
+        'weapon4': (0.56, 0.53)
+    }
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("WeaponsContainer")
+        self.setMinimumSize(self.BASE_WIDTH, int(self.BASE_WIDTH * self.ASPECT_RATIO))
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.slots = {}
+    
+    def add_slot(self, slot_id: str, slot: QWidget):
+        """Add a weapon slot to the cross."""
+        slot.setParent(self)
+        self.slots[slot_id] = slot
+        self._layout_slots()
+    
+    def resizeEvent(self, event):
+        """Handle resize - fit the cross into the available space."""
+        super().resizeEvent(event)
+        self._layout_slots()
+    
+    def _layout_slots(self):
+        """Position weapon slots in the largest 1:1.1 box that fits, centered."""
+        geometry = self.cross_geometry(self.width(), self.height())
+        for slot_id, slot in self.slots.items():
+            slot.setGeometry(geometry[slot_id])
+    
+    @classmethod
+    def cross_geometry(cls, available_width: int, available_height: int) -> Dict[str, QRect]:
+        """Get weapon slot rects for the largest 1:1.1 cross fitting the given size, centered."""
+        width = min(available_width, int(available_height / cls.ASPECT_RATIO))
+        height = int(width * cls.ASPECT_RATIO)
+        left = (available_width - width) // 2
+        top = (available_height - height) // 2
+        
+        geometry = {}
+        for slot_id, (w_frac, h_frac) in cls.SLOT_FRACTIONS.items():
+            slot_width = int(width * w_frac)
+            slot_height = int(height * h_frac)
+            
+            if slot_id == 'weapon1':
+                # Left side, middle (top: 50%, left: 0, translate: 0 -50%)
+                x, y = 0, (height - slot_height) // 2
+            elif slot_id == 'weapon2':
+                # Top center (top: 0, left: 50%, translate: -50% 0)
+                x, y = (width - slot_width) // 2, 0
+            elif slot_id == 'weapon3':
+                # Right side, middle (top: 50%, right: 0, translate: 0 -50%)
+                x, y = width - slot_width, (height - slot_height) // 2
+            else:
+                # Bottom center (bottom: 0, left: 50%, translate: -50% 0)
+                x, y = (width - slot_width) // 2, height - slot_height
+            
+            geometry[slot_id] = QRect(left + x, top + y, slot_width, slot_height)
+        
+        return geometry
 
 
 class EquipmentWidget(QWidget):
     """Main Equipment widget displaying all equipment slots."""
     
     slot_clicked = pyqtSignal(str, dict)  # slot_id, current_item
+    item_changed = pyqtSignal(str, object)  # slot_id, item_data (None when cleared)
+    history_changed = pyqtSignal()  # undo/redo availability may have changed
     
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName("EquipmentWidget")
         self.editable = False
         
-        # Equipment data
-        self.equipment = {
+        # Equipment data (immutable; every edit is a new version sharing the unchanged slots).
+        # Each slot subscribes to its own key; repaints happen once per event-loop tick.
+        self.store = Store({
             'weapon1': None,
             'weapon2': None,
             'weapon3': None,
@@ -35,7 +111,8 @@ class EquipmentWidget(QWidget):
             'class-mod': None,
             'shield': None,
             'enhancement': None
-        }
+        })
+        self.history = History(self.store.state)
         
         # Create layout
         layout = QVBoxLayout(self)
@@ -44,7 +121,7 @@ class EquipmentWidget(QWidget):
         
         # Weapons section (aspect ratio 1:1.1)
         weapons_widget = self._create_weapons_section()
-        layout.addWidget(weapons_widget)
+        layout.addWidget(weapons_widget, 1)
         
         # Support section (repkit, ordnance)
         support_widget = self._create_support_section()
@@ -54,19 +131,15 @@ class EquipmentWidget(QWidget):
         auxiliaries_widget = self._create_auxiliaries_section()
         layout.addWidget(auxiliaries_widget)
         
-        # Apply styles
-        self.setStyleSheet(styles.get_equipment_stylesheet())
+        for slot_id in self.store.state:
+            self.store.subscribe(slot_id, lambda item_data, sid=slot_id: self._show_item(sid, item_data))
+        
+        # No stylesheet: slots paint themselves from styles.get_theme()
     
     def _create_weapons_section(self) -> QWidget:
         """Create weapons section with 4 weapon slots in cross pattern."""
-        container = QWidget()
-        container.setObjectName("WeaponsContainer")
-        
-        # Set aspect ratio 1:1.1 (width:height)
-        # Use a fixed width, height will be calculated
-        container_width = 400
-        container_height = int(container_width * 1.1)
-        container.setFixedSize(container_width, container_height)
+        # Cross scales with the window, keeping aspect ratio 1:1.1 (width:height)
+        container = WeaponsContainer()
         
         # Create weapon slots with numbers
         self.weapon_slots = {}
@@ -76,51 +149,7 @@ class EquipmentWidget(QWidget):
             slot.set_editable(self.editable)
             slot.clicked.connect(lambda checked=False, sid=slot_id: self._on_slot_clicked(sid))
             self.weapon_slots[slot_id] = slot
-        
-        # Position weapon slots according to CSS:
-        # Weapon 1: left side, middle (top: 50%, left: 0, translate: 0 -50%)
-        # Width: 53%, Height: 56%
-        w1_width = int(container_width * 0.53)
-        w1_height = int(container_height * 0.56)
-        self.weapon_slots['weapon1'].setGeometry(
-            0,
-            (container_height - w1_height) // 2,
-            w1_width,
-            w1_height
-        )
-        
-        # Weapon 2: top center (top: 0, left: 50%, translate: -50% 0)
-        # Width: 56%, Height: 53%
-        w2_width = int(container_width * 0.56)
-        w2_height = int(container_height * 0.53)
-        self.weapon_slots['weapon2'].setGeometry(
-            (container_width - w2_width) // 2,
-            0,
-            w2_width,
-            w2_height
-        )
-        
-        # Weapon 3: right side, middle (top: 50%, right: 0, translate: 0 -50%)
-        # Width: 53%, Height: 56%
-        w3_width = int(container_width * 0.53)
-        w3_height = int(container_height * 0.56)
-        self.weapon_slots['weapon3'].setGeometry(
-            container_width - w3_width,
-            (container_height - w3_height) // 2,
-            w3_width,
-            w3_height
-        )
-        
-        # Weapon 4: bottom center (bottom: 0, left: 50%, translate: -50% 0)
-        # Width: 56%, Height: 53%
-        w4_width = int(container_width * 0.56)
-        w4_height = int(container_height * 0.53)
-        self.weapon_slots['weapon4'].setGeometry(
-            (container_width - w4_width) // 2,
-            container_height - w4_height,
-            w4_width,
-            w4_height
-        )
+            container.add_slot(slot_id, slot)
         
         return container
     
@@ -203,16 +232,66 @@ class EquipmentWidget(QWidget):
         self.shield_slot.set_editable(editable)
         self.enhancement_slot.set_editable(editable)
     
+    @property
+    def equipment(self) -> PersistentMap:
+        """Current equipment (slot id -> item data), read-only."""
+        return self.store.state
+    
     def set_item(self, slot_id: str, item_data: dict):
-        """Set item in a slot."""
-        self.equipment[slot_id] = item_data
-        
-        # Update slot widget
+        """Set item in a slot (recorded in the undo history)."""
+        self.store.set(slot_id, item_data)
+        self.history.push(self.store.state)
+        self.history_changed.emit()
+    
+    def undo(self) -> bool:
+        """Go back one edit. Returns False if there is nothing to undo."""
+        if not self.history.can_undo():
+            return False
+        self.jump_to(self.history.index - 1)
+        return True
+    
+    def redo(self) -> bool:
+        """Re-apply one undone edit. Returns False if there is nothing to redo."""
+        if not self.history.can_redo():
+            return False
+        self.jump_to(self.history.index + 1)
+        return True
+    
+    def jump_to(self, index: int):
+        """Show any point in the history, repainting only the slots that differ."""
+        self.store.replace(self.history.jump(index))
+        self.history_changed.emit()
+    
+    def _show_item(self, slot_id: str, item_data: Optional[dict]):
+        """Update one slot widget and notify listeners (store subscription of the slot)."""
         slot = self._get_slot_widget(slot_id)
         if slot:
             rarity = item_data.get('rarity', 'gray') if item_data else 'gray'
             slot.set_rarity(rarity)
             slot.set_item(item_data)
+        
+        self.item_changed.emit(slot_id, item_data)
+    
+    def refresh_icons(self):
+        """Resolve every slot's icon again (after the image index or caches changed)."""
+        self.refresh_slots(self.store.state)
+    
+    def refresh_slots(self, slot_ids: Iterable[str]):
+        """Resolve some slots' icons again; the other slots are not repainted."""
+        for slot_id in slot_ids:
+            slot = self._get_slot_widget(slot_id)
+            if slot:
+                slot.update_display()
+    
+    def stale_icon_slots(self, changed_paths: Set[str]) -> List[str]:
+        """Slots whose icon file changed or whose icon now resolves to another path."""
+        stale = []
+        for slot_id, item_data in self.store.state.items():
+            slot = self._get_slot_widget(slot_id)
+            if slot and (slot.icon_path in changed_paths
+                         or resolve_slot_icon(slot.slot_type, item_data) != slot.icon_path):
+                stale.append(slot_id)
+        return stale
     
     def _get_slot_widget(self, slot_id: str) -> SlotWidget:
         """Get slot widget by ID."""
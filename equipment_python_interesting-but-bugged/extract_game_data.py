@@ -4,15 +4,34 @@ Extract game data from maxroll.gg JavaScript files
 Parses bl4-chunk-00-e58afd3e.js to extract weapons, augments, manufacturers, elements
 """
 
+import os
 import re
 import json
+import hashlib
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+try:
+    from . import catalog
+except ImportError:
+    import catalog
 
 SCRIPT_DIR = Path(__file__).parent
 BASE_DIR = SCRIPT_DIR.parent
 JS_DIR = BASE_DIR / "web editors" / "maxroll.gg-build-planner"
 OUTPUT_FILE = SCRIPT_DIR / "data" / "game_data.json"
+CHUNK_NAME = "bl4-chunk-00-e58afd3e.js"
+
+# Slim data module for the HTML editor (js/game-data.js loadGameData reads the manifest, then the module)
+SLIM_MODULE_DIR = BASE_DIR / "js" / "data"
+SLIM_MANIFEST_FILE = SLIM_MODULE_DIR / "manifest.json"
+
+# Tables and fields the HTML editor reads from game data; everything else in the chunk is left out
+SLIM_TABLES = {
+    'manufacturers': ['name'],  # utils.js resolveEntity, customize-dialog.js options
+    'elements': ['name'],  # utils.js resolveEntity, customize-dialog.js options
+    'firmwares': ['name'],  # utils.js resolveEntity, firmware-handler.js
+    'itemAugments': ['icon', 'description', 'source', 'type', 'manufacturerId']  # getAugmentsForItemType
+}
 
 # Ensure data directory exists
 OUTPUT_FILE.parent.mkdir(parents=True, exist_ok=True)
@@ -23,7 +42,7 @@ def extract_manufacturers(content: str) -> Dict[str, Any]:
     manufacturers = {}
     
     # Look for manufacturer definitions
-    pattern = r'(\w+):\s*\{\s*name:\s*"([^"]+)",\s*isBaseItemManufacturer:\s*(\w+),'
+    pattern = r'(\w+):\s*\{\s*name:\s*"([^"]+)",\s*isBaseItemManufacturer:\s*(!?\w+),'
     matches = re.finditer(pattern, content)
     
     for match in matches:
@@ -57,7 +76,7 @@ def extract_elements(content: str) -> Dict[str, Any]:
     elements = {}
     
     # Look for element definitions
-    pattern = r'(\w+):\s*\{\s*name:\s*"([^"]+)",\s*hasStatusEffect:\s*(\w+),'
+    pattern = r'(\w+):\s*\{\s*name:\s*"([^"]+)",\s*hasStatusEffect:\s*(!?\w+),'
     matches = re.finditer(pattern, content)
     
     for match in matches:
@@ -157,27 +176,366 @@ def extract_weapon_types(content: str) -> List[str]:
     return sorted(weapon_types)
 
 
-def main():
-    print("Equipment Editor - Game Data Extraction")
-    print("=" * 50)
+class JSLiteralParser:
+    """
+    Parser for the literal subset of JavaScript used by the data chunk:
+    const declarations of objects, arrays, strings, numbers and !0/!1,
+    with references between declarations and a final export block.
+    """
     
-    js_file = JS_DIR / "bl4-chunk-00-e58afd3e.js"
+    ESCAPES = {'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+    IDENTIFIER = re.compile(r'[A-Za-z_$][\w$]*')
+    NUMBER = re.compile(r'-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?')
     
-    if not js_file.exists():
-        print(f"ERROR: JavaScript file not found: {js_file}")
-        return
+    def __init__(self, content: str):
+        self.content = content
+        self.pos = 0
+        self.variables: Dict[str, Any] = {}
+        self.exports: Dict[str, str] = {}
     
-    print(f"\nReading {js_file.name}...")
+    def error(self, message: str) -> ValueError:
+        line = self.content.count('\n', 0, self.pos) + 1
+        return ValueError(f"{message} at line {line}")
+    
+    def skip_space(self):
+        content = self.content
+        while self.pos < len(content):
+            char = content[self.pos]
+            if char.isspace():
+                self.pos += 1
+            elif content.startswith('//', self.pos):
+                end = content.find('\n', self.pos)
+                self.pos = len(content) if end < 0 else end
+            elif content.startswith('/*', self.pos):
+                end = content.find('*/', self.pos + 2)
+                if end < 0:
+                    raise self.error("Unterminated comment")
+                self.pos = end + 2
+            else:
+                break
+    
+    def peek(self) -> str:
+        self.skip_space()
+        return self.content[self.pos:self.pos + 1]
+    
+    def expect(self, token: str):
+        self.skip_space()
+        if not self.content.startswith(token, self.pos):
+            raise self.error(f"Expected {token!r}")
+        self.pos += len(token)
+    
+    def identifier(self) -> str:
+        self.skip_space()
+        match = self.IDENTIFIER.match(self.content, self.pos)
+        if not match:
+            raise self.error("Expected identifier")
+        self.pos = match.end()
+        return match.group(0)
+    
+    def string(self) -> str:
+        quote = self.content[self.pos]
+        self.pos += 1
+        parts = []
+        start = self.pos
+        content = self.content
+        while True:
+            if self.pos >= len(content):
+                raise self.error("Unterminated string")
+            char = content[self.pos]
+            if char == quote:
+                parts.append(content[start:self.pos])
+                self.pos += 1
+                return ''.join(parts)
+            if char == '\\':
+                parts.append(content[start:self.pos])
+                escaped = content[self.pos + 1:self.pos + 2]
+                if escaped == 'u':
+                    parts.append(chr(int(content[self.pos + 2:self.pos + 6], 16)))
+                    self.pos += 6
+                elif escaped == 'x':
+                    parts.append(chr(int(content[self.pos + 2:self.pos + 4], 16)))
+                    self.pos += 4
+                elif escaped == '\n':
+                    # Line continuation
+                    self.pos += 2
+                else:
+                    parts.append(self.ESCAPES.get(escaped, escaped))
+                    self.pos += 2
+                start = self.pos
+            elif quote == '`' and content.startswith('${', self.pos):
+                raise self.error("Template expressions are not supported")
+            else:
+                self.pos += 1
+    
+    def value(self) -> Any:
+        char = self.peek()
+        if char == '{':
+            return self.object()
+        if char == '[':
+            return self.array()
+        if char in ('"', "'", '`'):
+            return self.string()
+        if self.content.startswith('!0', self.pos):
+            self.pos += 2
+            return True
+        if self.content.startswith('!1', self.pos):
+            self.pos += 2
+            return False
+        match = self.NUMBER.match(self.content, self.pos)
+        if match:
+            self.pos = match.end()
+            text = match.group(0)
+            return float(text) if any(c in text for c in '.eE') else int(text)
+        name = self.identifier()
+        if name in ('true', 'false'):
+            return name == 'true'
+        if name in ('null', 'undefined'):
+            return None
+        if name not in self.variables:
+            raise self.error(f"Unknown reference {name!r}")
+        return self.variables[name]
+    
+    def key(self) -> str:
+        char = self.peek()
+        if char in ('"', "'"):
+            return self.string()
+        match = self.NUMBER.match(self.content, self.pos)
+        if match:
+            self.pos = match.end()
+            return match.group(0)
+        return self.identifier()
+    
+    def object(self) -> Dict[str, Any]:
+        self.expect('{')
+        result = {}
+        while self.peek() != '}':
+            key = self.key()
+            if self.peek() == ':':
+                self.expect(':')
+                result[key] = self.value()
+            else:
+                # Shorthand property ({ name } == { name: name })
+                result[key] = self.variables[key]
+            if self.peek() == ',':
+                self.expect(',')
+        self.expect('}')
+        return result
+    
+    def array(self) -> List[Any]:
+        self.expect('[')
+        result = []
+        while self.peek() != ']':
+            result.append(self.value())
+            if self.peek() == ',':
+                self.expect(',')
+        self.expect(']')
+        return result
+    
+    def parse(self) -> Dict[str, Any]:
+        """Parse the module. Returns exported name -> value."""
+        while self.peek():
+            keyword = self.identifier()
+            if keyword in ('const', 'let', 'var'):
+                while True:
+                    name = self.identifier()
+                    self.expect('=')
+                    self.variables[name] = self.value()
+                    if self.peek() != ',':
+                        break
+                    self.expect(',')
+            elif keyword == 'export':
+                self.expect('{')
+                while self.peek() != '}':
+                    local = self.identifier()
+                    exported = local
+                    if self.peek() == 'a':
+                        self.identifier()  # "as"
+                        exported = self.identifier()
+                    self.exports[exported] = local
+                    if self.peek() == ',':
+                        self.expect(',')
+                self.expect('}')
+            else:
+                raise self.error(f"Unexpected {keyword!r}")
+            if self.peek() == ';':
+                self.expect(';')
+        
+        return {name: self.variables[local] for name, local in self.exports.items()}
+
+
+def parse_chunk(content: str) -> Dict[str, Any]:
+    """Parse the chunk's exported tables (manufacturers, itemAugments, ...)."""
+    return JSLiteralParser(content).parse()
+
+
+# Markup in descriptions: [keyword id="secondary"]...[/keyword], [rarity_legendary]...[/rarity_legendary]
+MARKUP_PATTERN = re.compile(r'\[/?[^\]]*\]')
+
+
+def strip_markup(text: str) -> str:
+    """Remove [tag] markup and collapse whitespace."""
+    return ' '.join(MARKUP_PATTERN.sub('', text).split())
+
+
+def _description_name(description: str) -> Optional[str]:
+    """Name of an effect written as "Name - description", if any."""
+    text = strip_markup(description)
+    if ' - ' in text:
+        return text.split(' - ', 1)[0].strip() or None
+    return None
+
+
+# legendaryItemAugmentPool itemType -> entity type
+ITEM_TYPE_ENTITIES = {
+    'ar': 'bl4-weapon',
+    'pistol': 'bl4-weapon',
+    'smg': 'bl4-weapon',
+    'shotgun': 'bl4-weapon',
+    'sniper': 'bl4-weapon',
+    'repkit': 'bl4-repkit',
+    'ordnance': 'bl4-ordnance',
+    'shield': 'bl4-shield',
+    'class-mod': 'bl4-class-mod',
+    'enhancement': 'bl4-enhancement'
+}
+
+
+def augment_source(item: Dict[str, Any]) -> Optional[str]:
+    """Augment source (gun, grenade, heavy-weapon, repkit, shield) of a legendary item."""
+    item_type = item.get('itemType')
+    if ITEM_TYPE_ENTITIES.get(item_type) == 'bl4-weapon':
+        return 'gun'
+    if item_type == 'ordnance':
+        return item.get('itemSubtype')
+    return item_type
+
+
+def extract_catalog(tables: Dict[str, Any]) -> catalog.Catalog:
+    """
+    Build the item catalog from parsed chunk tables.
+    Legendary items, class mod effects, enhancement/class mod item effects,
+    augments (item, legendary, stat) and firmware become one row each.
+    """
+    builder = catalog.CatalogBuilder({
+        'manufacturer': list(tables.get('manufacturers', {})),
+        'elements': list(tables.get('elements', {})),
+        'character': list(tables.get('characters', {}))
+    })
+    
+    # Legendary items
+    for item_id, item in tables.get('legendaryItemAugmentPool', {}).items():
+        item_type = item.get('itemType')
+        entity = ITEM_TYPE_ENTITIES.get(item_type)
+        if entity is None:
+            print(f"  WARNING: Unknown item type {item_type!r} for {item_id}")
+            continue
+        effects = item.get('effects') or []
+        builder.add({
+            'id': item_id,
+            'name': item.get('itemName') or item_id,
+            'description': '\n'.join(effects) or None,
+            'table': 'legendaryItemAugmentPool',
+            'entity': entity,
+            'subtype': item.get('itemSubtype') or item_type,
+            'manufacturer': item.get('manufacturerId'),
+            'rarity': 'orange'
+        })
+    
+    # Legendary class mods
+    for item_id, item in tables.get('legendaryClassModEffectsPool', {}).items():
+        builder.add({
+            'id': item_id,
+            'name': item.get('name') or item_id,
+            'description': item.get('effect'),
+            'table': 'legendaryClassModEffectsPool',
+            'entity': 'bl4-class-mod',
+            'subtype': 'class-mod',
+            'character': item.get('character'),
+            'rarity': 'orange'
+        })
+    
+    # Enhancement and class mod effects
+    for item_id, item in tables.get('itemEffects', {}).items():
+        source = item.get('source')
+        description = item.get('description') or ''
+        builder.add({
+            'id': item_id,
+            'name': _description_name(description) or item_id,
+            'description': description or None,
+            'table': 'itemEffects',
+            'entity': ITEM_TYPE_ENTITIES.get(source, 'bl4-enhancement'),
+            'subtype': source,
+            'source': source,
+            'manufacturer': item.get('manufacturerId'),
+            'character': item.get('characterId')
+        })
+    
+    # Augments (legendary augments take the source of their legendary item)
+    pool = tables.get('legendaryItemAugmentPool', {})
+    augment_tables = (
+        ('itemAugments', None),
+        ('legendaryItemAugments', 'legendary'),
+        ('statAugments', 'stat')
+    )
+    for table, subtype in augment_tables:
+        for item_id, item in tables.get(table, {}).items():
+            description = item.get('description') or ''
+            source_item = pool.get(item.get('sourceItem'), {})
+            source = item.get('source') or augment_source(source_item)
+            builder.add({
+                'id': item_id,
+                'name': _description_name(description) or strip_markup(description) or item_id,
+                'description': description or None,
+                'icon': item.get('icon'),
+                'table': table,
+                'entity': 'bl4-augment',
+                'subtype': subtype or item.get('type'),
+                'source': source,
+                'manufacturer': item.get('manufacturerId'),
+                'elements': item.get('elements'),
+                'rarity': 'orange' if subtype == 'legendary' else None
+            })
+    
+    # Firmware
+    for item_id, item in tables.get('firmwares', {}).items():
+        effects = item.get('effects') or []
+        builder.add({
+            'id': item_id,
+            'name': item.get('name') or item_id,
+            'description': '\n'.join(effect.get('description', '') for effect in effects) or None,
+            'icon': item.get('icon'),
+            'table': 'firmwares',
+            'entity': 'bl4-firmware',
+            'subtype': 'firmware'
+        })
+    
+    return builder.build()
+
+
+def find_chunk_file() -> Optional[Path]:
+    """Locate the data chunk (planner checkout first, then the repository root)."""
+    for candidate in (JS_DIR / CHUNK_NAME, BASE_DIR / CHUNK_NAME):
+        if candidate.exists():
+            return candidate
+    return None
+
+
+def read_chunk(js_file: Path) -> Optional[str]:
+    """Read chunk text, or None (with an error printed) if the file cannot be read."""
     try:
         with open(js_file, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+            return f.read()
     except Exception as e:
         print(f"ERROR: Could not read file: {e}")
-        return
-    
-    print("Extracting game data...")
-    
-    # Extract data
+        return None
+
+
+def extract_sources(content: str, tables: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], catalog.Catalog]:
+    """
+    Extract game data and the item catalog from chunk text without saving them.
+    tables are the already parsed chunk tables, if available. ValueError if the chunk is unparsable
+    or has no items or manufacturers (empty or half-written), so it never replaces good data.
+    """
     game_data = {
         'manufacturers': extract_manufacturers(content),
         'elements': extract_elements(content),
@@ -186,11 +544,105 @@ def main():
         'weaponTypes': extract_weapon_types(content),
         'version': '1.0.0'
     }
+    item_catalog = extract_catalog(parse_chunk(content) if tables is None else tables)
+    if not len(item_catalog):
+        raise ValueError("Chunk has no items (empty or incomplete file?)")
+    if not game_data['manufacturers']:
+        raise ValueError("Chunk has no manufacturers (empty or incomplete file?)")
+    return game_data, item_catalog
+
+
+def save_game_data(game_data: Dict[str, Any], path: Path = OUTPUT_FILE):
+    """Write game data JSON (the format catalog.load_game_data reads), replacing the file atomically."""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(game_data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def build_slim_module(tables: Dict[str, Any], source_name: str) -> str:
+    """ES module exporting the SLIM_TABLES subset of the chunk tables (one compact JSON literal)."""
+    data = {
+        table: {
+            key: {field: value[field] for field in fields if field in value}
+            for key, value in (tables.get(table) or {}).items()
+        }
+        for table, fields in SLIM_TABLES.items()
+    }
+    lines = [
+        f"// Generated by extract_game_data.py from {source_name} - do not edit",
+        f"const data = {json.dumps(data, separators=(',', ':'), ensure_ascii=False)};"
+    ]
+    lines += [f"export const {table} = data.{table};" for table in SLIM_TABLES]
+    lines.append("export default data;")
+    return '\n'.join(lines) + '\n'
+
+
+def save_slim_module(tables: Dict[str, Any], source_name: str, directory: Path = SLIM_MODULE_DIR) -> Path:
+    """
+    Write the slim module under a content-hashed name (cacheable forever) and point the manifest at it.
+    Older modules are removed.
+    """
+    data = build_slim_module(tables, source_name).encode('utf-8')
+    path = directory / f"game-data-{hashlib.sha256(data).hexdigest()[:8]}.js"
+    
+    directory.mkdir(parents=True, exist_ok=True)
+    if not path.exists():
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    for old_path in directory.glob("game-data-*.js"):
+        if old_path != path:
+            old_path.unlink()
+    
+    manifest = {'module': path.name, 'source': source_name, 'tables': list(SLIM_TABLES), 'size': len(data)}
+    manifest_path = directory / SLIM_MANIFEST_FILE.name
+    tmp_path = manifest_path.with_name(manifest_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+    return path
+
+
+def extract(js_file: Path) -> Optional[Tuple[Dict[str, Any], catalog.Catalog]]:
+    """Extract game data and the item catalog from a chunk and save both. None on failure."""
+    print(f"\nReading {js_file.name}...")
+    content = read_chunk(js_file)
+    if content is None:
+        return None
+    
+    print("Extracting game data and item catalog...")
+    try:
+        tables = parse_chunk(content)
+        game_data, item_catalog = extract_sources(content, tables)
+    except ValueError as e:
+        print(f"ERROR: Could not parse chunk: {e}")
+        return None
     
-    # Save to JSON
     print(f"\nSaving to {OUTPUT_FILE}...")
-    with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-        json.dump(game_data, f, indent=2, ensure_ascii=False)
+    save_game_data(game_data)
+    print(f"Saving to {catalog.CATALOG_FILE}...")
+    item_catalog.save(catalog.CATALOG_FILE)
+    slim_path = save_slim_module(tables, js_file.name)
+    print(f"Saved slim data module {slim_path.name}")
+    
+    return game_data, item_catalog
+
+
+def main():
+    print("Equipment Editor - Game Data Extraction")
+    print("=" * 50)
+    
+    js_file = find_chunk_file()
+    
+    if js_file is None:
+        print(f"ERROR: JavaScript file not found: {JS_DIR / CHUNK_NAME}")
+        return
+    
+    extracted = extract(js_file)
+    if extracted is None:
+        return
+    game_data, item_catalog = extracted
     
     # Print summary
     print("\nSummary:")
@@ -199,8 +651,15 @@ def main():
     print(f"  Characters: {len(game_data['characters'])}")
     print(f"  Rarities: {len(game_data['rarities'])}")
     print(f"  Weapon Types: {len(game_data['weaponTypes'])}")
+    print(f"  Catalog Items: {len(item_catalog)}")
+    for entity in catalog.ENTITY_TYPES:
+        print(f"    {entity}: {sum(1 for _ in item_catalog.rows(entity))}")
     
     print(f"\nGame data saved to: {OUTPUT_FILE}")
+    print(f"Item catalog saved to: {catalog.CATALOG_FILE}")
+    manifest = json.loads(SLIM_MANIFEST_FILE.read_text(encoding='utf-8'))
+    print(f"Slim data module saved to: {SLIM_MODULE_DIR / manifest['module']} "
+          f"({manifest['size'] / 1024:.0f} KB of {js_file.stat().st_size / 1024:.0f} KB)")
 
 
 if __name__ == "__main__":
@@ -152,6 +152,16 @@ def save_missing_urls(missing: List[str]):
     print(f"\nMissing URLs saved to: {output_file}")
 
 
+def save_all_urls(urls: Set[str]):
+    """Save every found URL to text file (for reference)."""
+    all_urls_file = TARGET_BASE / "all_image_urls.txt"
+    with open(all_urls_file, 'w', encoding='utf-8') as f:
+        f.write("# All Image URLs found in maxroll.gg JavaScript files\n\n")
+        for url in sorted(urls):
+            f.write(f"{url}\n")
+    print(f"All URLs saved to: {all_urls_file}")
+
+
 def main():
     print("Equipment Editor - Image URL Extraction")
     print("=" * 50)
@@ -176,12 +186,7 @@ def main():
         save_missing_urls(missing)
     
     # Also save all URLs for reference
-    all_urls_file = TARGET_BASE / "all_image_urls.txt"
-    with open(all_urls_file, 'w', encoding='utf-8') as f:
-        f.write("# All Image URLs found in maxroll.gg JavaScript files\n\n")
-        for url in sorted(all_urls):
-            f.write(f"{url}\n")
-    print(f"All URLs saved to: {all_urls_file}")
+    save_all_urls(all_urls)
     
     print("\nURL extraction complete!")
 
@@ -4,8 +4,13 @@ Loads Coda and Pridi fonts from resources/fonts/
 """
 
 from pathlib import Path
+from typing import Optional
 from PyQt6.QtGui import QFontDatabase, QFont
 from PyQt6.QtCore import QFile
+try:
+    from . import assets
+except ImportError:
+    import assets
 
 # Font family names
 FONT_BL4 = "Coda"
@@ -17,6 +22,23 @@ BASE_DIR = SCRIPT_DIR.parent
 FONTS_DIR = BASE_DIR / "resources" / "fonts"
 
 
+def _add_font(filename: str) -> Optional[int]:
+    """
+    Register a font from the asset pack, or from resources/fonts.
+    Returns font ID (-1 if Qt rejected it), or None if the font was not found.
+    """
+    pack = assets.get_asset_pack()
+    if pack is not None:
+        data = pack.read(f"resources/fonts/{filename}")
+        if data is not None:
+            return QFontDatabase.addApplicationFontFromData(data)
+    
+    font_path = FONTS_DIR / filename
+    if font_path.exists():
+        return QFontDatabase.addApplicationFont(str(font_path))
+    return None
+
+
 def load_fonts() -> dict:
     """
     Load all BL4 fonts and return font IDs.
@@ -24,14 +46,14 @@ def load_fonts() -> dict:
     """
     font_ids = {}
     
-    if not FONTS_DIR.exists():
+    if assets.get_asset_pack() is None and not FONTS_DIR.exists():
         print(f"WARNING: Fonts directory not found: {FONTS_DIR}")
         return font_ids
     
     # Load Coda (main text font)
     coda_path = FONTS_DIR / "Coda-Regular.ttf"
-    if coda_path.exists():
-        font_id = QFontDatabase.addApplicationFont(str(coda_path))
+    font_id = _add_font(coda_path.name)
+    if font_id is not None:
         if font_id != -1:
             families = QFontDatabase.applicationFontFamilies(font_id)
             if families:
@@ -49,8 +71,8 @@ def load_fonts() -> dict:
     
     for filename, weight in pridi_files:
         pridi_path = FONTS_DIR / filename
-        if pridi_path.exists():
-            font_id = QFontDatabase.addApplicationFont(str(pridi_path))
+        font_id = _add_font(filename)
+        if font_id is not None:
             if font_id != -1:
                 families = QFontDatabase.applicationFontFamilies(font_id)
                 if families:
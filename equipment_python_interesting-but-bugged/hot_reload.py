@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Hot Reload for Equipment Editor
+Swaps game data and asset snapshots in at runtime, invalidating only what their diff touches
+"""
+
+import os
+import time
+import random
+import argparse
+from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from PyQt6.QtCore import QObject, pyqtSignal
+try:
+    from . import assets, asset_pack, catalog, catalog_query, search_index, str_weak, build_code, item_editor_dialog
+    from . import icon_cache
+    from .source_watcher import CHANGED_GAME_DATA, CHANGED_IMAGES
+except ImportError:
+    import assets, asset_pack, catalog, catalog_query, search_index, str_weak, build_code, item_editor_dialog
+    import icon_cache
+    from source_watcher import CHANGED_GAME_DATA, CHANGED_IMAGES
+
+# Game data sections the item editor option models are built from
+OPTION_SECTIONS = ('manufacturers', 'elements')
+
+
+class GameDataSnapshot:
+    """One version of the item catalog and game data. Records are keyed by (id, table) for diffing."""
+    
+    def __init__(self, item_catalog: Optional[catalog.Catalog], game_data: Optional[dict]):
+        self.catalog = item_catalog
+        self.game_data = game_data or {}
+        self._records = None
+    
+    @classmethod
+    def load(cls, catalog_file: Path = catalog.CATALOG_FILE,
+             game_data_file: Path = catalog.GAME_DATA_FILE) -> 'GameDataSnapshot':
+        """Read a snapshot from disk (no catalog if the file is missing)."""
+        item_catalog = catalog.Catalog.load(catalog_file) if catalog_file.exists() else None
+        return cls(item_catalog, catalog.load_game_data(game_data_file))
+    
+    @classmethod
+    def current(cls) -> 'GameDataSnapshot':
+        """Snapshot of what the editor has loaded now."""
+        return cls(catalog.get_catalog(), catalog.load_game_data())
+    
+    @property
+    def records(self) -> Dict[Tuple[str, str], dict]:
+        """(id, table) -> record, built on first use (first row wins, as in Catalog.find)."""
+        if self._records is None:
+            self._records = {}
+            if self.catalog is not None:
+                for row in range(len(self.catalog)):
+                    record = self.catalog.record(row)
+                    self._records.setdefault((record['id'], record['table']), record)
+        return self._records
+    
+    def diff(self, new: 'GameDataSnapshot') -> 'GameDataDiff':
+        """What changed from this snapshot to new."""
+        diff = GameDataDiff(new)
+        
+        old_records, new_records = self.records, new.records
+        for key in old_records.keys() | new_records.keys():
+            if old_records.get(key) != new_records.get(key):
+                diff.items.add(key[0])
+        
+        old_enums = self.catalog.enums if self.catalog is not None else None
+        new_enums = new.catalog.enums if new.catalog is not None else None
+        diff.enums_changed = old_enums != new_enums
+        
+        for section in self.game_data.keys() | new.game_data.keys():
+            old_value, new_value = self.game_data.get(section), new.game_data.get(section)
+            if old_value == new_value:
+                continue
+            if isinstance(old_value, dict) and isinstance(new_value, dict):
+                diff.sections[section] = {
+                    key for key in old_value.keys() | new_value.keys() if old_value.get(key) != new_value.get(key)
+                }
+            else:
+                diff.sections[section] = None
+        
+        return diff
+
+
+class GameDataDiff:
+    """Changed item ids, catalog enums and game data sections between two GameDataSnapshots."""
+    
+    def __init__(self, snapshot: GameDataSnapshot):
+        self.snapshot = snapshot
+        # Ids of added, removed or changed records
+        self.items: Set[str] = set()
+        self.enums_changed = False
+        # Section -> changed keys (None if the whole section changed)
+        self.sections: Dict[str, Optional[Set[str]]] = {}
+    
+    @property
+    def empty(self) -> bool:
+        return not self.items and not self.enums_changed and not self.sections
+    
+    @property
+    def catalog_changed(self) -> bool:
+        return bool(self.items) or self.enums_changed
+    
+    def section_changed(self, section: str, key: Optional[str] = None) -> bool:
+        """Check whether a game data section (or one key of it) changed."""
+        if section not in self.sections:
+            return False
+        keys = self.sections[section]
+        return keys is None or key is None or key in keys
+    
+    def affects_item(self, item_data: Optional[dict]) -> bool:
+        """Check whether a slot item references a changed record, manufacturer or element."""
+        if not item_data:
+            return False
+        if item_data.get('id') in self.items:
+            return True
+        if any(augment_id in self.items for augment_id in item_data.get('augments') or []):
+            return True
+        
+        # Manufacturer and element fall back to the item's catalog record (as LoadoutEncoder does)
+        manufacturer = item_data.get('manufacturer')
+        elements = [item_data['element']] if item_data.get('element') else []
+        item_catalog = self.snapshot.catalog
+        if item_catalog is not None and item_data.get('id') and (manufacturer is None or not elements):
+            row = item_catalog.find(item_data['id'], item_data.get('table'))
+            if row >= 0:
+                manufacturer = manufacturer or item_catalog.enum('manufacturer', row)
+                elements = elements or item_catalog.elements(row)
+        
+        if manufacturer is not None and self.section_changed('manufacturers', manufacturer):
+            return True
+        return any(self.section_changed('elements', element) for element in elements)
+
+
+class AssetSnapshot:
+    """
+    One version of the image index, the asset pack and (mtime, size) of every indexed file.
+    Loose files newer than the pack override its entries, so edited images show without a repack.
+    """
+    
+    def __init__(self, index: Dict[str, dict], signatures: Optional[Dict[str, Tuple[int, int]]] = None,
+                 pack: Optional[asset_pack.AssetPack] = None, overrides: Optional[Set[str]] = None):
+        self.index = index
+        if signatures is None:
+            signatures = {}
+            for entry in index.values():
+                if entry['path'] not in signatures:
+                    signatures[entry['path']] = self._signature(assets.BASE_DIR / entry['path'])
+        self.signatures = signatures
+        self.pack = pack
+        if overrides is None:
+            overrides = set()
+            if pack is not None:
+                pack_mtime = pack.signature[0]
+                for original in pack.originals:
+                    entry = index.get(original)
+                    signature = self.signatures.get(entry['path']) if entry else None
+                    if signature and signature[0] > pack_mtime:
+                        overrides.add(original)
+        self.overrides = overrides
+    
+    @staticmethod
+    def _signature(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    @classmethod
+    def load(cls, index_file: Path = assets.INDEX_FILE, pack_file: Path = asset_pack.PACK_FILE) -> 'AssetSnapshot':
+        """Read the image index, stat its files and open the pack (the installed one if unchanged)."""
+        pack = assets.get_asset_pack()
+        signature = cls._signature(pack_file)
+        if pack is None or pack.path != pack_file or pack.signature != signature:
+            pack = assets.open_asset_pack(pack_file) if signature else None
+        return cls(assets.read_image_index(index_file), pack=pack)
+    
+    def _source(self, original: str) -> Optional[tuple]:
+        """Where an original is served from: ('pack', key) or ('file', path, signature)."""
+        if self.pack is not None and original in self.pack.originals and original not in self.overrides:
+            return ('pack', self.pack.originals[original])
+        entry = self.index.get(original)
+        if entry is None:
+            return None
+        return ('file', entry['path'], self.signatures.get(entry['path']))
+    
+    def _icon_paths(self, source: Optional[tuple]) -> List[str]:
+        """icon_cache keys a source may have been decoded under."""
+        if source is None:
+            return []
+        if source[0] == 'pack':
+            return [assets.PACK_PREFIX + key for key in self.pack.sized_keys(source[1])]
+        return [str(assets.BASE_DIR / source[1])]
+    
+    def _same_pack_entry(self, new: 'AssetSnapshot', key: str) -> bool:
+        """Whether an entry (and its thumbnails) has the same bytes in both packs."""
+        if self.pack is new.pack or self.pack.signature == new.pack.signature:
+            return True
+        old_keys, new_keys = self.pack.sized_keys(key), new.pack.sized_keys(key)
+        return old_keys == new_keys and all(self.pack.read(k) == new.pack.read(k) for k in old_keys)
+    
+    def diff(self, new: 'AssetSnapshot') -> 'AssetDiff':
+        """What changed from this snapshot to new."""
+        diff = AssetDiff()
+        originals = self.index.keys() | new.index.keys()
+        for snapshot in (self, new):
+            if snapshot.pack is not None:
+                originals |= snapshot.pack.originals.keys()
+        
+        for original in originals:
+            old_source, new_source = self._source(original), new._source(original)
+            old_entry, new_entry = self.index.get(original), new.index.get(original)
+            if old_source == new_source and old_entry == new_entry:
+                if old_source is None or old_source[0] == 'file' or self._same_pack_entry(new, old_source[1]):
+                    continue
+            diff.originals.add(original)
+            diff.paths.update(self._icon_paths(old_source))
+            diff.paths.update(new._icon_paths(new_source))
+        return diff
+
+
+class AssetDiff:
+    """Changed images (index entries, loose files or pack entries) and the icon paths whose decoded icons are stale."""
+    
+    def __init__(self):
+        # Lowercase original filenames whose entry or file changed
+        self.originals: Set[str] = set()
+        # Icon paths (icon_cache keys: local files or pack: entries) of those images, before and after
+        self.paths: Set[str] = set()
+    
+    @property
+    def empty(self) -> bool:
+        return not self.originals
+
+
+class PreparedSwap:
+    """A new snapshot, its diff against the installed one and caches rebuilt for it off the GUI thread."""
+    
+    def __init__(self, kind: str, snapshot, diff):
+        self.kind = kind
+        self.snapshot = snapshot
+        self.diff = diff
+        self.encoder: Optional[str_weak.LoadoutEncoder] = None
+        self.facet_index: Optional[catalog_query.FacetIndex] = None
+
+
+class HotReloader(QObject):
+    """
+    Accepts new game data and asset snapshots at runtime.
+    Loading, diffing and rebuilding caches run on one background thread (so swaps apply in order);
+    the GUI thread only installs the results and repaints what the diff touches.
+    """
+    
+    # Emitted on the GUI thread after a swap was installed
+    game_data_changed = pyqtSignal(object)  # GameDataDiff
+    assets_changed = pyqtSignal(object)  # AssetDiff
+    
+    # From the worker thread (queued to the GUI thread)
+    _prepared = pyqtSignal(object)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='hot-reload')
+        self._prepared.connect(self._install)
+        
+        # Latest snapshots as seen by the worker; each new one is diffed against these
+        self._game_data = GameDataSnapshot.current()
+        self._assets: Optional[AssetSnapshot] = None
+        self._submit(self._snapshot_assets)
+    
+    def reload(self, changed: Iterable[str]):
+        """Read changed sources (source_watcher CHANGED_* names) from disk and swap them in."""
+        changed = set(changed)
+        if CHANGED_GAME_DATA in changed:
+            self._submit(lambda: self._prepare_game_data(GameDataSnapshot.load()))
+        if CHANGED_IMAGES in changed:
+            self._submit(lambda: self._prepare_assets(AssetSnapshot.load()))
+    
+    def apply_game_data(self, snapshot: GameDataSnapshot):
+        """Swap in a game data snapshot."""
+        self._submit(lambda: self._prepare_game_data(snapshot))
+    
+    def apply_assets(self, snapshot: AssetSnapshot):
+        """Swap in an asset snapshot."""
+        self._submit(lambda: self._prepare_assets(snapshot))
+    
+    def wait(self):
+        """Block until every submitted snapshot is prepared (their installs are still queued)."""
+        self._executor.submit(lambda: None).result()
+    
+    def shutdown(self):
+        """Stop the worker thread, dropping snapshots not prepared yet."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _submit(self, job: Callable[[], Optional[PreparedSwap]]):
+        self._executor.submit(job).add_done_callback(self._on_prepared)
+    
+    def _on_prepared(self, future: Future):
+        """Worker thread: hand a prepared swap to the GUI thread."""
+        if future.cancelled():
+            return
+        try:
+            prepared = future.result()
+        except Exception as e:
+            print(f"WARNING: Could not reload sources: {e}")
+            return
+        if prepared is not None:
+            self._prepared.emit(prepared)
+    
+    def _installed_assets(self) -> AssetSnapshot:
+        """Worker thread: snapshot of what is installed (stat-ing every icon is too slow for the GUI thread)."""
+        return AssetSnapshot(assets.load_image_index(), pack=assets.get_asset_pack(),
+                             overrides=assets.get_pack_overrides())
+    
+    def _snapshot_assets(self) -> Optional[PreparedSwap]:
+        """Worker thread: baseline snapshot, then swap in loose files that are newer than the pack."""
+        self._assets = self._installed_assets()
+        return self._prepare_assets(AssetSnapshot(self._assets.index, self._assets.signatures, self._assets.pack))
+    
+    def _prepare_game_data(self, snapshot: GameDataSnapshot) -> Optional[PreparedSwap]:
+        """Worker thread: diff and rebuild the caches for a game data snapshot."""
+        diff = self._game_data.diff(snapshot)
+        self._game_data = snapshot
+        if diff.empty:
+            return None
+        
+        prepared = PreparedSwap(CHANGED_GAME_DATA, snapshot, diff)
+        prepared.encoder = str_weak.LoadoutEncoder(snapshot.catalog, snapshot.game_data)
+        if snapshot.catalog is not None:
+            # Build the lookup index now rather than on the first find() on the GUI thread
+            snapshot.catalog.find('')
+            if diff.catalog_changed:
+                prepared.facet_index = catalog_query.FacetIndex(snapshot.catalog)
+        return prepared
+    
+    def _prepare_assets(self, snapshot: AssetSnapshot) -> Optional[PreparedSwap]:
+        """Worker thread: diff an asset snapshot."""
+        if self._assets is None:
+            self._assets = self._installed_assets()
+        diff = self._assets.diff(snapshot)
+        self._assets = snapshot
+        if diff.empty:
+            return None
+        return PreparedSwap(CHANGED_IMAGES, snapshot, diff)
+    
+    def _install(self, prepared: PreparedSwap):
+        """GUI thread: install a prepared swap and drop only the caches its diff touches."""
+        diff = prepared.diff
+        if prepared.kind == CHANGED_GAME_DATA:
+            catalog.set_catalog(prepared.snapshot.catalog)
+            str_weak.set_encoder(prepared.encoder)
+            if diff.catalog_changed:
+                catalog_query.set_facet_index(prepared.facet_index)
+                search_index.clear_cache()
+                build_code.clear_cache()
+            if diff.enums_changed or any(section in diff.sections for section in OPTION_SECTIONS):
+                item_editor_dialog.clear_cache()
+            self.game_data_changed.emit(diff)
+        else:
+            assets.set_image_index(prepared.snapshot.index)
+            assets.set_asset_pack(prepared.snapshot.pack, prepared.snapshot.overrides)
+            icon_cache.invalidate(diff.paths)
+            self.assets_changed.emit(diff)
+
+
+def make_edited_catalog(base: catalog.Catalog, edits: int, seed: int = 0) -> catalog.Catalog:
+    """Copy of base with the names of edits random records changed (same enums)."""
+    rng = random.Random(seed)
+    edited = set(rng.sample(range(len(base)), min(edits, len(base))))
+    builder = catalog.CatalogBuilder(base.enums)
+    for row in range(len(base)):
+        record = base.record(row)
+        if row in edited:
+            record['name'] = f"{record['name']} (edited)"
+        builder.add(record)
+    return builder.build()
+
+
+def run_benchmark(base: GameDataSnapshot, edits: int, repeats: int = 20) -> Dict[str, float]:
+    """
+    Time swapping in a catalog with edits changed records.
+    Returns milliseconds per swap for the worker (diff + rebuild) and the GUI thread (install).
+    """
+    reloader = HotReloader()
+    reloader.wait()
+    snapshots = [
+        GameDataSnapshot(make_edited_catalog(base.catalog, edits, seed), base.game_data)
+        for seed in range(repeats)
+    ]
+    
+    prepare_seconds = install_seconds = 0.0
+    changed = 0
+    for snapshot in snapshots:
+        start = time.perf_counter()
+        prepared = reloader._prepare_game_data(snapshot)
+        prepare_seconds += time.perf_counter() - start
+        if prepared is None:
+            continue
+        changed += len(prepared.diff.items)
+        start = time.perf_counter()
+        reloader._install(prepared)
+        install_seconds += time.perf_counter() - start
+    reloader.shutdown()
+    
+    # Leave the editor caches as they were
+    for module in (catalog, catalog_query, search_index, str_weak, build_code, item_editor_dialog):
+        module.clear_cache()
+    
+    return {
+        'records': len(base.catalog),
+        'changed': changed / repeats,
+        'prepare_ms': prepare_seconds / repeats * 1000,
+        'install_ms': install_seconds / repeats * 1000
+    }
+
+
+def print_diff(diff: GameDataDiff):
+    """Print what a game data swap would invalidate."""
+    print(f"  Changed records: {len(diff.items)}")
+    for item_id in sorted(diff.items)[:20]:
+        print(f"    {item_id}")
+    if len(diff.items) > 20:
+        print(f"    ... and {len(diff.items) - 20} more")
+    print(f"  Catalog enums changed: {'yes' if diff.enums_changed else 'no'}")
+    for section, keys in sorted(diff.sections.items()):
+        print(f"  Section {section}: {'all' if keys is None else ', '.join(sorted(keys))}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff game data snapshots the way a running editor would")
+    parser.add_argument('--catalog', type=Path, default=catalog.CATALOG_FILE, help="catalog to compare against")
+    parser.add_argument('--game-data', type=Path, default=catalog.GAME_DATA_FILE, help="game data to compare against")
+    parser.add_argument('--bench', type=int, nargs='?', const=10, metavar='EDITS',
+                        help="time swaps of a catalog with EDITS changed records")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Hot Reload")
+    print("=" * 50)
+    
+    current = GameDataSnapshot.current()
+    if current.catalog is None:
+        print("ERROR: No item catalog found")
+        print("Run extract_game_data.py first.")
+        return
+    
+    if args.bench is not None:
+        results = run_benchmark(current, args.bench)
+        print(f"\nSwapped {results['records']} records, {results['changed']:.0f} changed per swap")
+        print("\nSummary:")
+        print(f"  Worker thread (diff + rebuild): {results['prepare_ms']:.2f} ms")
+        print(f"  GUI thread (install):           {results['install_ms']:.3f} ms")
+        return
+    
+    other = GameDataSnapshot.load(args.catalog, args.game_data)
+    diff = current.diff(other)
+    print(f"\n{catalog.CATALOG_FILE.name} -> {args.catalog}")
+    print("\nSummary:")
+    if diff.empty:
+        print("  No changes")
+    else:
+        print_diff(diff)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Icon Cache for Equipment Editor
+Multi-resolution icon pyramids so slots can scale without re-decoding images
+"""
+
+from typing import Dict, Iterable, List, Optional
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmap
+try:
+    from . import assets
+except ImportError:
+    import assets
+
+# Smallest pyramid level (px); levels halve from the full-size image down to this
+MIN_LEVEL_SIZE = 16
+
+# Pyramid cache (in-memory): icon path -> levels, largest first
+_pyramid_cache: Dict[str, List[QPixmap]] = {}
+
+
+def build_pyramid(pixmap: QPixmap) -> List[QPixmap]:
+    """Build pyramid levels from a full-size pixmap, largest first."""
+    levels = [pixmap]
+    current = pixmap
+    while max(current.width(), current.height()) // 2 >= MIN_LEVEL_SIZE:
+        current = current.scaled(
+            max(current.width() // 2, 1), max(current.height() // 2, 1),
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        levels.append(current)
+    return levels
+
+
+def get_pyramid(icon_path: str) -> Optional[List[QPixmap]]:
+    """Get pyramid levels for an icon path (decoded once), or None."""
+    if icon_path in _pyramid_cache:
+        return _pyramid_cache[icon_path]
+    
+    if assets.is_pack_path(icon_path):
+        pixmap = QPixmap()
+        data = assets.read_asset(icon_path)
+        if data is not None:
+            pixmap.loadFromData(data)
+    else:
+        pixmap = QPixmap(icon_path)
+    if pixmap.isNull():
+        return None
+    
+    levels = build_pyramid(pixmap)
+    _pyramid_cache[icon_path] = levels
+    return levels
+
+
+def get_scaled_icon(icon_path: str, size: int, device_pixel_ratio: float = 1.0,
+                    mode: Qt.TransformationMode = Qt.TransformationMode.SmoothTransformation) -> Optional[QPixmap]:
+    """
+    Get an icon fitting a size x size box (logical pixels).
+    Scales down from the nearest pyramid level that is at least as large.
+    """
+    levels = get_pyramid(icon_path)
+    if not levels:
+        return None
+    
+    target = max(int(round(size * device_pixel_ratio)), 1)
+    
+    # Levels are largest first - keep the last one still covering the target
+    source = levels[0]
+    for level in levels:
+        if max(level.width(), level.height()) < target:
+            break
+        source = level
+    
+    scaled = source.scaled(
+        target, target,
+        Qt.AspectRatioMode.KeepAspectRatio,
+        mode
+    )
+    scaled.setDevicePixelRatio(device_pixel_ratio)
+    return scaled
+
+
+def invalidate(icon_paths: Iterable[str]) -> int:
+    """Drop the pyramids of some icon paths (their files changed). Returns how many were cached."""
+    dropped = 0
+    for icon_path in icon_paths:
+        if _pyramid_cache.pop(icon_path, None) is not None:
+            dropped += 1
+    return dropped
+
+
+def clear_cache():
+    """Drop all cached pyramids."""
+    _pyramid_cache.clear()
@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+"""
+Item Editor Dialog for Equipment Editor
+Select / customize / augment tabs, built the first time each tab is shown
+"""
+
+import sys
+import time
+import argparse
+from typing import Callable, Dict, List, Optional, Tuple
+from PyQt6.QtWidgets import (QApplication, QDialog, QVBoxLayout, QGridLayout, QTabWidget,
+                             QWidget, QLabel, QComboBox, QPushButton, QLineEdit, QListView,
+                             QAbstractItemView, QDialogButtonBox)
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QStandardItemModel, QStandardItem, QIcon
+try:
+    from . import catalog, catalog_query, search_index, styles, icon_cache
+    from .item_picker import (ItemListModel, ItemDelegate, SLOT_ENTITIES, WEAPON_ICON_TYPES,
+                              SEARCH_SETTLE_MS, slot_type_for)
+    from .slot_widget import resolve_slot_icon
+except ImportError:
+    import catalog, catalog_query, search_index, styles, icon_cache
+    from item_picker import (ItemListModel, ItemDelegate, SLOT_ENTITIES, WEAPON_ICON_TYPES,
+                             SEARCH_SETTLE_MS, slot_type_for)
+    from slot_widget import resolve_slot_icon
+
+# Tabs, in display order
+TAB_SELECT = 0
+TAB_CUSTOMIZE = 1
+TAB_AUGMENT = 2
+TAB_TITLES = ["Select Item", "Customize Item", "Select Augment"]
+
+# Item subtypes per entity type (ITEM_SUBTYPES in js/game-data.js)
+ITEM_SUBTYPES = {
+    'bl4-weapon': ['ar', 'pistol', 'smg', 'shotgun', 'sniper'],
+    'bl4-repkit': ['repkit'],
+    'bl4-ordnance': ['grenade', 'heavy-weapon'],
+    'bl4-class-mod': ['class-mod'],
+    'bl4-shield': ['energy', 'armor'],
+    'bl4-enhancement': ['enhancement']
+}
+
+# Rarities offered by "Create New Item" (rows: purple, then legendary)
+CREATE_RARITIES = ['purple', 'orange']
+
+# Which selectors apply to which entity types (as in customize-dialog.js)
+MANUFACTURER_ENTITIES = ('bl4-weapon', 'bl4-ordnance', 'bl4-shield')
+ELEMENT_ENTITIES = ('bl4-weapon', 'bl4-ordnance')
+
+# Augment source for each entity type (ordnance uses its subtype: grenade / heavy-weapon)
+AUGMENT_SOURCES = {
+    'bl4-weapon': 'gun',
+    'bl4-repkit': 'repkit',
+    'bl4-shield': 'shield',
+    'bl4-class-mod': 'class-mod',
+    'bl4-enhancement': 'enhancement'
+}
+
+# Option data role (value stored with each option)
+OptionValueRole = Qt.ItemDataRole.UserRole + 1
+
+
+class OptionModels:
+    """Rarity, manufacturer and element option models, shared by every dialog."""
+    
+    def __init__(self, game_data: dict, item_catalog: Optional[catalog.Catalog] = None):
+        self.rarity = self._build([
+            (catalog_query.RARITY_NAMES[rarity], rarity) for rarity in catalog.RARITIES
+        ])
+        
+        manufacturers = game_data.get('manufacturers') or {}
+        manufacturer_ids = list(manufacturers) or (item_catalog.enums['manufacturer'] if item_catalog else [])
+        self.manufacturer = self._build([("None", None)] + [
+            ((manufacturers.get(key) or {}).get('name') or key.title(), key) for key in manufacturer_ids
+        ])
+        
+        elements = game_data.get('elements') or {}
+        element_ids = list(elements) or (item_catalog.enums['elements'] if item_catalog else [])
+        self.element = self._build([("None", None)] + [
+            ((elements.get(key) or {}).get('name') or key.title(), key) for key in element_ids
+        ])
+    
+    @staticmethod
+    def _build(options: List[Tuple[str, Optional[str]]]) -> QStandardItemModel:
+        model = QStandardItemModel()
+        for text, value in options:
+            item = QStandardItem(text)
+            item.setData(value, OptionValueRole)
+            item.setEditable(False)
+            model.appendRow(item)
+        return model
+    
+    @staticmethod
+    def find(model: QStandardItemModel, value: Optional[str]) -> int:
+        """Get option row for a value (0 if not found)."""
+        for row in range(model.rowCount()):
+            if model.item(row).data(OptionValueRole) == value:
+                return row
+        return 0
+
+
+# Shared option models (built on first dialog)
+_option_models = None
+
+
+def get_option_models() -> OptionModels:
+    """Get the shared option models, building them once from game data."""
+    global _option_models
+    
+    if _option_models is None:
+        _option_models = OptionModels(catalog.load_game_data(), catalog.get_catalog())
+    
+    return _option_models
+
+
+def clear_cache():
+    """Drop the shared option models (rebuilt from game data by the next dialog)."""
+    global _option_models
+    _option_models = None
+
+
+def entity_for_slot(slot_id: str) -> Optional[str]:
+    """Get entity type for a slot id."""
+    return SLOT_ENTITIES.get(slot_id)
+
+
+def augment_bitmap(facet_index: catalog_query.FacetIndex, entity: str, item_data: dict) -> int:
+    """Rows of augments that fit an item (AugmentSelector.getAvailableAugments)."""
+    source = item_data.get('subtype') if entity == 'bl4-ordnance' else AUGMENT_SOURCES.get(entity)
+    if not source:
+        return 0
+    bitmap = facet_index.query({'entity': ['bl4-augment'], 'source': [source]}, counts=False).bitmap
+    
+    # Manufacturer-specific augments only for the item's own manufacturer
+    specific = facet_index.facet_bitmap('subtype', ['manufacturer-specific'])
+    own = facet_index.facet_bitmap('manufacturer', [item_data['manufacturer']]) if item_data.get('manufacturer') else 0
+    return bitmap & ~(specific & ~own)
+
+
+class ItemEditorDialog(QDialog):
+    """
+    Item editor with select / customize / augment tabs.
+    Tab pages start empty and are filled the first time they become current.
+    """
+    
+    def __init__(self, slot_id: str = 'weapon1', current_item: Optional[dict] = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Customize Item")
+        self.setMinimumSize(600, 600)
+        self.setPalette(styles.get_theme().window_palette)
+        self.setAutoFillBackground(True)
+        
+        self.slot_id = slot_id
+        self.entity = entity_for_slot(slot_id)
+        self.item = dict(current_item) if current_item else None
+        self.options = get_option_models()
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        
+        self.tabs = QTabWidget()
+        self._builders: List[Callable[[QWidget], None]] = [
+            self._build_select_tab,
+            self._build_customize_tab,
+            self._build_augment_tab
+        ]
+        self._built = set()
+        for title in TAB_TITLES:
+            page = QWidget()
+            QVBoxLayout(page)
+            self.tabs.addTab(page, title)
+        layout.addWidget(self.tabs, 1)
+        
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Save | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self._on_save)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        # Customize tab if there is an item already, else select tab (as in customize-dialog.js)
+        self.tabs.currentChanged.connect(self._ensure_tab)
+        self.tabs.setCurrentIndex(TAB_CUSTOMIZE if self.item else TAB_SELECT)
+        self._ensure_tab(self.tabs.currentIndex())
+    
+    def _ensure_tab(self, index: int):
+        """Build a tab page on first show."""
+        if index < 0 or index in self._built:
+            return
+        self._built.add(index)
+        self._builders[index](self.tabs.widget(index))
+    
+    def _invalidate_tabs(self, *indexes: int):
+        """Drop built tab contents so they are rebuilt from the current item on next show."""
+        for index in indexes:
+            if index not in self._built:
+                continue
+            self._built.discard(index)
+            page = self.tabs.widget(index)
+            layout = page.layout()
+            while layout.count():
+                child = layout.takeAt(0)
+                if child.widget():
+                    child.widget().deleteLater()
+                elif child.layout():
+                    QWidget().setLayout(child.layout())
+        if self.tabs.currentIndex() in indexes:
+            self._ensure_tab(self.tabs.currentIndex())
+    
+    def _build_select_tab(self, page: QWidget):
+        """Create New Item: one button per subtype and rarity."""
+        layout = page.layout()
+        if not self.entity:
+            layout.addWidget(QLabel("Please select a slot first."))
+            return
+        
+        layout.addWidget(QLabel("Create New Item"))
+        grid = QGridLayout()
+        grid.setSpacing(8)
+        slot_type = slot_type_for(self.slot_id)
+        for row, rarity in enumerate(CREATE_RARITIES):
+            stylesheet = styles.get_rarity_button_stylesheet(rarity)
+            for column, subtype in enumerate(ITEM_SUBTYPES.get(self.entity, [])):
+                button = QPushButton(catalog_query.SUBTYPE_NAMES.get(subtype, subtype))
+                button.setStyleSheet(stylesheet)
+                button.setCheckable(True)
+                button.setChecked(bool(self.item) and self.item.get('subtype') == subtype
+                                  and self.item.get('rarity') == rarity)
+                icon_path = resolve_slot_icon(slot_type, {'weaponType': WEAPON_ICON_TYPES.get(subtype, subtype)})
+                if icon_path:
+                    pixmap = icon_cache.get_scaled_icon(icon_path, 32, self.devicePixelRatioF())
+                    if pixmap is not None:
+                        button.setIcon(QIcon(pixmap))
+                button.clicked.connect(lambda checked=False, s=subtype, r=rarity: self.create_item(s, r))
+                grid.addWidget(button, row, column)
+        layout.addLayout(grid)
+        layout.addStretch(1)
+    
+    def _build_customize_tab(self, page: QWidget):
+        """Rarity, manufacturer and element selectors over the shared option models."""
+        layout = page.layout()
+        if not self.item:
+            layout.addWidget(QLabel("No item selected. Please select an item first."))
+            return
+        
+        title = self.item.get('name') or catalog_query.SUBTYPE_NAMES.get(self.item.get('subtype'), 'Item')
+        layout.addWidget(QLabel(title))
+        
+        self.rarity_combo = self._option_combo(self.options.rarity, self.item.get('rarity', 'gray'), 'rarity')
+        layout.addWidget(QLabel("Rarity"))
+        layout.addWidget(self.rarity_combo)
+        
+        if self.entity in MANUFACTURER_ENTITIES:
+            layout.addWidget(QLabel("Manufacturer"))
+            layout.addWidget(self._option_combo(self.options.manufacturer, self.item.get('manufacturer'), 'manufacturer'))
+        
+        if self.entity in ELEMENT_ENTITIES:
+            layout.addWidget(QLabel("Element"))
+            layout.addWidget(self._option_combo(self.options.element, self.item.get('element'), 'element'))
+        
+        layout.addStretch(1)
+    
+    def _option_combo(self, model: QStandardItemModel, value: Optional[str], key: str) -> QComboBox:
+        """Combo box over a shared option model, writing its value into the item."""
+        combo = QComboBox()
+        combo.setModel(model)
+        combo.setCurrentIndex(OptionModels.find(model, value))
+        combo.currentIndexChanged.connect(lambda row: self._set_item_value(key, model.item(row).data(OptionValueRole)))
+        return combo
+    
+    def _set_item_value(self, key: str, value: Optional[str]):
+        if self.item is None:
+            return
+        if value is None:
+            self.item.pop(key, None)
+        else:
+            self.item[key] = value
+        # Available augments depend on the manufacturer
+        if key == 'manufacturer':
+            self._invalidate_tabs(TAB_AUGMENT)
+    
+    def _build_augment_tab(self, page: QWidget):
+        """Searchable augment list; selected rows are the item's augments."""
+        layout = page.layout()
+        facet_index = catalog_query.get_facet_index()
+        if not self.item or not self.entity:
+            layout.addWidget(QLabel("Please select an item first."))
+            return
+        if facet_index is None:
+            layout.addWidget(QLabel(f"Item catalog not found: {catalog.CATALOG_FILE}"))
+            return
+        
+        self._augment_rows = augment_bitmap(facet_index, self.entity, self.item)
+        
+        search_edit = QLineEdit()
+        search_edit.setPlaceholderText("Search...")
+        search_edit.setClearButtonEnabled(True)
+        layout.addWidget(search_edit)
+        
+        self.augment_model = ItemListModel(facet_index.catalog, slot_type_for(self.slot_id), page)
+        self.augment_model.set_rows(catalog_query.iter_bits(self._augment_rows))
+        self.augment_view = QListView()
+        self.augment_view.setUniformItemSizes(True)
+        self.augment_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.augment_view.setSelectionMode(QAbstractItemView.SelectionMode.MultiSelection)
+        self.augment_view.setItemDelegate(ItemDelegate(self.augment_view))
+        self.augment_view.setModel(self.augment_model)
+        self.augment_view.selectionModel().selectionChanged.connect(self._on_augments_changed)
+        layout.addWidget(self.augment_view, 1)
+        
+        if not self.augment_model.total_count():
+            layout.addWidget(QLabel("No augments available for this item type."))
+        
+        search_timer = QTimer(page)
+        search_timer.setSingleShot(True)
+        search_timer.setInterval(SEARCH_SETTLE_MS)
+        search_timer.timeout.connect(lambda: self._filter_augments(search_edit.text()))
+        search_edit.textChanged.connect(lambda text: search_timer.start())
+        
+        self._select_augments()
+    
+    def _filter_augments(self, text: str):
+        """Show augments matching the search text (all if empty)."""
+        query = text.strip()
+        if query:
+            index = search_index.get_search_index()
+            if index is None:
+                return
+            rows = [row for row, score in index.search(query, limit=len(self.augment_model.catalog),
+                                                       allowed=self._augment_rows)]
+        else:
+            rows = list(catalog_query.iter_bits(self._augment_rows))
+        self.augment_model.set_rows(rows)
+        self._select_augments()
+    
+    def _select_augments(self):
+        """Select the listed rows that are in the item's augments."""
+        selected = set(self.item.get('augments') or [])
+        if not selected:
+            return
+        item_catalog = self.augment_model.catalog
+        selection = self.augment_view.selectionModel()
+        selection.blockSignals(True)
+        while self.augment_model.canFetchMore():
+            self.augment_model.fetchMore()
+        for position in range(self.augment_model.rowCount()):
+            index = self.augment_model.index(position)
+            if item_catalog.string('id', self.augment_model.catalog_row(index)) in selected:
+                selection.select(index, selection.SelectionFlag.Select)
+        selection.blockSignals(False)
+    
+    def _on_augments_changed(self, selected, deselected):
+        item_catalog = self.augment_model.catalog
+        augments = list(self.item.get('augments') or [])
+        for index in deselected.indexes():
+            augment_id = item_catalog.string('id', self.augment_model.catalog_row(index))
+            if augment_id in augments:
+                augments.remove(augment_id)
+        for index in selected.indexes():
+            augment_id = item_catalog.string('id', self.augment_model.catalog_row(index))
+            if augment_id not in augments:
+                augments.append(augment_id)
+        self.item['augments'] = augments
+    
+    def create_item(self, subtype: str, rarity: str):
+        """Start a new item of a subtype and rarity, then switch to the customize tab."""
+        self.item = {'entity': self.entity, 'subtype': subtype, 'rarity': rarity}
+        if subtype in WEAPON_ICON_TYPES:
+            self.item['weaponType'] = WEAPON_ICON_TYPES[subtype]
+        self._invalidate_tabs(TAB_SELECT, TAB_CUSTOMIZE, TAB_AUGMENT)
+        self.tabs.setCurrentIndex(TAB_CUSTOMIZE)
+    
+    def _on_save(self):
+        if self.item:
+            self.accept()
+    
+    def get_item(self) -> Optional[dict]:
+        """Get the edited item data."""
+        return self.item
+
+
+def run_benchmark(app: QApplication, slot_id: str, opens: int = 10) -> Dict[str, float]:
+    """Time the first dialog open (builds shared models) and later opens, in ms."""
+    item = {'entity': entity_for_slot(slot_id), 'subtype': 'ar', 'rarity': 'purple', 'manufacturer': 'jakobs'}
+    timings = []
+    for _ in range(opens):
+        start = time.perf_counter()
+        dialog = ItemEditorDialog(slot_id, item)
+        dialog.show()
+        app.processEvents()
+        timings.append((time.perf_counter() - start) * 1000)
+        dialog.close()
+        dialog.deleteLater()
+        app.processEvents()
+    return {'first_ms': timings[0], 'next_ms': sum(timings[1:]) / max(len(timings) - 1, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open the item editor dialog for a slot")
+    parser.add_argument('--slot', default='weapon1', choices=list(SLOT_ENTITIES), help="slot id")
+    parser.add_argument('--bench', action='store_true', help="time first and repeated dialog opens")
+    args = parser.parse_args()
+    
+    app = QApplication(sys.argv)
+    
+    if args.bench:
+        stats = run_benchmark(app, args.slot)
+        print(f"First open: {stats['first_ms']:.1f} ms")
+        print(f"Next opens: {stats['next_ms']:.1f} ms")
+        return
+    
+    dialog = ItemEditorDialog(args.slot)
+    if dialog.exec():
+        print(f"Saved: {dialog.get_item()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Item Picker for Equipment Editor
+Virtualized catalog list (model + delegate) opened when a slot is clicked
+"""
+
+import sys
+import time
+import argparse
+from array import array
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtWidgets import (QApplication, QDialog, QVBoxLayout, QLineEdit, QListView,
+                             QStyledItemDelegate, QStyle, QDialogButtonBox, QLabel)
+from PyQt6.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QRect, QTimer
+from PyQt6.QtGui import QPainter, QPixmap, QColor, QFont
+try:
+    from . import catalog, catalog_query, search_index, styles, icon_cache
+    from .slot_widget import resolve_slot_icon
+except ImportError:
+    import catalog, catalog_query, search_index, styles, icon_cache
+    from slot_widget import resolve_slot_icon
+
+# Row geometry (logical px)
+ROW_HEIGHT = 48
+ROW_ICON_SIZE = 40
+RARITY_BAR_WIDTH = 4
+
+# Rows handed to the view per fetchMore() call
+FETCH_BATCH = 256
+
+# Delay before a search runs after the last keystroke (ms)
+SEARCH_SETTLE_MS = 80
+
+# Slot id -> catalog entity type
+SLOT_ENTITIES = {
+    'weapon1': 'bl4-weapon',
+    'weapon2': 'bl4-weapon',
+    'weapon3': 'bl4-weapon',
+    'weapon4': 'bl4-weapon',
+    'repkit': 'bl4-repkit',
+    'ordnance': 'bl4-ordnance',
+    'class-mod': 'bl4-class-mod',
+    'shield': 'bl4-shield',
+    'enhancement': 'bl4-enhancement'
+}
+
+# Catalog weapon subtype -> weaponType used by slot icons (assets.get_weapon_icon)
+WEAPON_ICON_TYPES = {
+    'ar': 'assault',
+    'pistol': 'pistol',
+    'smg': 'smg',
+    'shotgun': 'shotgun',
+    'sniper': 'sniper'
+}
+
+# Custom item roles
+RowRole = Qt.ItemDataRole.UserRole + 1
+RarityRole = Qt.ItemDataRole.UserRole + 2
+SubtitleRole = Qt.ItemDataRole.UserRole + 3
+
+
+def slot_type_for(slot_id: str) -> str:
+    """Get slot type ('weapon', 'repkit', ...) for a slot id."""
+    return 'weapon' if slot_id.startswith('weapon') else slot_id
+
+
+def item_from_row(item_catalog: catalog.Catalog, row: int, current_item: Optional[dict] = None) -> dict:
+    """Build slot item data for a catalog row (keys used by SlotWidget, plus catalog identity)."""
+    subtype = item_catalog.enum('subtype', row)
+    item_data = {
+        'id': item_catalog.string('id', row),
+        'table': item_catalog.string('table', row),
+        'name': item_catalog.string('name', row),
+        'entity': item_catalog.enum('entity', row),
+        'subtype': subtype,
+        'rarity': item_catalog.enum('rarity', row) or (current_item or {}).get('rarity') or 'gray'
+    }
+    manufacturer = item_catalog.enum('manufacturer', row)
+    if manufacturer:
+        item_data['manufacturer'] = manufacturer
+    if subtype in WEAPON_ICON_TYPES:
+        item_data['weaponType'] = WEAPON_ICON_TYPES[subtype]
+    return item_data
+
+
+class ItemListModel(QAbstractListModel):
+    """
+    List model over catalog row numbers. Display data is read from the catalog
+    columns when a row is painted; rows are exposed to the view in batches.
+    """
+    
+    def __init__(self, item_catalog: catalog.Catalog, slot_type: str, parent=None):
+        super().__init__(parent)
+        self.catalog = item_catalog
+        self.slot_type = slot_type
+        self._rows = array('i')
+        self._fetched = 0
+        # (weapon icon type, pixel ratio) -> scaled icon; rows share a handful of icons
+        self._icons: Dict[Tuple[str, float], Optional[QPixmap]] = {}
+        self.device_pixel_ratio = 1.0
+    
+    def set_rows(self, rows):
+        """Replace the listed catalog rows."""
+        self.beginResetModel()
+        self._rows = array('i', rows)
+        self._fetched = min(len(self._rows), FETCH_BATCH)
+        self.endResetModel()
+    
+    def catalog_row(self, index: QModelIndex) -> int:
+        """Get catalog row number for a model index (-1 if invalid)."""
+        if not index.isValid() or index.row() >= self._fetched:
+            return -1
+        return self._rows[index.row()]
+    
+    def total_count(self) -> int:
+        """Get number of rows listed (fetched or not)."""
+        return len(self._rows)
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return self._fetched
+    
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._fetched < len(self._rows)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(FETCH_BATCH, len(self._rows) - self._fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+    
+    def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+        row = self.catalog_row(index)
+        if row < 0:
+            return None
+        
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.catalog.string('name', row)
+        if role == RowRole:
+            return row
+        if role == RarityRole:
+            return self.catalog.enum('rarity', row) or 'gray'
+        if role == SubtitleRole:
+            subtype = self.catalog.enum('subtype', row)
+            parts = [catalog_query.SUBTYPE_NAMES.get(subtype, subtype or '')]
+            manufacturer = self.catalog.enum('manufacturer', row)
+            character = self.catalog.enum('character', row)
+            if manufacturer or character:
+                parts.append((manufacturer or character).capitalize())
+            return ' - '.join(part for part in parts if part)
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._icon(row)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            description = self.catalog.string('description', row)
+            return search_index.strip_markup(description) if description else None
+        return None
+    
+    def _icon_type(self, row: int) -> str:
+        """Get the weapon icon type of a row ('' outside weapon slots: one icon per slot type)."""
+        if self.slot_type != 'weapon':
+            return ''
+        return WEAPON_ICON_TYPES.get(self.catalog.enum('subtype', row), 'assault')
+    
+    def _icon(self, row: int) -> Optional[QPixmap]:
+        """Get the row icon, resolved and scaled once per icon type and pixel ratio."""
+        key = (self._icon_type(row), self.device_pixel_ratio)
+        if key not in self._icons:
+            icon_path = resolve_slot_icon(self.slot_type, item_from_row(self.catalog, row))
+            self._icons[key] = (icon_cache.get_scaled_icon(icon_path, ROW_ICON_SIZE, self.device_pixel_ratio)
+                                if icon_path else None)
+        return self._icons[key]
+
+
+class ItemDelegate(QStyledItemDelegate):
+    """Paints one picker row: rarity bar, icon, name and subtitle."""
+    
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(option.rect.width(), ROW_HEIGHT)
+    
+    def paint(self, painter: QPainter, option, index):
+        theme = styles.get_theme()
+        rect = option.rect
+        painter.save()
+        
+        # Background
+        if option.state & QStyle.StateFlag.State_Selected:
+            painter.fillRect(rect, theme.grey_3)
+        elif option.state & QStyle.StateFlag.State_MouseOver:
+            painter.fillRect(rect, theme.grey_2)
+        else:
+            painter.fillRect(rect, theme.dark_bg)
+        
+        # Rarity bar
+        rarity = theme.get_rarity(index.data(RarityRole))
+        painter.fillRect(QRect(rect.left(), rect.top(), RARITY_BAR_WIDTH, rect.height()), rarity.border_pen.color())
+        
+        # Icon
+        text_left = rect.left() + RARITY_BAR_WIDTH + 8
+        icon = index.data(Qt.ItemDataRole.DecorationRole)
+        if icon is not None:
+            icon_width = icon.width() / icon.devicePixelRatio()
+            icon_height = icon.height() / icon.devicePixelRatio()
+            painter.drawPixmap(
+                int(text_left + (ROW_ICON_SIZE - icon_width) / 2),
+                int(rect.top() + (rect.height() - icon_height) / 2),
+                icon
+            )
+        text_left += ROW_ICON_SIZE + 8
+        text_width = rect.right() - text_left - 8
+        half = rect.height() // 2
+        
+        # Name (upper half) and subtitle (lower half), meeting at the row center
+        name_font = QFont(option.font)
+        name_font.setBold(True)
+        painter.setFont(name_font)
+        painter.setPen(QColor('#ffffff'))
+        painter.drawText(QRect(text_left, rect.top(), text_width, half),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignBottom, index.data() or '')
+        
+        painter.setFont(option.font)
+        painter.setPen(QColor('#b0b0b0'))
+        painter.drawText(QRect(text_left, rect.top() + half, text_width, rect.height() - half),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop, index.data(SubtitleRole) or '')
+        
+        # Row separator
+        painter.fillRect(QRect(rect.left(), rect.bottom(), rect.width(), 1), theme.base_bg)
+        
+        painter.restore()
+
+
+class ItemPickerDialog(QDialog):
+    """Dialog listing catalog items for one slot, with search."""
+    
+    def __init__(self, slot_id: str, current_item: Optional[dict] = None,
+                 facet_index: Optional[catalog_query.FacetIndex] = None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Select Item")
+        self.setMinimumSize(420, 560)
+        self.slot_id = slot_id
+        self.current_item = current_item or {}
+        self._selected_item = None
+        
+        facet_index = facet_index or catalog_query.get_facet_index()
+        self.catalog = facet_index.catalog if facet_index else None
+        self.setPalette(styles.get_theme().window_palette)
+        self.setAutoFillBackground(True)
+        
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(12, 12, 12, 12)
+        layout.setSpacing(8)
+        
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("Search...")
+        self.search_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.search_edit)
+        
+        self.count_label = QLabel()
+        self.count_label.setStyleSheet("color: #b0b0b0;")
+        layout.addWidget(self.count_label)
+        
+        self.list_view = QListView()
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.list_view.setItemDelegate(ItemDelegate(self.list_view))
+        layout.addWidget(self.list_view, 1)
+        
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self._on_accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+        
+        if self.catalog is None:
+            self.count_label.setText(f"Item catalog not found: {catalog.CATALOG_FILE}")
+            self.search_edit.setEnabled(False)
+            return
+        
+        self.model = ItemListModel(self.catalog, slot_type_for(slot_id), self)
+        self.model.device_pixel_ratio = self.devicePixelRatioF()
+        self.list_view.setModel(self.model)
+        self.list_view.doubleClicked.connect(lambda index: self._on_accept())
+        
+        # Rows for this slot's entity type (bitmap also restricts search results)
+        entity = SLOT_ENTITIES.get(slot_id)
+        self._slot_result = facet_index.query({'entity': [entity]} if entity else None, counts=False)
+        self._show_rows(self._slot_result.rows())
+        
+        # Search runs after typing settles; the index is loaded on first search only
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(SEARCH_SETTLE_MS)
+        self._search_timer.timeout.connect(self._run_search)
+        self.search_edit.textChanged.connect(lambda text: self._search_timer.start())
+        
+        self._select_current()
+    
+    def _show_rows(self, rows: List[int]):
+        """Show catalog rows in the list."""
+        self.model.set_rows(rows)
+        self.count_label.setText(f"{self.model.total_count()} items")
+    
+    def _run_search(self):
+        """Filter the list by the search text (ranked), or show all slot items."""
+        query = self.search_edit.text().strip()
+        if not query:
+            self._show_rows(self._slot_result.rows())
+            return
+        index = search_index.get_search_index()
+        if index is None or index.catalog is not self.catalog:
+            return
+        results = index.search(query, limit=self._slot_result.bitmap.bit_count(), allowed=self._slot_result.bitmap)
+        self._show_rows([row for row, score in results])
+    
+    def _select_current(self):
+        """Select the row of the item currently in the slot, if listed."""
+        item_id = self.current_item.get('id')
+        if not item_id:
+            return
+        row = self.catalog.find(item_id, self.current_item.get('table'))
+        while True:
+            for position in range(self.model.rowCount()):
+                if self.model.catalog_row(self.model.index(position)) == row:
+                    index = self.model.index(position)
+                    self.list_view.setCurrentIndex(index)
+                    self.list_view.scrollTo(index)
+                    return
+            if not self.model.canFetchMore():
+                return
+            self.model.fetchMore()
+    
+    def _on_accept(self):
+        """Accept the current row."""
+        row = self.model.catalog_row(self.list_view.currentIndex())
+        if row < 0:
+            return
+        self._selected_item = item_from_row(self.catalog, row, self.current_item)
+        self.accept()
+    
+    def selected_item(self) -> Optional[dict]:
+        """Get item data for the accepted row, or None."""
+        return self._selected_item
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Open the item picker for a slot")
+    parser.add_argument('--slot', default='weapon1', choices=list(SLOT_ENTITIES), help="slot id")
+    parser.add_argument('--bench', type=int, metavar='ROWS', help="time first show with a synthetic catalog of ROWS rows")
+    args = parser.parse_args()
+    
+    app = QApplication(sys.argv)
+    
+    facet_index = None
+    if args.bench:
+        base = catalog.get_catalog()
+        if base is None:
+            print(f"ERROR: Item catalog not found: {catalog.CATALOG_FILE}")
+            return
+        facet_index = catalog_query.FacetIndex(catalog_query.make_synthetic_catalog(base, args.bench))
+    
+    start = time.perf_counter()
+    dialog = ItemPickerDialog(args.slot, facet_index=facet_index)
+    dialog.show()
+    app.processEvents()
+    shown_ms = (time.perf_counter() - start) * 1000
+    
+    if args.bench:
+        print(f"Rows: {len(facet_index.catalog)}")
+        print(f"Listed: {dialog.model.total_count()} (fetched {dialog.model.rowCount()})")
+        print(f"First show: {shown_ms:.1f} ms")
+        return
+    
+    if dialog.exec():
+        print(f"Selected: {dialog.selected_item()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+Loadout Grid for Equipment Editor
+Flyweight renderer drawing many loadouts in one scrollable view from shared caches
+"""
+
+import sys
+import time
+import random
+import argparse
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtWidgets import QAbstractScrollArea, QApplication
+from PyQt6.QtCore import Qt, pyqtSignal, QRect, QRectF, QPoint
+from PyQt6.QtGui import QPainter, QPixmap, QPalette
+try:
+    from . import styles, icon_cache
+    from .slot_widget import paint_slot_chrome, paint_empty_marker, paint_number_badge, resolve_slot_icon
+    from .equipment_widget import WeaponsContainer
+except ImportError:
+    import styles, icon_cache
+    from slot_widget import paint_slot_chrome, paint_empty_marker, paint_number_badge, resolve_slot_icon
+    from equipment_widget import WeaponsContainer
+
+# Cell geometry (logical px)
+CELL_WIDTH = 220
+CELL_SPACING = 12
+CELL_MARGIN = 8
+
+# Slot id -> (slot type, weapon number), same ids as EquipmentWidget.equipment
+SLOT_TYPES = {
+    'weapon1': ('weapon', 1),
+    'weapon2': ('weapon', 2),
+    'weapon3': ('weapon', 3),
+    'weapon4': ('weapon', 4),
+    'repkit': ('repkit', None),
+    'ordnance': ('ordnance', None),
+    'class-mod': ('class-mod', None),
+    'shield': ('shield', None),
+    'enhancement': ('enhancement', None)
+}
+
+# Shared caches (in-memory), reused by every cell of every view
+_chrome_cache: Dict[Tuple[str, str, int, int, float, float], QPixmap] = {}
+_icon_path_cache: Dict[Tuple[str, str], Optional[str]] = {}
+_scaled_icon_cache: Dict[Tuple[str, int, float], Optional[QPixmap]] = {}
+
+
+class LoadoutLayout:
+    """Slot rects inside one loadout cell. Computed once per cell width and shared by all cells."""
+    
+    def __init__(self, cell_width: int):
+        self.cell_width = cell_width
+        inner_width = cell_width - 2 * CELL_MARGIN
+        
+        # Same proportions as EquipmentWidget (400px wide cross, 32px section spacing, 12px gaps);
+        # scale maps editor coordinates into the cell so badges and markers shrink with it
+        self.scale = inner_width / WeaponsContainer.BASE_WIDTH
+        section_spacing = max(int(32 * self.scale), 2)
+        gap = max(int(12 * self.scale), 1)
+        
+        self.rects: Dict[str, QRect] = {}
+        
+        cross_height = int(inner_width * WeaponsContainer.ASPECT_RATIO)
+        for slot_id, rect in WeaponsContainer.cross_geometry(inner_width, cross_height).items():
+            self.rects[slot_id] = rect.translated(CELL_MARGIN, CELL_MARGIN)
+        y = CELL_MARGIN + cross_height + section_spacing
+        
+        # Support row (aspect ratio 159/82)
+        support_width = (inner_width - gap) // 2
+        support_height = support_width * 82 // 159
+        for i, slot_id in enumerate(['repkit', 'ordnance']):
+            self.rects[slot_id] = QRect(CELL_MARGIN + i * (support_width + gap), y, support_width, support_height)
+        y += support_height + section_spacing
+        
+        # Auxiliaries row (aspect ratio 12/10)
+        aux_width = (inner_width - 2 * gap) // 3
+        aux_height = aux_width * 10 // 12
+        for i, slot_id in enumerate(['class-mod', 'shield', 'enhancement']):
+            self.rects[slot_id] = QRect(CELL_MARGIN + i * (aux_width + gap), y, aux_width, aux_height)
+        y += aux_height
+        
+        self.cell_height = y + CELL_MARGIN
+    
+    def slot_at(self, pos: QPoint) -> Optional[str]:
+        """Get slot id at a position relative to the cell, or None."""
+        for slot_id, rect in self.rects.items():
+            if rect.contains(pos):
+                return slot_id
+        return None
+
+
+def get_slot_chrome(slot_id: str, rarity: str, width: int, height: int, scale: float,
+                    device_pixel_ratio: float) -> QPixmap:
+    """
+    Get pre-rendered border, background and badge for a slot (rendered once per key).
+    The slot is painted in editor coordinates and scaled down to width x height.
+    """
+    key = (slot_id, rarity, width, height, scale, device_pixel_ratio)
+    pixmap = _chrome_cache.get(key)
+    if pixmap is not None:
+        return pixmap
+    
+    slot_type, weapon_number = SLOT_TYPES[slot_id]
+    theme = styles.get_theme()
+    
+    pixmap = QPixmap(int(width * device_pixel_ratio), int(height * device_pixel_ratio))
+    pixmap.setDevicePixelRatio(device_pixel_ratio)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.scale(scale, scale)
+    rect = QRectF(0, 0, width / scale, height / scale)
+    paint_slot_chrome(painter, rect, slot_type, weapon_number, theme.get_rarity(rarity))
+    if weapon_number:
+        paint_number_badge(painter, rect, weapon_number, theme)
+    painter.end()
+    
+    _chrome_cache[key] = pixmap
+    return pixmap
+
+
+def get_item_icon(slot_type: str, item_data: dict, size: int, device_pixel_ratio: float) -> Optional[QPixmap]:
+    """Get a scaled item icon, resolving and scaling each (icon, size) only once."""
+    path_key = (slot_type, item_data.get('weaponType', 'assault') if slot_type == 'weapon' else '')
+    if path_key not in _icon_path_cache:
+        _icon_path_cache[path_key] = resolve_slot_icon(slot_type, item_data)
+    icon_path = _icon_path_cache[path_key]
+    if icon_path is None:
+        return None
+    
+    icon_key = (icon_path, size, device_pixel_ratio)
+    if icon_key not in _scaled_icon_cache:
+        _scaled_icon_cache[icon_key] = icon_cache.get_scaled_icon(icon_path, size, device_pixel_ratio)
+    return _scaled_icon_cache[icon_key]
+
+
+def clear_caches():
+    """Drop shared chrome and icon caches (e.g. after a theme or asset change)."""
+    _chrome_cache.clear()
+    _icon_path_cache.clear()
+    _scaled_icon_cache.clear()
+
+
+class LoadoutGridView(QAbstractScrollArea):
+    """Single widget that paints any number of loadouts; only visible cells are drawn."""
+    
+    loadout_clicked = pyqtSignal(int, str)  # loadout index, slot_id
+    
+    def __init__(self, cell_width: int = CELL_WIDTH, parent=None):
+        super().__init__(parent)
+        self.setObjectName("LoadoutGridView")
+        self.viewport().setAutoFillBackground(True)
+        self.viewport().setBackgroundRole(QPalette.ColorRole.Window)
+        self.viewport().setPalette(styles.get_theme().window_palette)
+        self.verticalScrollBar().setSingleStep(24)
+        
+        self._loadouts: List[Dict[str, Optional[dict]]] = []
+        self._layout = LoadoutLayout(cell_width)
+    
+    def set_loadouts(self, loadouts: List[Dict[str, Optional[dict]]]):
+        """Set loadouts to display (slot_id -> item dict, like EquipmentWidget.equipment)."""
+        self._loadouts = loadouts
+        self._update_scrollbars()
+        self.viewport().update()
+    
+    def loadout_count(self) -> int:
+        """Get number of loadouts displayed."""
+        return len(self._loadouts)
+    
+    def _columns(self) -> int:
+        """Get number of cell columns for the current viewport width."""
+        pitch = self._layout.cell_width + CELL_SPACING
+        return max(1, (self.viewport().width() - CELL_SPACING) // pitch)
+    
+    def _row_pitch(self) -> int:
+        """Get vertical distance between cell rows."""
+        return self._layout.cell_height + CELL_SPACING
+    
+    def _update_scrollbars(self):
+        """Update scroll range from loadout count and viewport size."""
+        rows = (len(self._loadouts) + self._columns() - 1) // self._columns()
+        content_height = CELL_SPACING + rows * self._row_pitch()
+        scrollbar = self.verticalScrollBar()
+        scrollbar.setPageStep(self.viewport().height())
+        scrollbar.setRange(0, max(0, content_height - self.viewport().height()))
+    
+    def _cell_origin(self, index: int) -> QPoint:
+        """Get top-left of a cell in viewport coordinates."""
+        columns = self._columns()
+        row, column = divmod(index, columns)
+        x = CELL_SPACING + column * (self._layout.cell_width + CELL_SPACING)
+        y = CELL_SPACING + row * self._row_pitch() - self.verticalScrollBar().value()
+        return QPoint(x, y)
+    
+    def resizeEvent(self, event):
+        """Handle resize - reflow columns."""
+        super().resizeEvent(event)
+        self._update_scrollbars()
+    
+    def scrollContentsBy(self, dx: int, dy: int):
+        """Handle scroll - repaint the viewport (no child widgets to move)."""
+        self.viewport().update()
+    
+    def paintEvent(self, event):
+        """Paint visible loadouts from the shared caches."""
+        if not self._loadouts:
+            return
+        
+        painter = QPainter(self.viewport())
+        theme = styles.get_theme()
+        dpr = self.viewport().devicePixelRatioF()
+        scale = self._layout.scale
+        columns = self._columns()
+        pitch = self._row_pitch()
+        
+        # Visible row range only - cost is independent of the loadout count
+        scroll = self.verticalScrollBar().value()
+        first_row = max(0, (scroll + event.rect().top() - CELL_SPACING) // pitch)
+        last_row = (scroll + event.rect().bottom()) // pitch
+        first = first_row * columns
+        last = min(len(self._loadouts), (last_row + 1) * columns)
+        
+        for index in range(first, last):
+            origin = self._cell_origin(index)
+            loadout = self._loadouts[index]
+            
+            for slot_id, rect in self._layout.rects.items():
+                item_data = loadout.get(slot_id)
+                rarity = item_data.get('rarity', 'gray') if item_data else 'gray'
+                slot_rect = rect.translated(origin)
+                
+                painter.drawPixmap(slot_rect.topLeft(), get_slot_chrome(
+                    slot_id, rarity, rect.width(), rect.height(), scale, dpr
+                ))
+                
+                icon = None
+                if item_data:
+                    icon_size = max(min(rect.width(), rect.height()) // 2, 1)
+                    icon = get_item_icon(SLOT_TYPES[slot_id][0], item_data, icon_size, dpr)
+                
+                if icon is not None:
+                    icon_width = icon.width() / icon.devicePixelRatio()
+                    icon_height = icon.height() / icon.devicePixelRatio()
+                    painter.drawPixmap(
+                        int(slot_rect.x() + (rect.width() - icon_width) / 2),
+                        int(slot_rect.y() + (rect.height() - icon_height) / 2),
+                        icon
+                    )
+                else:
+                    painter.save()
+                    painter.translate(slot_rect.topLeft())
+                    painter.scale(scale, scale)
+                    paint_empty_marker(painter, QRectF(0, 0, rect.width() / scale, rect.height() / scale), theme)
+                    painter.restore()
+        
+        painter.end()
+    
+    def mousePressEvent(self, event):
+        """Handle mouse click - emit loadout index and slot id under the cursor."""
+        if event.button() == Qt.MouseButton.LeftButton:
+            pos = event.position().toPoint()
+            columns = self._columns()
+            pitch_x = self._layout.cell_width + CELL_SPACING
+            column = (pos.x() - CELL_SPACING) // pitch_x
+            row = (pos.y() + self.verticalScrollBar().value() - CELL_SPACING) // self._row_pitch()
+            index = row * columns + column
+            if 0 <= column < columns and 0 <= index < len(self._loadouts):
+                slot_id = self._layout.slot_at(pos - self._cell_origin(index))
+                if slot_id:
+                    self.loadout_clicked.emit(index, slot_id)
+        super().mousePressEvent(event)
+
+
+def make_random_loadouts(count: int, seed: int = 0) -> List[Dict[str, Optional[dict]]]:
+    """Generate random loadouts for demos and benchmarks."""
+    rng = random.Random(seed)
+    rarities = list(styles.RARITY_COLORS.keys())
+    weapon_types = ['assault', 'pistol', 'smg', 'shotgun', 'sniper']
+    loadouts = []
+    for _ in range(count):
+        loadout = {}
+        for slot_id in SLOT_TYPES:
+            if rng.random() < 0.2:
+                loadout[slot_id] = None
+            else:
+                loadout[slot_id] = {'rarity': rng.choice(rarities), 'weaponType': rng.choice(weapon_types)}
+        loadouts.append(loadout)
+    return loadouts
+
+
+def run_benchmark(view: LoadoutGridView) -> Dict[str, float]:
+    """Scroll through the whole grid, repainting synchronously at each step."""
+    scrollbar = view.verticalScrollBar()
+    step = max(scrollbar.pageStep() // 4, 1)
+    frames = 0
+    start = time.perf_counter()
+    for value in range(0, scrollbar.maximum() + 1, step):
+        scrollbar.setValue(value)
+        view.viewport().repaint()
+        frames += 1
+    elapsed = time.perf_counter() - start
+    return {'frames': frames, 'ms_per_frame': 1000 * elapsed / max(frames, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show many loadouts in one flyweight grid")
+    parser.add_argument('--count', type=int, default=200, help="number of random loadouts")
+    parser.add_argument('--bench', action='store_true', help="scroll through the grid and report frame times")
+    args = parser.parse_args()
+    
+    app = QApplication(sys.argv)
+    
+    view = LoadoutGridView()
+    view.setWindowTitle(f"Borderlands 4 - {args.count} Loadouts")
+    view.resize(1200, 900)
+    view.set_loadouts(make_random_loadouts(args.count))
+    view.loadout_clicked.connect(lambda index, slot_id: print(f"Loadout {index}: {slot_id}"))
+    view.show()
+    
+    if args.bench:
+        app.processEvents()
+        stats = run_benchmark(view)
+        print(f"Loadouts: {args.count}")
+        print(f"Frames: {stats['frames']}")
+        print(f"Average frame: {stats['ms_per_frame']:.2f} ms")
+        return
+    
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
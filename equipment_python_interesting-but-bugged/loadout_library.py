@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+Loadout Library for Equipment Editor
+Local SQLite store of saved builds, indexed by slot item, manufacturer and rarity
+"""
+
+import json
+import time
+import random
+import sqlite3
+import argparse
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+try:
+    from . import catalog
+    from .str_weak import SLOT_IDS, WEAPON_TYPE_SUBTYPES
+    from .loadout_optimizer import slot_entity
+except ImportError:
+    import catalog
+    from str_weak import SLOT_IDS, WEAPON_TYPE_SUBTYPES
+    from loadout_optimizer import slot_entity
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+LIBRARY_FILE = SCRIPT_DIR / "data" / "loadouts.db"
+
+SCHEMA_VERSION = 1
+
+# Loadouts per import transaction
+IMPORT_BATCH = 5000
+
+# One row per filled slot; the item dict is kept whole in data, the indexed fields beside it
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS loadouts (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    notes TEXT NOT NULL DEFAULT '',
+    created REAL NOT NULL,
+    updated REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS slots (
+    loadout_id INTEGER NOT NULL REFERENCES loadouts(id) ON DELETE CASCADE,
+    slot TEXT NOT NULL,
+    item_id TEXT,
+    manufacturer TEXT,
+    rarity TEXT,
+    subtype TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (loadout_id, slot)
+) WITHOUT ROWID;
+"""
+
+INDEXES = """
+CREATE INDEX IF NOT EXISTS slots_item ON slots (item_id, slot);
+CREATE INDEX IF NOT EXISTS slots_manufacturer ON slots (manufacturer, rarity, slot);
+CREATE INDEX IF NOT EXISTS slots_rarity ON slots (rarity, slot);
+CREATE INDEX IF NOT EXISTS slots_subtype ON slots (subtype, rarity, slot);
+"""
+INDEX_NAMES = ['slots_item', 'slots_manufacturer', 'slots_rarity', 'slots_subtype']
+
+# Fixed statements (sqlite3 keeps them prepared in its statement cache)
+INSERT_LOADOUT = "INSERT INTO loadouts (id, name, notes, created, updated) VALUES (?, ?, ?, ?, ?)"
+UPDATE_LOADOUT = "UPDATE loadouts SET name = ?, notes = ?, updated = ? WHERE id = ?"
+INSERT_SLOT = ("INSERT OR REPLACE INTO slots (loadout_id, slot, item_id, manufacturer, rarity, subtype, data) "
+               "VALUES (?, ?, ?, ?, ?, ?, ?)")
+DELETE_SLOTS = "DELETE FROM slots WHERE loadout_id = ?"
+SELECT_LOADOUT = "SELECT id, name, notes, created, updated FROM loadouts WHERE id = ?"
+SELECT_SLOTS = "SELECT slot, data FROM slots WHERE loadout_id = ?"
+SELECT_NAMES = "SELECT id, name FROM loadouts WHERE id IN (SELECT value FROM json_each(?)) ORDER BY id"
+
+# Slot conditions usable in find(); each is one column of the slots table
+CONDITION_COLUMNS = ['slot', 'item_id', 'manufacturer', 'rarity', 'subtype']
+
+
+def slot_row(slot_id: str, item_data: dict) -> Tuple[str, Optional[str], Optional[str], Optional[str], Optional[str], str]:
+    """Indexed columns and JSON of one slot item (without the loadout id)."""
+    subtype = item_data.get('subtype') or WEAPON_TYPE_SUBTYPES.get(item_data.get('weaponType'))
+    return (
+        slot_id,
+        item_data.get('id'),
+        item_data.get('manufacturer'),
+        item_data.get('rarity'),
+        subtype,
+        json.dumps(item_data, separators=(',', ':'), ensure_ascii=False)
+    )
+
+
+def _condition_sql(columns: Tuple[str, ...]) -> str:
+    """Subquery for one slot condition (same text for the same columns, so it stays cached)."""
+    where = ' AND '.join(f"{column} = ?" for column in columns)
+    return f"SELECT loadout_id FROM slots WHERE {where}"
+
+
+class LoadoutLibrary:
+    """Saved builds in one SQLite file (WAL mode: readers never block the writer)."""
+    
+    def __init__(self, path: Path = LIBRARY_FILE):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(str(self.path), cached_statements=256)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(SCHEMA + INDEXES)
+        self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    
+    def close(self):
+        self.connection.close()
+    
+    def __enter__(self) -> 'LoadoutLibrary':
+        return self
+    
+    def __exit__(self, *exc):
+        self.close()
+    
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM loadouts").fetchone()[0]
+    
+    def save(self, name: str, equipment: Mapping[str, Optional[dict]], notes: str = '',
+             loadout_id: Optional[int] = None) -> int:
+        """Save a build (slot id -> item data, e.g. EquipmentWidget.equipment). Returns its id."""
+        now = time.time()
+        with self.connection:
+            if loadout_id is None:
+                loadout_id = self.connection.execute(INSERT_LOADOUT, (None, name, notes, now, now)).lastrowid
+            else:
+                self.connection.execute(UPDATE_LOADOUT, (name, notes, now, loadout_id))
+                self.connection.execute(DELETE_SLOTS, (loadout_id,))
+            self.connection.executemany(INSERT_SLOT, [
+                (loadout_id,) + slot_row(slot_id, item_data)
+                for slot_id, item_data in equipment.items() if item_data
+            ])
+        return loadout_id
+    
+    def load(self, loadout_id: int) -> Optional[dict]:
+        """Get a saved build: id, name, notes, created, updated and equipment (every slot id)."""
+        row = self.connection.execute(SELECT_LOADOUT, (loadout_id,)).fetchone()
+        if row is None:
+            return None
+        equipment = {slot_id: None for slot_id in SLOT_IDS}
+        for slot_id, data in self.connection.execute(SELECT_SLOTS, (loadout_id,)):
+            equipment[slot_id] = json.loads(data)
+        return {
+            'id': row[0],
+            'name': row[1],
+            'notes': row[2],
+            'created': row[3],
+            'updated': row[4],
+            'equipment': equipment
+        }
+    
+    def delete(self, loadout_id: int):
+        with self.connection:
+            self.connection.execute("DELETE FROM loadouts WHERE id = ?", (loadout_id,))
+    
+    def import_loadouts(self, loadouts: Iterable[dict], batch_size: int = IMPORT_BATCH,
+                        rebuild_indexes: bool = False) -> int:
+        """
+        Bulk import builds ({'name', 'notes'?, 'equipment'}), one transaction per batch.
+        rebuild_indexes drops the secondary indexes first and rebuilds them once at the end
+        (faster for imports that are large compared to the library). Returns the number imported.
+        """
+        connection = self.connection
+        next_id = (connection.execute("SELECT MAX(id) FROM loadouts").fetchone()[0] or 0) + 1
+        imported = 0
+        
+        if rebuild_indexes:
+            with connection:
+                for index_name in INDEX_NAMES:
+                    connection.execute(f"DROP INDEX IF EXISTS {index_name}")
+        
+        try:
+            batch_loadouts = []
+            batch_slots = []
+            for loadout in loadouts:
+                now = loadout.get('created') or time.time()
+                batch_loadouts.append((next_id, loadout['name'], loadout.get('notes') or '', now, now))
+                for slot_id, item_data in loadout['equipment'].items():
+                    if item_data:
+                        batch_slots.append((next_id,) + slot_row(slot_id, item_data))
+                next_id += 1
+                if len(batch_loadouts) >= batch_size:
+                    imported += self._write_batch(batch_loadouts, batch_slots)
+                    batch_loadouts, batch_slots = [], []
+            if batch_loadouts:
+                imported += self._write_batch(batch_loadouts, batch_slots)
+        finally:
+            if rebuild_indexes:
+                with connection:
+                    connection.executescript(INDEXES)
+                connection.execute("ANALYZE")
+        
+        return imported
+    
+    def _write_batch(self, loadouts: List[tuple], slots: List[tuple]) -> int:
+        with self.connection:
+            self.connection.executemany(INSERT_LOADOUT, loadouts)
+            self.connection.executemany(INSERT_SLOT, slots)
+        return len(loadouts)
+    
+    def find(self, *conditions: Dict[str, Any], limit: Optional[int] = None) -> List[int]:
+        """
+        Ids of builds matching every condition. A condition is one slot's columns, e.g.
+        {'slot': 'weapon2', 'manufacturer': 'jakobs', 'rarity': 'orange'} for
+        "a Jakobs legendary in weapon2"; without 'slot' any slot may match.
+        """
+        parts = []
+        parameters = []
+        for condition in conditions:
+            columns = tuple(column for column in CONDITION_COLUMNS if condition.get(column) is not None)
+            unknown = set(condition) - set(CONDITION_COLUMNS)
+            if unknown:
+                raise ValueError(f"Unknown condition columns: {sorted(unknown)}")
+            if not columns:
+                continue
+            parts.append(_condition_sql(columns))
+            parameters.extend(condition[column] for column in columns)
+        
+        if parts:
+            sql = f"SELECT loadout_id FROM ({' INTERSECT '.join(parts)}) ORDER BY loadout_id"
+        else:
+            sql = "SELECT id FROM loadouts ORDER BY id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            parameters.append(limit)
+        return [row[0] for row in self.connection.execute(sql, parameters)]
+    
+    def names(self, loadout_ids: List[int]) -> Dict[int, str]:
+        """Names of builds by id."""
+        return dict(self.connection.execute(SELECT_NAMES, (json.dumps(loadout_ids),)))
+
+
+def make_random_loadouts(item_catalog: catalog.Catalog, count: int, seed: int = 0) -> Iterable[dict]:
+    """Random builds of catalog items (random rarity), generated lazily."""
+    rng = random.Random(seed)
+    rows = {slot_id: list(item_catalog.rows(slot_entity(slot_id))) for slot_id in SLOT_IDS}
+    items = {}
+    for slot_rows in rows.values():
+        for row in slot_rows:
+            items[row] = {
+                'id': item_catalog.string('id', row),
+                'table': item_catalog.string('table', row),
+                'name': item_catalog.string('name', row),
+                'subtype': item_catalog.enum('subtype', row),
+                'manufacturer': item_catalog.enum('manufacturer', row)
+            }
+    for number in range(count):
+        equipment = {}
+        for slot_id in SLOT_IDS:
+            if rng.random() < 0.1:
+                equipment[slot_id] = None
+                continue
+            item_data = dict(items[rng.choice(rows[slot_id])])
+            item_data['rarity'] = rng.choice(catalog.RARITIES)
+            equipment[slot_id] = item_data
+        yield {'name': f"Build {number}", 'equipment': equipment}
+
+
+def run_benchmark(path: Path, count: int, seed: int = 0) -> Dict[str, float]:
+    """Import count random builds into a fresh library, then time indexed queries."""
+    for suffix in ('', '-wal', '-shm'):
+        Path(str(path) + suffix).unlink(missing_ok=True)
+    
+    item_catalog = catalog.get_catalog()
+    with LoadoutLibrary(path) as library:
+        start = time.perf_counter()
+        library.import_loadouts(make_random_loadouts(item_catalog, count, seed), rebuild_indexes=True)
+        import_seconds = time.perf_counter() - start
+        slot_rows = library.connection.execute("SELECT COUNT(*) FROM slots").fetchone()[0]
+        
+        queries = {
+            'jakobs legendary in weapon2': [{'slot': 'weapon2', 'manufacturer': 'jakobs', 'rarity': 'orange'}],
+            'item in any slot': [{'item_id': library.connection.execute(
+                "SELECT item_id FROM slots WHERE slot = 'shield' LIMIT 1").fetchone()[0]}],
+            'legendary shotgun + legendary shield': [
+                {'subtype': 'shotgun', 'rarity': 'orange'}, {'slot': 'shield', 'rarity': 'orange'}],
+            'first 50 torgue ordnance': [{'slot': 'ordnance', 'manufacturer': 'torgue'}]
+        }
+        query_stats = {}
+        for label, conditions in queries.items():
+            limit = 50 if label.startswith('first') else None
+            library.find(*conditions, limit=limit)
+            start = time.perf_counter()
+            repeats = 20
+            for _ in range(repeats):
+                matches = library.find(*conditions, limit=limit)
+            query_stats[label] = ((time.perf_counter() - start) / repeats * 1000, len(matches))
+        
+        start = time.perf_counter()
+        for loadout_id in random.Random(seed).sample(range(1, count + 1), min(1000, count)):
+            library.load(loadout_id)
+        load_ms = (time.perf_counter() - start) / min(1000, count) * 1000
+        
+        plan = library.connection.execute(
+            "EXPLAIN QUERY PLAN " + _condition_sql(('slot', 'manufacturer', 'rarity')),
+            ('weapon2', 'jakobs', 'orange')).fetchall()
+    
+    return {
+        'loadouts': count,
+        'slot_rows': slot_rows,
+        'import_s': import_seconds,
+        'queries': query_stats,
+        'load_ms': load_ms,
+        'plan': ' / '.join(row[-1] for row in plan),
+        'size_mb': path.stat().st_size / 1e6
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the local loadout library")
+    parser.add_argument('--db', type=Path, default=LIBRARY_FILE, help="library file")
+    parser.add_argument('--slot', help="slot id, e.g. weapon2")
+    parser.add_argument('--item', help="catalog item id")
+    parser.add_argument('--manufacturer', help="manufacturer id, e.g. jakobs")
+    parser.add_argument('--rarity', help="rarity color, e.g. orange")
+    parser.add_argument('--subtype', help="item subtype, e.g. shotgun")
+    parser.add_argument('--import', dest='import_file', type=Path, help="import builds from a JSON list")
+    parser.add_argument('--limit', type=int, default=20, help="builds to list")
+    parser.add_argument('--bench', type=int, nargs='?', const=120000, metavar='LOADOUTS',
+                        help="import LOADOUTS random builds (default 120000, ~1M slot rows) into a scratch library and time queries")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Loadout Library")
+    print("=" * 50)
+    
+    if args.bench:
+        if catalog.get_catalog() is None:
+            print(f"ERROR: Item catalog not found: {catalog.CATALOG_FILE}")
+            return
+        path = SCRIPT_DIR / "data" / "loadouts-bench.db"
+        print(f"\nImporting {args.bench} random builds into {path}...")
+        stats = run_benchmark(path, args.bench)
+        
+        print("\nQueries:")
+        for label, (ms, matches) in stats['queries'].items():
+            print(f"  {label}: {ms:.2f} ms ({matches} builds)")
+        
+        print("\nSummary:")
+        print(f"  Builds: {stats['loadouts']} ({stats['slot_rows']} slot rows, {stats['size_mb']:.0f} MB)")
+        print(f"  Import: {stats['import_s']:.1f} s ({stats['slot_rows'] / stats['import_s']:,.0f} rows/s)")
+        print(f"  Load one build: {stats['load_ms']:.3f} ms")
+        print(f"  Plan (slot + manufacturer + rarity): {stats['plan']}")
+        return
+    
+    with LoadoutLibrary(args.db) as library:
+        if args.import_file:
+            try:
+                with open(args.import_file, 'r', encoding='utf-8') as f:
+                    loadouts = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"ERROR: Could not read {args.import_file}: {e}")
+                return
+            imported = library.import_loadouts(loadouts)
+            print(f"\nImported {imported} build(s)")
+        
+        condition = {
+            'slot': args.slot,
+            'item_id': args.item,
+            'manufacturer': args.manufacturer,
+            'rarity': args.rarity,
+            'subtype': args.subtype
+        }
+        matches = library.find(condition, limit=args.limit)
+        names = library.names(matches)
+        for loadout_id in matches:
+            print(f"  #{loadout_id}: {names.get(loadout_id)}")
+        
+        print("\nSummary:")
+        print(f"  Library: {args.db} ({len(library)} builds)")
+        print(f"  Listed: {len(matches)}")
+
+
+if __name__ == "__main__":
+    main()
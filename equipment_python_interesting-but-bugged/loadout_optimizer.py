@@ -0,0 +1,619 @@
+#!/usr/bin/env python3
+"""
+Loadout Optimizer for Equipment Editor
+Branch-and-bound search for the best builds over the nine equipment slots, split across a process pool
+"""
+
+import os
+import math
+import time
+import heapq
+import argparse
+import itertools
+import threading
+import multiprocessing
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+try:
+    from . import catalog, catalog_query
+    from .str_weak import SLOT_IDS, WEAPON_SLOTS
+except ImportError:
+    import catalog, catalog_query
+    from str_weak import SLOT_IDS, WEAPON_SLOTS
+
+# Objective weights (points). Item terms are per item; synergy and variety are set bonuses
+# earned per item (another item of an already used manufacturer, a new weapon subtype).
+WEIGHTS = {
+    'rarity': 0.25,        # per rarity level (gray = 0 ... orange = 4)
+    'query': 3.0,          # search relevance, normalized to the best match
+    'manufacturer': 2.0,   # manufacturer is one of the goal manufacturers
+    'subtype': 1.5,        # subtype is one of the goal subtypes
+    'synergy': 0.5,        # manufacturer already in the build
+    'variety': 0.75        # weapon subtype not yet in the build
+}
+
+# Scores are kept as integers (points * SCORE_SCALE) so bounds and scores compare exactly
+SCORE_SCALE = 1000
+
+# Nodes between reads of the threshold shared by all worker processes
+SHARED_POLL_NODES = 1024
+
+# Subtrees per pool task, and pool tasks queued per worker (more are only generated
+# as results come back, so subtrees beaten by then are skipped instead of queued)
+BATCH_SUBTREES = 64
+QUEUED_BATCHES = 4
+
+Progress = Callable[[int, int, Optional[float]], None]
+
+
+def slot_entity(slot_id: str) -> str:
+    """Catalog entity type equipped in a slot."""
+    return 'bl4-weapon' if slot_id.startswith('weapon') else f'bl4-{slot_id}'
+
+
+class BuildGoal:
+    """What "best" means: preferred manufacturers and subtypes, class-mod character, search text."""
+    
+    def __init__(self, manufacturers: Sequence[str] = (), subtypes: Sequence[str] = (),
+                 character: Optional[str] = None, query: Optional[str] = None,
+                 weights: Optional[Dict[str, float]] = None):
+        self.manufacturers = set(manufacturers)
+        self.subtypes = set(subtypes)
+        self.character = character
+        self.query = query
+        self.weights = {**WEIGHTS, **(weights or {})}
+
+
+class SearchProblem:
+    """
+    Plain per-slot candidate lists (picklable, no catalog needed in workers).
+    Candidates of each slot are sorted by their optimistic score, best first.
+    """
+    
+    def __init__(self, slot_ids: List[str], rows: List[List[int]], values: List[List[int]],
+                 manufacturers: List[List[int]], subtypes: List[List[int]],
+                 synergy: int, variety: int, top_k: int):
+        self.slot_ids = slot_ids
+        self.rows = rows
+        self.values = values
+        self.manufacturers = manufacturers
+        self.subtypes = subtypes
+        self.synergy = synergy
+        self.variety = variety
+        self.top_k = top_k
+        self.weapon_count = min(WEAPON_SLOTS, len(rows[0]))
+        
+        # Optimistic score of a candidate: its value plus every set bonus it could earn
+        self.optimistic = [
+            [
+                value + (synergy if manufacturer >= 0 else 0) + (variety if slot < WEAPON_SLOTS and subtype >= 0 else 0)
+                for value, manufacturer, subtype in zip(values[slot], manufacturers[slot], subtypes[slot])
+            ]
+            for slot in range(len(slot_ids))
+        ]
+        
+        # Upper bound of all slots after the weapons (per-slot best optimistic scores)
+        self.rest_bound = [0] * (len(slot_ids) + 1)
+        for slot in range(len(slot_ids) - 1, WEAPON_SLOTS - 1, -1):
+            self.rest_bound[slot] = self.rest_bound[slot + 1] + max(self.optimistic[slot], default=0)
+        
+        # Weapons are one combination (no repeats, any order): prefix sums of the sorted
+        # optimistic scores bound the best r weapons after any position
+        weapon_optimistic = self.optimistic[0]
+        self.weapon_prefix = [0]
+        for value in weapon_optimistic:
+            self.weapon_prefix.append(self.weapon_prefix[-1] + value)
+    
+    def weapon_bound(self, after: int, remaining: int) -> int:
+        """Upper bound of remaining more weapons chosen after candidate index after."""
+        end = min(after + 1 + remaining, len(self.weapon_prefix) - 1)
+        return self.weapon_prefix[end] - self.weapon_prefix[after + 1]
+    
+    def subtree_count(self) -> int:
+        """Number of (first weapon, second weapon) subtrees."""
+        return math.comb(len(self.rows[0]), 2) if self.weapon_count >= 2 else 1
+
+
+class SubtreeFeed:
+    """
+    Batches of subtrees (first weapon, second weapon), best bound first.
+    Pairs whose bound is below the current threshold are skipped (with all later
+    pairs they dominate); window, if given, is acquired before each batch.
+    Once stopped is set the feed ends at its next wait.
+    """
+    
+    def __init__(self, problem: SearchProblem, threshold, window: Optional[threading.Semaphore] = None,
+                 batch_size: int = BATCH_SUBTREES):
+        self.problem = problem
+        self.threshold = threshold
+        self.window = window
+        self.batch_size = batch_size
+        self.skipped = 0
+        self.stopped = threading.Event()
+    
+    def __iter__(self) -> Iterator[List[Tuple[int, ...]]]:
+        problem = self.problem
+        if problem.weapon_count < 2:
+            yield [()]
+            return
+        
+        count = len(problem.rows[0])
+        optimistic = problem.optimistic[0]
+        rest = problem.rest_bound[WEAPON_SLOTS]
+        remaining = problem.weapon_count - 2
+        batch = []
+        for first in range(count - 1):
+            for second in range(first + 1, count):
+                bound = optimistic[first] + optimistic[second] + problem.weapon_bound(second, remaining) + rest
+                if bound < self.threshold.value:
+                    # Later seconds (and, if this is the first one, later firsts) bound no higher
+                    self.skipped += count - second
+                    break
+                batch.append((first, second))
+                if len(batch) >= self.batch_size:
+                    if not self._wait():
+                        return
+                    yield batch
+                    batch = []
+            else:
+                continue
+            if second == first + 1:
+                self.skipped += math.comb(count - first - 1, 2)
+                break
+        if batch and self._wait():
+            yield batch
+    
+    def _wait(self) -> bool:
+        """Wait for room in the window; False if the consumer stopped meanwhile."""
+        if self.window is not None:
+            self.window.acquire()
+        return not self.stopped.is_set()
+
+
+class Build:
+    """One optimized build: score in points and the catalog row per slot."""
+    
+    def __init__(self, score: float, rows: Dict[str, int]):
+        self.score = score
+        self.rows = rows
+    
+    def __repr__(self) -> str:
+        return f"Build({self.score:.3f}, {self.rows})"
+
+
+def item_value(item_catalog: catalog.Catalog, row: int, goal: BuildGoal, relevance: Dict[int, float]) -> float:
+    """Goal score of one item on its own (without set bonuses)."""
+    weights = goal.weights
+    value = 0.0
+    rarity = item_catalog.columns['rarity'][row]
+    if rarity >= 0:
+        value += weights['rarity'] * rarity
+    value += weights['query'] * relevance.get(row, 0.0)
+    if goal.manufacturers and item_catalog.enum('manufacturer', row) in goal.manufacturers:
+        value += weights['manufacturer']
+    if goal.subtypes and item_catalog.enum('subtype', row) in goal.subtypes:
+        value += weights['subtype']
+    return value
+
+
+def query_relevance(query: Optional[str]) -> Dict[int, float]:
+    """Search relevance per catalog row for query, normalized so the best match is 1."""
+    if not query:
+        return {}
+    try:
+        from . import search_index
+    except ImportError:
+        import search_index
+    index = search_index.get_search_index()
+    if index is None:
+        return {}
+    results = index.search(query, limit=len(index.catalog))
+    if not results:
+        print(f"WARNING: No items match '{query}'")
+        return {}
+    best = results[0][1]
+    return {row: score / best for row, score in results}
+
+
+def build_problem(item_catalog: catalog.Catalog, goal: BuildGoal, top_k: int = 10,
+                  relevance: Optional[Dict[int, float]] = None) -> SearchProblem:
+    """Collect and score the candidates for every slot."""
+    if relevance is None:
+        relevance = query_relevance(goal.query)
+    
+    slot_rows = {}
+    for slot_id in SLOT_IDS:
+        entity = slot_entity(slot_id)
+        if entity not in slot_rows:
+            rows = list(item_catalog.rows(entity))
+            if entity == 'bl4-class-mod' and goal.character:
+                # Class mods only work for their own character
+                rows = [row for row in rows if item_catalog.enum('character', row) in (goal.character, None)]
+            slot_rows[entity] = rows
+    
+    scale = SCORE_SCALE
+    synergy = round(goal.weights['synergy'] * scale)
+    variety = round(goal.weights['variety'] * scale)
+    candidates = []
+    for slot, slot_id in enumerate(SLOT_IDS):
+        entries = []
+        for row in slot_rows[slot_entity(slot_id)]:
+            value = round(item_value(item_catalog, row, goal, relevance) * scale)
+            manufacturer = item_catalog.columns['manufacturer'][row]
+            subtype = item_catalog.columns['subtype'][row]
+            optimistic = value + (synergy if manufacturer >= 0 else 0) + (variety if slot < WEAPON_SLOTS and subtype >= 0 else 0)
+            entries.append((-optimistic, row, value, manufacturer, subtype))
+        if not entries:
+            raise ValueError(f"No candidates for slot {slot_id}")
+        entries.sort()
+        candidates.append(entries)
+    
+    return SearchProblem(
+        list(SLOT_IDS),
+        [[entry[1] for entry in entries] for entries in candidates],
+        [[entry[2] for entry in entries] for entries in candidates],
+        [[entry[3] for entry in entries] for entries in candidates],
+        [[entry[4] for entry in entries] for entries in candidates],
+        synergy, variety, top_k
+    )
+
+
+# Worker state (set by _init_worker in pool processes, or directly for in-process search)
+_problem: Optional[SearchProblem] = None
+_shared_threshold = None
+
+
+def _init_worker(problem: SearchProblem, shared_threshold):
+    global _problem, _shared_threshold
+    _problem = problem
+    _shared_threshold = shared_threshold
+
+
+def _publish_threshold(score: int):
+    """Raise the threshold shared by all workers to score (k-th best known)."""
+    if _shared_threshold is None or score <= _shared_threshold.value:
+        return
+    with _shared_threshold.get_lock():
+        if score > _shared_threshold.value:
+            _shared_threshold.value = score
+
+
+def _run_task(prefix: Tuple[int, ...]) -> Tuple[List[Tuple[int, Tuple[int, ...]]], int]:
+    """
+    Depth-first search of one subtree (weapon candidate indices fixed by prefix).
+    Returns (top-k as (score, candidate indices), nodes visited).
+    
+    Within a subtree candidates are visited in lexicographic index order, so a later
+    build that ties the local k-th score always loses the tie: local pruning can use <=.
+    Other subtrees may hold equal builds that win the tie, so the shared threshold uses <.
+    """
+    problem = _problem
+    top_k = problem.top_k
+    slot_count = len(problem.slot_ids)
+    weapon_count = problem.weapon_count
+    values = problem.values
+    optimistic = problem.optimistic
+    manufacturers = problem.manufacturers
+    subtypes = problem.subtypes
+    synergy = problem.synergy
+    variety = problem.variety
+    rest_bound = problem.rest_bound
+    weapon_bound = problem.weapon_bound
+    
+    heap: List[Tuple[int, Tuple[int, ...]]] = []
+    chosen = [0] * slot_count
+    nodes = 0
+    shared = _shared_threshold.value if _shared_threshold is not None else float('-inf')
+    
+    def beaten(bound: int) -> bool:
+        """True if nothing under a node with this bound can enter the top-k."""
+        if bound < shared:
+            return True
+        return len(heap) >= top_k and bound <= heap[0][0]
+    
+    def add(slot: int, index: int, score: int, used: int, kinds: int) -> Tuple[int, int, int]:
+        manufacturer = manufacturers[slot][index]
+        subtype = subtypes[slot][index]
+        score += values[slot][index]
+        if manufacturer >= 0:
+            if (used >> manufacturer) & 1:
+                score += synergy
+            used |= 1 << manufacturer
+        if slot < WEAPON_SLOTS and subtype >= 0:
+            if not (kinds >> subtype) & 1:
+                score += variety
+            kinds |= 1 << subtype
+        return score, used, kinds
+    
+    def leaf(score: int):
+        nonlocal shared
+        # Heap holds the k best as (score, inverted indices): the root is the worst,
+        # ties broken toward lexicographically smaller candidate indices
+        key = (score, tuple(-index for index in chosen))
+        if len(heap) < top_k:
+            heapq.heappush(heap, key)
+        elif key > heap[0]:
+            heapq.heapreplace(heap, key)
+        else:
+            return
+        if len(heap) >= top_k:
+            _publish_threshold(heap[0][0])
+    
+    def search(slot: int, score: int, used: int, kinds: int):
+        nonlocal nodes, shared
+        nodes += 1
+        if nodes % SHARED_POLL_NODES == 0 and _shared_threshold is not None:
+            shared = _shared_threshold.value
+        
+        if slot == slot_count:
+            leaf(score)
+            return
+        
+        if slot < weapon_count:
+            # Next weapon of the combination: indices after the previous weapon
+            start = chosen[slot - 1] + 1 if slot else 0
+            remaining = weapon_count - slot - 1
+            last = len(values[0]) - remaining
+            for index in range(start, last):
+                bound = score + optimistic[0][index] + weapon_bound(index, remaining) + rest_bound[WEAPON_SLOTS]
+                if beaten(bound):
+                    break
+                chosen[slot] = index
+                search(slot + 1, *add(0, index, score, used, kinds))
+            return
+        
+        if slot < WEAPON_SLOTS:
+            # Fewer weapon candidates than weapon slots: leave the rest empty
+            chosen[slot] = -1
+            search(slot + 1, score, used, kinds)
+            return
+        
+        slot_optimistic = optimistic[slot]
+        after = rest_bound[slot + 1]
+        for index in range(len(slot_optimistic)):
+            if beaten(score + slot_optimistic[index] + after):
+                break
+            chosen[slot] = index
+            search(slot + 1, *add(slot, index, score, used, kinds))
+    
+    # Walk down the fixed prefix, then search below it
+    score = used = kinds = 0
+    for slot, index in enumerate(prefix):
+        chosen[slot] = index
+        score, used, kinds = add(0, index, score, used, kinds)
+    if prefix:
+        remaining = weapon_count - len(prefix)
+        bound = score + weapon_bound(prefix[-1], remaining) + rest_bound[WEAPON_SLOTS]
+        if bound < shared:
+            return [], 1
+    search(len(prefix), score, used, kinds)
+    
+    return [(score, tuple(-index for index in inverted)) for score, inverted in heap], nodes
+
+
+def _run_batch(batch: List[Tuple[int, ...]]) -> Tuple[List[Tuple[int, Tuple[int, ...]]], int, int]:
+    """Search a batch of subtrees. Returns (builds found, nodes visited, subtrees)."""
+    found = []
+    nodes = 0
+    for prefix in batch:
+        task_found, task_nodes = _run_task(prefix)
+        found.extend(task_found)
+        nodes += task_nodes
+    return found, nodes, len(batch)
+
+
+def optimize(problem: SearchProblem, workers: int = 0, progress: Optional[Progress] = None) -> Tuple[List[Build], Dict[str, float]]:
+    """
+    Find the top-k builds. workers: processes (0 = one per CPU, 1 = in this process).
+    progress(done_subtrees, total_subtrees, best_score) is called as subtrees finish.
+    Results are identical for any worker count.
+    """
+    workers = workers or os.cpu_count() or 1
+    total = problem.subtree_count()
+    best: List[Tuple[int, Tuple[int, ...]]] = []
+    nodes = 0
+    start = time.perf_counter()
+    
+    def merge(found: List[Tuple[int, Tuple[int, ...]]]):
+        for score, indices in found:
+            key = (score, tuple(-index for index in indices))
+            if len(best) < problem.top_k:
+                heapq.heappush(best, key)
+            elif key > best[0]:
+                heapq.heapreplace(best, key)
+        if len(best) >= problem.top_k:
+            _publish_threshold(best[0][0])
+    
+    shared_threshold = multiprocessing.Value('q', -(1 << 62))
+    _init_worker(problem, shared_threshold)
+    if workers == 1:
+        window = None
+        feed = SubtreeFeed(problem, shared_threshold)
+        results = map(_run_batch, feed)
+        pool = None
+    else:
+        window = threading.Semaphore(workers * QUEUED_BATCHES)
+        feed = SubtreeFeed(problem, shared_threshold, window)
+        pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(problem, shared_threshold))
+        results = pool.imap_unordered(_run_batch, feed)
+    
+    searched = 0
+    reported = 0
+    completed = False
+    try:
+        for found, batch_nodes, batch_size in results:
+            if window is not None:
+                window.release()
+            nodes += batch_nodes
+            searched += batch_size
+            merge(found)
+            done = searched + feed.skipped
+            if progress is not None and done - reported >= total // 10:
+                reported = done
+                progress(done, total, max(best)[0] / SCORE_SCALE if best else None)
+        if progress is not None and reported < total:
+            progress(total, total, max(best)[0] / SCORE_SCALE if best else None)
+        completed = True
+    finally:
+        if pool is not None:
+            if completed:
+                pool.close()
+            else:
+                # The pool's feed thread may be blocked on a full window: stop it and let it through
+                feed.stopped.set()
+                for _ in range(workers * QUEUED_BATCHES):
+                    window.release()
+                pool.terminate()
+            pool.join()
+        _init_worker(None, None)
+    
+    builds = []
+    for score, inverted in sorted(best, reverse=True):
+        rows = {}
+        for slot, index in enumerate(-value for value in inverted):
+            if index >= 0:
+                rows[problem.slot_ids[slot]] = problem.rows[slot][index]
+        builds.append(Build(score / SCORE_SCALE, rows))
+    
+    elapsed = time.perf_counter() - start
+    stats = {'seconds': elapsed, 'nodes': nodes, 'subtrees': searched, 'skipped': feed.skipped, 'workers': workers}
+    return builds, stats
+
+
+def brute_force(problem: SearchProblem) -> List[Build]:
+    """Exhaustive top-k (for checking optimize() on small problems)."""
+    weapons = range(len(problem.rows[0]))
+    others = [range(len(problem.rows[slot])) for slot in range(WEAPON_SLOTS, len(problem.slot_ids))]
+    keys = []
+    for weapon_indices in itertools.combinations(weapons, problem.weapon_count):
+        padding = (-1,) * (WEAPON_SLOTS - problem.weapon_count)
+        for other_indices in itertools.product(*others):
+            indices = weapon_indices + padding + other_indices
+            score = used = kinds = 0
+            for slot, index in enumerate(indices):
+                if index < 0:
+                    continue
+                manufacturer = problem.manufacturers[slot][index]
+                subtype = problem.subtypes[slot][index]
+                score += problem.values[slot][index]
+                if manufacturer >= 0:
+                    score += problem.synergy if (used >> manufacturer) & 1 else 0
+                    used |= 1 << manufacturer
+                if slot < WEAPON_SLOTS and subtype >= 0:
+                    score += 0 if (kinds >> subtype) & 1 else problem.variety
+                    kinds |= 1 << subtype
+            keys.append((-score, indices))
+    keys.sort()
+    return [
+        Build(-score / SCORE_SCALE, {
+            problem.slot_ids[slot]: problem.rows[slot][index] for slot, index in enumerate(indices) if index >= 0
+        })
+        for score, indices in keys[:problem.top_k]
+    ]
+
+
+def truncate_problem(problem: SearchProblem, per_slot: int) -> SearchProblem:
+    """Keep only the first per_slot candidates of every slot."""
+    return SearchProblem(
+        problem.slot_ids,
+        *[[column[:per_slot] for column in columns] for columns in
+          (problem.rows, problem.values, problem.manufacturers, problem.subtypes)],
+        problem.synergy, problem.variety, problem.top_k
+    )
+
+
+def run_benchmark(rows: int, top_k: int, workers: int, seed: int = 0) -> Dict[str, float]:
+    """Deterministic benchmark: fixed goal on a synthetic catalog, 1 process vs the pool."""
+    base = catalog.get_catalog()
+    item_catalog = catalog_query.make_synthetic_catalog(base, rows, seed)
+    # No preferences: rarity and set bonuses only, so many builds tie (hardest to prune)
+    goal = BuildGoal()
+    problem = build_problem(item_catalog, goal, top_k, relevance={})
+    
+    # Correctness on a small slice of the same problem
+    small = truncate_problem(problem, 6)
+    expected = [(build.score, build.rows) for build in brute_force(small)]
+    found = [(build.score, build.rows) for build in optimize(small, 1)[0]]
+    if found != expected:
+        print("ERROR: Branch-and-bound result differs from exhaustive search")
+    
+    single, single_stats = optimize(problem, 1)
+    pooled, pooled_stats = optimize(problem, workers)
+    if [(b.score, b.rows) for b in single] != [(b.score, b.rows) for b in pooled]:
+        print("ERROR: Pool result differs from single-process result")
+    
+    space = 1
+    for slot in range(WEAPON_SLOTS, len(problem.slot_ids)):
+        space *= len(problem.rows[slot])
+    space *= math.comb(len(problem.rows[0]), problem.weapon_count)
+    
+    return {
+        'candidates': {slot_id: len(problem.rows[slot]) for slot, slot_id in enumerate(problem.slot_ids)},
+        'space': space,
+        'single_s': single_stats['seconds'],
+        'single_nodes': single_stats['nodes'],
+        'pool_s': pooled_stats['seconds'],
+        'pool_nodes': pooled_stats['nodes'],
+        'workers': pooled_stats['workers'],
+        'best': single[0].score if single else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find the best builds for a goal")
+    parser.add_argument('--manufacturer', action='append', default=[], help="preferred manufacturer (repeatable)")
+    parser.add_argument('--subtype', action='append', default=[], help="preferred subtype, e.g. shotgun (repeatable)")
+    parser.add_argument('--character', help="class-mod character (vex, rafa, amon, harlowe)")
+    parser.add_argument('--query', help="search text the items should match, e.g. 'crit damage'")
+    parser.add_argument('--top', type=int, default=10, help="number of builds to return")
+    parser.add_argument('--workers', type=int, default=0, help="processes (0 = one per CPU)")
+    parser.add_argument('--bench', type=int, nargs='?', const=3000, metavar='ROWS',
+                        help="deterministic benchmark on a synthetic catalog of ROWS rows (default 3000)")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Loadout Optimizer")
+    print("=" * 50)
+    
+    item_catalog = catalog.get_catalog()
+    if item_catalog is None:
+        print(f"ERROR: Item catalog not found: {catalog.CATALOG_FILE}")
+        print("Run extract_game_data.py first.")
+        return
+    
+    if args.bench:
+        print(f"\nBenchmarking on a synthetic catalog ({args.bench} rows)...")
+        stats = run_benchmark(args.bench, args.top, args.workers)
+        
+        print("\nSummary:")
+        print(f"  Candidates: {stats['candidates']}")
+        print(f"  Search space: {stats['space']:.3g} builds")
+        print(f"  1 process: {stats['single_s']:.2f} s ({stats['single_nodes']} nodes)")
+        print(f"  {stats['workers']} processes: {stats['pool_s']:.2f} s ({stats['pool_nodes']} nodes)")
+        print(f"  Speedup: {stats['single_s'] / stats['pool_s']:.1f}x")
+        print(f"  Best score: {stats['best']:.3f}")
+        return
+    
+    goal = BuildGoal(args.manufacturer, args.subtype, args.character, args.query)
+    problem = build_problem(item_catalog, goal, args.top)
+    
+    def report(done: int, total: int, best: Optional[float]):
+        best_text = f"{best:.3f}" if best is not None else "-"
+        print(f"  {done}/{total} subtrees, best {best_text}")
+    
+    print("\nSearching...")
+    builds, stats = optimize(problem, args.workers, report)
+    
+    for rank, build in enumerate(builds, 1):
+        print(f"\n#{rank} score {build.score:.3f}")
+        for slot_id, row in build.rows.items():
+            details = [item_catalog.enum(column, row) for column in ('rarity', 'manufacturer', 'subtype')]
+            print(f"  {slot_id}: {item_catalog.string('name', row)} ({', '.join(value for value in details if value)})")
+    
+    print("\nSummary:")
+    print(f"  Builds: {len(builds)}")
+    print(f"  Subtrees: {stats['subtrees']} searched, {stats['skipped']} skipped, on {stats['workers']} process(es)")
+    print(f"  Nodes visited: {stats['nodes']}")
+    print(f"  Time: {stats['seconds']:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,19 @@ Main entry point for the Equipment Editor
 
 import sys
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton
-from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout, QPushButton, QScrollArea, QFrame
+from PyQt6.QtCore import Qt, QFileSystemWatcher
+from PyQt6.QtGui import QKeySequence, QShortcut
 try:
     from .equipment_widget import EquipmentWidget
-    from . import fonts, styles
+    from .item_picker import ItemPickerDialog
+    from .str_weak_widget import StrWeakWidget
+    from . import fonts, styles, source_watcher, hot_reload, str_weak
 except ImportError:
     from equipment_widget import EquipmentWidget
-    import fonts, styles
+    from item_picker import ItemPickerDialog
+    from str_weak_widget import StrWeakWidget
+    import fonts, styles, source_watcher, hot_reload, str_weak
 
 
 class EquipmentEditorWindow(QMainWindow):
@@ -35,11 +40,28 @@ class EquipmentEditorWindow(QMainWindow):
         layout = QVBoxLayout(central_widget)
         layout.setContentsMargins(0, 0, 0, 0)
         
+        # Equipment and analysis scroll together (like the page below the equipment)
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QFrame.Shape.NoFrame)
+        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        content = QWidget()
+        content_layout = QVBoxLayout(content)
+        content_layout.setContentsMargins(0, 0, 0, 16)
+        
         # Create equipment widget
         self.equipment_widget = EquipmentWidget()
         self.equipment_widget.set_editable(True)
         self.equipment_widget.slot_clicked.connect(self._on_slot_clicked)
-        layout.addWidget(self.equipment_widget)
+        content_layout.addWidget(self.equipment_widget, 1)
+        
+        # Strengths & weaknesses, updated for each changed slot
+        self.str_weak_widget = StrWeakWidget(self.equipment_widget.equipment)
+        self.equipment_widget.item_changed.connect(self.str_weak_widget.set_item)
+        content_layout.addWidget(self.str_weak_widget)
+        
+        scroll_area.setWidget(content)
+        layout.addWidget(scroll_area, 1)
         
         # Edit mode toggle button
         self.edit_button = QPushButton("Edit Mode: ON")
@@ -48,46 +70,91 @@ class EquipmentEditorWindow(QMainWindow):
         self.edit_button.toggled.connect(self._on_edit_mode_toggled)
         layout.addWidget(self.edit_button)
         
+        # Undo/redo slot edits (Ctrl+Z, Ctrl+Y / Ctrl+Shift+Z)
+        QShortcut(QKeySequence.StandardKey.Undo, self, self.equipment_widget.undo)
+        QShortcut(QKeySequence.StandardKey.Redo, self, self.equipment_widget.redo)
+        
+        # Hot reload when source_watcher.py re-extracts something (swapped in the background)
+        self.hot_reloader = hot_reload.HotReloader(self)
+        self.hot_reloader.game_data_changed.connect(self._on_game_data_changed)
+        self.hot_reloader.assets_changed.connect(self._on_assets_changed)
+        self._watch_reload_file()
+        
         # Apply dark theme
         self._apply_dark_theme()
     
     def _apply_dark_theme(self):
         """Apply dark theme styling."""
-        self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {styles.BASE_BG};
-            }}
-            QPushButton {{
-                background-color: {styles.DARK_BG};
-                color: {styles.GREY_2};
-                border: 1px solid {styles.GREY_3};
-                padding: 8px 16px;
-                font-size: 14px;
-            }}
-            QPushButton:hover {{
-                background-color: {styles.GREY_3};
-            }}
-            QPushButton:checked {{
-                background-color: {styles.RARITY_COLORS['green']['border']};
-            }}
-        """)
+        # Window background from the precomputed theme palette (no QSS cascade)
+        self.setPalette(styles.get_theme().window_palette)
+        self.setAutoFillBackground(True)
+        
+        # Hover/checked button states still need QSS - scoped to the one button
+        self.edit_button.setStyleSheet(styles.get_button_stylesheet())
     
     def _on_edit_mode_toggled(self, checked: bool):
         """Handle edit mode toggle."""
         self.equipment_widget.set_editable(checked)
         self.edit_button.setText(f"Edit Mode: {'ON' if checked else 'OFF'}")
     
+    def _watch_reload_file(self):
+        """Watch the watcher's notification file (and its directory, since it is replaced atomically)."""
+        reload_file = source_watcher.RELOAD_FILE
+        reload_file.parent.mkdir(parents=True, exist_ok=True)
+        notification = source_watcher.read_notification(reload_file)
+        self._reload_time = notification.get('time') if notification else None
+        
+        self._reload_watcher = QFileSystemWatcher(self)
+        self._reload_watcher.addPath(str(reload_file.parent))
+        if reload_file.exists():
+            self._reload_watcher.addPath(str(reload_file))
+        self._reload_watcher.directoryChanged.connect(self._on_reload_notified)
+        self._reload_watcher.fileChanged.connect(self._on_reload_notified)
+    
+    def _on_reload_notified(self, path: str = ''):
+        """Reload what the watcher reports as changed (once per notification)."""
+        reload_file = source_watcher.RELOAD_FILE
+        if reload_file.exists() and str(reload_file) not in self._reload_watcher.files():
+            self._reload_watcher.addPath(str(reload_file))
+        
+        notification = source_watcher.read_notification(reload_file)
+        if not notification or notification.get('time') == self._reload_time:
+            return
+        self._reload_time = notification.get('time')
+        self.reload_sources(set(notification.get('changed') or []))
+    
+    def reload_sources(self, changed: set):
+        """Read changed sources from disk in the background; views refresh once the swap is installed."""
+        print(f"Reloading: {', '.join(sorted(changed))}")
+        self.hot_reloader.reload(changed)
+    
+    def apply_game_data(self, snapshot: 'hot_reload.GameDataSnapshot'):
+        """Swap in new game data without a restart."""
+        self.hot_reloader.apply_game_data(snapshot)
+    
+    def apply_assets(self, snapshot: 'hot_reload.AssetSnapshot'):
+        """Swap in new assets without a restart."""
+        self.hot_reloader.apply_assets(snapshot)
+    
+    def _on_game_data_changed(self, diff: 'hot_reload.GameDataDiff'):
+        """Re-analyze and repaint only the slots whose items reference changed records."""
+        equipment = self.equipment_widget.equipment
+        slot_ids = [slot_id for slot_id, item_data in equipment.items() if diff.affects_item(item_data)]
+        self.str_weak_widget.set_encoder(str_weak.get_encoder(), equipment, slot_ids)
+        self.equipment_widget.refresh_slots(slot_ids)
+        print(f"Game data reloaded: {len(diff.items)} changed record(s), {len(slot_ids)} slot(s) affected")
+    
+    def _on_assets_changed(self, diff: 'hot_reload.AssetDiff'):
+        """Repaint only the slots whose icon changed."""
+        slot_ids = self.equipment_widget.stale_icon_slots(diff.paths)
+        self.equipment_widget.refresh_slots(slot_ids)
+        print(f"Assets reloaded: {len(diff.originals)} changed image(s), {len(slot_ids)} slot(s) affected")
+    
     def _on_slot_clicked(self, slot_id: str, current_item: dict):
-        """Handle slot click - open customize/select dialog."""
-        print(f"Slot clicked: {slot_id}, current item: {current_item}")
-        # TODO: Open customize/select dialog
-        # For now, just set a test item
-        test_item = {
-            'weaponType': 'assault',
-            'rarity': 'purple',
-            'manufacturer': 'jakobs'
-        }
-        self.equipment_widget.set_item(slot_id, test_item)
+        """Handle slot click - open the item picker."""
+        dialog = ItemPickerDialog(slot_id, current_item, parent=self)
+        if dialog.exec() and dialog.selected_item():
+            self.equipment_widget.set_item(slot_id, dialog.selected_item())
 
 
 def main():
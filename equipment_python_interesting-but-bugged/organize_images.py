@@ -8,8 +8,11 @@ import os
 import shutil
 import json
 import re
+import time
+import random
+import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Source directories
 DOWNLOAD_DIRS = [
@@ -23,6 +26,9 @@ SCRIPT_DIR = Path(__file__).parent
 BASE_DIR = SCRIPT_DIR.parent
 TARGET_BASE = BASE_DIR / "resources" / "assets" / "equipment"
 
+# Image files picked up from the download directories
+IMAGE_EXTENSIONS = ('.webp', '.png', '.jpg', '.jpeg', '.svg', '.avif')
+
 # Subdirectories
 SUBDIRS = {
     "weapons": TARGET_BASE / "weapons",
@@ -33,67 +39,102 @@ SUBDIRS = {
     "ui": TARGET_BASE / "ui"
 }
 
-# Patterns for categorization
-WEAPON_PATTERNS = [
-    r"assault", r"pistol", r"smg", r"shotgun", r"sniper", r"heavy.?weapon",
-    r"weapon", r"grenade", r"repkit"
-]
-
-MANUFACTURER_PATTERNS = [
-    r"atlas", r"cov", r"daedalus", r"hyperion", r"jakobs", r"maliwan",
-    r"order", r"ripper", r"tediore", r"torgue", r"vladof"
-]
-
-AUGMENT_PATTERNS = [
-    r"augment", r"aug-", r"repkit-aug"
-]
-
-SLOT_PATTERNS = [
-    r"class.?mod", r"shield", r"enhancement", r"repkit", r"ordnance"
-]
+# Filename rules: categories in priority order, each with its regular expressions
+RULES_FILE = SCRIPT_DIR / "data" / "image_rules.json"
 
-RARITY_PATTERNS = [
-    r"common", r"uncommon", r"rare", r"epic", r"legendary", r"gray", r"green",
-    r"blue", r"purple", r"orange"
-]
+# Benchmark
+BENCH_FILENAMES = 100_000
+BENCH_NOISE_WORDS = ["item", "final", "hd", "v2", "transparent", "small", "large", "alt", "new", "copy"]
 
-UI_PATTERNS = [
-    r"icon", r"logo", r"banner", r"border", r"background", r"chevron", r"arrow",
-    r"plus", r"minus", r"check", r"clear", r"delete", r"edit"
-]
+_rules = None
 
 
-def categorize_file(filename: str) -> str:
-    """Categorize a file based on its filename."""
-    filename_lower = filename.lower()
-    
-    # Check patterns in order of specificity
-    for pattern in AUGMENT_PATTERNS:
-        if re.search(pattern, filename_lower):
-            return "item-augments"
-    
-    for pattern in SLOT_PATTERNS:
-        if re.search(pattern, filename_lower):
-            return "slots"
+class CategoryRules:
+    """
+    Filename rules compiled into one regular expression.
+    Each category is one group of alternatives inside a lookahead, so every position of the filename
+    reports the highest-priority category matching there and one scan finds the first category by priority.
+    """
     
-    for pattern in MANUFACTURER_PATTERNS:
-        if re.search(pattern, filename_lower):
-            return "manufacturers"
+    def __init__(self, categories: List[Tuple[str, List[str]]], default: str):
+        self.categories = categories
+        self.default = default
+        self.rules: List[Tuple[str, str]] = [
+            (category, pattern) for category, patterns in categories for pattern in patterns
+        ]
+        # One group per category (named by priority), not per rule - saving 50 group marks costs more than the scan
+        alternatives = '|'.join(
+            f'(?P<c{priority}>{"|".join(patterns)})' for priority, (_, patterns) in enumerate(categories)
+        )
+        self.pattern = re.compile(f'(?=(?:{alternatives}))')
     
-    for pattern in WEAPON_PATTERNS:
-        if re.search(pattern, filename_lower):
-            return "weapons"
+    @classmethod
+    def load(cls, path: Path = RULES_FILE) -> 'CategoryRules':
+        """Read and compile a rules file. Raises ValueError if it is malformed."""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        
+        try:
+            categories = [(entry['category'], list(entry['patterns'])) for entry in data['categories']]
+            default = data['default']
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Malformed rules file {path}: {e}")
+        
+        for category in [default] + [category for category, _ in categories]:
+            if category not in SUBDIRS:
+                raise ValueError(f"Unknown category in {path}: {category}")
+        try:
+            return cls(categories, default)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern in {path}: {e}")
     
-    for pattern in RARITY_PATTERNS:
-        if re.search(pattern, filename_lower):
-            return "rarity"
+    def categorize(self, filename: str) -> str:
+        """First category (by priority) with a rule matching anywhere in the filename."""
+        best = None
+        for match in self.pattern.finditer(filename.lower()):
+            priority = int(match.lastgroup[1:])
+            if best is None or priority < best:
+                best = priority
+                if priority == 0:
+                    break
+        return self.default if best is None else self.categories[best][0]
     
-    for pattern in UI_PATTERNS:
-        if re.search(pattern, filename_lower):
-            return "ui"
+    def categorize_sequentially(self, filename: str) -> str:
+        """Reference implementation: one re.search per rule, in priority order."""
+        filename_lower = filename.lower()
+        for category, pattern in self.rules:
+            if re.search(pattern, filename_lower):
+                return category
+        return self.default
     
-    # Default to ui if uncertain
-    return "ui"
+    def explain(self, filename: str) -> List[Tuple[str, str, int, str]]:
+        """Every matching rule as (category, pattern, position, matched text), in priority order."""
+        filename_lower = filename.lower()
+        matches = []
+        for category, pattern in self.rules:
+            match = re.search(pattern, filename_lower)
+            if match:
+                matches.append((category, pattern, match.start(), match.group()))
+        return matches
+
+
+def get_rules() -> CategoryRules:
+    """Get the compiled filename rules (loaded from RULES_FILE once)."""
+    global _rules
+    if _rules is None:
+        _rules = CategoryRules.load(RULES_FILE)
+    return _rules
+
+
+def clear_cache():
+    """Forget the compiled rules (after RULES_FILE changed)."""
+    global _rules
+    _rules = None
+
+
+def categorize_file(filename: str) -> str:
+    """Categorize a file based on its filename."""
+    return get_rules().categorize(filename)
 
 
 def organize_images() -> Dict[str, List[Tuple[str, str]]]:
@@ -115,32 +156,71 @@ def organize_images() -> Dict[str, List[Tuple[str, str]]]:
         for root, dirs, files in os.walk(download_dir):
             for file in files:
                 # Only process image files
-                if not file.lower().endswith(('.webp', '.png', '.jpg', '.jpeg', '.svg', '.avif')):
+                if not file.lower().endswith(IMAGE_EXTENSIONS):
                     continue
                 
-                source_path = os.path.join(root, file)
-                category = categorize_file(file)
-                target_dir = SUBDIRS[category]
-                
-                # Handle duplicate filenames
-                target_path = target_dir / file
-                counter = 1
-                while target_path.exists():
-                    name_parts = file.rsplit('.', 1)
-                    if len(name_parts) == 2:
-                        new_name = f"{name_parts[0]}_{counter}.{name_parts[1]}"
-                    else:
-                        new_name = f"{file}_{counter}"
-                    target_path = target_dir / new_name
-                    counter += 1
-                
-                try:
-                    shutil.copy2(source_path, target_path)
-                    relative_path = str(target_path.relative_to(BASE_DIR))
-                    image_index[category].append((file, relative_path))
-                    print(f"  OK: {file} -> {category}/")
-                except Exception as e:
-                    print(f"  ERROR: Failed to copy {file}: {e}")
+                organize_file(os.path.join(root, file), image_index)
+    
+    return image_index
+
+
+def organize_file(source_path: str, image_index: Dict[str, List[Tuple[str, str]]],
+                  replace: bool = False) -> Optional[str]:
+    """
+    Copy one image into its category directory and add it to image_index.
+    With replace, an image already in the index is copied over its earlier copy.
+    Returns the category, or None if the copy failed.
+    """
+    file = os.path.basename(source_path)
+    category = categorize_file(file)
+    target_dir = SUBDIRS[category]
+    target_dir.mkdir(parents=True, exist_ok=True)
+    
+    existing = None
+    if replace:
+        existing = next((path for original, path in image_index.get(category, []) if original == file), None)
+    
+    if existing is not None:
+        target_path = BASE_DIR / existing.replace('\\', '/')
+    else:
+        # Handle duplicate filenames
+        target_path = target_dir / file
+        counter = 1
+        while target_path.exists():
+            name_parts = file.rsplit('.', 1)
+            if len(name_parts) == 2:
+                new_name = f"{name_parts[0]}_{counter}.{name_parts[1]}"
+            else:
+                new_name = f"{file}_{counter}"
+            target_path = target_dir / new_name
+            counter += 1
+    
+    try:
+        shutil.copy2(source_path, target_path)
+    except Exception as e:
+        print(f"  ERROR: Failed to copy {file}: {e}")
+        return None
+    
+    if existing is None:
+        relative_path = str(target_path.relative_to(BASE_DIR))
+        image_index.setdefault(category, []).append((file, relative_path))
+    print(f"  OK: {file} -> {category}/")
+    return category
+
+
+def load_image_index() -> Dict[str, List[Tuple[str, str]]]:
+    """Load the image index saved by save_image_index (empty categories if missing)."""
+    image_index = {category: [] for category in SUBDIRS.keys()}
+    index_path = TARGET_BASE / "image_index.json"
+    
+    if index_path.exists():
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            for category, files in data.items():
+                image_index[category] = [(entry['original'], entry['path']) for entry in files]
+        except Exception as e:
+            print(f"WARNING: Could not load image index: {e}")
     
     return image_index
 
@@ -161,10 +241,98 @@ def save_image_index(image_index: Dict[str, List[Tuple[str, str]]]):
     print(f"\nImage index saved to: {index_path}")
 
 
+def synthetic_filenames(rules: CategoryRules, count: int = BENCH_FILENAMES, seed: int = 0) -> List[str]:
+    """Download-style filenames mixing rule words, noise words and case, for benchmarking."""
+    rng = random.Random(seed)
+    # Literal spellings of the rules ("class.?mod" -> "class mod" / "class-mod" / "classmod")
+    words = []
+    for _, pattern in rules.rules:
+        for filler in (' ', '-', ''):
+            words.append(pattern.replace('.?', filler))
+    
+    filenames = []
+    for _ in range(count):
+        parts = [rng.choice(BENCH_NOISE_WORDS) for _ in range(rng.randint(1, 3))]
+        for _ in range(rng.randint(0, 2)):
+            parts.insert(rng.randint(0, len(parts)), rng.choice(words))
+        name = rng.choice(('_', '-', ' ')).join(parts)
+        if rng.random() < 0.3:
+            name = name.title()
+        if rng.random() < 0.3:
+            name = f"{name} ({rng.randint(1, 9)})"
+        filenames.append(name + rng.choice(IMAGE_EXTENSIONS))
+    return filenames
+
+
+def run_benchmark(rules: CategoryRules, count: int = BENCH_FILENAMES) -> bool:
+    """Time the compiled matcher against one search per rule; returns whether every category agreed."""
+    filenames = synthetic_filenames(rules, count)
+    
+    start = time.perf_counter()
+    sequential = [rules.categorize_sequentially(name) for name in filenames]
+    sequential_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    compiled = [rules.categorize(name) for name in filenames]
+    compiled_time = time.perf_counter() - start
+    
+    mismatches = [name for name, a, b in zip(filenames, sequential, compiled) if a != b]
+    print(f"Categorized {count:,} synthetic filenames ({len(rules.rules)} rules)")
+    print(f"  One search per rule: {sequential_time * 1000:.0f} ms ({count / sequential_time:,.0f} files/s)")
+    print(f"  Compiled matcher: {compiled_time * 1000:.0f} ms ({count / compiled_time:,.0f} files/s)")
+    print(f"  Speedup: {sequential_time / compiled_time:.1f}x")
+    
+    counts: Dict[str, int] = {}
+    for category in compiled:
+        counts[category] = counts.get(category, 0) + 1
+    for category, _ in rules.categories:
+        print(f"  {category}: {counts.get(category, 0):,}")
+    
+    for name in mismatches[:10]:
+        print(f"  MISMATCH: {name}")
+    return not mismatches
+
+
+def print_explanation(rules: CategoryRules, filename: str):
+    """Show the category of a filename and every rule that matched it."""
+    category = rules.categorize(filename)
+    matches = rules.explain(filename)
+    print(f"\n{filename} -> {category}")
+    if not matches:
+        print(f"  (no rule matched, default: {rules.default})")
+    for index, (rule_category, pattern, position, text) in enumerate(matches):
+        marker = '*' if index == 0 else ' '
+        print(f"  {marker} {rule_category:<14} /{pattern}/ at {position}: {text!r}")
+
+
 def main():
+    parser = argparse.ArgumentParser(description="Organize downloaded images into category directories")
+    parser.add_argument('--rules', type=Path, default=RULES_FILE, help="categorization rules file")
+    parser.add_argument('--explain', nargs='+', metavar='FILENAME', help="show how filenames are categorized")
+    parser.add_argument('--bench', action='store_true', help="benchmark categorization on synthetic filenames")
+    args = parser.parse_args()
+    
     print("Equipment Editor - Image Organization")
     print("=" * 50)
     
+    global _rules
+    try:
+        _rules = CategoryRules.load(args.rules)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: Could not load rules: {e}")
+        return
+    
+    if args.explain:
+        for filename in args.explain:
+            print_explanation(_rules, filename)
+        return
+    
+    if args.bench:
+        agreed = run_benchmark(_rules)
+        print("\nSummary:")
+        print(f"  Categories match one-search-per-rule: {'yes' if agreed else 'NO'}")
+        return
+    
     image_index = organize_images()
     
     # Print summary
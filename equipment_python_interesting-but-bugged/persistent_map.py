@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Persistent Map for Equipment Editor
+Immutable, structurally shared hash map (HAMT) and a linear undo/redo history of its versions
+"""
+
+import time
+import random
+import argparse
+import tracemalloc
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Tuple
+
+# 32-way branching on 5 hash bits per level; past HASH_BITS equal hashes share a collision node
+BITS = 5
+BRANCH_MASK = (1 << BITS) - 1
+HASH_BITS = 64
+HASH_MASK = (1 << HASH_BITS) - 1
+
+# Default number of states kept by History (oldest are dropped first)
+HISTORY_LIMIT = 500
+
+
+class _Leaf:
+    __slots__ = ('hash', 'key', 'value')
+    
+    def __init__(self, key_hash: int, key: Any, value: Any):
+        self.hash = key_hash
+        self.key = key
+        self.value = value
+
+
+class _Collision:
+    """Leaves whose full hashes are equal."""
+    __slots__ = ('hash', 'leaves')
+    
+    def __init__(self, key_hash: int, leaves: Tuple[_Leaf, ...]):
+        self.hash = key_hash
+        self.leaves = leaves
+
+
+class _Node:
+    """Bitmap-compressed branch: one child per set bit, in bit order."""
+    __slots__ = ('bitmap', 'children')
+    
+    def __init__(self, bitmap: int, children: tuple):
+        self.bitmap = bitmap
+        self.children = children
+
+
+_EMPTY = _Node(0, ())
+
+
+def _hash(key: Any) -> int:
+    return hash(key) & HASH_MASK
+
+
+def _merge(first: _Leaf, second: _Leaf, shift: int):
+    """Smallest subtree holding two leaves with different keys."""
+    if shift >= HASH_BITS or first.hash == second.hash:
+        return _Collision(first.hash, (first, second))
+    first_bit = (first.hash >> shift) & BRANCH_MASK
+    second_bit = (second.hash >> shift) & BRANCH_MASK
+    if first_bit == second_bit:
+        return _Node(1 << first_bit, (_merge(first, second, shift + BITS),))
+    children = (first, second) if first_bit < second_bit else (second, first)
+    return _Node((1 << first_bit) | (1 << second_bit), children)
+
+
+def _set(node, shift: int, leaf: _Leaf) -> Tuple[Any, bool]:
+    """Copy of the path to leaf.key with leaf in place. Returns (node, added); node is unchanged if the value is."""
+    if isinstance(node, _Collision):
+        for index, existing in enumerate(node.leaves):
+            if existing.key == leaf.key:
+                if existing.value is leaf.value:
+                    return node, False
+                return _Collision(node.hash, node.leaves[:index] + (leaf,) + node.leaves[index + 1:]), False
+        if leaf.hash == node.hash:
+            return _Collision(node.hash, node.leaves + (leaf,)), True
+        # Different hash: split below a branch (only reachable before HASH_BITS)
+        return _set(_Node(1 << ((node.hash >> shift) & BRANCH_MASK), (node,)), shift, leaf)
+    
+    bit = 1 << ((leaf.hash >> shift) & BRANCH_MASK)
+    index = (node.bitmap & (bit - 1)).bit_count()
+    children = node.children
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit, children[:index] + (leaf,) + children[index:]), True
+    
+    child = children[index]
+    if isinstance(child, _Leaf):
+        if child.key == leaf.key:
+            if child.value is leaf.value:
+                return node, False
+            replacement, added = leaf, False
+        else:
+            replacement, added = _merge(child, leaf, shift + BITS), True
+    else:
+        replacement, added = _set(child, shift + BITS, leaf)
+        if replacement is child:
+            return node, False
+    return _Node(node.bitmap, children[:index] + (replacement,) + children[index + 1:]), added
+
+
+def _leaves(node) -> Iterator[_Leaf]:
+    if isinstance(node, _Leaf):
+        yield node
+    elif isinstance(node, _Collision):
+        yield from node.leaves
+    else:
+        for child in node.children:
+            yield from _leaves(child)
+
+
+class PersistentMap(Mapping):
+    """
+    Immutable mapping. set() returns a new map sharing every untouched subtree
+    with the old one, so a version costs O(log32 n) new nodes, and diff()
+    skips shared subtrees by identity. Iteration order follows key hashes.
+    """
+    
+    __slots__ = ('_root', '_size')
+    
+    def __init__(self, root=_EMPTY, size: int = 0):
+        self._root = root
+        self._size = size
+    
+    @classmethod
+    def from_dict(cls, values: Dict[Any, Any]) -> 'PersistentMap':
+        result = cls()
+        for key, value in values.items():
+            result = result.set(key, value)
+        return result
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[Any]:
+        return (leaf.key for leaf in _leaves(self._root))
+    
+    def __getitem__(self, key: Any) -> Any:
+        key_hash = _hash(key)
+        node = self._root
+        shift = 0
+        while True:
+            if isinstance(node, _Leaf):
+                if node.key == key:
+                    return node.value
+                raise KeyError(key)
+            if isinstance(node, _Collision):
+                for leaf in node.leaves:
+                    if leaf.key == key:
+                        return leaf.value
+                raise KeyError(key)
+            bit = 1 << ((key_hash >> shift) & BRANCH_MASK)
+            if not node.bitmap & bit:
+                raise KeyError(key)
+            node = node.children[(node.bitmap & (bit - 1)).bit_count()]
+            shift += BITS
+    
+    def items(self):
+        return [(leaf.key, leaf.value) for leaf in _leaves(self._root)]
+    
+    def set(self, key: Any, value: Any) -> 'PersistentMap':
+        """New map with key set to value (self if the value is already there)."""
+        root, added = _set(self._root, 0, _Leaf(_hash(key), key, value))
+        if root is self._root:
+            return self
+        return PersistentMap(root, self._size + added)
+    
+    def diff(self, other: 'PersistentMap') -> List[Any]:
+        """Keys whose values differ between the two maps (shared subtrees are not visited)."""
+        changed = []
+        _diff(self._root, other._root, changed)
+        return changed
+
+
+def _diff(first, second, changed: List[Any]):
+    if first is second:
+        return
+    if isinstance(first, _Node) and isinstance(second, _Node):
+        # Walk both branches in bit order; children present on one side only differ entirely
+        bits = first.bitmap | second.bitmap
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            left = first.children[(first.bitmap & (bit - 1)).bit_count()] if first.bitmap & bit else _EMPTY
+            right = second.children[(second.bitmap & (bit - 1)).bit_count()] if second.bitmap & bit else _EMPTY
+            _diff(left, right, changed)
+        return
+    if isinstance(first, _Leaf) and isinstance(second, _Leaf) and first.key == second.key:
+        if first.value is not second.value:
+            changed.append(first.key)
+        return
+    # Different shapes (leaf vs branch, collisions): compare by key
+    left = {leaf.key: leaf.value for leaf in _leaves(first)}
+    right = {leaf.key: leaf.value for leaf in _leaves(second)}
+    for key in left.keys() | right.keys():
+        if key not in left or key not in right or left[key] is not right[key]:
+            changed.append(key)
+
+
+class History:
+    """Linear undo/redo history of immutable states. Editing after an undo drops the redo states."""
+    
+    def __init__(self, initial: Any, limit: int = HISTORY_LIMIT):
+        self.states = [initial]
+        self.index = 0
+        self.limit = limit
+    
+    @property
+    def current(self) -> Any:
+        return self.states[self.index]
+    
+    def push(self, state: Any):
+        """Record a new state after the current one."""
+        if state is self.current:
+            return
+        del self.states[self.index + 1:]
+        self.states.append(state)
+        if len(self.states) > self.limit:
+            del self.states[:len(self.states) - self.limit]
+        self.index = len(self.states) - 1
+    
+    def can_undo(self) -> bool:
+        return self.index > 0
+    
+    def can_redo(self) -> bool:
+        return self.index < len(self.states) - 1
+    
+    def undo(self) -> Any:
+        return self.jump(self.index - 1)
+    
+    def redo(self) -> Any:
+        return self.jump(self.index + 1)
+    
+    def jump(self, index: int) -> Any:
+        """Move to any recorded state (clamped). Returns the new current state."""
+        self.index = max(0, min(index, len(self.states) - 1))
+        return self.current
+
+
+def fuzz(operations: int, keys: int, seed: int = 0) -> int:
+    """Random sets against a dict reference, checking contents and diff() of old versions. Returns failures."""
+    rng = random.Random(seed)
+    versions = [(PersistentMap(), {})]
+    failures = 0
+    for _ in range(operations):
+        persistent, reference = versions[-1]
+        key = rng.randrange(keys)
+        value = rng.choice([None, rng.random(), f"item{rng.randrange(10)}"])
+        persistent = persistent.set(key, value)
+        reference = {**reference, key: value}
+        versions.append((persistent, reference))
+        
+        if dict(persistent.items()) != reference or len(persistent) != len(reference):
+            failures += 1
+        old_persistent, old_reference = rng.choice(versions)
+        expected = {k for k in old_reference.keys() | reference.keys()
+                    if k not in old_reference or k not in reference or old_reference[k] is not reference[k]}
+        if set(old_persistent.diff(persistent)) != expected:
+            failures += 1
+    return failures
+
+
+def run_benchmark(edits: int, keys: int, seed: int = 0) -> Dict[str, float]:
+    """Memory per recorded edit (persistent vs dict snapshots) and diff/set timings."""
+    rng = random.Random(seed)
+    changes = [(rng.randrange(keys), object()) for _ in range(edits)]
+    initial = {key: None for key in range(keys)}
+    
+    tracemalloc.start()
+    history = History(PersistentMap.from_dict(initial), limit=edits + 1)
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for key, value in changes:
+        history.push(history.current.set(key, value))
+    set_seconds = time.perf_counter() - start
+    persistent_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    snapshots = [dict(initial)]
+    before = tracemalloc.get_traced_memory()[0]
+    for key, value in changes:
+        snapshot = dict(snapshots[-1])
+        snapshot[key] = value
+        snapshots.append(snapshot)
+    snapshot_bytes = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    
+    start = time.perf_counter()
+    differing = 0
+    for _ in range(1000):
+        first, second = rng.randrange(len(history.states)), rng.randrange(len(history.states))
+        differing += len(history.states[first].diff(history.states[second]))
+    diff_seconds = time.perf_counter() - start
+    
+    return {
+        'persistent_bytes_per_edit': persistent_bytes / edits,
+        'snapshot_bytes_per_edit': snapshot_bytes / edits,
+        'set_us': set_seconds / edits * 1e6,
+        'diff_us': diff_seconds / 1000 * 1e6,
+        'average_diff': differing / 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and benchmark the persistent map")
+    parser.add_argument('--bench', type=int, nargs='?', const=10000, metavar='EDITS',
+                        help="record EDITS edits (default 10000)")
+    parser.add_argument('--keys', type=int, default=9, help="keys per map (9 = equipment slots)")
+    parser.add_argument('--fuzz', type=int, default=5000, metavar='OPERATIONS', help="random operations to check")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Persistent Map")
+    print("=" * 50)
+    
+    failures = fuzz(args.fuzz, args.keys) + fuzz(args.fuzz, 1000, seed=1)
+    if failures:
+        print(f"ERROR: {failures} fuzz check(s) failed")
+    
+    if args.bench:
+        stats = run_benchmark(args.bench, args.keys)
+    
+    print("\nSummary:")
+    print(f"  Fuzz operations: {args.fuzz * 2} ({failures} failures)")
+    if args.bench:
+        print(f"  Edits: {args.bench} over {args.keys} keys")
+        print(f"  Memory per edit: {stats['persistent_bytes_per_edit']:.0f} bytes "
+              f"(dict snapshots: {stats['snapshot_bytes_per_edit']:.0f} bytes)")
+        print(f"  Set: {stats['set_us']:.2f} us")
+        print(f"  Diff between two versions: {stats['diff_us']:.2f} us ({stats['average_diff']:.1f} keys)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Search Index for Equipment Editor
+Typo-tolerant search over catalog and augment names, descriptions and keywords (trigram + prefix index)
+"""
+
+import os
+import re
+import json
+import math
+import time
+import bisect
+import hashlib
+import argparse
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+try:
+    from . import catalog
+except ImportError:
+    import catalog
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+BASE_DIR = SCRIPT_DIR.parent
+PAGES_DIR = BASE_DIR / "01-source-files"
+INDEX_FILE = BASE_DIR / "resources" / "cache" / "search_index.json"
+INDEX_VERSION = 2
+
+# Field weights (a hit in the name outranks the same hit in the description)
+NAME_WEIGHT = 3.0
+KEYWORD_WEIGHT = 1.5
+DESCRIPTION_WEIGHT = 1.0
+
+# Fuzzy matching
+PREFIX_SIMILARITY = 0.9
+MIN_TRIGRAM_SIMILARITY = 0.4
+TRIGRAM_SIMILARITY_SCALE = 0.8
+
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+MARKUP_PATTERN = re.compile(r'\[/?[^\]]*\]')
+PLACEHOLDER_PATTERN = re.compile(r'\{[^}]*\}')
+# Text wrapped in markup: [keyword id="secondary"]Text[/keyword], [secondary]Text[/secondary]
+MARKUP_KEYWORD_PATTERN = re.compile(r'\[(?!/)[^\]]*\]([^\[]+)\[/[^\]]*\]')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens (single letters dropped, numbers kept)."""
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if len(token) > 1 or token.isdigit()]
+
+
+def strip_markup(text: str) -> str:
+    """Remove [tag] markup and collapse whitespace."""
+    return ' '.join(MARKUP_PATTERN.sub('', text).split())
+
+
+def description_key(text: str) -> str:
+    """Normalized description used to match saved pages to catalog rows."""
+    text = PLACEHOLDER_PATTERN.sub(' ', text).lower().replace('[alt fire]', ' ')
+    return ' '.join(TOKEN_PATTERN.findall(text))
+
+
+def trigrams(term: str) -> set:
+    """Trigrams of a term padded so word starts weigh more."""
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class AugmentPageParser(HTMLParser):
+    """Collects augment descriptions and their keyword spans from a saved planner page."""
+    
+    VOID_TAGS = {'img', 'br', 'input', 'meta', 'link', 'hr', 'source', 'wbr', 'area', 'col', 'embed'}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.augments: List[Tuple[str, List[str]]] = []  # (description text, keywords)
+        self._depth = 0
+        self._keyword_depth = 0
+        self._text = []
+        self._keywords = []
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.VOID_TAGS:
+            return
+        classes = (dict(attrs).get('class') or '').split()
+        if self._depth:
+            self._depth += 1
+            if self._keyword_depth:
+                self._keyword_depth += 1
+            elif 'keyword' in classes:
+                self._keyword_depth = 1
+                self._keywords.append('')
+        elif any('augmentDescriptionInner' in name for name in classes):
+            self._depth = 1
+            self._text = []
+            self._keywords = []
+    
+    def handle_endtag(self, tag):
+        if tag in self.VOID_TAGS or not self._depth:
+            return
+        self._depth -= 1
+        if self._keyword_depth:
+            self._keyword_depth -= 1
+        if not self._depth:
+            keywords = [keyword.strip() for keyword in self._keywords if keyword.strip()]
+            self.augments.append((''.join(self._text), keywords))
+    
+    def handle_data(self, data):
+        if self._depth:
+            self._text.append(data)
+            if self._keyword_depth:
+                self._keywords[-1] += data
+
+
+def parse_augment_page(path: Path) -> Dict[str, List[str]]:
+    """Get description key -> keywords for one saved page."""
+    parser = AugmentPageParser()
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        parser.feed(f.read())
+    keywords = {}
+    for text, words in parser.augments:
+        keywords.setdefault(description_key(text), []).extend(words)
+    return keywords
+
+
+def _fingerprint(path: Path) -> Optional[List[int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _catalog_document(item_catalog: catalog.Catalog, row: int) -> dict:
+    """Term weights for one catalog row."""
+    name = item_catalog.string('name', row) or ''
+    description = item_catalog.string('description', row) or ''
+    facets = ' '.join(item_catalog.enum(column, row) or '' for column in ('manufacturer', 'character', 'subtype'))
+    terms = {}
+    for text, weight in (
+        (strip_markup(description), DESCRIPTION_WEIGHT),
+        (' '.join(MARKUP_KEYWORD_PATTERN.findall(description)), KEYWORD_WEIGHT),
+        (facets, KEYWORD_WEIGHT),
+        (name, NAME_WEIGHT)
+    ):
+        for term in tokenize(text):
+            terms[term] = max(terms.get(term, 0.0), weight)
+    return {'terms': terms, 'match': description_key(strip_markup(description))}
+
+
+def _document_hash(item_catalog: catalog.Catalog, row: int) -> str:
+    text = '\0'.join(item_catalog.string(name, row) or '' for name in ('name', 'description'))
+    text += '\0'.join(item_catalog.enum(column, row) or '' for column in ('manufacturer', 'character', 'subtype'))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def load_index_data() -> dict:
+    """Load persisted index data (sources, documents, page keywords)."""
+    if INDEX_FILE.exists():
+        try:
+            with open(INDEX_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == INDEX_VERSION:
+                return data
+        except Exception as e:
+            print(f"WARNING: Could not load search index: {e}")
+    return {'version': INDEX_VERSION, 'catalog': None, 'documents': {}, 'pages': {}}
+
+
+def save_index_data(data: dict):
+    """Save index data to INDEX_FILE."""
+    INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = INDEX_FILE.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+    os.replace(tmp_path, INDEX_FILE)
+
+
+def update_index_data(data: dict, item_catalog: catalog.Catalog, catalog_file: Path = catalog.CATALOG_FILE,
+                      pages_dir: Path = PAGES_DIR) -> Dict[str, int]:
+    """
+    Bring index data up to date. Only changed sources are re-read:
+    catalog rows whose text hash changed, and pages whose mtime/size changed.
+    """
+    stats = {'documents': 0, 'reused': 0, 'pages': 0, 'pages_reused': 0}
+    
+    fingerprint = _fingerprint(catalog_file)
+    if fingerprint is None or data['catalog'] != fingerprint:
+        previous = data['documents']
+        documents = {}
+        for row in range(len(item_catalog)):
+            key = f"{item_catalog.string('table', row)}:{item_catalog.string('id', row)}"
+            row_hash = _document_hash(item_catalog, row)
+            document = previous.get(key)
+            if document and document['hash'] == row_hash:
+                stats['reused'] += 1
+            else:
+                document = _catalog_document(item_catalog, row)
+                document['hash'] = row_hash
+                stats['documents'] += 1
+            documents[key] = document
+        data['documents'] = documents
+        data['catalog'] = fingerprint
+    else:
+        stats['reused'] = len(data['documents'])
+    
+    pages = {}
+    if pages_dir.exists():
+        for path in sorted(pages_dir.glob('*.html')):
+            page_fingerprint = _fingerprint(path)
+            page = data['pages'].get(path.name)
+            if page and page['fingerprint'] == page_fingerprint:
+                stats['pages_reused'] += 1
+            else:
+                page = {'fingerprint': page_fingerprint, 'keywords': parse_augment_page(path)}
+                stats['pages'] += 1
+            pages[path.name] = page
+    data['pages'] = pages
+    
+    return stats
+
+
+class SearchIndex:
+    """
+    In-memory search structures: postings per term, a sorted vocabulary
+    for prefix lookups and a trigram -> terms map for typo tolerance.
+    """
+    
+    def __init__(self, item_catalog: catalog.Catalog, data: dict):
+        self.catalog = item_catalog
+        
+        page_keywords: Dict[str, List[str]] = {}
+        for page in data['pages'].values():
+            for match, keywords in page['keywords'].items():
+                page_keywords.setdefault(match, []).extend(keywords)
+        
+        self.postings: Dict[str, Dict[int, float]] = {}
+        for row in range(len(item_catalog)):
+            key = f"{item_catalog.string('table', row)}:{item_catalog.string('id', row)}"
+            document = data['documents'].get(key)
+            if document is None:
+                continue
+            terms = dict(document['terms'])
+            for term in tokenize(' '.join(page_keywords.get(document['match'], []))):
+                terms[term] = max(terms.get(term, 0.0), KEYWORD_WEIGHT)
+            for term, weight in terms.items():
+                self.postings.setdefault(term, {})[row] = weight
+        
+        document_count = max(len(item_catalog), 1)
+        self.idf = {term: math.log(1.0 + document_count / len(rows)) for term, rows in self.postings.items()}
+        self.vocabulary = sorted(self.postings)
+        self.trigram_terms: Dict[str, List[int]] = {}
+        self.term_trigram_counts = []
+        for number, term in enumerate(self.vocabulary):
+            grams = trigrams(term)
+            self.term_trigram_counts.append(len(grams))
+            for gram in grams:
+                self.trigram_terms.setdefault(gram, []).append(number)
+    
+    def expand(self, query_term: str) -> Dict[str, float]:
+        """Vocabulary terms close to a query term -> similarity (1.0 = exact)."""
+        matches = {}
+        if query_term in self.postings:
+            matches[query_term] = 1.0
+        
+        # Prefix matches (as-you-type)
+        start = bisect.bisect_left(self.vocabulary, query_term)
+        for term in self.vocabulary[start:start + 64]:
+            if not term.startswith(query_term):
+                break
+            matches.setdefault(term, PREFIX_SIMILARITY)
+        
+        # Trigram (Dice) similarity for typos
+        if len(query_term) >= 3:
+            query_grams = trigrams(query_term)
+            shared: Dict[int, int] = {}
+            for gram in query_grams:
+                for number in self.trigram_terms.get(gram, ()):
+                    shared[number] = shared.get(number, 0) + 1
+            for number, count in shared.items():
+                similarity = 2.0 * count / (len(query_grams) + self.term_trigram_counts[number])
+                if similarity >= MIN_TRIGRAM_SIMILARITY:
+                    term = self.vocabulary[number]
+                    scaled = similarity * TRIGRAM_SIMILARITY_SCALE
+                    if scaled > matches.get(term, 0.0):
+                        matches[term] = scaled
+        
+        return matches
+    
+    def search(self, query: str, limit: int = 50, allowed: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Ranked (row, score) results. Every query term must match a row
+        (exactly, by prefix or fuzzily). allowed is an optional row bitmap
+        (e.g. from catalog_query) restricting the results.
+        """
+        query_terms = tokenize(query)
+        if not query_terms:
+            return []
+        
+        scores: Optional[Dict[int, float]] = None
+        for query_term in dict.fromkeys(query_terms):
+            term_scores: Dict[int, float] = {}
+            for term, similarity in self.expand(query_term).items():
+                boost = similarity * self.idf[term]
+                for row, weight in self.postings[term].items():
+                    score = boost * weight
+                    if score > term_scores.get(row, 0.0):
+                        term_scores[row] = score
+            if scores is None:
+                scores = term_scores
+            else:
+                scores = {row: score + term_scores[row] for row, score in scores.items() if row in term_scores}
+            if not scores:
+                return []
+        
+        if allowed is not None:
+            scores = {row: score for row, score in scores.items() if (allowed >> row) & 1}
+        
+        ranked = sorted(scores.items(), key=lambda entry: (-entry[1], entry[0]))
+        return ranked[:limit]
+
+
+# Shared index (built on first use)
+_search_index = None
+
+
+def get_search_index(rebuild: bool = False) -> Optional[SearchIndex]:
+    """Get the search index, updating the persisted index data if sources changed."""
+    global _search_index
+    
+    if _search_index is not None and not rebuild:
+        return _search_index
+    
+    item_catalog = catalog.get_catalog()
+    if item_catalog is None:
+        return None
+    
+    data = {'version': INDEX_VERSION, 'catalog': None, 'documents': {}, 'pages': {}} if rebuild else load_index_data()
+    stats = update_index_data(data, item_catalog)
+    if stats['documents'] or stats['pages'] or rebuild:
+        try:
+            save_index_data(data)
+        except OSError as e:
+            print(f"WARNING: Could not save search index: {e}")
+    
+    _search_index = SearchIndex(item_catalog, data)
+    return _search_index
+
+
+def clear_cache():
+    """Drop the shared search index (updated for the current catalog on next use)."""
+    global _search_index
+    _search_index = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search the item catalog")
+    parser.add_argument('query', nargs='*', help="search text")
+    parser.add_argument('--rebuild', action='store_true', help="rebuild the index from scratch")
+    parser.add_argument('--limit', type=int, default=20, help="results to show")
+    parser.add_argument('--bench', action='store_true', help="time index load and a set of queries")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Search")
+    print("=" * 50)
+    
+    start = time.perf_counter()
+    index = get_search_index(rebuild=args.rebuild)
+    load_ms = (time.perf_counter() - start) * 1000
+    if index is None:
+        print(f"ERROR: Item catalog not found: {catalog.CATALOG_FILE}")
+        print("Run extract_game_data.py first.")
+        return
+    
+    item_catalog = index.catalog
+    if args.query:
+        query = ' '.join(args.query)
+        print(f"\nResults for '{query}':")
+        for row, score in index.search(query, limit=args.limit):
+            print(f"  {score:6.2f}  {item_catalog.string('name', row)} ({item_catalog.enum('entity', row)})")
+    
+    if args.bench:
+        queries = ['hellwalker', 'helwalker', 'jak', 'tracker darts', 'shiled boost', 'critical dmg',
+                   'maliwan', 'licensed underbarrel', 'cryo', 'anarhcy', 'reload speed', 'rocket hom']
+        start = time.perf_counter()
+        rounds = 20
+        for _ in range(rounds):
+            for query in queries:
+                index.search(query)
+        query_ms = (time.perf_counter() - start) * 1000 / (rounds * len(queries))
+    
+    print("\nSummary:")
+    print(f"  Terms: {len(index.vocabulary)}")
+    print(f"  Load/update: {load_ms:.1f} ms")
+    if args.bench:
+        print(f"  Query: {query_ms:.2f} ms")
+    print(f"\nSearch index saved to: {INDEX_FILE}")
+
+
+if __name__ == "__main__":
+    main()
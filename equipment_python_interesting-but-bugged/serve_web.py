@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Static Web Server for Equipment Editor
+Serves the HTML editor with strong ETags, immutable caching, precompressed files and ranges
+"""
+
+import os
+import re
+import time
+import email.utils
+import hashlib
+import argparse
+import threading
+import http.client
+import http.server
+import urllib.parse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+try:
+    from .build_web import BASE_DIR, DIST_DIR, HASH_LENGTH
+except ImportError:
+    from build_web import BASE_DIR, DIST_DIR, HASH_LENGTH
+
+# Server defaults
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+DEFAULT_WORKERS = 16
+REQUEST_QUEUE_SIZE = 128
+
+# Idle keep-alive connections give their worker back after this many seconds
+KEEP_ALIVE_TIMEOUT = 5
+
+# Fingerprinted names (app.<hash>.js, game-data-<hash>.js, bl4-chunk-00-<hash>.js) never change content
+FINGERPRINT_PATTERN = re.compile(rf'[.-][0-9a-f]{{{HASH_LENGTH}}}\.[A-Za-z0-9]+$')
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "no-cache"
+
+# Single byte range: "bytes=start-end", "bytes=start-" or "bytes=-suffix"
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+# Files .gz variants are looked for next to
+PRECOMPRESSED_SUFFIX = ".gz"
+
+# Load test
+BENCH_SECONDS = 3.0
+BENCH_CLIENTS = 8
+BENCH_PATHS = 12
+
+
+class ETagCache:
+    """Strong ETags (content hashes), recomputed only when a file's size or mtime changes."""
+    
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, path: str, stat: os.stat_result) -> str:
+        with self._lock:
+            entry = self._entries.get(path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        
+        with open(path, 'rb') as f:
+            etag = f'"{hashlib.file_digest(f, "sha256").hexdigest()[:16]}"'
+        with self._lock:
+            self._entries[path] = (stat.st_mtime_ns, stat.st_size, etag)
+        return etag
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single-range Range header into (start, end) inclusive.
+    Returns None when the header should be ignored (malformed or multi-range) and raises
+    ValueError when the range cannot be satisfied.
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise ValueError(f"Unsatisfiable range: {header}")
+        return max(size - length, 0), size - 1
+    
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError(f"Unsatisfiable range: {header}")
+    return start, end
+
+
+def accepts_gzip(header: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip (and does not refuse it with q=0)."""
+    for coding in header.split(','):
+        name, _, params = coding.strip().partition(';')
+        if name.strip().lower() not in ('gzip', '*'):
+            continue
+        quality = params.strip()
+        if quality.startswith('q='):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+class StaticRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """GET/HEAD for static files, with conditional requests, caching headers, gzip variants and ranges."""
+    
+    protocol_version = "HTTP/1.1"
+    timeout = KEEP_ALIVE_TIMEOUT
+    # Headers and the sendfile body are separate writes; don't let Nagle hold the second one back
+    disable_nagle_algorithm = True
+    server_version = "EquipmentEditor/1.0"
+    etags = ETagCache()
+    
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+    
+    def do_GET(self):
+        self._serve(send_body=True)
+    
+    def do_HEAD(self):
+        self._serve(send_body=False)
+    
+    def _serve(self, send_body: bool):
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not self.path.split('?', 1)[0].endswith('/'):
+                self._redirect_to_directory()
+                return
+            path = os.path.join(path, 'index.html')
+        
+        try:
+            f = open(path, 'rb')
+        except OSError:
+            self.send_error(http.HTTPStatus.NOT_FOUND, "File not found")
+            return
+        
+        try:
+            stat = os.fstat(f.fileno())
+            content_type = self.guess_type(path)
+            etag = self.etags.get(path, stat)
+            byte_range = None
+            encoding = None
+            
+            # Pick the representation first: validators (and a 304) are those of what a 200 would send.
+            # Ranges always refer to the identity representation.
+            range_header = self.headers.get('Range')
+            ranged = bool(range_header) and self._range_applies(etag, stat)
+            if not ranged and accepts_gzip(self.headers.get('Accept-Encoding', '')):
+                compressed = self._open_precompressed(path, stat)
+                if compressed:
+                    f.close()
+                    f, stat = compressed
+                    etag = etag[:-1] + '-gz"'
+                    encoding = 'gzip'
+            
+            if self._not_modified(etag, stat):
+                self._send_headers(http.HTTPStatus.NOT_MODIFIED, path, etag, stat)
+                self.end_headers()
+                return
+            
+            if ranged:
+                try:
+                    byte_range = parse_range(range_header, stat.st_size)
+                except ValueError:
+                    self._send_headers(http.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE, path, etag, stat)
+                    self.send_header('Content-Range', f'bytes */{stat.st_size}')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+            
+            if byte_range:
+                start, end = byte_range
+                self._send_headers(http.HTTPStatus.PARTIAL_CONTENT, path, etag, stat)
+                self.send_header('Content-Range', f'bytes {start}-{end}/{stat.st_size}')
+            else:
+                start, end = 0, stat.st_size - 1
+                self._send_headers(http.HTTPStatus.OK, path, etag, stat)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(end - start + 1))
+            if encoding:
+                self.send_header('Content-Encoding', encoding)
+            self.end_headers()
+            
+            if send_body and end >= start:
+                # socket.sendfile uses os.sendfile where available (no copies through Python)
+                self.connection.sendfile(f, start, end - start + 1)
+        finally:
+            f.close()
+    
+    def _send_headers(self, status: int, path: str, etag: str, stat: os.stat_result):
+        """Status line plus the validators and cache policy shared by every response."""
+        self.send_response(status)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', self.date_time_string(int(stat.st_mtime)))
+        self.send_header('Cache-Control', cache_control(path))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Vary', 'Accept-Encoding')
+    
+    def _not_modified(self, etag: str, stat: os.stat_result) -> bool:
+        """If-None-Match (against the chosen representation's ETag), else If-Modified-Since."""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match:
+            if if_none_match.strip() == '*':
+                return True
+            candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+            return etag in candidates
+        
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            return int(stat.st_mtime) <= since.timestamp()
+        return False
+    
+    def _range_applies(self, etag: str, stat: os.stat_result) -> bool:
+        """If-Range: only honor the range when the client's copy is still current."""
+        if_range = self.headers.get('If-Range')
+        if not if_range:
+            return True
+        if if_range.startswith('"'):
+            return if_range.strip() == etag
+        return if_range.strip() == self.date_time_string(int(stat.st_mtime))
+    
+    def _open_precompressed(self, path: str, stat: os.stat_result) -> Optional[Tuple[object, os.stat_result]]:
+        """Open path.gz if it exists and is not older than the file it was built from."""
+        try:
+            f = open(path + PRECOMPRESSED_SUFFIX, 'rb')
+        except OSError:
+            return None
+        compressed_stat = os.fstat(f.fileno())
+        if compressed_stat.st_mtime_ns < stat.st_mtime_ns:
+            f.close()
+            return None
+        return f, compressed_stat
+    
+    def _redirect_to_directory(self):
+        path, _, query = self.path.partition('?')
+        self.send_response(http.HTTPStatus.MOVED_PERMANENTLY)
+        self.send_header('Location', path + '/' + ('?' + query if query else ''))
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+
+def cache_control(path: str) -> str:
+    """Fingerprinted files are cached forever; everything else is revalidated with its ETag."""
+    if FINGERPRINT_PATTERN.search(os.path.basename(path)):
+        return IMMUTABLE_CACHE_CONTROL
+    return REVALIDATE_CACHE_CONTROL
+
+
+class PooledHTTPServer(http.server.HTTPServer):
+    """HTTP server handing each connection to a fixed pool of worker threads."""
+    
+    request_queue_size = REQUEST_QUEUE_SIZE
+    
+    def __init__(self, address: Tuple[str, int], handler, workers: int = DEFAULT_WORKERS, verbose: bool = False):
+        super().__init__(address, handler)
+        self.verbose = verbose
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="serve_web")
+    
+    def process_request(self, request, client_address):
+        self.pool.submit(self._process_request_worker, request, client_address)
+    
+    def _process_request_worker(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+    
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def make_server(root: Path, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                workers: int = DEFAULT_WORKERS, verbose: bool = False) -> PooledHTTPServer:
+    """Create a server for root (not yet serving)."""
+    class Handler(StaticRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(root), **kwargs)
+    
+    return PooledHTTPServer((host, port), Handler, workers=workers, verbose=verbose)
+
+
+def default_root() -> Path:
+    """The built bundle if there is one, else the source tree (what `python -m http.server` served)."""
+    if (DIST_DIR / "index.html").exists():
+        return DIST_DIR
+    return BASE_DIR
+
+
+def _bench_paths(root: Path, count: int = BENCH_PATHS) -> List[str]:
+    """index.html, its scripts and stylesheets, plus a few assets - what a page load requests."""
+    paths = ['/index.html']
+    for pattern in ('static/*.js', 'static/*.css', 'js/*.js', 'css/*.css', 'assets/db/assets/*/*.webp'):
+        for path in sorted(root.glob(pattern))[:count]:
+            paths.append('/' + urllib.parse.quote(path.relative_to(root).as_posix()))
+    return paths[:count]
+
+
+def _load(port: int, paths: List[str], seconds: float, clients: int, gzip: bool = False,
+          etags: Optional[Dict[str, str]] = None) -> Tuple[int, int]:
+    """
+    Hammer the server from several keep-alive clients; returns (requests, body bytes).
+    With etags every request revalidates with If-None-Match and must get a 304.
+    """
+    deadline = time.perf_counter() + seconds
+    totals = [0, 0]
+    lock = threading.Lock()
+    
+    def client(offset: int):
+        connection = http.client.HTTPConnection(DEFAULT_HOST, port, timeout=10)
+        requests = received = 0
+        index = offset
+        try:
+            while time.perf_counter() < deadline:
+                path = paths[index % len(paths)]
+                headers = {'Accept-Encoding': 'gzip'} if gzip else {}
+                if etags:
+                    headers['If-None-Match'] = etags[path]
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                received += len(response.read())
+                if etags and response.status != http.HTTPStatus.NOT_MODIFIED:
+                    raise RuntimeError(f"Expected 304 for {path}, got {response.status}")
+                requests += 1
+                index += 1
+        finally:
+            connection.close()
+        with lock:
+            totals[0] += requests
+            totals[1] += received
+    
+    threads = [threading.Thread(target=client, args=(i,)) for i in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return totals[0], totals[1]
+
+
+def _fetch_etags(port: int, paths: List[str]) -> Dict[str, str]:
+    """ETags of the gzip representations, as a browser would have cached them."""
+    etags = {}
+    connection = http.client.HTTPConnection(DEFAULT_HOST, port, timeout=10)
+    try:
+        for path in paths:
+            connection.request('GET', path, headers={'Accept-Encoding': 'gzip'})
+            response = connection.getresponse()
+            response.read()
+            etags[path] = response.getheader('ETag')
+    finally:
+        connection.close()
+    return etags
+
+
+def run_benchmark(root: Path, workers: int = DEFAULT_WORKERS, seconds: float = BENCH_SECONDS,
+                  clients: int = BENCH_CLIENTS) -> Dict[str, Tuple[int, int]]:
+    """Compare `python -m http.server` with this server (plain, gzip and revalidating) on a local port."""
+    paths = _bench_paths(root)
+    print(f"Load test: {len(paths)} paths, {clients} clients, {seconds:.0f}s per run")
+    
+    class BaselineHandler(http.server.SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(root), **kwargs)
+        
+        def log_message(self, format, *args):
+            pass
+    
+    results = {}
+    baseline = http.server.ThreadingHTTPServer((DEFAULT_HOST, 0), BaselineHandler)
+    servers = [("http.server", baseline), ("serve_web", make_server(root, port=0, workers=workers))]
+    for name, server in servers:
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        port = server.server_address[1]
+        try:
+            results[name] = _load(port, paths, seconds, clients)
+            if server is not baseline:
+                results["serve_web (gzip)"] = _load(port, paths, seconds, clients, gzip=True)
+                # Revalidation: what a reload costs once everything is cached
+                etags = _fetch_etags(port, paths)
+                results["serve_web (304)"] = _load(port, paths, seconds, clients, gzip=True, etags=etags)
+        finally:
+            server.shutdown()
+            server.server_close()
+    
+    for name, (requests, received) in results.items():
+        print(f"  {name:<18} {requests / seconds:>9.0f} requests/s  {received / requests / 1024:>7.1f} KB/request")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the HTML editor with caching headers")
+    parser.add_argument('--root', type=Path, default=None, help="directory to serve (default: dist/ if built)")
+    parser.add_argument('--host', default=DEFAULT_HOST, help="address to bind")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help="port to bind")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="worker threads")
+    parser.add_argument('--verbose', action='store_true', help="log every request")
+    parser.add_argument('--bench', action='store_true', help="run a local load test and exit")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Static Web Server")
+    print("=" * 50)
+    
+    root = (args.root or default_root()).resolve()
+    if not (root / "index.html").exists():
+        print(f"ERROR: No index.html in {root}")
+        return
+    print(f"Serving {root}")
+    
+    if args.bench:
+        results = run_benchmark(root, workers=args.workers)
+        baseline = results["http.server"][0]
+        print("\nSummary:")
+        for name, (requests, _) in results.items():
+            if name != "http.server":
+                print(f"  {name}: {requests / baseline:.1f}x http.server")
+        return
+    
+    try:
+        server = make_server(root, args.host, args.port, args.workers, args.verbose)
+    except OSError as e:
+        print(f"ERROR: Could not bind {args.host}:{args.port}: {e}")
+        return
+    
+    print(f"Listening on http://{args.host}:{server.server_address[1]}/ ({args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
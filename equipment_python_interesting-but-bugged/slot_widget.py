@@ -4,13 +4,23 @@ Individual equipment slot with rarity styling, clip-paths, and icon display
 Matches maxroll.gg design exactly
 """
 
-from PyQt6.QtWidgets import QWidget, QLabel
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QPointF
-from PyQt6.QtGui import QPixmap, QPainter, QColor, QBrush, QPen, QPolygonF, QLinearGradient, QRadialGradient, QPainterPath
+from typing import Optional
+from PyQt6.QtWidgets import QWidget, QLabel, QSizePolicy
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QSizeF, QPointF, QRectF, QTimer, QEvent
+from PyQt6.QtGui import QPainter, QBrush, QPolygonF, QLinearGradient, QRadialGradient, QPainterPath
 try:
-    from . import assets, styles
+    from . import assets, styles, icon_cache
 except ImportError:
-    import assets, styles
+    import assets, styles, icon_cache
+
+# Delay (ms) after the last resize step before the icon is rescaled smoothly
+RESIZE_SETTLE_MS = 120
+
+# Icon edge length (px) at the slot's minimum size; grows as the slot is scaled up
+ICON_BASE_SIZE = 80
+
+# Support slot (repkit/ordnance) width:height, kept while the slot scales
+SUPPORT_ASPECT_RATIO = 159 / 82
 
 
 class SlotWidget(QWidget):
@@ -26,14 +36,29 @@ class SlotWidget(QWidget):
         self.item_data = None
         self.editable = False
         
+        # Icon path for the current item (pixels are served from icon_cache)
+        self._icon_path = None
+        
+        # Paint the "+" marker when there is no icon to show
+        self._show_empty = True
+        
+        # Coalesce resize steps: fast scaling while dragging, smooth once settled
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_SETTLE_MS)
+        self._resize_timer.timeout.connect(self._on_resize_settled)
+        
         self.setObjectName("SlotWidget")
         
         # Set minimum size based on slot type
         if slot_type == 'weapon':
             self.setMinimumSize(200, 140)
         elif slot_type in ['repkit', 'ordnance']:
-            # Aspect ratio 159/82
+            # Aspect ratio 159/82 - layouts ask heightForWidth()
             self.setMinimumSize(159, 82)
+            policy = QSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Preferred)
+            policy.setHeightForWidth(True)
+            self.setSizePolicy(policy)
         elif slot_type in ['class-mod', 'shield', 'enhancement']:
             # Aspect ratio 12/10
             self.setMinimumSize(120, 100)
@@ -45,35 +70,17 @@ class SlotWidget(QWidget):
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.icon_label.setScaledContents(False)
         
-        # Empty slot "+" label
-        self.empty_label = QLabel("+", self)
-        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.empty_label.setStyleSheet("""
-            font-size: 500%;
-            line-height: 50%;
-            color: rgb(150, 148, 171);
-            font-family: 'Source Sans 3', sans-serif;
-        """)
-        self.empty_label.hide()
-        
-        # Weapon number badge (for weapon slots)
-        self.number_label = None
-        if weapon_number:
-            self.number_label = QLabel(str(weapon_number), self)
-            self.number_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.number_label.setStyleSheet("""
-                font-size: 22px;
-                line-height: 16px;
-                color: rgb(136, 138, 156);
-                background: rgb(20, 24, 28);
-                padding: 4px;
-                min-width: 40px;
-                min-height: 40px;
-            """)
-            self.number_label.hide()
+        # Empty slot "+" marker and weapon number badge are painted from
+        # styles.get_theme() in paintEvent - no child labels or QSS
         
         self.update_display()
     
+    def heightForWidth(self, width: int) -> int:
+        """Support slots keep their 159:82 aspect ratio at any width."""
+        if self.slot_type in ['repkit', 'ordnance']:
+            return max(int(round(width / SUPPORT_ASPECT_RATIO)), self.minimumHeight())
+        return super().heightForWidth(width)
+    
     def set_editable(self, editable: bool):
         """Set whether slot is editable (clickable)."""
         self.editable = editable
@@ -92,45 +99,53 @@ class SlotWidget(QWidget):
         self.item_data = item_data
         self.update_display()
     
+    @property
+    def icon_path(self) -> Optional[str]:
+        """Icon path currently shown (None while the "+" marker is shown)."""
+        return self._icon_path
+    
     def update_display(self):
         """Update icon/empty display."""
-        if self.item_data:
-            # Show icon
-            icon_path = None
-            
-            if self.slot_type == 'weapon':
-                weapon_type = self.item_data.get('weaponType', 'assault')
-                icon_path = assets.get_weapon_icon(weapon_type)
-            elif self.slot_type in ['repkit', 'ordnance', 'class-mod', 'shield', 'enhancement']:
-                icon_path = assets.get_slot_icon(self.slot_type)
-            
-            if icon_path:
-                pixmap = QPixmap(icon_path)
-                if not pixmap.isNull():
-                    # Scale to fit
-                    max_size = min(self.width() - 20, self.height() - 20, 80)
-                    scaled = pixmap.scaled(
-                        max_size, max_size,
-                        Qt.AspectRatioMode.KeepAspectRatio,
-                        Qt.TransformationMode.SmoothTransformation
-                    )
-                    self.icon_label.setPixmap(scaled)
-                    self.icon_label.show()
-                    self.empty_label.hide()
-                else:
-                    self.icon_label.hide()
-                    self.empty_label.show()
-            else:
-                self.icon_label.hide()
-                self.empty_label.show()
+        self._icon_path = resolve_slot_icon(self.slot_type, self.item_data)
+        
+        if self._icon_path and icon_cache.get_pyramid(self._icon_path):
+            self._rescale_icon(Qt.TransformationMode.SmoothTransformation)
+            self.icon_label.show()
+            self._show_empty = False
         else:
-            # Empty slot - show "+"
+            # Empty slot (or icon unavailable) - show "+"
+            self._icon_path = None
             self.icon_label.hide()
-            self.empty_label.show()
+            self._show_empty = True
         
-        # Show/hide weapon number badge
-        if self.number_label:
-            self.number_label.show()
+        self.update()
+    
+    def _icon_size(self) -> int:
+        """Get icon edge length for the current widget size."""
+        min_size = self.minimumSize()
+        scale = max(1.0, min(
+            self.width() / max(min_size.width(), 1),
+            self.height() / max(min_size.height(), 1)
+        ))
+        return min(self.width() - 20, self.height() - 20, int(ICON_BASE_SIZE * scale))
+    
+    def _rescale_icon(self, mode: Qt.TransformationMode):
+        """Scale the current icon from its pyramid to the current size."""
+        if self._icon_path is None:
+            return
+        
+        scaled = icon_cache.get_scaled_icon(
+            self._icon_path,
+            max(self._icon_size(), 1),
+            self.devicePixelRatioF(),
+            mode
+        )
+        if scaled is not None:
+            self.icon_label.setPixmap(scaled)
+    
+    def _on_resize_settled(self):
+        """Size has been stable for RESIZE_SETTLE_MS - rescale smoothly."""
+        self._rescale_icon(Qt.TransformationMode.SmoothTransformation)
     
     def resizeEvent(self, event):
         """Handle resize - update icon size and positions."""
@@ -140,7 +155,7 @@ class SlotWidget(QWidget):
         center_x = self.width() // 2
         center_y = self.height() // 2
         
-        icon_size = min(self.width() - 20, self.height() - 20, 80)
+        icon_size = self._icon_size()
         self.icon_label.setGeometry(
             center_x - icon_size // 2,
             center_y - icon_size // 2,
@@ -148,28 +163,16 @@ class SlotWidget(QWidget):
             icon_size
         )
         
-        # Position empty label
-        self.empty_label.setGeometry(0, 0, self.width(), self.height())
-        
-        # Position weapon number badge
-        if self.number_label:
-            badge_size = 40
-            if self.weapon_number == 1:
-                # Left side
-                self.number_label.setGeometry(0, center_y - badge_size // 2, badge_size, badge_size)
-            elif self.weapon_number == 2:
-                # Top center
-                self.number_label.setGeometry(center_x - badge_size // 2, 0, badge_size, badge_size)
-            elif self.weapon_number == 3:
-                # Right side
-                self.number_label.setGeometry(self.width() - badge_size, center_y - badge_size // 2, badge_size, badge_size)
-            elif self.weapon_number == 4:
-                # Bottom center
-                self.number_label.setGeometry(center_x - badge_size // 2, self.height() - badge_size, badge_size, badge_size)
-        
-        # Refresh icon if item exists
-        if self.item_data:
-            self.update_display()
+        # Refresh icon if item exists: cheap scale now, smooth scale once settled
+        if self._icon_path is not None:
+            self._rescale_icon(Qt.TransformationMode.FastTransformation)
+            self._resize_timer.start()
+    
+    def event(self, event):
+        """Re-render the icon when moved to a screen with another pixel ratio."""
+        if event.type() == QEvent.Type.DevicePixelRatioChange:
+            self._rescale_icon(Qt.TransformationMode.SmoothTransformation)
+        return super().event(event)
     
     def paintEvent(self, event):
         """Custom paint event for rarity borders, gradients, and clip-paths."""
@@ -179,232 +182,286 @@ class SlotWidget(QWidget):
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         
         rect = self.rect()
-        colors = styles.RARITY_COLORS.get(self.rarity, styles.RARITY_COLORS['gray'])
-        
-        if self.slot_type == 'weapon':
-            self._paint_weapon_slot(painter, rect, colors)
-        elif self.slot_type in ['repkit', 'ordnance']:
-            self._paint_support_slot(painter, rect, colors)
-        elif self.slot_type in ['class-mod', 'shield', 'enhancement']:
-            self._paint_auxiliary_slot(painter, rect, colors)
-    
-    def _paint_weapon_slot(self, painter: QPainter, rect, colors):
-        """Paint weapon slot with clip-path shape."""
-        # Draw border with clip-path
-        border_polygon = self._get_weapon_clip_path(rect, 0)
-        border_path = QPainterPath()
-        border_path.addPolygon(border_polygon)
-        painter.setPen(QPen(QColor(colors['border']), 1))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawPath(border_path)
-        
-        # Draw background with gradient
-        bg_polygon = self._get_weapon_clip_path(rect, 1)
-        bg_path = QPainterPath()
-        bg_path.addPolygon(bg_polygon)
+        theme = styles.get_theme()
+        colors = theme.get_rarity(self.rarity)
         
-        # Radial gradient based on weapon position
-        if self.weapon_number == 1:
-            center = QPointF(rect.width(), rect.height() * 0.495)
-        elif self.weapon_number == 2:
-            center = QPointF(rect.width() * 0.495, rect.height())
-        elif self.weapon_number == 3:
-            center = QPointF(0, rect.height() * 0.495)
-        elif self.weapon_number == 4:
-            center = QPointF(rect.width() * 0.495, 0)
-        else:
-            center = QPointF(rect.width() // 2, rect.height() // 2)
-        
-        # Parse rgba colors
-        def parse_rgba(rgba_str):
-            import re
-            match = re.match(r'rgba?\((\d+),(\d+),(\d+),?([\d.]+)?\)', rgba_str)
-            if match:
-                r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
-                a = float(match.group(4)) if match.group(4) else 1.0
-                return QColor(r, g, b, int(a * 255))
-            return QColor(136, 138, 156, 128)  # Default gray
-        
-        gradient = QRadialGradient(center, rect.width() * 1.15)
-        gradient.setColorAt(0.0, parse_rgba(colors['gradient_end']))
-        gradient.setColorAt(0.4, parse_rgba(colors['gradient_mid']))
-        gradient.setColorAt(1.0, parse_rgba(colors['gradient_start']))
-        
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(bg_path)
-    
-    def _paint_support_slot(self, painter: QPainter, rect, colors):
-        """Paint support slot (repkit/ordnance) with clip-path."""
-        # Draw border
-        border_polygon = self._get_support_clip_path(rect, 0)
-        border_path = QPainterPath()
-        border_path.addPolygon(border_polygon)
-        painter.setPen(QPen(QColor(colors['border']), 1))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawPath(border_path)
-        
-        # Draw background with gradient
-        bg_polygon = self._get_support_clip_path(rect, 3)
-        bg_path = QPainterPath()
-        bg_path.addPolygon(bg_polygon)
-        
-        # Parse rgba colors
-        def parse_rgba(rgba_str):
-            import re
-            match = re.match(r'rgba?\((\d+),(\d+),(\d+),?([\d.]+)?\)', rgba_str)
-            if match:
-                r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
-                a = float(match.group(4)) if match.group(4) else 1.0
-                return QColor(r, g, b, int(a * 255))
-            return QColor(136, 138, 156, 128)  # Default gray
-        
-        gradient = QLinearGradient(0, 0, rect.width(), rect.height())
-        gradient.setColorAt(0.0, parse_rgba(colors['gradient_start']))
-        gradient.setColorAt(0.6, parse_rgba(colors['gradient_mid']))
-        gradient.setColorAt(1.0, parse_rgba(colors['gradient_end']))
-        
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawPath(bg_path)
-    
-    def _paint_auxiliary_slot(self, painter: QPainter, rect, colors):
-        """Paint auxiliary slot (class-mod/shield/enhancement) - simple rectangle."""
-        # Draw border
-        inner_rect = rect.adjusted(0, 0, -1, -1)
-        painter.setPen(QPen(QColor(colors['border']), 1))
-        painter.setBrush(Qt.BrushStyle.NoBrush)
-        painter.drawRect(inner_rect)
-        
-        # Draw background with gradient
-        bg_rect = rect.adjusted(2, 2, -2, -2)
-        
-        # Parse rgba colors
-        def parse_rgba(rgba_str):
-            import re
-            match = re.match(r'rgba?\((\d+),(\d+),(\d+),?([\d.]+)?\)', rgba_str)
-            if match:
-                r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
-                a = float(match.group(4)) if match.group(4) else 1.0
-                return QColor(r, g, b, int(a * 255))
-            return QColor(136, 138, 156, 128)  # Default gray
-        
-        gradient = QLinearGradient(0, 0, rect.width(), rect.height())
-        gradient.setColorAt(0.0, parse_rgba(colors['gradient_start']))
-        gradient.setColorAt(0.6, parse_rgba(colors['gradient_mid']))
-        gradient.setColorAt(1.0, parse_rgba(colors['gradient_end']))
-        
-        painter.setBrush(QBrush(gradient))
-        painter.setPen(Qt.PenStyle.NoPen)
-        painter.drawRect(bg_rect)
-    
-    def _get_weapon_clip_path(self, rect, offset: int):
-        """Get clip-path polygon for weapon slot based on number."""
-        w, h = rect.width(), rect.height()
-        
-        # CSS variables from style.css
-        weap_id_cut_offset = w * 0.32
-        weap_id_cut_small = w * 0.18
-        weap_id_cut_center_offset = h * 0.12
-        weap_id_cut_side_width = w * 0.24
-        weap_id_cut_large = (w * 0.5) - weap_id_cut_offset
-        weap_id_cut_large_neg = w - weap_id_cut_large
-        weap_id_cut_small_neg = w - weap_id_cut_small
-        
-        if self.weapon_number == 1:
-            # Left side, middle
-            points = [
-                QPointF(weap_id_cut_large + offset, offset),
-                QPointF(weap_id_cut_large + weap_id_cut_side_width + offset, offset),
-                QPointF(w - offset, (h * 0.5) - weap_id_cut_center_offset + offset),
-                QPointF(w - offset, (h * 0.5) + weap_id_cut_center_offset - offset),
-                QPointF(weap_id_cut_large + weap_id_cut_side_width + offset, h - offset),
-                QPointF(weap_id_cut_large + offset, h - offset),
-                QPointF(offset, weap_id_cut_small_neg - offset),
-                QPointF(offset, weap_id_cut_small + offset)
-            ]
-        elif self.weapon_number == 2:
-            # Top center
-            points = [
-                QPointF(weap_id_cut_small + offset, offset),
-                QPointF(weap_id_cut_small_neg - offset, offset),
-                QPointF(w - offset, weap_id_cut_large + offset),
-                QPointF(w - offset, weap_id_cut_large + weap_id_cut_side_width + offset),
-                QPointF((w * 0.5) + weap_id_cut_center_offset - offset, h - offset),
-                QPointF((w * 0.5) - weap_id_cut_center_offset + offset, h - offset),
-                QPointF(offset, weap_id_cut_large + weap_id_cut_side_width + offset),
-                QPointF(offset, weap_id_cut_large + offset)
-            ]
-        elif self.weapon_number == 3:
-            # Right side, middle
-            points = [
-                QPointF(weap_id_cut_large_neg - weap_id_cut_side_width - offset, offset),
-                QPointF(weap_id_cut_large_neg - offset, offset),
-                QPointF(w - offset, weap_id_cut_small + offset),
-                QPointF(w - offset, weap_id_cut_small_neg - offset),
-                QPointF(weap_id_cut_large_neg - offset, h - offset),
-                QPointF(weap_id_cut_large_neg - weap_id_cut_side_width - offset, h - offset),
-                QPointF(offset, (h * 0.5) + weap_id_cut_center_offset - offset),
-                QPointF(offset, (h * 0.5) - weap_id_cut_center_offset + offset)
-            ]
-        elif self.weapon_number == 4:
-            # Bottom center
-            points = [
-                QPointF((w * 0.5) - weap_id_cut_center_offset + offset, offset),
-                QPointF((w * 0.5) + weap_id_cut_center_offset - offset, offset),
-                QPointF(w - offset, weap_id_cut_large_neg - weap_id_cut_side_width - offset),
-                QPointF(w - offset, weap_id_cut_large_neg - offset),
-                QPointF(weap_id_cut_small_neg - offset, h - offset),
-                QPointF(weap_id_cut_small + offset, h - offset),
-                QPointF(offset, weap_id_cut_large_neg - offset),
-                QPointF(offset, weap_id_cut_large_neg - weap_id_cut_side_width - offset)
-            ]
-        else:
-            # Fallback: simple rectangle
-            points = [
-                QPointF(offset, offset),
-                QPointF(w - offset, offset),
-                QPointF(w - offset, h - offset),
-                QPointF(offset, h - offset)
-            ]
-        
-        return QPolygonF(points)
-    
-    def _get_support_clip_path(self, rect, offset: int):
-        """Get clip-path polygon for support slot (repkit/ordnance)."""
-        w, h = rect.width(), rect.height()
-        cut_width = w * 0.10
-        cut_width_neg = w - cut_width
-        cut_height = (cut_width * 159) / 82
-        cut_height_neg = h - cut_height
-        
-        if self.slot_type == 'repkit':
-            # Repkit clip-path
-            points = [
-                QPointF(offset, offset),
-                QPointF(cut_width_neg - offset, offset),
-                QPointF(w - offset, cut_height + offset),
-                QPointF(w - offset, cut_height_neg - offset),
-                QPointF(cut_width_neg - offset, h - offset),
-                QPointF(cut_width + offset, h - offset),
-                QPointF(offset, cut_height_neg - offset)
-            ]
-        else:
-            # Ordnance clip-path (flipped)
-            points = [
-                QPointF(cut_width + offset, offset),
-                QPointF(w - offset, offset),
-                QPointF(w - offset, cut_height_neg - offset),
-                QPointF(cut_width_neg - offset, h - offset),
-                QPointF(cut_width + offset, h - offset),
-                QPointF(offset, cut_height_neg - offset),
-                QPointF(offset, cut_height + offset)
-            ]
+        paint_slot_chrome(painter, rect, self.slot_type, self.weapon_number, colors)
         
-        return QPolygonF(points)
+        if self._show_empty:
+            paint_empty_marker(painter, rect, theme)
+        if self.weapon_number:
+            paint_number_badge(painter, rect, self.weapon_number, theme)
     
     def mousePressEvent(self, event):
         """Handle mouse click."""
         if self.editable and event.button() == Qt.MouseButton.LeftButton:
             self.clicked.emit()
         super().mousePressEvent(event)
+
+
+def paint_slot_chrome(painter: QPainter, rect, slot_type: str, weapon_number: Optional[int],
+                      colors: 'styles.RarityPaint'):
+    """Paint slot border and background (shared by SlotWidget and loadout renderers)."""
+    if slot_type == 'weapon':
+        paint_weapon_slot(painter, rect, weapon_number, colors)
+    elif slot_type in ['repkit', 'ordnance']:
+        paint_support_slot(painter, rect, slot_type, colors)
+    elif slot_type in ['class-mod', 'shield', 'enhancement']:
+        paint_auxiliary_slot(painter, rect, colors)
+
+
+def resolve_slot_icon(slot_type: str, item_data: Optional[dict]) -> Optional[str]:
+    """Get the icon path for an item in a slot, or None."""
+    if not item_data:
+        return None
+    
+    if slot_type == 'weapon':
+        weapon_type = item_data.get('weaponType', 'assault')
+        return assets.get_weapon_icon(weapon_type)
+    elif slot_type in ['repkit', 'ordnance', 'class-mod', 'shield', 'enhancement']:
+        return assets.get_slot_icon(slot_type)
+    return None
+
+
+def paint_empty_marker(painter: QPainter, rect, theme: 'styles.Theme'):
+    """Paint the empty slot "+" marker, centered."""
+    text = theme.empty_marker_text
+    size = text.size()
+    painter.setFont(theme.empty_marker_font)
+    painter.setPen(theme.empty_marker_pen)
+    painter.drawStaticText(
+        QPointF((rect.width() - size.width()) / 2, (rect.height() - size.height()) / 2),
+        text
+    )
+
+
+def get_badge_rect(rect, weapon_number: int, badge_size: int) -> QRectF:
+    """Get weapon number badge rect for the slot's position in the cross."""
+    center_x = rect.width() // 2
+    center_y = rect.height() // 2
+    
+    if weapon_number == 1:
+        # Left side
+        return QRectF(0, center_y - badge_size // 2, badge_size, badge_size)
+    elif weapon_number == 2:
+        # Top center
+        return QRectF(center_x - badge_size // 2, 0, badge_size, badge_size)
+    elif weapon_number == 3:
+        # Right side
+        return QRectF(rect.width() - badge_size, center_y - badge_size // 2, badge_size, badge_size)
+    # Bottom center
+    return QRectF(center_x - badge_size // 2, rect.height() - badge_size, badge_size, badge_size)
+
+
+def paint_number_badge(painter: QPainter, rect, weapon_number: int, theme: 'styles.Theme'):
+    """Paint weapon number badge (1-4)."""
+    text = theme.badge_texts.get(weapon_number)
+    if text is None:
+        return
+    
+    # Anchored like a badge_size box, grown by padding on the right/bottom (as the QSS label was)
+    badge = get_badge_rect(rect, weapon_number, theme.badge_size)
+    badge.setSize(badge.size() + QSizeF(2 * theme.badge_padding, 2 * theme.badge_padding))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(theme.badge_brush)
+    painter.drawRect(badge)
+    
+    size = text.size()
+    painter.setFont(theme.badge_font)
+    painter.setPen(theme.badge_pen)
+    painter.drawStaticText(
+        QPointF(badge.x() + (badge.width() - size.width()) / 2,
+                badge.y() + (badge.height() - size.height()) / 2),
+        text
+    )
+
+
+def paint_weapon_slot(painter: QPainter, rect, weapon_number: int, colors: 'styles.RarityPaint'):
+    """Paint weapon slot with clip-path shape."""
+    # Draw border with clip-path
+    border_polygon = get_weapon_clip_path(rect, weapon_number, 0)
+    border_path = QPainterPath()
+    border_path.addPolygon(border_polygon)
+    painter.setPen(colors.border_pen)
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.drawPath(border_path)
+    
+    # Draw background with gradient
+    bg_polygon = get_weapon_clip_path(rect, weapon_number, 1)
+    bg_path = QPainterPath()
+    bg_path.addPolygon(bg_polygon)
+    
+    # Radial gradient based on weapon position
+    if weapon_number == 1:
+        center = QPointF(rect.width(), rect.height() * 0.495)
+    elif weapon_number == 2:
+        center = QPointF(rect.width() * 0.495, rect.height())
+    elif weapon_number == 3:
+        center = QPointF(0, rect.height() * 0.495)
+    elif weapon_number == 4:
+        center = QPointF(rect.width() * 0.495, 0)
+    else:
+        center = QPointF(rect.width() // 2, rect.height() // 2)
+    
+    gradient = QRadialGradient(center, rect.width() * 1.15)
+    gradient.setColorAt(0.0, colors.gradient_end)
+    gradient.setColorAt(0.4, colors.gradient_mid)
+    gradient.setColorAt(1.0, colors.gradient_start)
+    
+    painter.setBrush(QBrush(gradient))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawPath(bg_path)
+
+
+def paint_support_slot(painter: QPainter, rect, slot_type: str, colors: 'styles.RarityPaint'):
+    """Paint support slot (repkit/ordnance) with clip-path."""
+    # Draw border
+    border_polygon = get_support_clip_path(rect, slot_type, 0)
+    border_path = QPainterPath()
+    border_path.addPolygon(border_polygon)
+    painter.setPen(colors.border_pen)
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.drawPath(border_path)
+    
+    # Draw background with gradient
+    bg_polygon = get_support_clip_path(rect, slot_type, 3)
+    bg_path = QPainterPath()
+    bg_path.addPolygon(bg_polygon)
+    
+    gradient = QLinearGradient(0, 0, rect.width(), rect.height())
+    gradient.setColorAt(0.0, colors.gradient_start)
+    gradient.setColorAt(0.6, colors.gradient_mid)
+    gradient.setColorAt(1.0, colors.gradient_end)
+    
+    painter.setBrush(QBrush(gradient))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawPath(bg_path)
+
+
+def paint_auxiliary_slot(painter: QPainter, rect, colors: 'styles.RarityPaint'):
+    """Paint auxiliary slot (class-mod/shield/enhancement) - simple rectangle."""
+    # Draw border
+    inner_rect = rect.adjusted(0, 0, -1, -1)
+    painter.setPen(colors.border_pen)
+    painter.setBrush(Qt.BrushStyle.NoBrush)
+    painter.drawRect(inner_rect)
+    
+    # Draw background with gradient
+    bg_rect = rect.adjusted(2, 2, -2, -2)
+    
+    gradient = QLinearGradient(0, 0, rect.width(), rect.height())
+    gradient.setColorAt(0.0, colors.gradient_start)
+    gradient.setColorAt(0.6, colors.gradient_mid)
+    gradient.setColorAt(1.0, colors.gradient_end)
+    
+    painter.setBrush(QBrush(gradient))
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.drawRect(bg_rect)
+
+
+def get_weapon_clip_path(rect, weapon_number: int, offset: int) -> QPolygonF:
+    """Get clip-path polygon for weapon slot based on number."""
+    w, h = rect.width(), rect.height()
+    
+    # CSS variables from style.css
+    weap_id_cut_offset = w * 0.32
+    weap_id_cut_small = w * 0.18
+    weap_id_cut_center_offset = h * 0.12
+    weap_id_cut_side_width = w * 0.24
+    weap_id_cut_large = (w * 0.5) - weap_id_cut_offset
+    weap_id_cut_large_neg = w - weap_id_cut_large
+    weap_id_cut_small_neg = w - weap_id_cut_small
+    
+    if weapon_number == 1:
+        # Left side, middle
+        points = [
+            QPointF(weap_id_cut_large + offset, offset),
+            QPointF(weap_id_cut_large + weap_id_cut_side_width + offset, offset),
+            QPointF(w - offset, (h * 0.5) - weap_id_cut_center_offset + offset),
+            QPointF(w - offset, (h * 0.5) + weap_id_cut_center_offset - offset),
+            QPointF(weap_id_cut_large + weap_id_cut_side_width + offset, h - offset),
+            QPointF(weap_id_cut_large + offset, h - offset),
+            QPointF(offset, weap_id_cut_small_neg - offset),
+            QPointF(offset, weap_id_cut_small + offset)
+        ]
+    elif weapon_number == 2:
+        # Top center
+        points = [
+            QPointF(weap_id_cut_small + offset, offset),
+            QPointF(weap_id_cut_small_neg - offset, offset),
+            QPointF(w - offset, weap_id_cut_large + offset),
+            QPointF(w - offset, weap_id_cut_large + weap_id_cut_side_width + offset),
+            QPointF((w * 0.5) + weap_id_cut_center_offset - offset, h - offset),
+            QPointF((w * 0.5) - weap_id_cut_center_offset + offset, h - offset),
+            QPointF(offset, weap_id_cut_large + weap_id_cut_side_width + offset),
+            QPointF(offset, weap_id_cut_large + offset)
+        ]
+    elif weapon_number == 3:
+        # Right side, middle
+        points = [
+            QPointF(weap_id_cut_large_neg - weap_id_cut_side_width - offset, offset),
+            QPointF(weap_id_cut_large_neg - offset, offset),
+            QPointF(w - offset, weap_id_cut_small + offset),
+            QPointF(w - offset, weap_id_cut_small_neg - offset),
+            QPointF(weap_id_cut_large_neg - offset, h - offset),
+            QPointF(weap_id_cut_large_neg - weap_id_cut_side_width - offset, h - offset),
+            QPointF(offset, (h * 0.5) + weap_id_cut_center_offset - offset),
+            QPointF(offset, (h * 0.5) - weap_id_cut_center_offset + offset)
+        ]
+    elif weapon_number == 4:
+        # Bottom center
+        points = [
+            QPointF((w * 0.5) - weap_id_cut_center_offset + offset, offset),
+            QPointF((w * 0.5) + weap_id_cut_center_offset - offset, offset),
+            QPointF(w - offset, weap_id_cut_large_neg - weap_id_cut_side_width - offset),
+            QPointF(w - offset, weap_id_cut_large_neg - offset),
+            QPointF(weap_id_cut_small_neg - offset, h - offset),
+            QPointF(weap_id_cut_small + offset, h - offset),
+            QPointF(offset, weap_id_cut_large_neg - offset),
+            QPointF(offset, weap_id_cut_large_neg - weap_id_cut_side_width - offset)
+        ]
+    else:
+        # Fallback: simple rectangle
+        points = [
+            QPointF(offset, offset),
+            QPointF(w - offset, offset),
+            QPointF(w - offset, h - offset),
+            QPointF(offset, h - offset)
+        ]
+    
+    return QPolygonF(points)
+
+
+def get_support_clip_path(rect, slot_type: str, offset: int) -> QPolygonF:
+    """Get clip-path polygon for support slot (repkit/ordnance)."""
+    w, h = rect.width(), rect.height()
+    cut_width = w * 0.10
+    cut_width_neg = w - cut_width
+    # Never past the middle, or the left/right edges would cross over
+    cut_height = min(cut_width * SUPPORT_ASPECT_RATIO, h / 2)
+    cut_height_neg = h - cut_height
+    
+    if slot_type == 'repkit':
+        # Repkit clip-path
+        points = [
+            QPointF(offset, offset),
+            QPointF(cut_width_neg - offset, offset),
+            QPointF(w - offset, cut_height + offset),
+            QPointF(w - offset, cut_height_neg - offset),
+            QPointF(cut_width_neg - offset, h - offset),
+            QPointF(cut_width + offset, h - offset),
+            QPointF(offset, cut_height_neg - offset)
+        ]
+    else:
+        # Ordnance clip-path (flipped)
+        points = [
+            QPointF(cut_width + offset, offset),
+            QPointF(w - offset, offset),
+            QPointF(w - offset, cut_height_neg - offset),
+            QPointF(cut_width_neg - offset, h - offset),
+            QPointF(cut_width + offset, h - offset),
+            QPointF(offset, cut_height_neg - offset),
+            QPointF(offset, cut_height + offset)
+        ]
+    
+    return QPolygonF(points)
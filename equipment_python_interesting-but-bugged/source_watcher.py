@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+Source Watcher for Equipment Editor
+Watches the planner JavaScript and the download folders and re-runs only the affected extractor
+"""
+
+import os
+import json
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+try:
+    from . import extract_game_data, extract_image_urls, organize_images, asset_pack
+except ImportError:
+    import extract_game_data, extract_image_urls, organize_images, asset_pack
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+BASE_DIR = SCRIPT_DIR.parent
+RELOAD_FILE = SCRIPT_DIR / "data" / "reload.json"
+
+# Quiet time before a burst of events is handled, and the longest a burst can delay it
+DEBOUNCE_SECONDS = 0.5
+MAX_DELAY_SECONDS = 5.0
+
+# Polling fallback interval
+POLL_SECONDS = 1.0
+
+# What an editor reloads after a job (see EquipmentEditorWindow.reload_sources)
+CHANGED_GAME_DATA = 'game_data'
+CHANGED_IMAGES = 'images'
+
+# inotify (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, 'O_CLOEXEC', 0)
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+# A file is only read once it is complete: written and closed, or moved into place
+# (IN_CREATE is only for new directories - a file that was just created may still be empty)
+FILE_READY_MASK = IN_CLOSE_WRITE | IN_MOVED_TO
+# Removals are reported too; the jobs drop what the file contributed and never read it
+FILE_GONE_MASK = IN_MOVED_FROM | IN_DELETE
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def is_chunk_file(path: Path) -> bool:
+    return path.name.startswith('bl4-chunk-') and path.suffix == '.js'
+
+
+class WatchedSources:
+    """Where the sources live and which job a changed file belongs to."""
+    
+    def __init__(self, js_dir: Path = extract_game_data.JS_DIR, base_dir: Path = BASE_DIR,
+                 download_dirs: Iterable[str] = organize_images.DOWNLOAD_DIRS,
+                 pack_file: Path = asset_pack.PACK_FILE):
+        self.js_dir = Path(js_dir)
+        self.base_dir = Path(base_dir)
+        self.download_dirs = [Path(directory) for directory in download_dirs]
+        self.pack_file = Path(pack_file)
+    
+    def roots(self) -> List[Tuple[Path, bool]]:
+        """(directory, recursive) for every existing source directory."""
+        roots = [(self.js_dir, False), (self.base_dir, False), (self.pack_file.parent, False)]
+        roots += [(directory, True) for directory in self.download_dirs]
+        return [(directory, recursive) for directory, recursive in roots if directory.is_dir()]
+    
+    def jobs_for(self, path: Path) -> List[str]:
+        """Jobs a changed file needs: 'game_data', 'image_urls', 'images' and/or 'asset_pack'."""
+        jobs = []
+        if path == self.pack_file:
+            jobs.append('asset_pack')
+        elif path.suffix == '.js' and path.parent in (self.js_dir, self.base_dir):
+            if is_chunk_file(path):
+                jobs.append('game_data')
+            if path.parent == self.js_dir:
+                jobs.append('image_urls')
+        elif path.name.lower().endswith(organize_images.IMAGE_EXTENSIONS):
+            if any(directory in path.parents for directory in self.download_dirs):
+                jobs.append('images')
+        return jobs
+    
+    def is_relevant(self, path: Path) -> bool:
+        return bool(self.jobs_for(path))
+    
+    def all_files(self) -> List[Path]:
+        """Every source file (after missed events)."""
+        files = []
+        for directory, recursive in self.roots():
+            walk = os.walk(directory) if recursive else [(str(directory), [], os.listdir(directory))]
+            files += [Path(root) / name for root, _, names in walk for name in names]
+        return [path for path in files if self.is_relevant(path)]
+
+
+class InotifyWatcher:
+    """Linux inotify watches (through libc), recursive where asked; new subdirectories are watched too."""
+    
+    def __init__(self, roots: List[Tuple[Path, bool]]):
+        libc_name = ctypes.util.find_library('c')
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories: Dict[int, Tuple[Path, bool]] = {}
+        self.overflowed = False
+        for directory, recursive in roots:
+            self._watch_tree(directory, recursive)
+    
+    def _watch(self, directory: Path, recursive: bool):
+        descriptor = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), WATCH_MASK)
+        if descriptor < 0:
+            error = ctypes.get_errno()
+            if error == errno.ENOSPC:
+                raise OSError(error, "inotify watch limit reached (fs.inotify.max_user_watches)")
+            print(f"WARNING: Could not watch {directory}: {os.strerror(error)}")
+            return
+        self.directories[descriptor] = (directory, recursive)
+    
+    def _watch_tree(self, directory: Path, recursive: bool):
+        self._watch(directory, recursive)
+        if recursive:
+            for root, dirs, files in os.walk(directory):
+                for name in dirs:
+                    self._watch(Path(root) / name, True)
+    
+    def read(self, timeout: float) -> List[Path]:
+        """Changed paths, waiting up to timeout seconds for the first event."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+        changed = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                descriptor, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    self.overflowed = True
+                    continue
+                if descriptor not in self.directories:
+                    continue
+                directory, recursive = self.directories[descriptor]
+                path = directory / os.fsdecode(name)
+                if mask & IN_ISDIR:
+                    if recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                        # Files can land before the watch exists: report what is already there
+                        self._watch_tree(path, True)
+                        changed.extend(Path(root) / file for root, _, files in os.walk(path) for file in files)
+                    continue
+                if mask & (FILE_READY_MASK | FILE_GONE_MASK):
+                    changed.append(path)
+        return changed
+    
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Fallback: compares (mtime, size) of every file under the roots each interval."""
+    
+    def __init__(self, roots: List[Tuple[Path, bool]], interval: float = POLL_SECONDS):
+        self.roots = roots
+        self.interval = interval
+        self.overflowed = False
+        self.snapshot = self._scan()
+    
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        snapshot = {}
+        for directory, recursive in self.roots:
+            walk = os.walk(directory) if recursive else [(str(directory), [], os.listdir(directory))]
+            for root, _, files in walk:
+                for name in files:
+                    path = Path(root) / name
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+    
+    def read(self, timeout: float) -> List[Path]:
+        time.sleep(min(timeout, self.interval))
+        snapshot = self._scan()
+        changed = [path for path, signature in snapshot.items() if self.snapshot.get(path) != signature]
+        changed += [path for path in self.snapshot if path not in snapshot]
+        self.snapshot = snapshot
+        return changed
+    
+    def close(self):
+        pass
+
+
+class Debouncer:
+    """Collects paths until events stop for debounce seconds (or max_delay passes since the first)."""
+    
+    def __init__(self, debounce: float = DEBOUNCE_SECONDS, max_delay: float = MAX_DELAY_SECONDS):
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.pending: Set[Path] = set()
+        self.first = 0.0
+        self.last = 0.0
+    
+    def add(self, paths: Iterable[Path], now: float):
+        for path in paths:
+            if not self.pending:
+                self.first = now
+            self.pending.add(path)
+            self.last = now
+    
+    def timeout(self, now: float) -> Optional[float]:
+        """Seconds until the pending burst is due (None if nothing is pending)."""
+        if not self.pending:
+            return None
+        return max(0.0, min(self.last + self.debounce, self.first + self.max_delay) - now)
+    
+    def take(self, now: float) -> Set[Path]:
+        """The pending paths if the burst is due, else an empty set."""
+        timeout = self.timeout(now)
+        if timeout is None or timeout > 0:
+            return set()
+        paths, self.pending = self.pending, set()
+        return paths
+
+
+class SourceJobs:
+    """Runs the extractors for changed files, keeping what is needed to update incrementally."""
+    
+    def __init__(self, sources: WatchedSources):
+        self.sources = sources
+        self.urls_by_file: Optional[Dict[Path, Set[str]]] = None
+        self.image_index = None
+        self.runs = {'game_data': 0, 'image_urls': 0, 'images': 0, 'asset_pack': 0}
+    
+    def run(self, paths: Set[Path]) -> Set[str]:
+        """Handle a burst of changed paths. Returns what editors should reload."""
+        chunks = set()
+        scripts = set()
+        images = set()
+        repacked = False
+        for path in paths:
+            for job in self.sources.jobs_for(path):
+                if job == 'game_data':
+                    chunks.add(path)
+                elif job == 'image_urls':
+                    scripts.add(path)
+                elif job == 'asset_pack':
+                    repacked = True
+                else:
+                    images.add(path)
+        
+        changed = set()
+        # A rebuilt pack needs no job here; editors reopen it with the images
+        if repacked:
+            self.runs['asset_pack'] += 1
+            changed.add(CHANGED_IMAGES)
+        # Only the newest chunk matters; a deleted one leaves the last extraction in place
+        existing_chunks = [path for path in chunks if path.exists()]
+        if existing_chunks:
+            chunk = max(existing_chunks, key=lambda path: path.stat().st_mtime_ns)
+            self.runs['game_data'] += 1
+            if extract_game_data.extract(chunk) is not None:
+                changed.add(CHANGED_GAME_DATA)
+        # Images first: the missing-URL list is checked against the image index
+        if images:
+            self.runs['images'] += 1
+            if self.organize(images):
+                changed.add(CHANGED_IMAGES)
+        if scripts:
+            self.runs['image_urls'] += 1
+            self.update_urls(scripts)
+        return changed
+    
+    def update_urls(self, scripts: Set[Path]):
+        """Rescan only the changed scripts, then rewrite the URL lists from the per-file sets."""
+        if self.urls_by_file is None:
+            # First run: the one full scan, kept per file afterwards
+            js_dir = self.sources.js_dir
+            self.urls_by_file = {path: extract_image_urls.extract_urls_from_file(path) for path in js_dir.glob("*.js")}
+        for path in scripts:
+            if path.exists():
+                self.urls_by_file[path] = extract_image_urls.extract_urls_from_file(path)
+            else:
+                self.urls_by_file.pop(path, None)
+        all_urls = set().union(*self.urls_by_file.values()) if self.urls_by_file else set()
+        extract_image_urls.TARGET_BASE.mkdir(parents=True, exist_ok=True)
+        missing = extract_image_urls.check_missing_urls(all_urls, extract_image_urls.load_existing_images())
+        extract_image_urls.save_missing_urls(missing)
+        extract_image_urls.save_all_urls(all_urls)
+    
+    def organize(self, images: Set[Path]) -> bool:
+        """Copy only the new or changed images and update the saved index. Returns True if any was copied."""
+        if self.image_index is None:
+            self.image_index = organize_images.load_image_index()
+        copied = False
+        for path in sorted(images):
+            if path.exists():
+                copied |= organize_images.organize_file(str(path), self.image_index, replace=True) is not None
+        if copied:
+            organize_images.save_image_index(self.image_index)
+        return copied
+
+
+def notify_editors(changed: Set[str], reload_file: Path = RELOAD_FILE):
+    """Tell open editors to reload (they watch reload_file); written atomically."""
+    reload_file.parent.mkdir(parents=True, exist_ok=True)
+    temporary = reload_file.with_suffix('.tmp')
+    with open(temporary, 'w', encoding='utf-8') as f:
+        json.dump({'changed': sorted(changed), 'time': time.time()}, f)
+    os.replace(temporary, reload_file)
+
+
+def read_notification(reload_file: Path = RELOAD_FILE) -> Optional[dict]:
+    """The last notification ({'changed': [...], 'time': ...}), or None."""
+    try:
+        with open(reload_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def open_watcher(roots: List[Tuple[Path, bool]], polling: bool, interval: float):
+    """inotify where available, else polling."""
+    if not polling:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError, TypeError) as e:
+            # AttributeError: libc without inotify (not Linux)
+            print(f"WARNING: inotify unavailable ({e}), polling every {interval:g} s")
+    return PollingWatcher(roots, interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-run extractors when their source files change")
+    parser.add_argument('--poll', action='store_true', help="poll instead of using inotify")
+    parser.add_argument('--interval', type=float, default=POLL_SECONDS, help="polling interval in seconds")
+    parser.add_argument('--debounce', type=float, default=DEBOUNCE_SECONDS, help="quiet time before a burst is handled")
+    parser.add_argument('--js-dir', type=Path, default=extract_game_data.JS_DIR, help="planner JavaScript directory")
+    parser.add_argument('--download-dir', type=Path, action='append', help="download directory (repeatable)")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Source Watcher")
+    print("=" * 50)
+    
+    sources = WatchedSources(args.js_dir, BASE_DIR, args.download_dir or organize_images.DOWNLOAD_DIRS)
+    roots = sources.roots()
+    for directory in [sources.js_dir] + sources.download_dirs:
+        if not directory.is_dir():
+            print(f"WARNING: Directory not found: {directory}")
+    watcher = open_watcher(roots, args.poll, args.interval)
+    jobs = SourceJobs(sources)
+    debouncer = Debouncer(args.debounce)
+    notifications = 0
+    
+    print(f"\nWatching {len(roots)} director{'y' if len(roots) == 1 else 'ies'} "
+          f"({'polling' if isinstance(watcher, PollingWatcher) else 'inotify'}), Ctrl+C to stop")
+    try:
+        while True:
+            timeout = debouncer.timeout(time.monotonic())
+            paths = [path for path in watcher.read(1.0 if timeout is None else timeout) if sources.is_relevant(path)]
+            if watcher.overflowed:
+                print("WARNING: Event queue overflowed, re-running every job")
+                watcher.overflowed = False
+                paths += sources.all_files()
+            debouncer.add(paths, time.monotonic())
+            
+            burst = debouncer.take(time.monotonic())
+            if not burst:
+                continue
+            print(f"\n{len(burst)} changed file(s)")
+            try:
+                changed = jobs.run(burst)
+            except Exception as e:
+                # One bad file must not stop the watcher; the next change retries
+                print(f"ERROR: Job failed: {e}")
+                continue
+            if changed:
+                notify_editors(changed)
+                notifications += 1
+                print(f"Notified editors: {', '.join(sorted(changed))}")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    
+    print("\nSummary:")
+    for job, count in jobs.runs.items():
+        print(f"  {job}: {count} run(s)")
+    print(f"  Editor notifications: {notifications}")
+
+
+if __name__ == "__main__":
+    main()
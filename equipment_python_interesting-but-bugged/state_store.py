@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+State Store for Equipment Editor
+Reactive key-value store with per-key subscriptions and one batched notification per event-loop tick
+"""
+
+import time
+import random
+import argparse
+from typing import Any, Callable, Dict, List, Optional
+from PyQt6.QtCore import QCoreApplication, QTimer
+try:
+    from .persistent_map import PersistentMap
+except ImportError:
+    from persistent_map import PersistentMap
+
+KeyCallback = Callable[[Any], None]
+StateCallback = Callable[[PersistentMap, List[Any]], None]
+
+
+class Store:
+    """
+    State as a PersistentMap: set() makes a new version without copying the others.
+    Changes made during one event-loop tick are delivered together on the next one,
+    once per changed key (a key set and then set back is not reported at all).
+    """
+    
+    def __init__(self, initial: Optional[Dict[Any, Any]] = None, logging: bool = False):
+        self._state = PersistentMap.from_dict(initial or {})
+        self._notified = self._state
+        self._key_subscribers: Dict[Any, List[KeyCallback]] = {}
+        self._state_subscribers: List[StateCallback] = []
+        self._scheduled = False
+        self.logging = logging
+    
+    @property
+    def state(self) -> PersistentMap:
+        """Current state (immutable; later changes make new versions)."""
+        return self._state
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self._state.get(key, default)
+    
+    def set(self, key: Any, value: Any):
+        """Set one key. Subscribers are notified on the next event-loop tick."""
+        self.replace(self._state.set(key, value))
+    
+    def update(self, values: Dict[Any, Any]):
+        """Set several keys."""
+        state = self._state
+        for key, value in values.items():
+            state = state.set(key, value)
+        self.replace(state)
+    
+    def replace(self, state: PersistentMap):
+        """Switch to another version (e.g. from an undo history)."""
+        if state is self._state:
+            return
+        self._state = state
+        self._schedule()
+    
+    def subscribe(self, key: Any, callback: KeyCallback) -> Callable[[], None]:
+        """Call callback(value) when key changes. Returns an unsubscribe function."""
+        callbacks = self._key_subscribers.setdefault(key, [])
+        callbacks.append(callback)
+        
+        def unsubscribe():
+            if callback in callbacks:
+                callbacks.remove(callback)
+            if not callbacks and self._key_subscribers.get(key) is callbacks:
+                del self._key_subscribers[key]
+        
+        return unsubscribe
+    
+    def subscribe_all(self, callback: StateCallback) -> Callable[[], None]:
+        """Call callback(state, changed_keys) once per batch of changes. Returns an unsubscribe function."""
+        self._state_subscribers.append(callback)
+        
+        def unsubscribe():
+            if callback in self._state_subscribers:
+                self._state_subscribers.remove(callback)
+        
+        return unsubscribe
+    
+    def _schedule(self):
+        if self._scheduled:
+            return
+        if QCoreApplication.instance() is None:
+            # No event loop to batch on: deliver right away
+            self.flush()
+            return
+        self._scheduled = True
+        QTimer.singleShot(0, self.flush)
+    
+    def flush(self):
+        """Deliver pending changes now."""
+        self._scheduled = False
+        state = self._state
+        changed = self._notified.diff(state)
+        self._notified = state
+        if not changed:
+            return
+        
+        if self.logging:
+            print(f"[Store] Changed: {changed}")
+        
+        for key in changed:
+            for callback in list(self._key_subscribers.get(key, ())):
+                self._call(callback, state.get(key))
+        for callback in list(self._state_subscribers):
+            self._call(callback, state, changed)
+    
+    def _call(self, callback: Callable, *args):
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"ERROR: Store subscriber {getattr(callback, '__qualname__', callback)} failed: {e}")
+
+
+class CopyingStore:
+    """The js/state-manager.js pattern (copy the state twice per change, notify everyone), for comparison."""
+    
+    def __init__(self, initial: Dict[Any, Any]):
+        self.state = dict(initial)
+        self.subscribers: List[Callable[[dict], None]] = []
+    
+    def set_state(self, updates: Dict[Any, Any]):
+        old_state = dict(self.state)  # oldState, kept for logging in the JS
+        self.state = {**self.state, **updates}
+        for callback in self.subscribers:
+            callback(self.state)
+
+
+def run_benchmark(keys: int, ticks: int, changes_per_tick: int, seed: int = 0) -> Dict[str, float]:
+    """Time event-loop ticks of random changes with one subscriber per key."""
+    app = QCoreApplication.instance() or QCoreApplication([])
+    rng = random.Random(seed)
+    batches = [[(rng.randrange(keys), rng.random()) for _ in range(changes_per_tick)] for _ in range(ticks)]
+    initial = {key: None for key in range(keys)}
+    
+    calls = [0]
+    
+    def on_change(value):
+        calls[0] += 1
+    
+    store = Store(initial)
+    for key in range(keys):
+        store.subscribe(key, on_change)
+    start = time.perf_counter()
+    for batch in batches:
+        for key, value in batch:
+            store.set(key, value)
+        app.processEvents()
+    keyed_seconds = time.perf_counter() - start
+    keyed_calls = calls[0]
+    
+    # Every subscriber checks its own key against what it last saw
+    calls[0] = 0
+    copying = CopyingStore(initial)
+    for key in range(keys):
+        seen = {'value': None}
+        
+        def on_state(state, key=key, seen=seen):
+            calls[0] += 1
+            if state[key] is not seen['value']:
+                seen['value'] = state[key]
+        
+        copying.subscribers.append(on_state)
+    start = time.perf_counter()
+    for batch in batches:
+        for key, value in batch:
+            copying.set_state({key: value})
+    copying_seconds = time.perf_counter() - start
+    
+    return {
+        'keyed_us': keyed_seconds / ticks * 1e6,
+        'keyed_calls': keyed_calls / ticks,
+        'copying_us': copying_seconds / ticks * 1e6,
+        'copying_calls': calls[0] / ticks
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the state store against copy-and-notify-all")
+    parser.add_argument('--keys', type=int, default=9, help="state keys, one subscriber each (9 = equipment slots)")
+    parser.add_argument('--ticks', type=int, default=2000, help="event-loop ticks")
+    parser.add_argument('--changes', type=int, default=3, help="changes per tick")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - State Store")
+    print("=" * 50)
+    
+    stats = run_benchmark(args.keys, args.ticks, args.changes)
+    
+    print("\nSummary:")
+    print(f"  Keys: {args.keys}, {args.changes} change(s) per tick, {args.ticks} ticks")
+    print(f"  Keyed store: {stats['keyed_us']:.1f} us/tick, {stats['keyed_calls']:.1f} callbacks/tick")
+    print(f"  Copy + notify all: {stats['copying_us']:.1f} us/tick, {stats['copying_calls']:.1f} callbacks/tick")
+
+
+if __name__ == "__main__":
+    main()
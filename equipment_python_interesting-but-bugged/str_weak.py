@@ -0,0 +1,533 @@
+#!/usr/bin/env python3
+"""
+Strengths & Weaknesses for Equipment Editor
+Vectorized loadout analysis (port of js/str-weak-handler.js) with incremental per-slot updates
+"""
+
+import time
+import argparse
+import numpy as np
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+try:
+    from . import catalog, catalog_query
+except ImportError:
+    import catalog, catalog_query
+
+# Slot order of encoded loadouts (same ids as EquipmentWidget.equipment); weapons come first
+SLOT_IDS = ['weapon1', 'weapon2', 'weapon3', 'weapon4', 'repkit', 'ordnance', 'class-mod', 'shield', 'enhancement']
+SLOT_INDEX = {slot_id: index for index, slot_id in enumerate(SLOT_IDS)}
+WEAPON_SLOTS = 4
+
+# Encoded fields per slot (int8 codes into the LoadoutEncoder vocabularies, -1 = not set)
+RARITY, SUBTYPE, MANUFACTURER, ELEMENT = range(4)
+FIELD_COUNT = 4
+
+# slot icon weaponType -> catalog subtype (inverse of item_picker.WEAPON_ICON_TYPES)
+WEAPON_TYPE_SUBTYPES = {
+    'assault': 'ar',
+    'pistol': 'pistol',
+    'smg': 'smg',
+    'shotgun': 'shotgun',
+    'sniper': 'sniper'
+}
+
+# Loadouts scored per NumPy pass (bounds temporary memory for large batches)
+CHUNK_SIZE = 65536
+
+# Thresholds
+SYNERGY_ITEMS = 3
+LEGENDARY_ITEMS = 3
+VARIETY_TYPES = 3
+ELEMENTAL_COVERAGE = 2
+LOW_RARITY_MEAN = 2.0  # below blue
+
+# Fallback messages (same as js/str-weak-handler.js)
+NO_STRENGTHS = 'No equipment analyzed'
+NO_WEAKNESSES = 'No weaknesses detected'
+
+
+class LoadoutEncoder:
+    """Maps item data to per-slot codes. Vocabularies come from the catalog enums."""
+    
+    def __init__(self, item_catalog: Optional[catalog.Catalog] = None, game_data: Optional[dict] = None):
+        game_data = game_data or {}
+        enums = item_catalog.enums if item_catalog is not None else {}
+        self.catalog = item_catalog
+        self.rarities = list(catalog.RARITIES)
+        self.subtypes = list(enums.get('subtype') or catalog_query.SUBTYPE_NAMES)
+        self.manufacturers = list(enums.get('manufacturer') or game_data.get('manufacturers') or [])
+        self.elements = list(enums.get('elements') or game_data.get('elements') or [])
+        for name in ('subtypes', 'manufacturers', 'elements'):
+            if len(getattr(self, name)) > 127:
+                raise ValueError(f"Too many {name} to encode")
+        
+        self._codes = [
+            {value: code for code, value in enumerate(values)}
+            for values in (self.rarities, self.subtypes, self.manufacturers, self.elements)
+        ]
+        
+        # Display names from game data, where it has them
+        self.manufacturer_names = [
+            (game_data.get('manufacturers') or {}).get(value, {}).get('name') or value.title()
+            for value in self.manufacturers
+        ]
+        self.element_names = [
+            (game_data.get('elements') or {}).get(value, {}).get('name') or value.title()
+            for value in self.elements
+        ]
+        # Elements that deal elemental damage (hasStatusEffect in game data, else anything but kinetic)
+        element_info = game_data.get('elements') or {}
+        self.status_elements = np.array([
+            element_info[value].get('hasStatusEffect', True) if value in element_info else value != 'kinetic'
+            for value in self.elements
+        ], dtype=bool)
+        self.weapon_subtypes = np.array([value in WEAPON_TYPE_SUBTYPES.values() for value in self.subtypes], dtype=bool)
+    
+    def code(self, field: int, value: Optional[str]) -> int:
+        """Get the code of a field value (-1 if unknown or None)."""
+        if value is None:
+            return -1
+        return self._codes[field].get(value, -1)
+    
+    def encode_item(self, item_data: Optional[dict]) -> Tuple[int, int, int, int]:
+        """Encode one slot item as (rarity, subtype, manufacturer, element) codes; all -1 when empty."""
+        if not item_data:
+            return (-1, -1, -1, -1)
+        
+        row = -1
+        if self.catalog is not None and item_data.get('id'):
+            row = self.catalog.find(item_data['id'], item_data.get('table'))
+        
+        subtype = item_data.get('subtype')
+        if subtype is None and item_data.get('weaponType'):
+            subtype = WEAPON_TYPE_SUBTYPES.get(item_data['weaponType'])
+        manufacturer = item_data.get('manufacturer')
+        element = item_data.get('element')
+        if row >= 0:
+            subtype = subtype or self.catalog.enum('subtype', row)
+            manufacturer = manufacturer or self.catalog.enum('manufacturer', row)
+            if element is None:
+                elements = self.catalog.elements(row)
+                element = elements[0] if elements else None
+        
+        rarity = self.code(RARITY, item_data.get('rarity') or 'gray')
+        return (
+            rarity if rarity >= 0 else 0,
+            self.code(SUBTYPE, subtype),
+            self.code(MANUFACTURER, manufacturer),
+            self.code(ELEMENT, element)
+        )
+    
+    def encode(self, loadouts: List[Dict[str, Optional[dict]]]) -> np.ndarray:
+        """Encode loadouts (slot id -> item data) as an int8 array of shape (N, slots, fields)."""
+        codes = np.full((len(loadouts), len(SLOT_IDS), FIELD_COUNT), -1, dtype=np.int8)
+        for index, loadout in enumerate(loadouts):
+            for slot_id, item_data in loadout.items():
+                if slot_id in SLOT_INDEX:
+                    codes[index, SLOT_INDEX[slot_id]] = self.encode_item(item_data)
+        return codes
+
+
+def _bincount_rows(codes: np.ndarray, size: int) -> np.ndarray:
+    """Per-row value counts of a (N, slots) code array, ignoring -1. Returns (N, size) int32."""
+    count = codes.shape[0]
+    if size == 0:
+        return np.zeros((count, 0), dtype=np.int32)
+    valid = codes >= 0
+    flat = (np.arange(count, dtype=np.int64)[:, None] * size + codes)[valid]
+    return np.bincount(flat, minlength=count * size).reshape(count, size).astype(np.int32)
+
+
+class LoadoutCounts:
+    """
+    Per-loadout aggregates that every rule is computed from.
+    Sums over slots, so one slot can be removed and re-added without touching the others.
+    """
+    
+    def __init__(self, encoder: LoadoutEncoder, count: int):
+        self.encoder = encoder
+        self.slot_filled = np.zeros((count, len(SLOT_IDS)), dtype=bool)
+        self.rarity = np.zeros((count, len(encoder.rarities)), dtype=np.int32)
+        self.manufacturer = np.zeros((count, len(encoder.manufacturers)), dtype=np.int32)
+        self.weapon_subtype = np.zeros((count, len(encoder.subtypes)), dtype=np.int32)
+        self.weapon_element = np.zeros((count, len(encoder.elements)), dtype=np.int32)
+    
+    def __len__(self) -> int:
+        return self.slot_filled.shape[0]
+    
+    @classmethod
+    def from_codes(cls, encoder: LoadoutEncoder, codes: np.ndarray) -> 'LoadoutCounts':
+        """Aggregate an encoded batch of shape (N, slots, fields)."""
+        counts = cls.__new__(cls)
+        counts.encoder = encoder
+        weapons = codes[:, :WEAPON_SLOTS]
+        counts.slot_filled = codes[:, :, RARITY] >= 0
+        counts.rarity = _bincount_rows(codes[:, :, RARITY], len(encoder.rarities))
+        counts.manufacturer = _bincount_rows(codes[:, :, MANUFACTURER], len(encoder.manufacturers))
+        counts.weapon_subtype = _bincount_rows(weapons[:, :, SUBTYPE], len(encoder.subtypes))
+        counts.weapon_element = _bincount_rows(weapons[:, :, ELEMENT], len(encoder.elements))
+        return counts
+    
+    def add_slot(self, index: int, slot: int, fields: Tuple[int, int, int, int], sign: int = 1):
+        """Add (sign=1) or remove (sign=-1) one slot's contribution to loadout index."""
+        rarity, subtype, manufacturer, element = fields
+        if rarity < 0:
+            return
+        self.slot_filled[index, slot] = sign > 0
+        self.rarity[index, rarity] += sign
+        if manufacturer >= 0:
+            self.manufacturer[index, manufacturer] += sign
+        if slot < WEAPON_SLOTS:
+            if subtype >= 0:
+                self.weapon_subtype[index, subtype] += sign
+            if element >= 0:
+                self.weapon_element[index, element] += sign
+
+
+class Rule:
+    """One strength or weakness: a vectorized test over LoadoutCounts plus its message."""
+    
+    def __init__(self, key: str, strength: bool, weight: float,
+                 test: Callable[[LoadoutCounts], np.ndarray],
+                 message: Callable[[LoadoutCounts, int], str]):
+        self.key = key
+        self.strength = strength
+        self.weight = weight
+        self.test = test
+        self.message = message
+
+
+def _weapons(counts: LoadoutCounts) -> np.ndarray:
+    return counts.slot_filled[:, :WEAPON_SLOTS].sum(axis=1)
+
+
+def _weapon_types(counts: LoadoutCounts) -> np.ndarray:
+    return (counts.weapon_subtype > 0).sum(axis=1)
+
+
+def _status_elements(counts: LoadoutCounts) -> np.ndarray:
+    return ((counts.weapon_element > 0) & counts.encoder.status_elements).sum(axis=1)
+
+
+def _legendaries(counts: LoadoutCounts) -> np.ndarray:
+    return counts.rarity[:, counts.encoder.rarities.index('orange')]
+
+
+def _top_manufacturer(counts: LoadoutCounts) -> np.ndarray:
+    if counts.manufacturer.shape[1] == 0:
+        return np.zeros(len(counts), dtype=np.int32)
+    return counts.manufacturer.max(axis=1)
+
+
+def _mean_rarity(counts: LoadoutCounts) -> np.ndarray:
+    filled = counts.rarity.sum(axis=1)
+    levels = counts.rarity @ np.arange(counts.rarity.shape[1], dtype=np.int32)
+    return np.where(filled > 0, levels / np.maximum(filled, 1), np.inf)
+
+
+def _slot_empty(slot_id: str) -> Callable[[LoadoutCounts], np.ndarray]:
+    slot = SLOT_INDEX[slot_id]
+    return lambda counts: ~counts.slot_filled[:, slot]
+
+
+def _synergy_message(counts: LoadoutCounts, index: int) -> str:
+    code = int(counts.manufacturer[index].argmax())
+    return f"{counts.encoder.manufacturer_names[code]} synergy ({counts.manufacturer[index, code]} items)"
+
+
+def _coverage_message(counts: LoadoutCounts, index: int) -> str:
+    present = (counts.weapon_element[index] > 0) & counts.encoder.status_elements
+    names = [counts.encoder.element_names[code] for code in np.flatnonzero(present)]
+    return f"Elemental coverage: {', '.join(names)}"
+
+
+def _single_type_message(counts: LoadoutCounts, index: int) -> str:
+    subtype = counts.encoder.subtypes[int(counts.weapon_subtype[index].argmax())]
+    return f"Only {catalog_query.SUBTYPE_NAMES.get(subtype, subtype)} weapons"
+
+
+# Rules in display order. Weights give the loadout score (strengths add, weaknesses subtract).
+RULES = [
+    Rule('weapons', True, 1.0,
+         lambda counts: _weapons(counts) > 0,
+         lambda counts, index: f"Equipped {_weapons(counts)[index]} weapon(s)"),
+    Rule('legendary', True, 1.0,
+         lambda counts: _legendaries(counts) >= LEGENDARY_ITEMS,
+         lambda counts, index: f"{_legendaries(counts)[index]} legendary items"),
+    Rule('manufacturer-synergy', True, 1.5,
+         lambda counts: _top_manufacturer(counts) >= SYNERGY_ITEMS,
+         _synergy_message),
+    Rule('elemental-coverage', True, 1.0,
+         lambda counts: _status_elements(counts) >= ELEMENTAL_COVERAGE,
+         _coverage_message),
+    Rule('weapon-variety', True, 1.0,
+         lambda counts: _weapon_types(counts) >= VARIETY_TYPES,
+         lambda counts, index: f"Weapon variety ({_weapon_types(counts)[index]} types)"),
+    Rule('full-loadout', True, 0.5,
+         lambda counts: counts.slot_filled.all(axis=1),
+         lambda counts, index: "All slots equipped"),
+    Rule('no-weapons', False, -3.0,
+         lambda counts: _weapons(counts) == 0,
+         lambda counts, index: "No weapons equipped"),
+    Rule('no-shield', False, -1.5,
+         _slot_empty('shield'),
+         lambda counts, index: "No shield equipped"),
+    Rule('no-repkit', False, -1.0,
+         _slot_empty('repkit'),
+         lambda counts, index: "No repkit equipped"),
+    Rule('no-ordnance', False, -0.5,
+         _slot_empty('ordnance'),
+         lambda counts, index: "No ordnance equipped"),
+    Rule('no-elements', False, -1.0,
+         lambda counts: (_weapons(counts) > 0) & (_status_elements(counts) == 0),
+         lambda counts, index: "No elemental damage"),
+    Rule('single-weapon-type', False, -1.0,
+         lambda counts: (_weapons(counts) >= 2) & (_weapon_types(counts) == 1),
+         _single_type_message),
+    Rule('low-rarity', False, -1.0,
+         lambda counts: _mean_rarity(counts) < LOW_RARITY_MEAN,
+         lambda counts, index: "Mostly low rarity gear")
+]
+RULE_WEIGHTS = np.array([rule.weight for rule in RULES], dtype=np.float32)
+
+
+def evaluate(counts: LoadoutCounts) -> np.ndarray:
+    """Test every rule on every loadout. Returns (N, rules) bool."""
+    flags = np.empty((len(counts), len(RULES)), dtype=bool)
+    for column, rule in enumerate(RULES):
+        flags[:, column] = rule.test(counts)
+    return flags
+
+
+def score_batch(encoder: LoadoutEncoder, codes: np.ndarray, chunk_size: int = CHUNK_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score an encoded batch of shape (N, slots, fields).
+    Returns (flags (N, rules) bool, scores (N,) float32).
+    """
+    flags = np.empty((codes.shape[0], len(RULES)), dtype=bool)
+    for start in range(0, codes.shape[0], chunk_size):
+        end = min(start + chunk_size, codes.shape[0])
+        flags[start:end] = evaluate(LoadoutCounts.from_codes(encoder, codes[start:end]))
+    return flags, flags @ RULE_WEIGHTS
+
+
+def messages(counts: LoadoutCounts, flags: np.ndarray, index: int = 0) -> Tuple[List[str], List[str]]:
+    """Get (strengths, weaknesses) text for one loadout, with the JS fallbacks."""
+    strengths = []
+    weaknesses = []
+    for column, rule in enumerate(RULES):
+        if flags[index, column]:
+            (strengths if rule.strength else weaknesses).append(rule.message(counts, index))
+    return strengths or [NO_STRENGTHS], weaknesses or [NO_WEAKNESSES]
+
+
+class LoadoutAnalysis:
+    """
+    Strengths and weaknesses of one loadout, kept up to date per slot:
+    set_item() swaps one slot's contribution in the counts instead of re-encoding the loadout.
+    """
+    
+    def __init__(self, encoder: Optional[LoadoutEncoder] = None, equipment: Optional[Dict[str, Optional[dict]]] = None):
+        self.encoder = encoder or get_encoder()
+        self.codes = np.full((len(SLOT_IDS), FIELD_COUNT), -1, dtype=np.int8)
+        self.counts = LoadoutCounts(self.encoder, 1)
+        self._flags = None
+        for slot_id, item_data in (equipment or {}).items():
+            self.set_item(slot_id, item_data)
+    
+    def set_item(self, slot_id: str, item_data: Optional[dict]) -> bool:
+        """Update one slot. Returns True if the analysis may have changed."""
+        if slot_id not in SLOT_INDEX:
+            return False
+        return self.set_codes(SLOT_INDEX[slot_id], self.encoder.encode_item(item_data))
+    
+    def set_codes(self, slot: int, fields: Tuple[int, int, int, int]) -> bool:
+        """Update one slot (by index) from already encoded fields."""
+        old = tuple(int(value) for value in self.codes[slot])
+        if fields == old:
+            return False
+        
+        self.counts.add_slot(0, slot, old, -1)
+        self.counts.add_slot(0, slot, fields, 1)
+        self.codes[slot] = fields
+        self._flags = None
+        return True
+    
+    def set_encoder(self, encoder: LoadoutEncoder, equipment: Dict[str, Optional[dict]],
+                    slot_ids: Optional[Iterable[str]] = None):
+        """
+        Switch to a new encoder (catalog or game data changed).
+        With the same vocabularies the codes stay valid, so only slot_ids are encoded again;
+        otherwise every slot is.
+        """
+        same_codes = (encoder.rarities == self.encoder.rarities and encoder.subtypes == self.encoder.subtypes
+                      and encoder.manufacturers == self.encoder.manufacturers
+                      and encoder.elements == self.encoder.elements)
+        self.encoder = encoder
+        self.counts.encoder = encoder
+        self._flags = None
+        if not same_codes:
+            self.codes[:] = -1
+            self.counts = LoadoutCounts(encoder, 1)
+            slot_ids = None
+        
+        for slot_id in (SLOT_IDS if slot_ids is None else slot_ids):
+            self.set_item(slot_id, equipment.get(slot_id))
+    
+    @property
+    def flags(self) -> np.ndarray:
+        """Rule flags, shape (rules,)."""
+        if self._flags is None:
+            self._flags = evaluate(self.counts)
+        return self._flags[0]
+    
+    @property
+    def score(self) -> float:
+        return float(self.flags @ RULE_WEIGHTS)
+    
+    def results(self) -> Tuple[List[str], List[str]]:
+        """Get (strengths, weaknesses) text."""
+        return messages(self.counts, self.flags[None])
+
+
+# Shared encoder over the shared catalog (built on first use)
+_encoder = None
+
+
+def get_encoder() -> LoadoutEncoder:
+    """Get the encoder for catalog.get_catalog() and the extracted game data."""
+    global _encoder
+    
+    if _encoder is None:
+        _encoder = LoadoutEncoder(catalog.get_catalog(), catalog.load_game_data())
+    
+    return _encoder
+
+
+def set_encoder(encoder: LoadoutEncoder):
+    """Install an encoder built elsewhere (e.g. by hot_reload.py off the GUI thread)."""
+    global _encoder
+    _encoder = encoder
+
+
+def clear_cache():
+    """Drop the shared encoder (rebuilt from the current catalog and game data on next use)."""
+    global _encoder
+    _encoder = None
+
+
+def analyze(equipment: Dict[str, Optional[dict]]) -> Tuple[List[str], List[str]]:
+    """Get (strengths, weaknesses) for one loadout (slot id -> item data)."""
+    return LoadoutAnalysis(get_encoder(), equipment).results()
+
+
+def make_random_codes(encoder: LoadoutEncoder, count: int, seed: int = 0, empty_chance: float = 0.15) -> np.ndarray:
+    """Random encoded loadouts: weapon slots get weapon subtypes, every filled slot a rarity and manufacturer."""
+    rng = np.random.default_rng(seed)
+    shape = (count, len(SLOT_IDS))
+    codes = np.full(shape + (FIELD_COUNT,), -1, dtype=np.int8)
+    filled = rng.random(shape) >= empty_chance
+    
+    codes[:, :, RARITY] = np.where(filled, rng.integers(0, len(encoder.rarities), shape), -1)
+    if encoder.manufacturers:
+        codes[:, :, MANUFACTURER] = np.where(filled, rng.integers(0, len(encoder.manufacturers), shape), -1)
+    
+    weapon_subtypes = np.flatnonzero(encoder.weapon_subtypes)
+    weapon_shape = (count, WEAPON_SLOTS)
+    weapon_filled = filled[:, :WEAPON_SLOTS]
+    if len(weapon_subtypes):
+        codes[:, :WEAPON_SLOTS, SUBTYPE] = np.where(weapon_filled, rng.choice(weapon_subtypes, weapon_shape), -1)
+    if encoder.elements:
+        codes[:, :WEAPON_SLOTS, ELEMENT] = np.where(weapon_filled, rng.integers(0, len(encoder.elements), weapon_shape), -1)
+    return codes
+
+
+def run_benchmark(encoder: LoadoutEncoder, count: int, updates: int = 10000, seed: int = 0) -> Dict[str, float]:
+    """Time batch scoring of count random loadouts, and incremental single-slot updates."""
+    codes = make_random_codes(encoder, count, seed)
+    
+    start = time.perf_counter()
+    flags, scores = score_batch(encoder, codes)
+    batch = time.perf_counter() - start
+    
+    # Incremental: one slot changes per step on a single analysis
+    rng = np.random.default_rng(seed)
+    analysis = LoadoutAnalysis(encoder)
+    slots = rng.integers(0, len(SLOT_IDS), updates)
+    sources = rng.integers(0, count, updates)
+    start = time.perf_counter()
+    for slot, source in zip(slots, sources):
+        analysis.set_codes(int(slot), tuple(int(value) for value in codes[source, slot]))
+        analysis.results()
+    incremental = time.perf_counter() - start
+    
+    # Cross-check: the incrementally updated counts match a full re-aggregation
+    full = evaluate(LoadoutCounts.from_codes(encoder, analysis.codes[None]))[0]
+    if not np.array_equal(full, analysis.flags):
+        print("ERROR: Incremental flags differ from full recompute")
+    
+    return {
+        'batch_s': batch,
+        'loadouts_per_s': count / batch,
+        'update_us': incremental / updates * 1e6,
+        'mean_score': float(scores.mean()),
+        'rule_rates': {rule.key: float(rate) for rule, rate in zip(RULES, flags.mean(axis=0))}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score loadouts by strengths and weaknesses")
+    parser.add_argument('--bench', type=int, nargs='?', const=1000000, metavar='LOADOUTS',
+                        help="score LOADOUTS random loadouts (default 1000000)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Strengths & Weaknesses")
+    print("=" * 50)
+    
+    encoder = get_encoder()
+    if encoder.catalog is None:
+        print(f"WARNING: Item catalog not found: {catalog.CATALOG_FILE}")
+    
+    if args.bench:
+        print(f"\nScoring {args.bench} random loadouts...")
+        stats = run_benchmark(encoder, args.bench, seed=args.seed)
+        
+        print("\nRule hit rates:")
+        for key, rate in stats['rule_rates'].items():
+            print(f"  {key}: {rate:.1%}")
+        
+        print("\nSummary:")
+        print(f"  Loadouts: {args.bench}")
+        print(f"  Batch: {stats['batch_s']:.2f} s ({stats['loadouts_per_s']:,.0f} loadouts/s)")
+        print(f"  Single-slot update: {stats['update_us']:.1f} us")
+        print(f"  Mean score: {stats['mean_score']:.2f}")
+        return
+    
+    codes = make_random_codes(encoder, 1, args.seed)
+    counts = LoadoutCounts.from_codes(encoder, codes)
+    flags = evaluate(counts)
+    strengths, weaknesses = messages(counts, flags)
+    
+    print("\nRandom loadout:")
+    for slot_id, fields in zip(SLOT_IDS, codes[0]):
+        if fields[RARITY] < 0:
+            print(f"  {slot_id}: (empty)")
+            continue
+        parts = [encoder.rarities[fields[RARITY]]]
+        if fields[SUBTYPE] >= 0:
+            parts.append(encoder.subtypes[fields[SUBTYPE]])
+        if fields[MANUFACTURER] >= 0:
+            parts.append(encoder.manufacturers[fields[MANUFACTURER]])
+        if fields[ELEMENT] >= 0:
+            parts.append(encoder.elements[fields[ELEMENT]])
+        print(f"  {slot_id}: {' '.join(parts)}")
+    
+    print("\nSummary:")
+    print(f"  Strengths: {strengths}")
+    print(f"  Weaknesses: {weaknesses}")
+    print(f"  Score: {float(flags[0] @ RULE_WEIGHTS):.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Strengths & Weaknesses Widget for Equipment Editor
+Panel listing loadout strengths and weaknesses, updated per changed slot
+"""
+
+from typing import Dict, Iterable, List, Optional
+from PyQt6.QtWidgets import QFrame, QWidget, QLabel, QVBoxLayout, QHBoxLayout
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QPainter, QPainterPath
+try:
+    from . import styles
+    from .str_weak import LoadoutAnalysis, LoadoutEncoder
+except ImportError:
+    import styles
+    from str_weak import LoadoutAnalysis, LoadoutEncoder
+
+
+class StrWeakMessage(QLabel):
+    """One strength or weakness: rounded card with a colored left accent, painted from the theme."""
+    
+    def __init__(self, kind: str, parent=None):
+        super().__init__(parent)
+        self.kind = kind
+        theme = styles.get_theme()
+        self.setWordWrap(True)
+        self.setFont(theme.str_weak_message_font)
+        self.setPalette(theme.str_weak_message_palette)
+        self.setContentsMargins(12 + styles.STR_WEAK_ACCENT_WIDTH, 8, 12, 8)
+    
+    def paintEvent(self, event):
+        theme = styles.get_theme()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        
+        card = QPainterPath()
+        card.addRoundedRect(QRectF(self.rect()), styles.STR_WEAK_MESSAGE_RADIUS, styles.STR_WEAK_MESSAGE_RADIUS)
+        painter.fillPath(card, theme.base_bg)
+        painter.setClipPath(card)
+        painter.fillRect(QRectF(0, 0, styles.STR_WEAK_ACCENT_WIDTH, self.height()), theme.str_weak_accents[self.kind])
+        painter.end()
+        
+        super().paintEvent(event)
+
+
+class StrWeakSection(QWidget):
+    """Titled list of messages. Labels are reused; only changed texts are set."""
+    
+    def __init__(self, title: str, kind: str, parent=None):
+        super().__init__(parent)
+        self.kind = kind
+        self.labels: List[QLabel] = []
+        
+        self._layout = QVBoxLayout(self)
+        self._layout.setSpacing(8)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+        
+        title_label = QLabel(title)
+        title_label.setFont(styles.get_theme().str_weak_section_font)
+        title_label.setPalette(styles.get_theme().str_weak_title_palette)
+        self._layout.addWidget(title_label)
+        self._layout.addStretch(1)
+    
+    def set_messages(self, messages: List[str]):
+        """Show messages, one label each."""
+        while len(self.labels) < len(messages):
+            label = StrWeakMessage(self.kind)
+            self._layout.insertWidget(len(self.labels) + 1, label)
+            self.labels.append(label)
+        
+        for index, label in enumerate(self.labels):
+            if index < len(messages):
+                if label.text() != messages[index]:
+                    label.setText(messages[index])
+                label.setVisible(True)
+            else:
+                label.setVisible(False)
+
+
+class StrWeakWidget(QFrame):
+    """Strengths & weaknesses panel (port of js/str-weak-handler.js)."""
+    
+    def __init__(self, equipment: Optional[Dict[str, Optional[dict]]] = None, parent=None):
+        super().__init__(parent)
+        self.analysis = LoadoutAnalysis(equipment=equipment)
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(16)
+        layout.setContentsMargins(20, 20, 20, 20)
+        
+        # No stylesheet: the panel and its messages paint themselves from styles.get_theme()
+        theme = styles.get_theme()
+        title = QLabel("Strengths & Weaknesses")
+        title.setFont(theme.str_weak_title_font)
+        title.setPalette(theme.str_weak_title_palette)
+        layout.addWidget(title)
+        
+        # Two columns, like the .str-weak__content grid
+        content = QHBoxLayout()
+        content.setSpacing(24)
+        self.strengths = StrWeakSection("Strengths", 'strength')
+        self.weaknesses = StrWeakSection("Weaknesses", 'weakness')
+        content.addWidget(self.strengths, 1, Qt.AlignmentFlag.AlignTop)
+        content.addWidget(self.weaknesses, 1, Qt.AlignmentFlag.AlignTop)
+        layout.addLayout(content)
+        
+        self._refresh()
+    
+    def reset(self, equipment: Optional[Dict[str, Optional[dict]]] = None):
+        """Analyze from scratch (after the catalog or game data changed)."""
+        self.analysis = LoadoutAnalysis(equipment=equipment)
+        self._refresh()
+    
+    def set_encoder(self, encoder: LoadoutEncoder, equipment: Dict[str, Optional[dict]], slot_ids: Iterable[str]):
+        """Switch encoder after a hot reload, re-encoding only the affected slots where possible."""
+        self.analysis.set_encoder(encoder, equipment, slot_ids)
+        self._refresh()
+    
+    def set_item(self, slot_id: str, item_data: Optional[dict]):
+        """Update the analysis for one changed slot."""
+        if self.analysis.set_item(slot_id, item_data):
+            self._refresh()
+    
+    def paintEvent(self, event):
+        """Rounded dark panel with a grey border (css/str-weak.css)."""
+        theme = styles.get_theme()
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(theme.str_weak_border_pen)
+        painter.setBrush(theme.dark_bg)
+        painter.drawRoundedRect(QRectF(self.rect()).adjusted(0.5, 0.5, -0.5, -0.5),
+                                styles.STR_WEAK_RADIUS, styles.STR_WEAK_RADIUS)
+    
+    def _refresh(self):
+        strengths, weaknesses = self.analysis.results()
+        self.strengths.set_messages(strengths)
+        self.weaknesses.set_messages(weaknesses)
@@ -1,8 +1,14 @@
 """
 Equipment Editor Styles (QSS)
 Converted from maxroll.gg CSS to PyQt6 QSS format
+Precomputed paint objects (Theme) for widgets that paint themselves instead of using QSS
 """
 
+import re
+from typing import Dict, Optional
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPen, QBrush, QFont, QPalette, QStaticText, QTransform
+
 # Rarity colors (from CSS)
 RARITY_COLORS = {
     'gray': {
@@ -48,6 +54,22 @@ DARK_BG = '#0b181e'
 GREY_2 = 'rgb(136, 138, 156)'
 GREY_3 = 'rgb(150, 148, 171)'
 
+# Slot decoration (formerly QSS on the "+" and weapon number labels)
+EMPTY_MARKER_FONT_FAMILY = 'Source Sans 3'
+EMPTY_MARKER_PIXEL_SIZE = 14
+BADGE_BG = 'rgb(20, 24, 28)'
+BADGE_PIXEL_SIZE = 22
+BADGE_SIZE = 40
+BADGE_PADDING = 4
+
+# Strengths & weaknesses panel (css/str-weak.css)
+STR_WEAK_RADIUS = 8
+STR_WEAK_TITLE_PIXEL_SIZE = 20
+STR_WEAK_SECTION_PIXEL_SIZE = 16
+STR_WEAK_MESSAGE_PIXEL_SIZE = 14
+STR_WEAK_MESSAGE_RADIUS = 4
+STR_WEAK_ACCENT_WIDTH = 3
+
 
 def get_equipment_stylesheet() -> str:
     """Get main Equipment widget stylesheet."""
@@ -116,3 +138,145 @@ def get_rarity_gradient(rarity: str) -> tuple:
         colors['gradient_end']
     )
 
+
+def parse_rgba(rgba_str: str) -> QColor:
+    """Parse a CSS rgb()/rgba() or hex color string into a QColor."""
+    match = re.match(r'rgba?\((\d+),\s*(\d+),\s*(\d+),?\s*([\d.]+)?\)', rgba_str)
+    if match:
+        r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        a = float(match.group(4)) if match.group(4) else 1.0
+        return QColor(r, g, b, int(a * 255))
+    color = QColor(rgba_str)
+    if color.isValid():
+        return color
+    return QColor(136, 138, 156, 128)  # Default gray
+
+
+class RarityPaint:
+    """Paint objects for one rarity."""
+    
+    def __init__(self, colors: dict):
+        self.border_pen = QPen(QColor(colors['border']), 1)
+        self.gradient_start = parse_rgba(colors['gradient_start'])
+        self.gradient_mid = parse_rgba(colors['gradient_mid'])
+        self.gradient_end = parse_rgba(colors['gradient_end'])
+        self.bg = QColor(colors['bg'])
+
+
+class Theme:
+    """Precomputed colors, pens, brushes, fonts and static text shared by all widgets."""
+    
+    def __init__(self):
+        self.rarity: Dict[str, RarityPaint] = {
+            name: RarityPaint(colors) for name, colors in RARITY_COLORS.items()
+        }
+        
+        self.base_bg = QColor(BASE_BG)
+        self.dark_bg = QColor(DARK_BG)
+        self.grey_2 = parse_rgba(GREY_2)
+        self.grey_3 = parse_rgba(GREY_3)
+        
+        # Empty slot "+" marker
+        self.empty_marker_pen = QPen(self.grey_3)
+        self.empty_marker_font = QFont(EMPTY_MARKER_FONT_FAMILY)
+        self.empty_marker_font.setStyleHint(QFont.StyleHint.SansSerif)
+        self.empty_marker_font.setPixelSize(EMPTY_MARKER_PIXEL_SIZE)
+        self.empty_marker_text = self._static_text("+", self.empty_marker_font)
+        
+        # Weapon number badges (1-4)
+        self.badge_pen = QPen(self.grey_2)
+        self.badge_brush = QBrush(parse_rgba(BADGE_BG))
+        self.badge_font = QFont()
+        self.badge_font.setPixelSize(BADGE_PIXEL_SIZE)
+        self.badge_size = BADGE_SIZE
+        self.badge_padding = BADGE_PADDING
+        self.badge_texts = {
+            number: self._static_text(str(number), self.badge_font) for number in range(1, 5)
+        }
+        
+        # Strengths & weaknesses panel
+        self.str_weak_border_pen = QPen(self.grey_3, 1)
+        self.str_weak_title_font = QFont()
+        self.str_weak_title_font.setPixelSize(STR_WEAK_TITLE_PIXEL_SIZE)
+        self.str_weak_section_font = QFont()
+        self.str_weak_section_font.setPixelSize(STR_WEAK_SECTION_PIXEL_SIZE)
+        self.str_weak_message_font = QFont()
+        self.str_weak_message_font.setPixelSize(STR_WEAK_MESSAGE_PIXEL_SIZE)
+        self.str_weak_accents = {
+            'strength': QColor(RARITY_COLORS['green']['border']),
+            'weakness': QColor(RARITY_COLORS['orange']['border']),
+        }
+        self.str_weak_title_palette = QPalette()
+        self.str_weak_title_palette.setColor(QPalette.ColorRole.WindowText, QColor('#fff'))
+        self.str_weak_message_palette = QPalette()
+        self.str_weak_message_palette.setColor(QPalette.ColorRole.WindowText, self.grey_2)
+        
+        # Main window
+        self.window_palette = QPalette()
+        self.window_palette.setColor(QPalette.ColorRole.Window, self.base_bg)
+    
+    def get_rarity(self, rarity: str) -> RarityPaint:
+        """Get paint objects for a rarity (gray if unknown)."""
+        return self.rarity.get(rarity, self.rarity['gray'])
+    
+    @staticmethod
+    def _static_text(text: str, font: QFont) -> QStaticText:
+        """Lay out text once so painting only replays the glyph run."""
+        static_text = QStaticText(text)
+        static_text.setTextFormat(Qt.TextFormat.PlainText)
+        static_text.setPerformanceHint(QStaticText.PerformanceHint.AggressiveCaching)
+        static_text.prepare(QTransform(), font)
+        return static_text
+
+
+# Shared theme (built on first use - needs a QApplication for fonts)
+_theme: Optional[Theme] = None
+
+
+def get_theme() -> Theme:
+    """Get the shared Theme instance."""
+    global _theme
+    
+    if _theme is None:
+        _theme = Theme()
+    
+    return _theme
+
+
+def get_button_stylesheet() -> str:
+    """Get stylesheet for the main window buttons."""
+    return f"""
+        QPushButton {{
+            background-color: {DARK_BG};
+            color: {GREY_2};
+            border: 1px solid {GREY_3};
+            padding: 8px 16px;
+            font-size: 14px;
+        }}
+        QPushButton:hover {{
+            background-color: {GREY_3};
+        }}
+        QPushButton:checked {{
+            background-color: {RARITY_COLORS['green']['border']};
+        }}
+    """
+
+
+def get_rarity_button_stylesheet(rarity: str) -> str:
+    """Get stylesheet for an item card button outlined in a rarity color."""
+    border = RARITY_COLORS.get(rarity, RARITY_COLORS['gray'])['border']
+    return f"""
+        QPushButton {{
+            background-color: {DARK_BG};
+            color: {GREY_2};
+            border: 2px solid {border};
+            padding: 6px 8px;
+            font-size: 13px;
+        }}
+        QPushButton:hover {{
+            background-color: {GREY_3};
+        }}
+        QPushButton:checked {{
+            background-color: {RARITY_COLORS[rarity]['gradient_end'] if rarity in RARITY_COLORS else GREY_3};
+        }}
+    """
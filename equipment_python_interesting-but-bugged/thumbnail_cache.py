@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Thumbnail Cache for Equipment Editor
+Pre-scaled PNG thumbnails keyed by content hash and size, with a parallel prewarm command
+"""
+
+import os
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
+
+# Paths
+SCRIPT_DIR = Path(__file__).parent
+BASE_DIR = SCRIPT_DIR.parent
+CACHE_DIR = BASE_DIR / "resources" / "cache" / "thumbnails"
+MANIFEST_FILE = CACHE_DIR / "manifest.json"
+
+# Edge lengths (px) used by SlotWidget: icon base size at 0.5x, 1x and 2x pixel ratio
+THUMBNAIL_SIZES = (40, 80, 160)
+
+# Image types that can be thumbnailed (svg is resolution-independent already)
+THUMBNAIL_EXTENSIONS = ('.webp', '.png', '.jpg', '.jpeg', '.avif')
+
+# Manifest cache (in-memory): source path -> {mtime, size, hash, sizes}
+_manifest = None
+
+
+def load_manifest() -> Dict[str, dict]:
+    """Load thumbnail manifest from JSON file."""
+    global _manifest
+    
+    if _manifest is not None:
+        return _manifest
+    
+    _manifest = {}
+    
+    if MANIFEST_FILE.exists():
+        try:
+            with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+                _manifest = json.load(f)
+        except Exception as e:
+            print(f"WARNING: Could not load thumbnail manifest: {e}")
+    
+    return _manifest
+
+
+def save_manifest(manifest: Dict[str, dict]):
+    """Save thumbnail manifest to JSON file."""
+    global _manifest
+    
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = MANIFEST_FILE.with_suffix('.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, MANIFEST_FILE)
+    _manifest = manifest
+
+
+def thumbnail_file(content_hash: str, size: int) -> Path:
+    """Get cache file path for a content hash and size."""
+    return CACHE_DIR / f"{content_hash}_{size}.png"
+
+
+def _manifest_key(source_path: str) -> str:
+    """Normalize a source path for manifest lookups."""
+    return os.path.normcase(os.path.abspath(source_path))
+
+
+def _thumbnails_exist(entry: dict) -> bool:
+    """Check that every thumbnail file of a manifest entry is still on disk."""
+    return all(thumbnail_file(entry['hash'], size).exists() for size in entry['sizes'])
+
+
+def pick_size(sizes: List[int], size: Optional[int]) -> int:
+    """The smallest of sizes >= size (largest if size is None or none is large enough)."""
+    sizes = sorted(sizes)
+    if size is None:
+        return sizes[-1]
+    return next((s for s in sizes if s >= size), sizes[-1])
+
+
+def get_thumbnails(source_path: str) -> Dict[int, str]:
+    """All cached thumbnails of a source image (size -> path), empty if there is no up-to-date entry."""
+    entry = load_manifest().get(_manifest_key(source_path))
+    if not entry:
+        return {}
+    
+    # Entry is valid only while the source file is unchanged
+    try:
+        stat = os.stat(source_path)
+    except OSError:
+        return {}
+    if entry['mtime'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+        return {}
+    
+    return {size: str(thumbnail_file(entry['hash'], size)) for size in entry['sizes']}
+
+
+def get_thumbnail_path(source_path: str, size: Optional[int] = None) -> Optional[str]:
+    """
+    Get cached thumbnail for a source image.
+    Returns the smallest cached size >= size (largest if size is None),
+    or None if there is no up-to-date entry.
+    """
+    thumbnails = get_thumbnails(source_path)
+    if not thumbnails:
+        return None
+    
+    path = thumbnails[pick_size(list(thumbnails), size)]
+    if os.path.exists(path):
+        return path
+    return None
+
+
+def _render_thumbnails(source_path: str, sizes: Tuple[int, ...]) -> Optional[dict]:
+    """Hash and decode one image, write its thumbnails. Runs in a worker process."""
+    from PyQt6.QtCore import Qt
+    from PyQt6.QtGui import QImage
+    
+    stat = os.stat(source_path)
+    with open(source_path, 'rb') as f:
+        data = f.read()
+    content_hash = hashlib.sha1(data).hexdigest()
+    
+    # Same content already rendered (e.g. duplicate downloads)
+    if all(thumbnail_file(content_hash, size).exists() for size in sizes):
+        return {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': content_hash, 'sizes': list(sizes)}
+    
+    image = QImage.fromData(data)
+    if image.isNull():
+        return None
+    image = image.convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+    
+    largest = max(image.width(), image.height())
+    for size in sizes:
+        # Never upscale - small sources are stored at their own size
+        target = min(size, largest)
+        scaled = image.scaled(
+            target, target,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        out_path = thumbnail_file(content_hash, size)
+        tmp_path = out_path.with_name(out_path.name + f".{os.getpid()}.tmp")
+        if scaled.save(str(tmp_path), 'PNG'):
+            os.replace(tmp_path, out_path)
+    
+    return {'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': content_hash, 'sizes': list(sizes)}
+
+
+def collect_indexed_assets() -> List[str]:
+    """Get local paths of all indexed images that can be thumbnailed."""
+    try:
+        from . import assets
+    except ImportError:
+        import assets
+    
+    paths = []
+    for entry in assets.load_image_index().values():
+        local_path = assets.BASE_DIR / entry['path']
+        if local_path.suffix.lower() in THUMBNAIL_EXTENSIONS and local_path.exists():
+            paths.append(str(local_path))
+    return sorted(set(paths))
+
+
+def prewarm(paths: List[str], sizes: Tuple[int, ...] = THUMBNAIL_SIZES, workers: Optional[int] = None) -> Dict[str, int]:
+    """Build thumbnails for all paths in parallel, skipping up-to-date entries."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = dict(load_manifest())
+    stats = {'cached': 0, 'built': 0, 'failed': 0}
+    
+    pending = []
+    for path in paths:
+        entry = manifest.get(_manifest_key(path))
+        try:
+            stat = os.stat(path)
+        except OSError:
+            stats['failed'] += 1
+            continue
+        if (entry and entry['mtime'] == stat.st_mtime_ns and entry['size'] == stat.st_size
+                and set(sizes) <= set(entry['sizes']) and _thumbnails_exist(entry)):
+            stats['cached'] += 1
+        else:
+            pending.append(path)
+    
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(_render_thumbnails, path, tuple(sizes)): path for path in pending}
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    entry = None
+                    print(f"  ERROR: {Path(path).name}: {e}")
+                if entry:
+                    manifest[_manifest_key(path)] = entry
+                    stats['built'] += 1
+                else:
+                    stats['failed'] += 1
+        
+        save_manifest(manifest)
+    
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prewarm the asset thumbnail cache")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+    
+    print("Equipment Editor - Thumbnail Prewarm")
+    print("=" * 50)
+    
+    paths = collect_indexed_assets()
+    print(f"\nFound {len(paths)} indexed images")
+    
+    stats = prewarm(paths, workers=args.workers)
+    
+    print("\nSummary:")
+    print(f"  Up to date: {stats['cached']}")
+    print(f"  Built: {stats['built']}")
+    print(f"  Failed: {stats['failed']}")
+    print(f"\nThumbnails saved to: {CACHE_DIR}")
+
+
+if __name__ == "__main__":
+    main()
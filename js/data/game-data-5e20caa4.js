@@ -0,0 +1,7 @@
+// Generated by extract_game_data.py from bl4-chunk-00-e58afd3e.js - do not edit
+const data = {"manufacturers":{"atlas":{"name":"Atlas"},"cov":{"name":"CoV"},"daedalus":{"name":"Daedalus"},"hyperion":{"name":"Hyperion"},"jakobs":{"name":"Jakobs"},"maliwan":{"name":"Maliwan"},"order":{"name":"Order"},"ripper":{"name":"Ripper"},"tediore":{"name":"Tediore"},"torgue":{"name":"Torgue"},"vladof":{"name":"Vladof"}},"elements":{"corrosive":{"name":"Corrosive"},"cryo":{"name":"Cryo"},"incendiary":{"name":"Incendiary"},"kinetic":{"name":"Kinetic"},"radiation":{"name":"Radiation"},"shock":{"name":"Shock"}},"firmwares":{"action-fist":{"name":"Action Fist"},"airstrike":{"name":"Airstrike"},"atlas-ex":{"name":"Atlas EX"},"atlas-infinum":{"name":"Atlas Infinum"},"baker":{"name":"Baker"},"bullets-to-spare":{"name":"Bullets to Spare"},"daed-dy-o":{"name":"Daed-dy O"},"deadeye":{"name":"Deadeye"},"gadget-ahoy":{"name":"Gadget Ahoy"},"get-throwin":{"name":"Get Throwin"},"god-killer":{"name":"God Killer"},"goojfc":{"name":"GOOJFC"},"heating-up":{"name":"Heating Up"},"high-caliber":{"name":"High Caliber"},"jacked":{"name":"Jacked"},"lifeblood":{"name":"Lifeblood"},"oscar-mike":{"name":"Oscar Mike"},"reel-big-fist":{"name":"Reel Big Fist"},"risky-boots":{"name":"Risky Boots"},"rubberband-man":{"name":"Rubberband Man"},"trickshot":{"name":"Trickshot"}},"itemAugments":{"grenade-manu-dad":{"icon":"icons/item-augments/grenade-manu-dad.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus[/keyword] - [keyword id=\"secondary\"]Grenades[/keyword] cook while held, and [keyword id=\"secondary\"]explode[/keyword] after a set [keyword id=\"secondary\"]Duration[/keyword]","source":"grenade","type":"manufacturer-specific","manufacturerId":"daedalus"},"grenade-manu-jak":{"icon":"icons/item-augments/grenade-manu-jak.webp","description":"[keyword id=\"jakobs_icon\"] [/keyword] [keyword id=\"secondary\"]Jakobs[/keyword] - [keyword id=\"secondary\"]Grenades[/keyword] deal [keyword id=\"secondary\"]Critical Damage[/keyword] when hitting [keyword id=\"secondary\"]Weak Points[/keyword]","source":"grenade","type":"manufacturer-specific","manufacturerId":"jakobs"},"grenade-manu-mal":{"icon":"icons/item-augments/grenade-manu-mal.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - [keyword id=\"secondary\"]Grenades stick[/keyword] to enemies, and any that land on the ground will [keyword id=\"secondary\"]propel[/keyword] themselves at the nearest incoming enemy","source":"grenade","type":"manufacturer-specific","manufacturerId":"maliwan"},"grenade-manu-ord":{"icon":"icons/item-augments/grenade-manu-ord.webp","description":"[keyword id=\"order_icon\"] [/keyword] [keyword id=\"secondary\"]Order[/keyword] - [keyword id=\"secondary\"]Grenades home in[/keyword] on nearby enemies","source":"grenade","type":"manufacturer-specific","manufacturerId":"order"},"grenade-manu-ted":{"icon":"icons/item-augments/grenade-manu-ted.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"] [/keyword]Double tap[keyword id=\"/secondary\"] [/keyword] [keyword id=\"glyph\"]action_gadget[/keyword] to [keyword id=\"secondary\"]remotely detonate[/keyword] thrown [keyword id=\"secondary\"]Grenades[/keyword]","source":"grenade","type":"manufacturer-specific","manufacturerId":"tediore"},"grenade-manu-tor":{"icon":"icons/item-augments/grenade-manu-tor.webp","description":"[keyword id=\"torgue_icon\"] [/keyword] [keyword id=\"secondary\"]Torgue[/keyword] - [keyword id=\"secondary\"]Grenades explode[/keyword] when impacting an enemy","source":"grenade","type":"manufacturer-specific","manufacturerId":"torgue"},"grenade-manu-vla":{"icon":"icons/item-augments/grenade-manu-vla.webp","description":"[keyword id=\"vladof_icon\"] [/keyword] [keyword id=\"secondary\"]Vladof[/keyword] - [keyword id=\"secondary\"]Grenades explode[/keyword] upon impact","source":"grenade","type":"manufacturer-specific","manufacturerId":"vladof"},"grenade-payload-artillery":{"icon":"icons/item-augments/grenade-payload-artillery.webp","description":"[keyword id=\"secondary\"]Artillery Payload[/keyword] - Fires bullets around the [keyword id=\"secondary\"]Grenade[/keyword], dealing [keyword id=\"secondary\"]{mod1} Damage/s[/keyword]","source":"grenade","type":"generic"},"grenade-payload-artillery-aug-duration":{"icon":"icons/item-augments/grenade-payload-artillery-aug-duration.webp","description":"[keyword id=\"secondary\"]Duration Augment[/keyword] - Increases the [keyword id=\"secondary\"]Duration[/keyword] of the [keyword id=\"secondary\"]Artillery Grenade[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword]","source":"grenade","type":"artillery"},"grenade-payload-artillery-aug-maglock":{"icon":"icons/item-augments/grenade-payload-artillery-aug-maglock.webp","description":"[keyword id=\"secondary\"]Maglock Augment[/keyword] - Homes in on nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"grenade","type":"artillery"},"grenade-payload-artillery-aug-missiles":{"icon":"icons/item-augments/grenade-payload-artillery-aug-missiles.webp","description":"[keyword id=\"secondary\"]Missiles Augment[/keyword] - Fires [keyword id=\"secondary\"]Micro-Missiles[/keyword] that home in on nearby [keyword id=\"secondary\"]enemies[/keyword], each dealing [keyword id=\"secondary\"]{mod1} Damage[/keyword]","source":"grenade","type":"artillery"},"grenade-payload-artillery-aug-mortar":{"icon":"icons/item-augments/grenade-payload-artillery-aug-mortar.webp","description":"[keyword id=\"secondary\"]Mortar Augment[/keyword] - Fires [keyword id=\"secondary\"]Mortars[/keyword] toward [keyword id=\"secondary\"]enemy[/keyword] positions, each dealing [keyword id=\"secondary\"]{mod1} Damage[/keyword]","source":"grenade","type":"artillery"},"grenade-payload-artillery-aug-ricochet":{"icon":"icons/item-augments/grenade-payload-artillery-aug-ricochet.webp","description":"[keyword id=\"secondary\"]Ricochet Augment[/keyword] - [keyword id=\"secondary\"]Artillery Projectiles[/keyword] will bounce off of [keyword id=\"secondary\"]enemies[/keyword], and [keyword id=\"secondary\"]Ricochet[/keyword] toward another nearby [keyword id=\"secondary\"]enemy[/keyword]","source":"grenade","type":"artillery"},"grenade-payload-damage-amp":{"icon":"icons/item-augments/grenade-payload-damage-amp.webp","description":"[keyword id=\"secondary\"]Damage Amp Payload[/keyword] - [keyword id=\"secondary\"]Damage Taken[/keyword] by impacted [keyword id=\"secondary\"]target[/keyword] is increased by [keyword id=\"secondary\"]{mod2}[/keyword] for [keyword id=\"secondary\"]{mod1}s[/keyword]","source":"grenade","type":"generic"},"grenade-payload-damage-amp-aug-bouncing-blade":{"icon":"icons/item-augments/grenade-payload-damage-amp-aug-bouncing-blade.webp","description":"[keyword id=\"secondary\"]Bouncing Blade Augment[/keyword] - [keyword id=\"secondary\"]Ricochets[/keyword] additional [keyword id=\"secondary\"]knives[/keyword] toward nearby [keyword id=\"secondary\"]enemies[/keyword], dealing [keyword id=\"secondary\"]{dmg} Damage[/keyword]","source":"grenade","type":"damage-amp"},"grenade-payload-damage-amp-aug-penetrator":{"icon":"icons/item-augments/grenade-payload-damage-amp-aug-penetrator.webp","description":"[keyword id=\"secondary\"]Penetrator Augment[/keyword] - [keyword id=\"secondary\"]Damage[/keyword] to the impacted [keyword id=\"secondary\"]target[/keyword] are [keyword id=\"secondary\"]automatic Critical Hits[/keyword] for [keyword id=\"secondary\"]{mod1}s[/keyword]","source":"grenade","type":"damage-amp"},"grenade-payload-damage-amp-aug-suppressor":{"icon":"icons/item-augments/grenade-payload-damage-amp-aug-suppressor.webp","description":"[keyword id=\"secondary\"]Suppressor Augment[/keyword] - [keyword id=\"secondary\"]Damage Dealt[/keyword] by impacted [keyword id=\"secondary\"]target[/keyword] is reduced by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{mod2}s[/keyword]","source":"grenade","type":"damage-amp"},"grenade-payload-divider":{"icon":"icons/item-augments/grenade-payload-divider.webp","description":"[keyword id=\"secondary\"]Divider Payload[/keyword] - Spawns a [keyword id=\"secondary\"]second Grenade[/keyword] while midflight","source":"grenade","type":"generic"},"grenade-payload-divider-aug-children":{"icon":"icons/item-augments/grenade-payload-divider-aug-children.webp","description":"[keyword id=\"secondary\"]Long Division Augment[/keyword] - Spawns another additional [keyword id=\"secondary\"]Grenade[/keyword] while midflight","source":"grenade","type":"divider"},"grenade-payload-divider-aug-repeater":{"icon":"icons/item-augments/grenade-payload-divider-aug-repeater.webp","description":"[keyword id=\"secondary\"]Repeater Augment[/keyword] - Spawns additional [keyword id=\"secondary\"]Grenades[/keyword] downward while midflight","source":"grenade","type":"divider"},"grenade-payload-divider-aug-repeater-jak":{"icon":"icons/item-augments/grenade-payload-divider-aug-repeater-jak.webp","description":"[keyword id=\"secondary\"]Repeater Augment[/keyword] - Spawns additional [keyword id=\"secondary\"]Grenades[/keyword] while midflight","source":"grenade","type":"divider","manufacturerId":"jakobs"},"grenade-payload-divider-aug-seeker":{"icon":"icons/item-augments/grenade-payload-divider-aug-seeker.webp","description":"[keyword id=\"secondary\"]Splinter Augment[/keyword] - Launches the second spawned [keyword id=\"secondary\"]Grenade[/keyword] toward an enemy","source":"grenade","type":"divider"},"grenade-payload-divider-aug-singularity":{"icon":"icons/item-augments/grenade-payload-divider-aug-singularity.webp","description":"[keyword id=\"secondary\"]Pulling Augment[/keyword] - Each [keyword id=\"secondary\"]Grenade[/keyword] spawns a [keyword id=\"secondary\"]Singularity[/keyword]","source":"grenade","type":"divider"},"grenade-payload-divider-aug-spring":{"icon":"icons/item-augments/grenade-payload-divider-aug-spring.webp","description":"[keyword id=\"secondary\"]Spring Augment[/keyword] - Each [keyword id=\"secondary\"]Grenade[/keyword] bounces in place, [keyword id=\"secondary\"]exploding 3[/keyword] extra times","source":"grenade","type":"divider"},"grenade-payload-lingering-aug-alchemic":{"icon":"icons/item-augments/grenade-payload-lingering-aug-alchemic.webp","description":"[keyword id=\"secondary\"]Alchemic Augment[/keyword] - [keyword id=\"secondary\"]Grenade Status Effect Chance[/keyword] increased by [keyword id=\"secondary\"]{mod}[/keyword]","source":"grenade","type":"lingering"},"grenade-payload-lingering-aug-duration":{"icon":"icons/item-augments/grenade-payload-lingering-aug-duration.webp","description":"[keyword id=\"secondary\"]Duration Augment[/keyword] - Increases the [keyword id=\"secondary\"]Duration[/keyword] of the [keyword id=\"secondary\"]Lingering Grenade[/keyword] by [keyword id=\"secondary\"]{mod1}[/keyword]","source":"grenade","type":"lingering"},"grenade-payload-lingering-aug-fracture":{"icon":"icons/item-augments/grenade-payload-lingering-aug-fracture.webp","description":"[keyword id=\"secondary\"]Fracture Augment[/keyword] - Spawns [keyword id=\"secondary\"] [/keyword]3[keyword id=\"/secondary\"] [/keyword] [keyword id=\"secondary\"]Elemental Pillars[/keyword] in the direction the Grenade was thrown, each dealing [keyword id=\"secondary\"]{mod1}[/keyword] Damage","source":"grenade","type":"lingering"},"grenade-payload-lingering-aug-pulse":{"icon":"icons/item-augments/grenade-payload-lingering-aug-pulse.webp","description":"[keyword id=\"secondary\"]Pulsing Augment[/keyword] - Radiates [keyword id=\"secondary\"]Elemental Pulses[/keyword] from the [keyword id=\"secondary\"]Grenade[/keyword], each [keyword id=\"secondary\"]Pulse[/keyword] dealing [keyword id=\"secondary\"]{mod1} Damage[/keyword]","source":"grenade","type":"lingering"},"grenade-payload-lingering-aug-splat-pack":{"icon":"icons/item-augments/grenade-payload-lingering-aug-splat-pack.webp","description":"[keyword id=\"secondary\"]Splat Pack Augment[/keyword] - Launches [keyword id=\"secondary\"] [/keyword]3[keyword id=\"/secondary\"] [/keyword] [keyword id=\"secondary\"]Projeciles[/keyword] that each spawn an [keyword id=\"secondary\"]Elemental Puddle[/keyword] on landing","source":"grenade","type":"lingering"},"grenade-payload-lingering-corrosive":{"icon":"icons/item-augments/grenade-payload-lingering-corrosive.webp","description":"[keyword id=\"secondary\"]Lingering Payload[/keyword] - Spawns [keyword id=\"secondary\"]4[/keyword] rotating [keyword id=\"secondary\"]beams[/keyword], dealing [keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]{mod1} Corrosive Damage/s[/keyword]","source":"grenade","type":"lingering"},"grenade-payload-lingering-cryo":{"icon":"icons/item-augments/grenade-payload-lingering-cryo.webp","description":"[keyword id=\"secondary\"]Lingering Payload[/keyword] - Spawns a [keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo Puddle[/keyword], dealing [keyword id=\"cryo\"]{mod1} Damage/s[/keyword] to all enemies within it","source":"grenade","type":"lingering"},"grenade-payload-lingering-fire":{"icon":"icons/item-augments/grenade-payload-lingering-fire.webp","description":"[keyword id=\"secondary\"]Lingering Payload[/keyword] - Spawns [keyword id=\"secondary\"]4[/keyword] rotating [keyword id=\"secondary\"]beams[/keyword] dealing [keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]{mod1} Incendiary Damage/s[/keyword]","source":"grenade","type":"lingering"},"grenade-payload-lingering-radiation":{"icon":"icons/item-augments/grenade-payload-lingering-radiation.webp","description":"[keyword id=\"secondary\"]Lingering Payload[/keyword] - Spawns [keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation Globules[/keyword] that [keyword id=\"secondary\"]home in[/keyword] on nearby enemies, dealing [keyword id=\"radiation\"]{mod1} Damage[/keyword]","source":"grenade","type":"lingering"},"grenade-payload-lingering-shock":{"icon":"icons/item-augments/grenade-payload-lingering-shock.webp","description":"[keyword id=\"secondary\"]Lingering Payload[/keyword] - Lashes out at [keyword id=\"secondary\"]3[/keyword] nearby enemies, dealing [keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]{mod1} Shock Damage/s[/keyword] to each","source":"grenade","type":"lingering"},"grenade-payload-mirv":{"icon":"icons/item-augments/grenade-payload-mirv.webp","description":"[keyword id=\"secondary\"]MIRV Payload[/keyword] - Spawns [keyword id=\"secondary\"]{mod1} MIRV Grenades[/keyword] on [keyword id=\"secondary\"]exploding[/keyword]","source":"grenade","type":"generic"},"grenade-payload-mirv-aug-bouncer":{"icon":"icons/item-augments/grenade-payload-mirv-aug-bouncer.webp","description":"[keyword id=\"secondary\"]Rubberized Augment[/keyword] - [keyword id=\"secondary\"]MIRV Grenades[/keyword] bounce up to [keyword id=\"secondary\"]5[/keyword] times before [keyword id=\"secondary\"]exploding[/keyword]","source":"grenade","type":"mirv"},"grenade-payload-mirv-aug-children":{"icon":"icons/item-augments/grenade-payload-mirv-aug-children.webp","description":"[keyword id=\"secondary\"]Tightly Packed Augment[/keyword] - Increases amount of [keyword id=\"secondary\"]MIRV Grenades[/keyword] spawned by [keyword id=\"secondary\"]+2[/keyword]","source":"grenade","type":"mirv"},"grenade-payload-mirv-aug-micro-mirv":{"icon":"icons/item-augments/grenade-payload-mirv-aug-micro-mirv.webp","description":"[keyword id=\"secondary\"]Micro MIRV Augment[/keyword] - [keyword id=\"secondary\"]MIRV Grenades[/keyword] each spawn [keyword id=\"secondary\"]3 Micro MIRVs[/keyword] when they [keyword id=\"secondary\"]explode[/keyword]","source":"grenade","type":"mirv"},"grenade-payload-mirv-aug-spring":{"icon":"icons/item-augments/grenade-payload-mirv-aug-spring.webp","description":"[keyword id=\"secondary\"]Spring Augment[/keyword] - [keyword id=\"secondary\"]MIRV Grenades[/keyword] bounce in place [keyword id=\"secondary\"]3[/keyword] times, [keyword id=\"secondary\"]exploding[/keyword] on each bounce","source":"grenade","type":"mirv"},"grenade-payload-singularity":{"icon":"icons/item-augments/grenade-payload-singularity.webp","description":"[keyword id=\"secondary\"]Singularity Payload[/keyword] - Spawns a [keyword id=\"secondary\"]Singularity[/keyword] that pulls in nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"grenade","type":"generic"},"grenade-payload-singularity-aug-collapsing":{"icon":"icons/item-augments/grenade-payload-singularity-aug-collapsing.webp","description":"[keyword id=\"secondary\"]Collapsing Augment[/keyword] - The [keyword id=\"secondary\"]Singularity[/keyword] pulls in [keyword id=\"secondary\"]enemies[/keyword] more rapidly, and with increased [keyword id=\"secondary\"]Force[/keyword], within a large [keyword id=\"secondary\"]Radius[/keyword]","source":"grenade","type":"singularity"},"grenade-payload-singularity-aug-duration":{"icon":"icons/item-augments/grenade-payload-singularity-aug-duration.webp","description":"[keyword id=\"secondary\"]Prolonged Augment[/keyword] - Increases the [keyword id=\"secondary\"]Duration[/keyword] of the [keyword id=\"secondary\"]Singularity Grenade[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword]","source":"grenade","type":"singularity"},"grenade-payload-singularity-aug-lingering":{"icon":"icons/item-augments/grenade-payload-singularity-aug-lingering.webp","description":"[keyword id=\"secondary\"]Gnawing Augment[/keyword] - Deals [keyword id=\"secondary\"]{mod1} Damage/s[/keyword] for the [keyword id=\"secondary\"]Duration[/keyword] of the [keyword id=\"secondary\"]Singularity[/keyword]","source":"grenade","type":"singularity"},"grenade-payload-singularity-aug-repulsor":{"icon":"icons/item-augments/grenade-payload-singularity-aug-repulsor.webp","description":"[keyword id=\"secondary\"]Repulsor Augment[/keyword] - Upon [keyword id=\"secondary\"]exploding[/keyword], pushes [keyword id=\"secondary\"]enemies[/keyword] away from the [keyword id=\"secondary\"]Singularity[/keyword]","source":"grenade","type":"singularity"},"grenade-payload-spring":{"icon":"icons/item-augments/grenade-payload-spring.webp","description":"[keyword id=\"secondary\"]Spring Payload[/keyword] - Bounces in place, [keyword id=\"secondary\"]exploding 3[/keyword] additional times","source":"grenade","type":"singularity"},"grenade-payload-spring-aug-apex":{"icon":"icons/item-augments/grenade-payload-spring-aug-apex.webp","description":"[keyword id=\"secondary\"]Apex Augment[/keyword] - Each [keyword id=\"secondary\"]Grenade[/keyword] also [keyword id=\"secondary\"]explodes[/keyword] at the apex of each bounce","source":"grenade","type":"spring"},"grenade-payload-spring-aug-artillery":{"icon":"icons/item-augments/grenade-payload-spring-aug-artillery.webp","description":"[keyword id=\"secondary\"]Spawning Augment[/keyword] - Spawns additional [keyword id=\"secondary\"]Grenades[/keyword] on each bounce","source":"grenade","type":"spring"},"grenade-payload-spring-aug-bouncer":{"icon":"icons/item-augments/grenade-payload-spring-aug-bouncer.webp","description":"[keyword id=\"secondary\"]Bouncer Augment[/keyword] - Each [keyword id=\"secondary\"]Grenade[/keyword] bounces toward nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"grenade","type":"spring"},"grenade-payload-spring-aug-compound":{"icon":"icons/item-augments/grenade-payload-spring-aug-compound.webp","description":"[keyword id=\"secondary\"]Compounding Augment[/keyword] - With every bounce, [keyword id=\"secondary\"]Damage[/keyword] increases by [keyword id=\"secondary\"]{mod1}[/keyword] and [keyword id=\"secondary\"]Damage Radius[/keyword] by [keyword id=\"secondary\"]{mod2}[/keyword]","source":"grenade","type":"spring"},"grenade-payload-spring-aug-springs":{"icon":"icons/item-augments/grenade-payload-spring-aug-springs.webp","description":"[keyword id=\"secondary\"]Tightly Coiled Augment[/keyword] - [keyword id=\"secondary\"]Grenade[/keyword] bounces in place, [keyword id=\"secondary\"]exploding[/keyword] an additional [keyword id=\"secondary\"]+3[/keyword] times","source":"grenade","type":"spring"},"grenade-stat-cdr":{"icon":"icons/item-augments/grenade-stat-cdr.webp","description":"[keyword id=\"secondary\"]Express[/keyword] - [keyword id=\"secondary\"]Grenade Cooldown Duration[/keyword] is reduced by [keyword id=\"secondary\"]{mod}[/keyword]","source":"grenade","type":"generic"},"grenade-stat-crit-chance":{"icon":"icons/item-augments/grenade-stat-crit-chance.webp","description":"[keyword id=\"secondary\"]Exacting[/keyword] - [keyword id=\"secondary\"]Grenade[/keyword] has a [keyword id=\"secondary\"]{mod1}[/keyword] Chance to deal [keyword id=\"secondary\"]Critical Damage[/keyword]","source":"grenade","type":"generic"},"grenade-stat-crit-damage":{"icon":"icons/item-augments/grenade-stat-crit-damage.webp","description":"[keyword id=\"secondary\"]Merciless[/keyword] - [keyword id=\"secondary\"]Grenade Critical Damage[/keyword] is increased by [keyword id=\"secondary\"]{mod1}[/keyword]","source":"grenade","type":"generic"},"grenade-stat-damage":{"icon":"icons/item-augments/grenade-stat-damage.webp","description":"[keyword id=\"secondary\"]Explosive[/keyword] - [keyword id=\"secondary\"]Grenade Damage[/keyword] is increased by [keyword id=\"secondary\"]{mod1}[/keyword]","source":"grenade","type":"generic"},"grenade-stat-elemental-power":{"icon":"icons/item-augments/grenade-stat-elemental-power.webp","description":"[keyword id=\"secondary\"]Hazardous[/keyword] - [keyword id=\"secondary\"]Grenade Status Effect Chance[/keyword] is increased by [keyword id=\"secondary\"]{mod1}[/keyword] and [keyword id=\"secondary\"]Greande Status Effect Damage[/keyword] is increased by [keyword id=\"secondary\"]{mod2}[/keyword]","source":"grenade","type":"generic"},"grenade-stat-extra-charge":{"icon":"icons/item-augments/grenade-stat-extra-charge.webp","description":"[keyword id=\"secondary\"]Overflow[/keyword] - [keyword id=\"secondary\"]Maximum Grenade Charge[/keyword] is increased by [keyword id=\"secondary\"]+1[/keyword]","source":"grenade","type":"generic"},"grenade-stat-force":{"icon":"icons/item-augments/grenade-stat-force.webp","description":"[keyword id=\"secondary\"]Concussive[/keyword] - [keyword id=\"secondary\"]Knockback Force[/keyword] is increased by [keyword id=\"secondary\"]{mod1}[/keyword]","source":"grenade","type":"generic"},"grenade-stat-nuke":{"icon":"icons/item-augments/grenade-stat-nuke.webp","description":"[keyword id=\"secondary\"]Nuke[/keyword] - [keyword id=\"secondary\"]Grenade Damage[/keyword] is increased by [keyword id=\"secondary\"]{mod1}[/keyword], [keyword id=\"secondary\"]Grenade Damage Radius[/keyword] is increased by [keyword id=\"secondary\"]{mod2}[/keyword], and [keyword id=\"secondary\"]Grenade Cooldown Duration[/keyword] is increased by [keyword id=\"secondary\"]{mod3}[/keyword]","source":"grenade","type":"generic"},"grenade-stat-oversized":{"icon":"icons/item-augments/grenade-stat-oversized.webp","description":"[keyword id=\"secondary\"]Lethal[/keyword] - [keyword id=\"secondary\"]Grenade Damage[/keyword] is increased by [keyword id=\"secondary\"]{mod1}[/keyword], and [keyword id=\"secondary\"]Grenade Projectile Speed[/keyword] is reduced by [keyword id=\"secondary\"]{mod2}[/keyword]","source":"grenade","type":"generic"},"grenade-stat-radius":{"icon":"icons/item-augments/grenade-stat-radius.webp","description":"[keyword id=\"secondary\"]Expansive[/keyword] - [keyword id=\"secondary\"]Grenade Damage Radius[/keyword] is increased by [keyword id=\"secondary\"]{mod1}[/keyword]","source":"grenade","type":"generic"},"grenade-stat-transfusion":{"icon":"icons/item-augments/grenade-stat-transfusion.webp","description":"[keyword id=\"secondary\"]Bloodthirsty[/keyword] - [keyword id=\"secondary\"]Grenade Lifesteal[/keyword] is increased by [keyword id=\"secondary\"]{mod1}[/keyword]","source":"grenade","type":"generic"},"grenade-stat-wideload":{"icon":"icons/item-augments/grenade-stat-wideload.webp","description":"[keyword id=\"secondary\"]Wideload[/keyword] - Damage Radius increased by [keyword id=\"secondary\"]{mod1}[/keyword], Homing Turn Rate reduced by [keyword id=\"secondary\"]{mod2}[/keyword]","source":"grenade","type":"generic"},"hw-bor-barrel-01-a":{"icon":"icons/item-augments/hw-bor-barrel-01-a.webp","description":"[keyword id=\"secondary\"]Explosive[/keyword] - [keyword id=\"secondary\"]Damage splashes[/keyword] to other enemies near the [keyword id=\"secondary\"]target[/keyword]","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"borg"},"hw-bor-barrel-01-b":{"icon":"icons/item-augments/hw-bor-barrel-01-b.webp","description":"[keyword id=\"secondary\"]Thermal Convection[/keyword] - [keyword id=\"secondary\"]Damage[/keyword] increases the longer the [keyword id=\"secondary\"]beam[/keyword] is fired","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"borg"},"hw-bor-barrel-01-c":{"icon":"icons/item-augments/hw-bor-barrel-01-c.webp","description":"[keyword id=\"secondary\"]Heat Sink[/keyword] - [keyword id=\"secondary\"]Magazine Size[/keyword] increased by [keyword id=\"secondary\"]{magsize}[/keyword]","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"borg"},"hw-bor-barrel-01-d":{"icon":"icons/item-augments/hw-bor-barrel-01-d.webp","description":"[keyword id=\"secondary\"]Beam Splitter[/keyword] - The [keyword id=\"secondary\"]beam[/keyword] splits to up to [keyword id=\"secondary\"]2[/keyword] other nearby [keyword id=\"secondary\"]targets[/keyword]","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"borg"},"hw-bor-barrel-02-a":{"icon":"icons/item-augments/hw-bor-barrel-02-a.webp","description":"[keyword id=\"secondary\"]Wide Disk[/keyword] - Increases the [keyword id=\"secondary\"]Projectile[/keyword] width","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"borg"},"hw-bor-barrel-02-b":{"icon":"icons/item-augments/hw-bor-barrel-02-b.webp","description":"[keyword id=\"secondary\"]Heat Exchange[/keyword] - Fires [keyword id=\"secondary\"]full auto[/keyword] after the initial [keyword id=\"secondary\"]charge[/keyword]","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"borg"},"hw-bor-barrel-02-c":{"icon":"icons/item-augments/hw-bor-barrel-02-c.webp","description":"[keyword id=\"secondary\"]Compound[/keyword] - Deals increased [keyword id=\"secondary\"]Damage[/keyword] per enemy hit","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"borg"},"hw-bor-barrel-02-d":{"icon":"icons/item-augments/hw-bor-barrel-02-d.webp","description":"[keyword id=\"secondary\"]Ricochet[/keyword] - [keyword id=\"secondary\"]Projectiles bounce[/keyword] off of surfaces","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"borg"},"hw-mal-barrel-01-a":{"icon":"icons/item-augments/hw-mal-barrel-01-a.webp","description":"[keyword id=\"secondary\"]Ricochet[/keyword] - [keyword id=\"secondary\"]Projectiles bounce[/keyword] off of surfaces","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"maliwan"},"hw-mal-barrel-01-b":{"icon":"icons/item-augments/hw-mal-barrel-01-b.webp","description":"[keyword id=\"secondary\"]Penetration[/keyword] - [keyword id=\"secondary\"]Projectiles pierce[/keyword] through enemies","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"maliwan"},"hw-mal-barrel-01-c":{"icon":"icons/item-augments/hw-mal-barrel-01-c.webp","description":"[keyword id=\"secondary\"]Speed Loader[/keyword] - [keyword id=\"secondary\"]Fire Rate[/keyword] is increased by [keyword id=\"secondary\"]30%[/keyword]","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"maliwan"},"hw-mal-barrel-01-d":{"icon":"icons/item-augments/hw-mal-barrel-01-d.webp","description":"[keyword id=\"secondary\"]Overload[/keyword] - Directly damaged enemies [keyword id=\"secondary\"]explode[/keyword] for [keyword id=\"secondary\"]additional Damage[/keyword] after a delay","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"maliwan"},"hw-mal-barrel-02-a":{"icon":"icons/item-augments/hw-mal-barrel-02-a.webp","description":"[keyword id=\"secondary\"]MIRV[/keyword] - Spawns [keyword id=\"secondary\"]3 MIRV Orbs[/keyword] on [keyword id=\"secondary\"]explosion[/keyword]","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"maliwan"},"hw-mal-barrel-02-b":{"icon":"icons/item-augments/hw-mal-barrel-02-b.webp","description":"[keyword id=\"secondary\"]Two-Shot[/keyword] - Fires [keyword id=\"secondary\"]2 Projectiles[/keyword] at a time","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"maliwan"},"hw-mal-barrel-02-c":{"icon":"icons/item-augments/hw-mal-barrel-02-c.webp","description":"[keyword id=\"secondary\"]Aerodynamics[/keyword] - [keyword id=\"secondary\"]Projectile Speed[/keyword] is increased by [keyword id=\"secondary\"]+100%[/keyword]","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"maliwan"},"hw-mal-barrel-02-d":{"icon":"icons/item-augments/hw-mal-barrel-02-d.webp","description":"[keyword id=\"secondary\"]Proxy Homing[/keyword] - [keyword id=\"secondary\"]Homes in[/keyword] on a nearby [keyword id=\"secondary\"]target[/keyword] before [keyword id=\"secondary\"]exploding[/keyword]","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"maliwan"},"hw-tor-barrel-01-a":{"icon":"icons/item-augments/hw-tor-barrel-01-a.webp","description":"[keyword id=\"secondary\"]Triple Barrel[/keyword] - Fires [keyword id=\"secondary\"]swirling Rockets[/keyword], or [keyword id=\"secondary\"]charge up[/keyword] to fire all of them at once","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"torgue"},"hw-tor-barrel-01-b":{"icon":"icons/item-augments/hw-tor-barrel-01-b.webp","description":"[keyword id=\"secondary\"]Shrapnel Rockets[/keyword] - On [keyword id=\"secondary\"]exploding[/keyword], [keyword id=\"secondary\"]propels shrapnel[/keyword] forward","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"torgue"},"hw-tor-barrel-01-c":{"icon":"icons/item-augments/hw-tor-barrel-01-c.webp","description":"[keyword id=\"secondary\"]Air Burst[/keyword] - [keyword id=\"secondary\"]Rockets[/keyword] explode when in [keyword id=\"secondary\"]proximity[/keyword] of an enemy","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"torgue"},"hw-tor-barrel-01-d":{"icon":"icons/item-augments/hw-tor-barrel-01-d.webp","description":"[keyword id=\"secondary\"]Reticle Homing[/keyword] - [keyword id=\"secondary\"]Rocket homes in[/keyword] on the [keyword id=\"secondary\"]Reticle's target[/keyword]","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"torgue"},"hw-tor-barrel-02-a":{"icon":"icons/item-augments/hw-tor-barrel-02-a.webp","description":"[keyword id=\"secondary\"]Two-Shot[/keyword] - Fires [keyword id=\"secondary\"]2 Rockets[/keyword] at a time","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"torgue"},"hw-tor-barrel-02-b":{"icon":"icons/item-augments/hw-tor-barrel-02-b.webp","description":"[keyword id=\"secondary\"]Fire Rate[/keyword] - [keyword id=\"secondary\"]Fire Rate[/keyword] is increased by [keyword id=\"secondary\"]{firerate}[/keyword]","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"torgue"},"hw-tor-barrel-02-c":{"icon":"icons/item-augments/hw-tor-barrel-02-c.webp","description":"[keyword id=\"secondary\"]Extended Magazine[/keyword] - [keyword id=\"secondary\"]Magazine Size[/keyword] is increased by [keyword id=\"secondary\"]{magsize}[/keyword]","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"torgue"},"hw-tor-barrel-02-d":{"icon":"icons/item-augments/hw-tor-barrel-02-d.webp","description":"[keyword id=\"secondary\"]Scanning[/keyword] - [keyword id=\"secondary\"]Rockets home toward[/keyword] nearby [keyword id=\"secondary\"]targets[/keyword]","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"torgue"},"hw-vla-barrel-01-a":{"icon":"icons/item-augments/hw-vla-barrel-01-a.webp","description":"[keyword id=\"secondary\"]Additional Barrel[/keyword] - Adds [keyword id=\"secondary\"]1[/keyword] additional barrel, increasing [keyword id=\"secondary\"]Fire Rate[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword]","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"vladof"},"hw-vla-barrel-01-b":{"icon":"icons/item-augments/hw-vla-barrel-01-b.webp","description":"[keyword id=\"secondary\"]Angel's Share[/keyword] - Every [keyword id=\"secondary\"]{mod}th[/keyword] shot doesn't cost [keyword id=\"secondary\"]Ammo[/keyword]","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"vladof"},"hw-vla-barrel-01-c":{"icon":"icons/item-augments/hw-vla-barrel-01-c.webp","description":"[keyword id=\"secondary\"]Magic Bullet[/keyword] - Every [keyword id=\"secondary\"]{mod}th[/keyword] shot is [keyword id=\"secondary\"]homing[/keyword]","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"vladof"},"hw-vla-barrel-01-d":{"icon":"icons/item-augments/hw-vla-barrel-01-d.webp","description":"[keyword id=\"secondary\"]Devil's Share[/keyword] - Every [keyword id=\"secondary\"]6th[/keyword] shot deals [keyword id=\"secondary\"]+100% Damage[/keyword]","source":"heavy-weapon","type":"hw-barrel-1","manufacturerId":"vladof"},"hw-vla-barrel-02-a":{"icon":"icons/item-augments/hw-vla-barrel-02-a.webp","description":"[keyword id=\"secondary\"]Additional Barrels[/keyword] - Adds [keyword id=\"secondary\"]2[/keyword] additional barrels, increasing [keyword id=\"secondary\"]Fire Rate[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword]","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"vladof"},"hw-vla-barrel-02-b":{"icon":"icons/item-augments/hw-vla-barrel-02-b.webp","description":"[keyword id=\"secondary\"]Explosive Rounds[/keyword] - Increases [keyword id=\"secondary\"]Damage[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] and [keyword id=\"secondary\"]Damage Radius[/keyword] by [keyword id=\"secondary\"]{mod2}[/keyword]","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"vladof"},"hw-vla-barrel-02-c":{"icon":"icons/item-augments/hw-vla-barrel-02-c.webp","description":"[keyword id=\"secondary\"]Two-Shot[/keyword] - [keyword id=\"secondary\"]2[/keyword] barrels fire simultaneously","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"vladof"},"hw-vla-barrel-02-d":{"icon":"icons/item-augments/hw-vla-barrel-02-d.webp","description":"[keyword id=\"secondary\"]Penetration[/keyword] - [keyword id=\"secondary\"]Projectiles pierce[/keyword] through enemies","source":"heavy-weapon","type":"hw-barrel-2","manufacturerId":"vladof"},"lp-atlas-dart-desc":{"icon":"icons/item-augments/lp-atlas-dart-desc.webp","description":"[keyword id=\"atlas_icon\"] [/keyword] [keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Atlas-Licensed Underbarrel[/keyword] - Fires [keyword id=\"secondary\"]Tracker Darts[/keyword], tagging [keyword id=\"secondary\"]enemies[/keyword] that your [keyword id=\"secondary\"]Projectiles[/keyword] will [keyword id=\"secondary\"]home in on[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"atlas"},"lp-atlas-grenade-desc":{"icon":"icons/item-augments/lp-atlas-grenade-desc.webp","description":"[keyword id=\"atlas_icon\"] [/keyword] [keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Atlas-Licensed Underbarrel[/keyword] - Fires [keyword id=\"secondary\"]Tracker Grenades[/keyword], tagging [keyword id=\"secondary\"]enemies[/keyword] that your [keyword id=\"secondary\"]Projectiles[/keyword] will [keyword id=\"secondary\"]home in on[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"grenade","type":"generic","manufacturerId":"atlas"},"lp-bor-mag":{"icon":"icons/item-augments/lp-bor-mag.webp","description":"[keyword id=\"borg_icon\"] [/keyword] [keyword id=\"secondary\"]Ripper-Licensed Magazine[/keyword] - This [keyword id=\"secondary\"]Gun[/keyword] charges before [keyword id=\"secondary\"]Full Auto[/keyword] firing","source":"gun","type":"licensed-part","manufacturerId":"borg"},"lp-bor-mag-order":{"icon":"icons/item-augments/lp-bor-mag-order.webp","description":"[keyword id=\"borg_icon\"] [/keyword] [keyword id=\"secondary\"]Ripper-Licensed Magazine[/keyword] - This [keyword id=\"secondary\"]Gun[/keyword] charges before [keyword id=\"secondary\"]Full Auto[/keyword] firing, overriding the [keyword id=\"primary\"]Order[/keyword] manufacturer's Charge functionality","source":"gun","type":"licensed-part","manufacturerId":"order"},"lp-cov-mag":{"icon":"icons/item-augments/lp-cov-mag.webp","description":"[keyword id=\"cov_icon\"] [/keyword] [keyword id=\"secondary\"]CoV-Licensed Magazine[/keyword] - This [keyword id=\"secondary\"]Gun[/keyword] has an unlimited [keyword id=\"secondary\"]Magazine[/keyword] size, however it will [keyword id=\"secondary\"]heat up[/keyword], and eventually break","source":"gun","type":"licensed-part","manufacturerId":"cov"},"lp-dad-ar":{"icon":"icons/item-augments/lp-dad-ar.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus-Licensed Multi-Loader[/keyword] - Secondary fire consumes [keyword id=\"secondary\"]Assault Rifle Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"daedalus"},"lp-dad-ps":{"icon":"icons/item-augments/lp-dad-ps.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus-Licensed Multi-Loader[/keyword] - Secondary fire consumes [keyword id=\"secondary\"]Pistol Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"daedalus"},"lp-dad-sg":{"icon":"icons/item-augments/lp-dad-sg.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus-Licensed Multi-Loader[/keyword] - Secondary fire consumes [keyword id=\"secondary\"]Shotgun Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"daedalus"},"lp-dad-smg":{"icon":"icons/item-augments/lp-dad-smg.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus-Licensed Multi-Loader[/keyword] - Secondary fire consumes [keyword id=\"secondary\"]SMG Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"daedalus"},"lp-dad-sr":{"icon":"icons/item-augments/lp-dad-sr.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus-Licensed Multi-Loader[/keyword] - Secondary fire consumes [keyword id=\"secondary\"]Sniper Rifle Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"daedalus"},"lp-hyp-acc":{"icon":"icons/item-augments/lp-hyp-acc.webp","description":"[keyword id=\"hyperion_icon\"] [/keyword] [keyword id=\"secondary\"]Hyperion-Licensed Grip[/keyword] - [keyword id=\"secondary\"]Accuracy[/keyword] increases with [keyword id=\"secondary\"]continuous fire[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"hyperion"},"lp-hyp-shield-ammo":{"icon":"icons/item-augments/lp-hyp-shield-ammo.webp","description":"[keyword id=\"hyperion_icon\"] [/keyword] [keyword id=\"secondary\"]Hyperion-Licensed Absorb Shield[/keyword] - [keyword id=\"secondary\"]Damage[/keyword] to [keyword id=\"secondary\"]Gun Shields[/keyword] absorbs [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"hyperion"},"lp-hyp-shield-amp":{"icon":"icons/item-augments/lp-hyp-shield-amp.webp","description":"[keyword id=\"hyperion_icon\"] [/keyword] [keyword id=\"secondary\"]Hyperion-Licensed Amp Shield[/keyword] - [keyword id=\"secondary\"]Damage[/keyword] to [keyword id=\"secondary\"]Gun Shields[/keyword] amplifies [keyword id=\"secondary\"]Gun Damage[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"hyperion"},"lp-hyp-shield-default":{"icon":"icons/item-augments/lp-hyp-shield-default.webp","description":"[keyword id=\"hyperion_icon\"] [/keyword] [keyword id=\"secondary\"]Hyperion-Licensed Shield[/keyword] - [keyword id=\"secondary\"]Zoom[/keyword] to enable [keyword id=\"secondary\"]Gun Shields[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"hyperion"},"lp-hyp-shield-ricochet":{"icon":"icons/item-augments/lp-hyp-shield-ricochet.webp","description":"[keyword id=\"hyperion_icon\"] [/keyword] [keyword id=\"secondary\"]Hyperion-Licensed Ricochet Shield[/keyword] - [keyword id=\"secondary\"]Damage[/keyword] to [keyword id=\"secondary\"]Gun Shields[/keyword] can [keyword id=\"secondary\"]Ricochet[/keyword] back toward enemies","source":"gun","type":"licensed-part","manufacturerId":"hyperion"},"lp-jak-ricochet":{"icon":"icons/item-augments/lp-jak-ricochet.webp","description":"[keyword id=\"jakobs_icon\"] [/keyword] [keyword id=\"secondary\"]Jakobs-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Critical Hits[/keyword] will [keyword id=\"secondary\"]Ricochet Projectiles[/keyword] to nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"jakobs"},"lp-mal-corrosive-cryo":{"icon":"icons/item-augments/lp-mal-corrosive-cryo.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-corrosive-fire":{"icon":"icons/item-augments/lp-mal-corrosive-fire.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-corrosive-radiation":{"icon":"icons/item-augments/lp-mal-corrosive-radiation.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-corrosive-shock":{"icon":"icons/item-augments/lp-mal-corrosive-shock.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-cryo-corrosive":{"icon":"icons/item-augments/lp-mal-cryo-corrosive.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-cryo-fire":{"icon":"icons/item-augments/lp-mal-cryo-fire.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-cryo-radiation":{"icon":"icons/item-augments/lp-mal-cryo-radiation.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-cryo-shock":{"icon":"icons/item-augments/lp-mal-cryo-shock.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-fire-corrosive":{"icon":"icons/item-augments/lp-mal-fire-corrosive.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-fire-cryo":{"icon":"icons/item-augments/lp-mal-fire-cryo.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-fire-radiation":{"icon":"icons/item-augments/lp-mal-fire-radiation.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-fire-shock":{"icon":"icons/item-augments/lp-mal-fire-shock.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-radiation-corrosive":{"icon":"icons/item-augments/lp-mal-radiation-corrosive.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-radiation-cryo":{"icon":"icons/item-augments/lp-mal-radiation-cryo.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-radiation-fire":{"icon":"icons/item-augments/lp-mal-radiation-fire.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-radiation-shock":{"icon":"icons/item-augments/lp-mal-radiation-shock.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-shock-corrosive":{"icon":"icons/item-augments/lp-mal-shock-corrosive.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-shock-cryo":{"icon":"icons/item-augments/lp-mal-shock-cryo.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-shock-fire":{"icon":"icons/item-augments/lp-mal-shock-fire.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-mal-shock-radiation":{"icon":"icons/item-augments/lp-mal-shock-radiation.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan-Licensed Underbarrel[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"licensed-part","manufacturerId":"maliwan"},"lp-ted-combo":{"icon":"icons/item-augments/lp-ted-combo.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Combo[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-combo":{"icon":"icons/item-augments/cond-ted-combo.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Combo[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-combo-homing":{"icon":"icons/item-augments/lp-ted-combo-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Combo Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword] and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-combo-homing":{"icon":"icons/item-augments/cond-ted-combo-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Combo Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword] and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-combo-javelin":{"icon":"icons/item-augments/lp-ted-combo-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Combo Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-combo-javelin":{"icon":"icons/item-augments/cond-ted-combo-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Combo Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-combo-legs":{"icon":"icons/item-augments/lp-ted-combo-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Combo Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-combo-legs":{"icon":"icons/item-augments/cond-ted-combo-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Combo Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-default":{"icon":"icons/item-augments/lp-ted-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - Throws a [keyword id=\"secondary\"]Gun[/keyword] on [keyword id=\"secondary\"]Reload[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-default":{"icon":"icons/item-augments/cond-ted-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - Throws a [keyword id=\"secondary\"]Gun[/keyword] on [keyword id=\"secondary\"]Reload[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-default-homing":{"icon":"icons/item-augments/lp-ted-default-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword] on nearby [keyword id=\"secondary\"]enemies[/keyword] before [keyword id=\"secondary\"]exploding[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-default-homing":{"icon":"icons/item-augments/cond-ted-default-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword] on nearby [keyword id=\"secondary\"]enemies[/keyword] before [keyword id=\"secondary\"]exploding[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-default-javelin":{"icon":"icons/item-augments/lp-ted-default-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward at high speed","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-default-javelin":{"icon":"icons/item-augments/cond-ted-default-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward at high speed","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-default-legs":{"icon":"icons/item-augments/lp-ted-default-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword] and [keyword id=\"secondary\"]runs[/keyword] toward [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-default-legs":{"icon":"icons/item-augments/cond-ted-default-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword] and [keyword id=\"secondary\"]runs[/keyword] toward [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-mirv":{"icon":"icons/item-augments/lp-ted-mirv.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]MIRV[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-mirv":{"icon":"icons/item-augments/cond-ted-mirv.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]MIRV[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-mirv-homing":{"icon":"icons/item-augments/lp-ted-mirv-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]MIRV Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword] and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-mirv-homing":{"icon":"icons/item-augments/cond-ted-mirv-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]MIRV Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword] and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-mirv-javelin":{"icon":"icons/item-augments/lp-ted-mirv-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]MIRV Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-mirv-javelin":{"icon":"icons/item-augments/cond-ted-mirv-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]MIRV Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-mirv-legs":{"icon":"icons/item-augments/lp-ted-mirv-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]MIRV Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-mirv-legs":{"icon":"icons/item-augments/cond-ted-mirv-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]MIRV Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-shooting":{"icon":"icons/item-augments/lp-ted-shooting.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Shooting[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] shoots [keyword id=\"secondary\"]enemies[/keyword] until it is out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-shooting":{"icon":"icons/item-augments/cond-ted-shooting.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Shooting[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] shoots [keyword id=\"secondary\"]enemies[/keyword] until it is out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-shooting-homing":{"icon":"icons/item-augments/lp-ted-shooting-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Shooting Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword], and shoots [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-shooting-homing":{"icon":"icons/item-augments/cond-ted-shooting-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Shooting Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword], and shoots [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-shooting-javelin":{"icon":"icons/item-augments/lp-ted-shooting-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Shooting Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward and shoots [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-shooting-javelin":{"icon":"icons/item-augments/cond-ted-shooting-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Shooting Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward and shoots [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-ted-shooting-legs":{"icon":"icons/item-augments/lp-ted-shooting-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Shooting Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword] and shoots [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"cond-ted-shooting-legs":{"icon":"icons/item-augments/cond-ted-shooting-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore-Licensed Accessory[/keyword] - [keyword id=\"secondary\"]Shooting Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword] and shoots [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"licensed-part","manufacturerId":"tediore"},"lp-tor-gyro":{"icon":"icons/item-augments/lp-tor-gyro.webp","description":"[keyword id=\"torgue_icon\"] [/keyword] [keyword id=\"secondary\"]Torgue-Licensed Impact Magazine[/keyword] -  Fires [keyword id=\"secondary\"]Gyrojets[/keyword] that [keyword id=\"secondary\"]explode[/keyword] on impact","source":"gun","type":"licensed-part","manufacturerId":"torgue"},"lp-tor-sticky":{"icon":"icons/item-augments/lp-tor-sticky.webp","description":"[keyword id=\"torgue_icon\"] [/keyword] [keyword id=\"secondary\"]Torgue-Licensed Sticky Magazine[/keyword] - Fires [keyword id=\"secondary\"]sticky Gyrojets[/keyword] that [keyword id=\"secondary\"]explode[/keyword] on [keyword id=\"secondary\"]Reload[/keyword], or when switching [keyword id=\"secondary\"]Modes[/keyword] - which increases [keyword id=\"secondary\"]explosion Damage[/keyword] by [keyword id=\"secondary\"]{stickymulti}[/keyword] each","source":"gun","type":"licensed-part","manufacturerId":"torgue"},"manu-bor-mag":{"icon":"icons/item-augments/manu-bor-mag.webp","description":"[keyword id=\"borg_icon\"] [/keyword] [keyword id=\"secondary\"]Ripper[/keyword] - This [keyword id=\"secondary\"]Gun[/keyword] charges before [keyword id=\"secondary\"]Full Auto[/keyword] firing","source":"gun","type":"manufacturer-specific","manufacturerId":"borg"},"manu-dad-ar":{"icon":"icons/item-augments/manu-dad-ar.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus[/keyword] - [keyword id=\"secondary\"]Secondary fire[/keyword] consumes [keyword id=\"secondary\"]Assault Rifle Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"daedalus"},"manu-dad-ps":{"icon":"icons/item-augments/manu-dad-ps.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus[/keyword] - [keyword id=\"secondary\"]Secondary fire[/keyword] consumes [keyword id=\"secondary\"]Pistol Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"daedalus"},"manu-dad-sg":{"icon":"icons/item-augments/manu-dad-sg.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus[/keyword] - [keyword id=\"secondary\"]Secondary fire[/keyword] consumes [keyword id=\"secondary\"]Shotgun Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"daedalus"},"manu-dad-smg":{"icon":"icons/item-augments/manu-dad-smg.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus[/keyword] - [keyword id=\"secondary\"]Secondary fire[/keyword] consumes [keyword id=\"secondary\"]SMG Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"daedalus"},"manu-dad-sr":{"icon":"icons/item-augments/manu-dad-sr.webp","description":"[keyword id=\"daedalus_icon\"] [/keyword] [keyword id=\"secondary\"]Daedalus[/keyword] - [keyword id=\"secondary\"]Secondary fire[/keyword] consumes [keyword id=\"secondary\"]Sniper Rifle Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"daedalus"},"manu-jak-ricochet":{"icon":"icons/item-augments/manu-jak-ricochet.webp","description":"[keyword id=\"jakobs_icon\"] [/keyword] [keyword id=\"secondary\"]Jakobs[/keyword] - [keyword id=\"secondary\"]Critical Hits[/keyword] will [keyword id=\"secondary\"]Ricochet Projectiles[/keyword] to nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"jakobs"},"manu-mal-corrosive-cryo":{"icon":"icons/item-augments/manu-mal-corrosive-cryo.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-mal-corrosive-fire":{"icon":"icons/item-augments/manu-mal-corrosive-fire.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-mal-corrosive-radiation":{"icon":"icons/item-augments/manu-mal-corrosive-radiation.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-mal-corrosive-shock":{"icon":"icons/item-augments/manu-mal-corrosive-shock.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-mal-cryo-corrosive":{"icon":"icons/item-augments/manu-mal-cryo-corrosive.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-mal-cryo-fire":{"icon":"icons/item-augments/manu-mal-cryo-fire.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-mal-cryo-radiation":{"icon":"icons/item-augments/manu-mal-cryo-radiation.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-mal-cryo-shock":{"icon":"icons/item-augments/manu-mal-cryo-shock.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-mal-fire-corrosive":{"icon":"icons/item-augments/manu-mal-fire-corrosive.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-mal-fire-cryo":{"icon":"icons/item-augments/manu-mal-fire-cryo.webp","description":"[keyword id=\"maliwan_icon\"] [/keyword] [keyword id=\"secondary\"]Maliwan[/keyword] - Can switch between [keyword id=\"nowrap\"] [/keyword][keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary[/keyword][keyword id=\"/nowrap\"] [/keyword] and [keyword id=\"nowrap\"] [/keyword][keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo[/keyword][keyword id=\"/nowrap\"] [/keyword] Elements","source":"gun","type":"manufacturer-specific","manufacturerId":"maliwan"},"manu-ord":{"icon":"icons/item-augments/manu-ord.webp","description":"[keyword id=\"order_icon\"] [/keyword] [keyword id=\"secondary\"]Order[/keyword] - Can [keyword id=\"secondary\"]charge up[/keyword] to fire [keyword id=\"secondary\"]multiple rounds[/keyword] at once","source":"gun","type":"manufacturer-specific","manufacturerId":"order"},"manu-ted-combo":{"icon":"icons/item-augments/manu-ted-combo.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-combo-homing":{"icon":"icons/item-augments/manu-ted-combo-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword] and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-combo-javelin":{"icon":"icons/item-augments/manu-ted-combo-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-combo-legs":{"icon":"icons/item-augments/manu-ted-combo-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword] and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-combo-replicator-default":{"icon":"icons/item-augments/manu-ted-combo-replicator-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Replicator[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-combo-replicating-default":{"icon":"icons/item-augments/cond-ted-combo-replicating-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Replicator[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-combo-replicator-homing":{"icon":"icons/item-augments/manu-ted-combo-replicator-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Replicator Homing[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]home in[/keyword] and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-combo-replicating-homing":{"icon":"icons/item-augments/cond-ted-combo-replicating-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Replicator Homing[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]home in[/keyword] and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-combo-replicator-javelin":{"icon":"icons/item-augments/manu-ted-combo-replicator-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Replicator Javelin[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]propel[/keyword] forward and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-combo-replicating-javelin":{"icon":"icons/item-augments/cond-ted-combo-replicating-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Replicator Javelin[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]propel[/keyword] forward and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-combo-replicator-legs":{"icon":"icons/item-augments/manu-ted-combo-replicator-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Replicator Legs[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] with [keyword id=\"secondary\"]legs[/keyword] that can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-combo-replicating-legs":{"icon":"icons/item-augments/cond-ted-combo-replicating-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Combo Replicator Legs[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] with [keyword id=\"secondary\"]legs[/keyword] that can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-mirv":{"icon":"icons/item-augments/manu-ted-mirv.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-mirv-combo-default":{"icon":"icons/item-augments/manu-ted-mirv-combo-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Combo[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword] and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-mirv-combo-default":{"icon":"icons/item-augments/cond-ted-mirv-combo-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Combo[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword] and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-mirv-combo-homing":{"icon":"icons/item-augments/manu-ted-mirv-combo-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Combo Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword], can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-mirv-combo-homing":{"icon":"icons/item-augments/cond-ted-mirv-combo-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Combo Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword], can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-mirv-combo-javelin":{"icon":"icons/item-augments/manu-ted-mirv-combo-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Combo Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward, can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-mirv-combo-javelin":{"icon":"icons/item-augments/cond-ted-mirv-combo-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Combo Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward, can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-mirv-combo-legs":{"icon":"icons/item-augments/manu-ted-mirv-combo-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Combo Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-mirv-combo-legs":{"icon":"icons/item-augments/cond-ted-mirv-combo-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Combo Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-mirv-homing":{"icon":"icons/item-augments/manu-ted-mirv-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword] and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-mirv-javelin":{"icon":"icons/item-augments/manu-ted-mirv-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-mirv-legs":{"icon":"icons/item-augments/manu-ted-mirv-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword] and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-mirv-replicator-default":{"icon":"icons/item-augments/manu-ted-mirv-replicator-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Replicator[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that spawn [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-mirv-replicating-default":{"icon":"icons/item-augments/cond-ted-mirv-replicating-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Replicator[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that spawn [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-mirv-replicator-homing":{"icon":"icons/item-augments/manu-ted-mirv-replicator-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Replicator Homing[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]home in[/keyword] and spawn [keyword id=\"secondary\"]4 Grenades[/keyword] on impact ","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-mirv-replicating-homing":{"icon":"icons/item-augments/cond-ted-mirv-replicating-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Replicator Homing[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]home in[/keyword] and spawn [keyword id=\"secondary\"]4 Grenades[/keyword] on impact ","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-mirv-replicator-javelin":{"icon":"icons/item-augments/manu-ted-mirv-replicator-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Replicator Javelin[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]propel[/keyword] forward and spawn [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-mirv-replicating-javelin":{"icon":"icons/item-augments/cond-ted-mirv-replicating-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Replicator Javelin[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]propel[/keyword] forward and spawn [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-mirv-replicator-legs":{"icon":"icons/item-augments/manu-ted-mirv-replicator-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Replicator Legs[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] with [keyword id=\"secondary\"]legs[/keyword] that spawn [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-mirv-replicating-legs":{"icon":"icons/item-augments/cond-ted-mirv-replicating-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]MIRV Replicator Legs[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] with [keyword id=\"secondary\"]legs[/keyword] that spawn [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-replicator":{"icon":"icons/item-augments/manu-ted-replicator.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Replicator[/keyword] - Throws additional [keyword id=\"secondary\"]Gun[/keyword] on [keyword id=\"secondary\"]Reload[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-replicating":{"icon":"icons/item-augments/cond-ted-replicating.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Replicator[/keyword] - Throws additional [keyword id=\"secondary\"]Gun[/keyword] on [keyword id=\"secondary\"]Reload[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-replicator-homing":{"icon":"icons/item-augments/manu-ted-replicator-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Replicator Homing[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]home in[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-replicating-homing":{"icon":"icons/item-augments/cond-ted-replicating-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Replicator Homing[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]home in[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-replicator-javelin":{"icon":"icons/item-augments/manu-ted-replicator-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Replicator Javelin[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]propel[/keyword] forward at high speed","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-replicating-javelin":{"icon":"icons/item-augments/cond-ted-replicating-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Replicator Javelin[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]propel[/keyword] forward at high speed","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-replicator-legs":{"icon":"icons/item-augments/manu-ted-replicator-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Replicator Legs[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] with [keyword id=\"secondary\"]legs[/keyword] that run toward enemies","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-replicating-legs":{"icon":"icons/item-augments/cond-ted-replicating-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Replicator Legs[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] with [keyword id=\"secondary\"]legs[/keyword] that run toward enemies","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting":{"icon":"icons/item-augments/manu-ted-shooting.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] shoots [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-shooting-combo-default":{"icon":"icons/item-augments/manu-ted-shooting-combo-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Combo[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] shoots [keyword id=\"secondary\"]enemies[/keyword] and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-combo-default":{"icon":"icons/item-augments/cond-ted-shooting-combo-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Combo[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] shoots [keyword id=\"secondary\"]enemies[/keyword] and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-combo-homing":{"icon":"icons/item-augments/manu-ted-shooting-combo-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Combo Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword], shoots [keyword id=\"secondary\"]enemies[/keyword], and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-combo-homing":{"icon":"icons/item-augments/cond-ted-shooting-combo-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Combo Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword], shoots [keyword id=\"secondary\"]enemies[/keyword], and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-combo-javelin":{"icon":"icons/item-augments/manu-ted-shooting-combo-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Combo Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward, shoots [keyword id=\"secondary\"]enemies[/keyword], and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-combo-javelin":{"icon":"icons/item-augments/cond-ted-shooting-combo-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Combo Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward, shoots [keyword id=\"secondary\"]enemies[/keyword], and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-combo-legs":{"icon":"icons/item-augments/manu-ted-shooting-combo-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Combo Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], shoots [keyword id=\"secondary\"]enemies[/keyword], and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-combo-legs":{"icon":"icons/item-augments/cond-ted-shooting-combo-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Combo Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], shoots [keyword id=\"secondary\"]enemies[/keyword], and can be shot to increase the [keyword id=\"secondary\"]explosion's Damage[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-homing":{"icon":"icons/item-augments/manu-ted-shooting-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword] and shoots [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-shooting-javelin":{"icon":"icons/item-augments/manu-ted-shooting-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward and  shoots [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-shooting-legs":{"icon":"icons/item-augments/manu-ted-shooting-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword] and shoot [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"manu-ted-shooting-mirv-default":{"icon":"icons/item-augments/manu-ted-shooting-mirv-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting MIRV[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] shoots [keyword id=\"secondary\"]enemies[/keyword] and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-mirv-default":{"icon":"icons/item-augments/cond-ted-shooting-mirv-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting MIRV[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] shoots [keyword id=\"secondary\"]enemies[/keyword] and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-mirv-homing":{"icon":"icons/item-augments/manu-ted-shooting-mirv-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting MIRV Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword], shoots [keyword id=\"secondary\"]enemies[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-mirv-homing":{"icon":"icons/item-augments/cond-ted-shooting-mirv-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting MIRV Homing[/keyword] - [keyword id=\"secondary\"]Thrown Gun homes in[/keyword], shoots [keyword id=\"secondary\"]enemies[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-mirv-javelin":{"icon":"icons/item-augments/manu-ted-shooting-mirv-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting MIRV Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward, shoots [keyword id=\"secondary\"]enemies[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-mirv-javelin":{"icon":"icons/item-augments/cond-ted-shooting-mirv-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting MIRV Javelin[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] is [keyword id=\"secondary\"]propelled[/keyword] forward, shoots [keyword id=\"secondary\"]enemies[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-mirv-legs":{"icon":"icons/item-augments/manu-ted-shooting-mirv-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting MIRV Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], shoots [keyword id=\"secondary\"]enemies[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-mirv-legs":{"icon":"icons/item-augments/cond-ted-shooting-mirv-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting MIRV Legs[/keyword] - [keyword id=\"secondary\"]Thrown Gun[/keyword] has [keyword id=\"secondary\"]legs[/keyword], shoots [keyword id=\"secondary\"]enemies[/keyword], and spawns [keyword id=\"secondary\"]4 Grenades[/keyword] on impact","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-replicator-default":{"icon":"icons/item-augments/manu-ted-shooting-replicator-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Replicator[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that shoot [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-replicating-default":{"icon":"icons/item-augments/cond-ted-shooting-replicating-default.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Replicator[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that shoot [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-replicator-homing":{"icon":"icons/item-augments/manu-ted-shooting-replicator-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Replicator Homing[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]home in[/keyword] and shoot [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-replicating-homing":{"icon":"icons/item-augments/cond-ted-shooting-replicating-homing.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Replicator Homing[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that [keyword id=\"secondary\"]home in[/keyword] and shoot [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-replicator-javelin":{"icon":"icons/item-augments/manu-ted-shooting-replicator-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Replicator Javelin[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that are [keyword id=\"secondary\"]propelled[/keyword] forward and shoot [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-replicating-javelin":{"icon":"icons/item-augments/cond-ted-shooting-replicating-javelin.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Replicator Javelin[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] that are [keyword id=\"secondary\"]propelled[/keyword] forward and shoot [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-ted-shooting-replicator-legs":{"icon":"icons/item-augments/manu-ted-shooting-replicator-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Replicator Legs[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] with [keyword id=\"secondary\"]legs[/keyword] that shoot [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"manufacturer-specific","manufacturerId":"tediore"},"cond-ted-shooting-replicating-legs":{"icon":"icons/item-augments/cond-ted-shooting-replicating-legs.webp","description":"[keyword id=\"tediore_icon\"] [/keyword] [keyword id=\"secondary\"]Tediore[/keyword] - [keyword id=\"secondary\"]Shooting Replicator Legs[/keyword] - Throws [keyword id=\"secondary\"]2 Guns[/keyword] with [keyword id=\"secondary\"]legs[/keyword] that shoot [keyword id=\"secondary\"]enemies[/keyword] until out of [keyword id=\"secondary\"]Ammo[/keyword]","source":"gun","type":"generic","manufacturerId":"tediore"},"manu-tor-sticky":{"icon":"icons/item-augments/manu-tor-sticky.webp","description":"[keyword id=\"torgue_icon\"] [/keyword] [keyword id=\"secondary\"]Torgue[/keyword] - Secondary fire shoots [keyword id=\"secondary\"]sticky Gyrojets[/keyword] that [keyword id=\"secondary\"]explode[/keyword] on [keyword id=\"secondary\"]Reload[/keyword] or when switching [keyword id=\"secondary\"]Modes[/keyword] - which increases [keyword id=\"secondary\"]explosion Damage[/keyword] by [keyword id=\"secondary\"]{stickymulti}[/keyword] each","source":"gun","type":"manufacturer-specific","manufacturerId":"torgue"},"repkit-aug-d-aoe-heal":{"icon":"icons/item-augments/repkit-aug-d-aoe-heal.webp","description":"[keyword id=\"secondary\"]Medic[/keyword] - On use, [keyword id=\"secondary\"]Heals[/keyword] nearby [keyword id=\"secondary\"]allies[/keyword] for [keyword id=\"secondary\"]{mod}[/keyword] of the [keyword id=\"secondary\"]Repkit's Healing[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-immunity-corrosive":{"icon":"icons/item-augments/repkit-aug-d-elemental-immunity-corrosive.webp","description":"[keyword id=\"secondary\"]Elemental Immunity[/keyword] - On use, grants [keyword id=\"secondary\"]immunity[/keyword] to [keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive Damage[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-immunity-cryo":{"icon":"icons/item-augments/repkit-aug-d-elemental-immunity-cryo.webp","description":"[keyword id=\"secondary\"]Elemental Immunity[/keyword] - On use, grants [keyword id=\"secondary\"]immunity[/keyword] to [keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo Damage[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-immunity-fire":{"icon":"icons/item-augments/repkit-aug-d-elemental-immunity-fire.webp","description":"[keyword id=\"secondary\"]Elemental Immunity[/keyword] - On use, grants [keyword id=\"secondary\"]immunity[/keyword] to [keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary Damage[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-immunity-radiation":{"icon":"icons/item-augments/repkit-aug-d-elemental-immunity-radiation.webp","description":"[keyword id=\"secondary\"]Elemental Immunity[/keyword] - On use, grants [keyword id=\"secondary\"]immunity[/keyword] to [keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation Damage[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-immunity-shock":{"icon":"icons/item-augments/repkit-aug-d-elemental-immunity-shock.webp","description":"[keyword id=\"secondary\"]Elemental Immunity[/keyword] - On use, grants [keyword id=\"secondary\"]immunity[/keyword] to [keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock Damage[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-resist-corrosive":{"icon":"icons/item-augments/repkit-aug-d-elemental-resist-corrosive.webp","description":"[keyword id=\"secondary\"]Elemental Resistance[/keyword] - On use, grants [keyword id=\"secondary\"]{mod}[/keyword] [keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive Resistance[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-resist-cryo":{"icon":"icons/item-augments/repkit-aug-d-elemental-resist-cryo.webp","description":"[keyword id=\"secondary\"]Elemental Resistance[/keyword] - On use, grants [keyword id=\"secondary\"]{mod}[/keyword] [keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo Resistance[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-resist-fire":{"icon":"icons/item-augments/repkit-aug-d-elemental-resist-fire.webp","description":"[keyword id=\"secondary\"]Elemental Resistance[/keyword] - On use, grants [keyword id=\"secondary\"]{mod}[/keyword] [keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary Resistance[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-resist-radiation":{"icon":"icons/item-augments/repkit-aug-d-elemental-resist-radiation.webp","description":"[keyword id=\"secondary\"]Elemental Resistance[/keyword] - On use, grants [keyword id=\"secondary\"]{mod}[/keyword] [keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation Resistance[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-elemental-resist-shock":{"icon":"icons/item-augments/repkit-aug-d-elemental-resist-shock.webp","description":"[keyword id=\"secondary\"]Elemental Resistance[/keyword] - On use, grants [keyword id=\"secondary\"]{mod}[/keyword] [keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock Resistance[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-health-burst":{"icon":"icons/item-augments/repkit-aug-d-health-burst.webp","description":"[keyword id=\"secondary\"]Health Burst[/keyword] - On use, grants an [keyword id=\"secondary\"]additional burst[/keyword] worth [keyword id=\"secondary\"]{mod}[/keyword] of the [keyword id=\"secondary\"]Repkit's[/keyword] initial [keyword id=\"secondary\"]Healing[/keyword] after [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-increased-healing":{"icon":"icons/item-augments/repkit-aug-d-increased-healing.webp","description":"[keyword id=\"secondary\"]Overdose[/keyword] - On use, increases all [keyword id=\"secondary\"]Healing[/keyword] received by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-lifesteal":{"icon":"icons/item-augments/repkit-aug-d-lifesteal.webp","description":"[keyword id=\"secondary\"]Leech[/keyword] - On use, grants [keyword id=\"secondary\"] [/keyword]{mod}[keyword id=\"/secondary\"] [/keyword] [keyword id=\"secondary\"]Lifesteal[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-overshield":{"icon":"icons/item-augments/repkit-aug-d-overshield.webp","description":"[keyword id=\"secondary\"]Overshield[/keyword] - On use, rather than [keyword id=\"secondary\"]Healing[/keyword], grants an [keyword id=\"secondary\"]Overshield[/keyword] equal to the [keyword id=\"secondary\"]Repkit's[/keyword] initial [keyword id=\"secondary\"]Heal[/keyword] amount","source":"repkit","type":"defensive"},"repkit-aug-d-shield-recharge":{"icon":"icons/item-augments/repkit-aug-d-shield-recharge.webp","description":"[keyword id=\"secondary\"]Power Cycle[/keyword] - On use, instantly starts [keyword id=\"secondary\"]recharging[/keyword] equipped [keyword id=\"secondary\"]Energy Shield[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-d-turtle":{"icon":"icons/item-augments/repkit-aug-d-turtle.webp","description":"[keyword id=\"secondary\"]Tank[/keyword] - On use, reduces [keyword id=\"secondary\"]Damage Taken[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"defensive"},"repkit-aug-o-amp":{"icon":"icons/item-augments/repkit-aug-o-amp.webp","description":"[keyword id=\"secondary\"]Amp[/keyword] - On use, grants increased [keyword id=\"secondary\"]Damage[/keyword] of the next [keyword id=\"secondary\"]shot[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-elemental-damage":{"icon":"icons/item-augments/repkit-aug-o-elemental-damage.webp","description":"[keyword id=\"secondary\"]Elemental Affinity[/keyword] - On use, grants increased [keyword id=\"secondary\"]Elemental Damage Dealt[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-firerate":{"icon":"icons/item-augments/repkit-aug-o-firerate.webp","description":"[keyword id=\"secondary\"]Fire Rate[/keyword] - On use, grants increased [keyword id=\"secondary\"]Fire Rate[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-melee-damage":{"icon":"icons/item-augments/repkit-aug-o-melee-damage.webp","description":"[keyword id=\"secondary\"]Hard Hitter[/keyword] - On use, grants increased [keyword id=\"secondary\"]Melee Damage Dealt[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-nova-corrosive":{"icon":"icons/item-augments/repkit-aug-o-nova-corrosive.webp","description":"[keyword id=\"secondary\"]Nova[/keyword] - On use, releases a [keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive Nova[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-nova-cryo":{"icon":"icons/item-augments/repkit-aug-o-nova-cryo.webp","description":"[keyword id=\"secondary\"]Nova[/keyword] - On use, releases a [keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo Nova[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-nova-fire":{"icon":"icons/item-augments/repkit-aug-o-nova-fire.webp","description":"[keyword id=\"secondary\"]Nova[/keyword] - On use, releases a [keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary  Nova[/keyword] ","source":"repkit","type":"offensive"},"repkit-aug-o-nova-radiation":{"icon":"icons/item-augments/repkit-aug-o-nova-radiation.webp","description":"[keyword id=\"secondary\"]Nova[/keyword] - On use, releases a [keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation Nova[/keyword] ","source":"repkit","type":"offensive"},"repkit-aug-o-nova-shock":{"icon":"icons/item-augments/repkit-aug-o-nova-shock.webp","description":"[keyword id=\"secondary\"]Nova[/keyword] - On use, releases a [keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock Nova[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-reloadspeed":{"icon":"icons/item-augments/repkit-aug-o-reloadspeed.webp","description":"[keyword id=\"secondary\"]Reload Speed[/keyword] - On use, grants increased [keyword id=\"secondary\"]Reload Speed[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-splash-damage":{"icon":"icons/item-augments/repkit-aug-o-splash-damage.webp","description":"[keyword id=\"secondary\"]Splash Damage[/keyword] - On use, grants increased [keyword id=\"secondary\"]Splash Damage Dealt[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-splat-corrosive":{"icon":"icons/item-augments/repkit-aug-o-splat-corrosive.webp","description":"[keyword id=\"secondary\"]Splat[/keyword] - On use, spawns a [keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Corrosive Splat[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-splat-cryo":{"icon":"icons/item-augments/repkit-aug-o-splat-cryo.webp","description":"[keyword id=\"secondary\"]Splat[/keyword] - On use, spawns a [keyword id=\"cryo_icon\"] [/keyword] [keyword id=\"cryo\"]Cryo Splat[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-splat-fire":{"icon":"icons/item-augments/repkit-aug-o-splat-fire.webp","description":"[keyword id=\"secondary\"]Splat[/keyword] - On use, spawns a [keyword id=\"fire_icon\"] [/keyword] [keyword id=\"fire\"]Incendiary Splat[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-splat-radiation":{"icon":"icons/item-augments/repkit-aug-o-splat-radiation.webp","description":"[keyword id=\"secondary\"]Splat[/keyword] - On use, spawns a [keyword id=\"radiation_icon\"] [/keyword] [keyword id=\"radiation\"]Radiation Splat[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-o-splat-shock":{"icon":"icons/item-augments/repkit-aug-o-splat-shock.webp","description":"[keyword id=\"secondary\"]Splat[/keyword] - On use, spawns a [keyword id=\"shock_icon\"] [/keyword] [keyword id=\"shock\"]Shock Splat[/keyword]","source":"repkit","type":"offensive"},"repkit-aug-u-actionskill-cdr":{"icon":"icons/item-augments/repkit-aug-u-actionskill-cdr.webp","description":"[keyword id=\"secondary\"]Accelerator[/keyword] - On use, grants increased  [keyword id=\"secondary\"]Action Skill Cooldown Rate[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"utility"},"repkit-aug-u-alldmg":{"icon":"icons/item-augments/repkit-aug-u-alldmg.webp","description":"[keyword id=\"secondary\"]Enrage[/keyword] - On use, grants an increase to all [keyword id=\"secondary\"]Damage Dealt[/keyword] by [keyword id=\"secondary\"]{mod1}[/keyword], and all [keyword id=\"secondary\"]Damage Taken[/keyword] by [keyword id=\"secondary\"]{mod2}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"utility"},"repkit-aug-u-gadget-cdr":{"icon":"icons/item-augments/repkit-aug-u-gadget-cdr.webp","description":"[keyword id=\"secondary\"]Go Go Gadget[/keyword] - On use, grants increased [keyword id=\"secondary\"]Ordnance Cooldown Rate[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"utility"},"repkit-aug-u-movespeed":{"icon":"icons/item-augments/repkit-aug-u-movespeed.webp","description":"[keyword id=\"secondary\"]Speed[/keyword] - On use, grants increased [keyword id=\"secondary\"]Movement Speed[/keyword] by [keyword id=\"secondary\"]{mod}[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"repkit","type":"utility"},"repkit-aug-u-repkit-cdr":{"icon":"icons/item-augments/repkit-aug-u-repkit-cdr.webp","description":"[keyword id=\"secondary\"]Repkit Cooling[/keyword] - The [keyword id=\"secondary\"]Repkit's Cooldown Duration[/keyword] is reduced by [keyword id=\"secondary\"]{mod}[/keyword]","source":"repkit","type":"utility"},"repkit-aug-u-repkit-duration":{"icon":"icons/item-augments/repkit-aug-u-repkit-duration.webp","description":"[keyword id=\"secondary\"]Everlasting[/keyword] - The [keyword id=\"secondary\"]Repkit's Healing Capacity[/keyword] and [keyword id=\"secondary\"]Duration[/keyword] are increased by [keyword id=\"secondary\"]{mod1}[/keyword]","source":"repkit","type":"utility"},"repkit-charges":{"icon":"icons/item-augments/repkit-charges.webp","description":"[keyword id=\"order_icon\"] [/keyword] [keyword id=\"secondary\"]Order[/keyword] - This Repkit has [keyword id=\"secondary\"]{mod}[/keyword] Charges","source":"repkit","type":"utility","manufacturerId":"order"},"shieldaug-eng-amp":{"icon":"icons/item-augments/shieldaug-eng-amp.webp","description":"[keyword id=\"secondary\"]Amp[/keyword] - When [keyword id=\"secondary\"]Energy Shields[/keyword] are [keyword id=\"secondary\"]full[/keyword], shots drain [keyword id=\"secondary\"]{mod1}[/keyword] of those [keyword id=\"secondary\"]Shields[/keyword] for [keyword id=\"secondary\"]{mod2} Gun Damage[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-berserker":{"icon":"icons/item-augments/shieldaug-eng-berserker.webp","description":"[keyword id=\"secondary\"]Berserker[/keyword] - When [keyword id=\"secondary\"]Energy Shields[/keyword] are empty, grants [keyword id=\"secondary\"]{mod1} Melee Damage[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-brimming":{"icon":"icons/item-augments/shieldaug-eng-brimming.webp","description":"[keyword id=\"secondary\"]Brimming[/keyword] - When [keyword id=\"secondary\"]Energy Shields[/keyword] are full, [keyword id=\"secondary\"]regenerates {mod1} Health/s[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-fleeting":{"icon":"icons/item-augments/shieldaug-eng-fleeting.webp","description":"[keyword id=\"secondary\"]Fleeting[/keyword] - When [keyword id=\"secondary\"]Energy Shields[/keyword] are empty, grants [keyword id=\"secondary\"]{mod1} Movement Speed[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-nova":{"icon":"icons/item-augments/shieldaug-eng-nova.webp","description":"[keyword id=\"secondary\"]Nova[/keyword] - When [keyword id=\"secondary\"]Energy Shield[/keyword] breaks, triggers a [keyword id=\"secondary\"]Nova[/keyword] that deals [keyword id=\"secondary\"]{mod1} Damage[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-recharge-delay":{"icon":"icons/item-augments/shieldaug-eng-recharge-delay.webp","description":"[keyword id=\"secondary\"]Recharge Delay[/keyword] - When equipped, grants [keyword id=\"secondary\"]{mod1} Shield Recharge Delay[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-recharge-rate":{"icon":"icons/item-augments/shieldaug-eng-recharge-rate.webp","description":"[keyword id=\"secondary\"]Recharge Rate[/keyword] - When equipped, grants [keyword id=\"secondary\"]{mod1} Shield Recharge Rate[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-shield-booster":{"icon":"icons/item-augments/shieldaug-eng-shield-booster.webp","description":"[keyword id=\"secondary\"]Shield Booster[/keyword] - When damaged, [keyword id=\"secondary\"]{mod1}[/keyword] chance to spawn a [keyword id=\"secondary\"]Shield Booster[/keyword] that [keyword id=\"secondary\"]refills[/keyword] up to [keyword id=\"secondary\"]{mod2}[/keyword] of [keyword id=\"secondary\"]Shield Capacity[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-siphon":{"icon":"icons/item-augments/shieldaug-eng-siphon.webp","description":"[keyword id=\"secondary\"]Siphon[/keyword] - When dealing [keyword id=\"secondary\"]Damage[/keyword], [keyword id=\"secondary\"]{mod1}[/keyword] chance to grant [keyword id=\"secondary\"]{mod2} Overshield[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-trigger-happy":{"icon":"icons/item-augments/shieldaug-eng-trigger-happy.webp","description":"[keyword id=\"secondary\"]Trigger Happy[/keyword] - When [keyword id=\"secondary\"]Energy Shields[/keyword] are empty, grants [keyword id=\"secondary\"]{mod1} Fire Rate[/keyword] and [keyword id=\"secondary\"]{mod2} Reload Speed[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-eng-vagabond":{"icon":"icons/item-augments/shieldaug-eng-vagabond.webp","description":"[keyword id=\"secondary\"]Vagabond[/keyword] - When [keyword id=\"secondary\"]Energy Shields[/keyword] are full, grants [keyword id=\"secondary\"]{mod1} Movement Speed[/keyword]","source":"shield","type":"energy-shield"},"shieldaug-ra-armor-segment":{"icon":"icons/item-augments/shieldaug-ra-armor-segment.webp","description":"[keyword id=\"secondary\"]Armor Segment[/keyword] - Grants [keyword id=\"secondary\"]{mod1} Armor Segment(s)[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-armor-strength":{"icon":"icons/item-augments/shieldaug-ra-armor-strength.webp","description":"[keyword id=\"secondary\"]Armor Strength[/keyword] - When [keyword id=\"secondary\"]Armor Shield[/keyword] is active, grants [keyword id=\"secondary\"]{mod1} Damage Reduction[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-bladed":{"icon":"icons/item-augments/shieldaug-ra-bladed.webp","description":"[keyword id=\"secondary\"]Bladed[/keyword] - On [keyword id=\"secondary\"]Armor Segment[/keyword] filled, grants [keyword id=\"secondary\"]{mod1} Gun Damage[/keyword] for [keyword id=\"secondary\"]{mod2}s[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-boxer":{"icon":"icons/item-augments/shieldaug-ra-boxer.webp","description":"[keyword id=\"secondary\"]Boxer[/keyword] - On [keyword id=\"secondary\"]Melee Hit[/keyword], consumes an [keyword id=\"secondary\"]Armor Segment[/keyword] to increase the [keyword id=\"secondary\"]Damage Dealt[/keyword] by [keyword id=\"secondary\"]{mod1}[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-flanking":{"icon":"icons/item-augments/shieldaug-ra-flanking.webp","description":"[keyword id=\"secondary\"]Flanking[/keyword] - Grants up to [keyword id=\"secondary\"]{mod1} Movement Speed[/keyword], scaling with broken [keyword id=\"secondary\"]Armor Segments[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-heavy-plating":{"icon":"icons/item-augments/shieldaug-ra-heavy-plating.webp","description":"[keyword id=\"secondary\"]Heavy Plating[/keyword] - Grants up to [keyword id=\"secondary\"]{mod1} Damage Reduction[/keyword], scaling with broken [keyword id=\"secondary\"]Armor Segments[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-knockback":{"icon":"icons/item-augments/shieldaug-ra-knockback.webp","description":"[keyword id=\"secondary\"]Knockback[/keyword] - On [keyword id=\"secondary\"]Armor Segment[/keyword] break, [keyword id=\"secondary\"]knocks back enemies[/keyword], and grants [keyword id=\"secondary\"]{mod1} Movement Speed[/keyword] for [keyword id=\"secondary\"]5s[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-mini-nova":{"icon":"icons/item-augments/shieldaug-ra-mini-nova.webp","description":"[keyword id=\"secondary\"]Mini Nova[/keyword] - On [keyword id=\"secondary\"]Armor Segment[/keyword] break, triggers a [keyword id=\"secondary\"]Nova[/keyword] that deals [keyword id=\"secondary\"]{mod1} Damage[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-missile-swarm":{"icon":"icons/item-augments/shieldaug-ra-missile-swarm.webp","description":"[keyword id=\"secondary\"]Missile Swarm[/keyword] - On [keyword id=\"secondary\"]Armor Segment[/keyword] break, launches [keyword id=\"secondary\"]{mod2} Missiles[/keyword], each dealing [keyword id=\"secondary\"]{mod1} Damage[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-positive-reinforcement":{"icon":"icons/item-augments/shieldaug-ra-positive-reinforcement.webp","description":"[keyword id=\"secondary\"]Positive Reinforcement[/keyword] - On kill, [keyword id=\"secondary\"]{mod1}[/keyword] Chance for [keyword id=\"secondary\"]enemies[/keyword] to drop an [keyword id=\"secondary\"]Armor Shard[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-reinforced":{"icon":"icons/item-augments/shieldaug-ra-reinforced.webp","description":"[keyword id=\"secondary\"]Reinforced[/keyword] - On [keyword id=\"secondary\"]Armor Segment[/keyword] filled, grants [keyword id=\"secondary\"]{mod1} Overshield[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-scavenger":{"icon":"icons/item-augments/shieldaug-ra-scavenger.webp","description":"[keyword id=\"secondary\"]Scavenger[/keyword] - On [keyword id=\"secondary\"]Armor Segment[/keyword] filled, refills up to [keyword id=\"secondary\"]{mod1}[/keyword] of current [keyword id=\"secondary\"]Gun's Magazine[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-ra-spunky":{"icon":"icons/item-augments/shieldaug-ra-spunky.webp","description":"[keyword id=\"secondary\"]Spunky[/keyword] - Grants up to [keyword id=\"secondary\"]{mod1} Damage Dealt[/keyword], scaling with broken [keyword id=\"secondary\"]Armor Segments[/keyword]","source":"shield","type":"armor-shield"},"shieldaug-unv-absorb":{"icon":"icons/item-augments/shieldaug-unv-absorb.webp","description":"[keyword id=\"secondary\"]Absorb[/keyword] - When equipped, grants [keyword id=\"secondary\"]{mod1}[/keyword] Chance to [keyword id=\"secondary\"]absorb[/keyword] bullets, adding them to your [keyword id=\"secondary\"]Ammo[/keyword] count instead","source":"shield","type":"universal"},"shieldaug-unv-adaptive":{"icon":"icons/item-augments/shieldaug-unv-adaptive.webp","description":"[keyword id=\"secondary\"]Adaptive[/keyword] - When equipped, grants [keyword id=\"secondary\"]{mod3} Maximum Health[/keyword].  When [keyword id=\"secondary\"]Shield[/keyword] is active, grants [keyword id=\"secondary\"]{mod1} Resistance[/keyword] to the last [keyword id=\"secondary\"]Damage type[/keyword] received for [keyword id=\"secondary\"]{mod2}s[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-capacity":{"icon":"icons/item-augments/shieldaug-unv-capacity.webp","description":"[keyword id=\"secondary\"]Capacity[/keyword] - When equipped, grants [keyword id=\"secondary\"]{mod1} Shield Capacity[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-evasive":{"icon":"icons/item-augments/shieldaug-unv-evasive.webp","description":"[keyword id=\"secondary\"]Evasive[/keyword] - When damaging [keyword id=\"secondary\"]enemies[/keyword], [keyword id=\"secondary\"]{mod1}[/keyword] Chance to grant [keyword id=\"secondary\"]{mod2} Movement Speed[/keyword] for [keyword id=\"secondary\"]5s[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-health-booster":{"icon":"icons/item-augments/shieldaug-unv-health-booster.webp","description":"[keyword id=\"secondary\"]Health Booster[/keyword] - When damaged, [keyword id=\"secondary\"]{mod1}[/keyword] Chance to spawn a [keyword id=\"secondary\"]Health Booster[/keyword] that restores up to [keyword id=\"secondary\"]{mod2} Health[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-healthy":{"icon":"icons/item-augments/shieldaug-unv-healthy.webp","description":"[keyword id=\"secondary\"]Healthy[/keyword] - When equipped, grants [keyword id=\"secondary\"]{mod1} Maximum Health[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-mag-booster":{"icon":"icons/item-augments/shieldaug-unv-mag-booster.webp","description":"[keyword id=\"secondary\"]Magazine Booster[/keyword] - On kill, [keyword id=\"secondary\"]{mod1}[/keyword] Chance to spawn a [keyword id=\"secondary\"]Magazine Booster[/keyword] that instantly [keyword id=\"secondary\"]refills[/keyword] your [keyword id=\"secondary\"]Gun[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-overshield-booster":{"icon":"icons/item-augments/shieldaug-unv-overshield-booster.webp","description":"[keyword id=\"secondary\"]Overshield Booster[/keyword] - On kill, [keyword id=\"secondary\"]{mod1}[/keyword] Chance to spawn an [keyword id=\"secondary\"]Overshield Booster[/keyword] that grants [keyword id=\"secondary\"]{mod2} Overshield[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-pinpoint":{"icon":"icons/item-augments/shieldaug-unv-pinpoint.webp","description":"[keyword id=\"secondary\"]Pinpoint[/keyword] - When [keyword id=\"secondary\"]Shield[/keyword] is empty, grants [keyword id=\"secondary\"]{mod1} Accuracy[/keyword], [keyword id=\"secondary\"]{mod2} Gun Handling[/keyword], and [keyword id=\"secondary\"]{mod3} Projectile Speed[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-power-booster":{"icon":"icons/item-augments/shieldaug-unv-power-booster.webp","description":"[keyword id=\"secondary\"]Power Booster[/keyword] - When damaged,  [keyword id=\"secondary\"]{mod1}[/keyword] Chance to spawn a [keyword id=\"secondary\"]Power Booster[/keyword] that grants [keyword id=\"secondary\"]{mod2} Gun Damage[/keyword] for [keyword id=\"secondary\"]5s[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-reflect":{"icon":"icons/item-augments/shieldaug-unv-reflect.webp","description":"[keyword id=\"secondary\"]Reflect[/keyword] - When [keyword id=\"secondary\"]Shield[/keyword] is active, [keyword id=\"secondary\"]{mod1}[/keyword] Chance to [keyword id=\"secondary\"]reflect Projectiles[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-resistant":{"icon":"icons/item-augments/shieldaug-unv-resistant.webp","description":"[keyword id=\"secondary\"]Resistant[/keyword] - When [keyword id=\"secondary\"]Shield[/keyword] is active, grants [keyword id=\"secondary\"]{mod1} Resistance[/keyword] to [keyword id=\"secondary\"]Elemental Damage[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-spike":{"icon":"icons/item-augments/shieldaug-unv-spike.webp","description":"[keyword id=\"secondary\"]Spike[/keyword] - When receiving [keyword id=\"secondary\"]Melee Damage[/keyword] while [keyword id=\"secondary\"]Shield[/keyword] is active, [keyword id=\"secondary\"]{mod1} Damage[/keyword] is [keyword id=\"secondary\"]reflected[/keyword] back to [keyword id=\"secondary\"]enemies[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-sturdy":{"icon":"icons/item-augments/shieldaug-unv-sturdy.webp","description":"[keyword id=\"secondary\"]Sturdy[/keyword] - When damaging [keyword id=\"secondary\"]enemies[/keyword], [keyword id=\"secondary\"]{mod1}[/keyword] Chance to grant [keyword id=\"secondary\"]{mod2} Damage Reduction[/keyword] for [keyword id=\"secondary\"]5s[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-turtle":{"icon":"icons/item-augments/shieldaug-unv-turtle.webp","description":"[keyword id=\"secondary\"]Turtle[/keyword] - When equipped, grants [keyword id=\"secondary\"]{mod1} Shield Capacity[/keyword] and [keyword id=\"secondary\"]{mod2} Maximum Health[/keyword]","source":"shield","type":"universal"},"shieldaug-unv-utility":{"icon":"icons/item-augments/shieldaug-unv-utility.webp","description":"[keyword id=\"secondary\"]Utility[/keyword] - When [keyword id=\"secondary\"]Shield[/keyword] is empty, grants [keyword id=\"secondary\"]{mod1} Gun Handling[/keyword] and [keyword id=\"secondary\"]{mod2} Movement Speed[/keyword]","source":"shield","type":"universal"},"ub-bor-sg-01":{"icon":"icons/item-augments/ub-bor-sg-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Lightning Beam[/keyword] - Fires a [keyword id=\"shock\"]Beam[/keyword] that deals [keyword id=\"shock\"]{damage} Shock Damage/s[/keyword] and can [keyword id=\"secondary\"]chain[/keyword] to an additional [keyword id=\"secondary\"]target[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"borg"},"ub-bor-sg-02":{"icon":"icons/item-augments/ub-bor-sg-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Gauss Gun[/keyword] - Charge-fires a [keyword id=\"secondary\"]Projectile[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"borg"},"ub-bor-sg-03":{"icon":"icons/item-augments/ub-bor-sg-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Fuel Rod Discharge[/keyword] - Fires a spent [keyword id=\"radiation\"]Fuel Rod[/keyword] that [keyword id=\"secondary\"]explodes[/keyword] after [keyword id=\"secondary\"]3s[/keyword] and deals [keyword id=\"radiation\"]{damage} Radiation Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"borg"},"ub-bor-sm-01":{"icon":"icons/item-augments/ub-bor-sm-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Shrapnel Cannon[/keyword] - Fires [keyword id=\"secondary\"]shrapnel[/keyword] that deals [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"borg"},"ub-bor-sm-02":{"icon":"icons/item-augments/ub-bor-sm-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Ripper Rocket Launcher[/keyword] - Launches [keyword id=\"secondary\"]bursts[/keyword] of [keyword id=\"secondary\"]6 Rockets[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"borg"},"ub-bor-sm-03":{"icon":"icons/item-augments/ub-bor-sm-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Gas Trap[/keyword] - Fires a [keyword id=\"secondary\"]Projectile[/keyword] that [keyword id=\"secondary\"]explodes[/keyword], causing a [keyword id=\"secondary\"]cloud[/keyword] of [keyword id=\"nowrap\"] [/keyword][keyword id=\"corrosive_icon\"] [/keyword] [keyword id=\"corrosive\"]Noxious Gas[/keyword][keyword id=\"/nowrap\"] [/keyword] that deals [keyword id=\"corrosive\"]{damage} Corrosive Damage[/keyword] to [keyword id=\"secondary\"]enemies[/keyword] over time","source":"gun","type":"underbarrel","manufacturerId":"borg"},"ub-bor-sr-01":{"icon":"icons/item-augments/ub-bor-sr-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Gravity Trap[/keyword] - Fires a [keyword id=\"secondary\"]Singularity[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword], and [keyword id=\"secondary\"]pulls in[/keyword] nearby enemies","source":"gun","type":"underbarrel","manufacturerId":"borg"},"ub-bor-sr-02":{"icon":"icons/item-augments/ub-bor-sr-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Seeker Missiles[/keyword] - Fires [keyword id=\"secondary\"]Missiles[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"borg"},"ub-bor-sr-03":{"icon":"icons/item-augments/ub-bor-sr-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Target Marker[/keyword] - Fires a [keyword id=\"secondary\"]Marker[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword], [keyword id=\"secondary\"]Marking[/keyword] the enemy to receive an additional [keyword id=\"secondary\"]{dmg_pct} Damage[/keyword] for [keyword id=\"secondary\"]{duration}s[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"borg"},"ub-dad-ar-01":{"icon":"icons/item-augments/ub-dad-ar-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Grenade Launcher[/keyword] - Launches a [keyword id=\"secondary\"]Grenade[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"daedalus"},"ub-dad-ar-02":{"icon":"icons/item-augments/ub-dad-ar-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Shotgun[/keyword] - Fires a [keyword id=\"secondary\"]Shotgun[/keyword], dealing [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-dad-ar-03":{"icon":"icons/item-augments/ub-dad-ar-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Micro-Rocket POD[/keyword] - Fires a [keyword id=\"secondary\"]Rocket[/keyword], dealing [keyword id=\"secondary\"]{damage} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"daedalus"},"ub-dad-ps-01":{"icon":"icons/item-augments/ub-dad-ps-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Taser[/keyword] - Fires a [keyword id=\"shock\"]Taser Dart[/keyword] that deals [keyword id=\"shock\"]{damage} Damage/s[/keyword] to a nearby [keyword id=\"secondary\"]enemy[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"daedalus"},"ub-dad-ps-02":{"icon":"icons/item-augments/ub-dad-ps-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Tactical Knife Launcher[/keyword] - Fires a [keyword id=\"secondary\"]Knife[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"daedalus"},"ub-dad-ps-03":{"icon":"icons/item-augments/ub-dad-ps-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Demolition Charge[/keyword] - Fires [keyword id=\"secondary\"]timed explosives[/keyword], each dealing [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"daedalus"},"ub-dad-sg-01":{"icon":"icons/item-augments/ub-dad-sg-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Micro-Rocket POD[/keyword] - Fires a [keyword id=\"secondary\"]Rocket[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"daedalus"},"ub-dad-sg-02":{"icon":"icons/item-augments/ub-dad-sg-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Gravity Harpoon[/keyword] - Fires a [keyword id=\"secondary\"]Harpoon[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"daedalus"},"ub-dad-sg-03":{"icon":"icons/item-augments/ub-dad-sg-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Proxy Mine Launcher[/keyword] - Launches a [keyword id=\"secondary\"]Mine[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-dad-sm-01":{"icon":"icons/item-augments/ub-dad-sm-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Grenade Launcher[/keyword] - Launches a [keyword id=\"secondary\"]Grenade[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-dad-sm-02":{"icon":"icons/item-augments/ub-dad-sm-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Shotgun[/keyword] - Fires a [keyword id=\"secondary\"]Shotgun[/keyword] that deals [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-dad-sm-03":{"icon":"icons/item-augments/ub-dad-sm-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Overcharge[/keyword] - Increases [keyword id=\"secondary\"]Burst Count[/keyword] to [keyword id=\"secondary\"]6[/keyword] and [keyword id=\"secondary\"]Fire Rate[/keyword] to [keyword id=\"secondary\"]{firerate}[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"daedalus"},"ub-jak-ar-01":{"icon":"icons/item-augments/ub-jak-ar-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Double Flintlocks[/keyword] - Fires twin [keyword id=\"secondary\"]Musket Barrels[/keyword] that deal [keyword id=\"secondary\"]{damage}x2 Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-ar-02":{"icon":"icons/item-augments/ub-jak-ar-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Hand Crank[/keyword] - Use a [keyword id=\"secondary\"]hand crank[/keyword] to fire [keyword id=\"secondary\"]Full Auto[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-ar-03":{"icon":"icons/item-augments/ub-jak-ar-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Underbarrel Shotgun[/keyword] - Fires a [keyword id=\"secondary\"]Shotgun[/keyword] that deal [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-ps-01":{"icon":"icons/item-augments/ub-jak-ps-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Zip Rockets[/keyword] - Fires [keyword id=\"secondary\"]Zip Rockets[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-ps-02":{"icon":"icons/item-augments/ub-jak-ps-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Knife Launcher[/keyword] - Launches a [keyword id=\"secondary\"]Knife[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-ps-03":{"icon":"icons/item-augments/ub-jak-ps-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Vial Launcher[/keyword] - Launches a [keyword id=\"corrosive\"]Corrosive Vial[/keyword] that deals [keyword id=\"corrosive\"]{damage} Corrosive Damage[/keyword] on impact and increases the [keyword id=\"secondary\"]target's Damage Taken[/keyword] by [keyword id=\"secondary\"]{dmgpct}[/keyword] for [keyword id=\"secondary\"]6s[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-sg-01":{"icon":"icons/item-augments/ub-jak-sg-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Knife Launcher[/keyword] - Fires a [keyword id=\"secondary\"]Knife[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-sg-02":{"icon":"icons/item-augments/ub-jak-sg-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Gravity Harpoon[/keyword] - Fires a [keyword id=\"secondary\"]Gravity Harpoon[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword] and pulls in nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-sg-03":{"icon":"icons/item-augments/ub-jak-sg-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Spread Launcher[/keyword] - Fires a spread of [keyword id=\"secondary\"]Grenades[/keyword] that deal [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-sr-01":{"icon":"icons/item-augments/ub-jak-sr-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Shotgun[/keyword] - Fires a [keyword id=\"secondary\"]Shotgun[/keyword] that deals [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-sr-02":{"icon":"icons/item-augments/ub-jak-sr-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Big Rocket[/keyword] - Fires a large [keyword id=\"secondary\"]Rocket[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-jak-sr-03":{"icon":"icons/item-augments/ub-jak-sr-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Crank SMG[/keyword] - Crank-fires a [keyword id=\"secondary\"]SMG[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"jakobs"},"ub-mal-sg-01":{"icon":"icons/item-augments/ub-mal-sg-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Energy Blast[/keyword] - Charge-fires a wide-angled [keyword id=\"secondary\"]Blast[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"maliwan"},"ub-mal-sg-02":{"icon":"icons/item-augments/ub-mal-sg-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Energy Disc[/keyword] - Launches a [keyword id=\"secondary\"]bouncing Energy Disc[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword] per bounce","source":"gun","type":"underbarrel","manufacturerId":"maliwan"},"ub-mal-sg-03":{"icon":"icons/item-augments/ub-mal-sg-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Beam Tosser[/keyword] - Launches a [keyword id=\"secondary\"]Projectile[/keyword] that fires [keyword id=\"secondary\"]3 Beams[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"maliwan"},"ub-mal-sm-01":{"icon":"icons/item-augments/ub-mal-sm-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Laser Wire[/keyword] - Spawns a [keyword id=\"secondary\"]Laser Wire[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage/s[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"maliwan"},"ub-mal-sm-02":{"icon":"icons/item-augments/ub-mal-sm-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Energy Discharge[/keyword] - Charge-fires a [keyword id=\"secondary\"]Blast[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"maliwan"},"ub-mal-sm-03":{"icon":"icons/item-augments/ub-mal-sm-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Railgun[/keyword] - Charge-fires a [keyword id=\"secondary\"]piercing Railgun[/keyword] shot that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"maliwan"},"ub-mal-sr-01":{"icon":"icons/item-augments/ub-mal-sr-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Singularity Grenade Launcher[/keyword] - Fires a [keyword id=\"secondary\"]Singularity[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage/s[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"maliwan"},"ub-mal-sr-02":{"icon":"icons/item-augments/ub-mal-sr-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Shock Field[/keyword] - On impact, creates a [keyword id=\"shock\"]Shock Field[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage/s[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"maliwan"},"ub-mal-sr-03":{"icon":"icons/item-augments/ub-mal-sr-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Rocket Pod[/keyword] - Fires a [keyword id=\"secondary\"]salvo[/keyword] of [keyword id=\"secondary\"]Homing Rockets[/keyword] that deal [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"maliwan"},"ub-ord-ar-01":{"icon":"icons/item-augments/ub-ord-ar-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Seeker Missiles[/keyword] - [keyword id=\"secondary\"]Charge[/keyword] to fire up to [keyword id=\"secondary\"]4 Seeker Missiles[/keyword] each dealing [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"order"},"ub-ord-ar-02":{"icon":"icons/item-augments/ub-ord-ar-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Death Sphere[/keyword] - Launches a [keyword id=\"secondary\"]Death Sphere[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage/s[/keyword] to nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"order"},"ub-ord-ar-03":{"icon":"icons/item-augments/ub-ord-ar-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Kill Drone[/keyword] - Launches a [keyword id=\"secondary\"]Drone[/keyword] that fires at [keyword id=\"secondary\"]enemies[/keyword] for [keyword id=\"secondary\"]{damage} Damage[/keyword] per shot, before [keyword id=\"secondary\"]exploding[/keyword] for [keyword id=\"secondary\"]{explode} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"order"},"ub-ord-ps-01":{"icon":"icons/item-augments/ub-ord-ps-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Energy Burst[/keyword] - Charge-fires an [keyword id=\"secondary\"]Energy Burst[/keyword], that deals up to [keyword id=\"secondary\"]{damage} Damage[/keyword] to nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"order"},"ub-ord-ps-02":{"icon":"icons/item-augments/ub-ord-ps-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Gravity Well[/keyword] - Charge-fires a [keyword id=\"secondary\"]Gravity Well[/keyword] that deals up to [keyword id=\"secondary\"]{damage} Damage[/keyword] and pulls in nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"order"},"ub-ord-ps-03":{"icon":"icons/item-augments/ub-ord-ps-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Micro-Rockets[/keyword] - Charge-fires up to [keyword id=\"secondary\"]{ammo} Micro-Rockets[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"order"},"ub-ord-sr-01":{"icon":"icons/item-augments/ub-ord-sr-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Ordonite Spike[/keyword] - Launches a [keyword id=\"secondary\"]Spike[/keyword] that drains [keyword id=\"secondary\"]power[/keyword] from nearby enemies before exploding for up to [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"order"},"ub-ord-sr-02":{"icon":"icons/item-augments/ub-ord-sr-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Tether Snare[/keyword] - Fires a [keyword id=\"secondary\"]Tether[/keyword] that creates [keyword id=\"secondary\"]Beams[/keyword] between all other [keyword id=\"secondary\"]Tethers[/keyword], dealing [keyword id=\"secondary\"]{damage} Damage/s[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"order"},"ub-ord-sr-03":{"icon":"icons/item-augments/ub-ord-sr-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Railgun[/keyword] - Charge-fires dual [keyword id=\"secondary\"]Railguns[/keyword] that deal [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"order"},"ub-ted-ar-01":{"icon":"icons/item-augments/ub-ted-ar-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Support Drone[/keyword] - Launches a [keyword id=\"secondary\"]Support Drone[/keyword] that will [keyword id=\"secondary\"]Heal {damage}/s[/keyword] and grants [keyword id=\"secondary\"]+20% Damage, Movement Speed[/keyword] and [keyword id=\"secondary\"]Reload Rate[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"tediore"},"ub-ted-ar-02":{"icon":"icons/item-augments/ub-ted-ar-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"] C.O.M.B.O.[/keyword] - Fires an [keyword id=\"secondary\"]Orb[/keyword] that can be shot to deal [keyword id=\"secondary\"]{damage} Damage[/keyword] to nearby [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"tediore"},"ub-ted-ar-03":{"icon":"icons/item-augments/ub-ted-ar-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Shotgun[/keyword] - Fires a [keyword id=\"secondary\"]Shotgun[/keyword] that deals [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"tediore"},"ub-ted-ps-01":{"icon":"icons/item-augments/ub-ted-ps-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Attack Drone[/keyword] - Launches a [keyword id=\"secondary\"]Drone[/keyword] that [keyword id=\"secondary\"]homes in[/keyword] on a nearby [keyword id=\"secondary\"]enemy[/keyword], exploding for [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"tediore"},"ub-ted-ps-02":{"icon":"icons/item-augments/ub-ted-ps-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Zip Rockets[/keyword] - Launches [keyword id=\"secondary\"]Zip Rockets[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-ted-ps-03":{"icon":"icons/item-augments/ub-ted-ps-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Micro-Shotgun[/keyword] - Fires a [keyword id=\"secondary\"]Shotgun[/keyword] that deals [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-ted-sg-01":{"icon":"icons/item-augments/ub-ted-sg-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Digital Backup[/keyword] - Deploys a [keyword id=\"primary\"] [/keyword]Tediore[keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Assault Rifle[/keyword] with legs that fires at [keyword id=\"secondary\"]enemies[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"tediore"},"ub-ted-sg-02":{"icon":"icons/item-augments/ub-ted-sg-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Proximity Mines[/keyword] - Fires [keyword id=\"secondary\"]Proximity Mines[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"tediore"},"ub-ted-sg-03":{"icon":"icons/item-augments/ub-ted-sg-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Deployable Barrier[/keyword] - Deploys a [keyword id=\"secondary\"]Shield[/keyword] that [keyword id=\"secondary\"]blocks[/keyword] incoming [keyword id=\"secondary\"]Projectiles[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"tediore"},"ub-tor-ar-01":{"icon":"icons/item-augments/ub-tor-ar-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]MIRV Grenade Launcher[/keyword] - Launches a [keyword id=\"secondary\"]MIRV Grenade[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"torgue"},"ub-tor-ar-02":{"icon":"icons/item-augments/ub-tor-ar-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Sticky Shotgun[/keyword] - Fires a [keyword id=\"secondary\"]Sticky Shotgun[/keyword] that deal [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"torgue"},"ub-tor-ar-03":{"icon":"icons/item-augments/ub-tor-ar-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Airstrike[/keyword] - [keyword id=\"secondary\"]Mark[/keyword] an area to call in an [keyword id=\"secondary\"]Airstrike[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"torgue"},"ub-tor-ps-01":{"icon":"icons/item-augments/ub-tor-ps-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Magnum Rockets[/keyword] - Fires a [keyword id=\"secondary\"]Rocket[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"torgue"},"ub-tor-ps-02":{"icon":"icons/item-augments/ub-tor-ps-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Exhaust Blast[/keyword] - Releases a [keyword id=\"secondary\"]Blast[/keyword] on nearby [keyword id=\"secondary\"]enemies[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"torgue"},"ub-tor-ps-03":{"icon":"icons/item-augments/ub-tor-ps-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Turbine Cleaver[/keyword] - Fires a [keyword id=\"secondary\"]piercing Cleaver[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"torgue"},"ub-tor-sg-01":{"icon":"icons/item-augments/ub-tor-sg-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Seeker Missiles[/keyword] - Launches [keyword id=\"secondary\"]Homing Missiles[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"torgue"},"ub-tor-sg-02":{"icon":"icons/item-augments/ub-tor-sg-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Flame Blast[/keyword] - Fires an [keyword id=\"fire\"]Incendiary Blast[/keyword] that deals [keyword id=\"fire\"]{damage} Damage/s[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"torgue"},"ub-tor-sg-03":{"icon":"icons/item-augments/ub-tor-sg-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Rolling Thunder Grenades[/keyword] - Fires [keyword id=\"secondary\"]Grenades[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"torgue"},"ub-vla-ar-01":{"icon":"icons/item-augments/ub-vla-ar-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Grenade Launcher[/keyword] - Launches a [keyword id=\"secondary\"]Grenade[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-ar-02":{"icon":"icons/item-augments/ub-vla-ar-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Shotgun[/keyword] - Fires a [keyword id=\"secondary\"]Shotgun[/keyword] that deals [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-ar-03":{"icon":"icons/item-augments/ub-vla-ar-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Bipod[/keyword] - Enabling the [keyword id=\"secondary\"]Bipod[/keyword] increases [keyword id=\"secondary\"]Accuracy[/keyword] by [keyword id=\"secondary\"]+75%[/keyword], but decreases [keyword id=\"secondary\"]Movement Speed[/keyword] by [keyword id=\"secondary\"]-50%[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-ar-03-acc":{"icon":"icons/item-augments/ub-vla-ar-03-acc.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Motile Bipod[/keyword] - Enabling the [keyword id=\"secondary\"]Bipod[/keyword] increases [keyword id=\"secondary\"]Accuracy[/keyword] without decreasing [keyword id=\"secondary\"]Movement Speed[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-ar-07":{"icon":"icons/item-augments/ub-vla-ar-07.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Extra Barrel[/keyword] - Enables a [keyword id=\"secondary\"]secondary Barrel[/keyword], increasing [keyword id=\"secondary\"]Fire Rate[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-sm-01":{"icon":"icons/item-augments/ub-vla-sm-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Zip Rockets[/keyword] - Fires [keyword id=\"secondary\"]Zip Rockets[/keyword] that deal [keyword id=\"secondary\"]{damage} Damage[/keyword] each","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-sm-02":{"icon":"icons/item-augments/ub-vla-sm-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Taser[/keyword] - Fires a [keyword id=\"shock\"]Taser[/keyword] that damages a nearby [keyword id=\"secondary\"]enemy[/keyword] for [keyword id=\"shock\"]{damage} Damage/s[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-sm-03":{"icon":"icons/item-augments/ub-vla-sm-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Flamethrower[/keyword] - Fires a [keyword id=\"fire\"]Flamethrower[/keyword] that deals [keyword id=\"fire\"]{damage} Damage/s[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-sm-07":{"icon":"icons/item-augments/ub-vla-sm-07.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Extra Barrel[/keyword] - Enables a [keyword id=\"secondary\"]Secondary Barrel[/keyword], increasing [keyword id=\"secondary\"]Fire Rate[/keyword] by [keyword id=\"secondary\"]{rate}[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-sr-01":{"icon":"icons/item-augments/ub-vla-sr-01.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Shotgun[/keyword] - Fires a [keyword id=\"secondary\"]Shotgun[/keyword] that deals [keyword id=\"secondary\"]{damage}x{projectiles} Damage[/keyword] per shot","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-sr-02":{"icon":"icons/item-augments/ub-vla-sr-02.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Big Rocket[/keyword] - Fires a [keyword id=\"secondary\"]Rocket[/keyword] that deals [keyword id=\"secondary\"]{damage} Damage[/keyword] on impact","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-sr-03":{"icon":"icons/item-augments/ub-vla-sr-03.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Bipod[/keyword] - Enabling the [keyword id=\"secondary\"]Bipod[/keyword] increases [keyword id=\"secondary\"]Accuracy[/keyword] by [keyword id=\"secondary\"]+75%[/keyword], but decreases [keyword id=\"secondary\"]Movement Speed[/keyword] by [keyword id=\"secondary\"]-50%[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-sr-03-acc":{"icon":"icons/item-augments/ub-vla-sr-03-acc.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Motile Bipod[/keyword] - Enabling the [keyword id=\"secondary\"]Bipod[/keyword] increases [keyword id=\"secondary\"]Accuracy[/keyword] by [keyword id=\"secondary\"]+75%[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"},"ub-vla-sr-07":{"icon":"icons/item-augments/ub-vla-sr-07.webp","description":"[keyword id=\"primary\"] [/keyword][Alt Fire][keyword id=\"/primary\"] [/keyword] [keyword id=\"secondary\"]Extra Barrel[/keyword] - Enables a [keyword id=\"secondary\"]Third Barrel[/keyword], increasing [keyword id=\"secondary\"]Fire Rate[/keyword]","source":"gun","type":"underbarrel","manufacturerId":"vladof"}}};
+export const manufacturers = data.manufacturers;
+export const elements = data.elements;
+export const firmwares = data.firmwares;
+export const itemAugments = data.itemAugments;
+export default data;
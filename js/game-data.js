@@ -94,11 +94,26 @@ export const SHIELD_TYPE_ICONS = {
   armor: GENERIC_ITEM_ICONS.ARMOR_SHIELD
 };
 
+// Slim data module written by extract_game_data.py: only the tables the editor reads,
+// under a content-hashed name that the manifest points at
+const SLIM_MANIFEST_URL = new URL('./data/manifest.json', import.meta.url);
+
 // Game data cache
 let gameDataCache = null;
 
 /**
- * Load game data from the chunk file
+ * Import the slim data module named by the manifest
+ * The manifest is revalidated on every load; the module itself never changes and can be cached forever
+ */
+async function importSlimModule() {
+  const response = await fetch(SLIM_MANIFEST_URL, { cache: 'no-cache' });
+  if (!response.ok) throw new Error(`Slim data manifest not found (${response.status})`);
+  const manifest = await response.json();
+  return import(new URL(manifest.module, SLIM_MANIFEST_URL).href);
+}
+
+/**
+ * Load game data (slim module first, then the full chunk file)
  * This should be called once on page load
  */
 export async function loadGameData() {
@@ -111,21 +126,31 @@ export async function loadGameData() {
     
     let chunkModule = null;
     
-    // Try local first
+    // Slim module first - kilobytes instead of the whole chunk
     try {
-      chunkModule = await import(localChunkPath);
-      console.log('Loaded game data from local chunk file');
-    } catch (localError) {
-      console.warn('Local chunk file not found, trying CDN...', localError);
-      
-      // Try CDN
+      chunkModule = await importSlimModule();
+      console.log('Loaded game data from slim data module');
+    } catch (slimError) {
+      console.warn('Slim data module not available, loading the chunk file...', slimError);
+    }
+    
+    // Try local first
+    if (!chunkModule) {
       try {
-        // For CDN, we need to fetch and evaluate the module
-        // Since it's a module, we'll try importing directly
-        chunkModule = await import(cdnChunkPath);
-        console.log('Loaded game data from CDN chunk file');
-      } catch (cdnError) {
-        console.warn('CDN chunk file not accessible, using fallback structure', cdnError);
+        chunkModule = await import(localChunkPath);
+        console.log('Loaded game data from local chunk file');
+      } catch (localError) {
+        console.warn('Local chunk file not found, trying CDN...', localError);
+        
+        // Try CDN
+        try {
+          // For CDN, we need to fetch and evaluate the module
+          // Since it's a module, we'll try importing directly
+          chunkModule = await import(cdnChunkPath);
+          console.log('Loaded game data from CDN chunk file');
+        } catch (cdnError) {
+          console.warn('CDN chunk file not accessible, using fallback structure', cdnError);
+        }
       }
     }
     
@@ -5,8 +5,11 @@ Run this to test the new PyQt6 item editor
 """
 
 import sys
+from pathlib import Path
 from PyQt6.QtWidgets import QApplication
-from app.ui.item_editor_dialog import ItemEditorDialog
+
+sys.path.insert(0, str(Path(__file__).parent / "equipment_python_interesting-but-bugged"))
+from item_editor_dialog import ItemEditorDialog
 
 def main():
     app = QApplication(sys.argv)